@@ -0,0 +1,193 @@
+"""초기 스키마 (기존 models.py 기준)
+
+기존에 create_all로 테이블을 만든 DB는 `alembic stamp 0001` 후 사용합니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 12:40:13.162345
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('bet_slips',
+    sa.Column('id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('bet_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('game_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('option_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('odds', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('result', sa.Enum('PENDING', 'WIN', 'LOSS', name='betslipresultenum'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_bet_slips_bet_id'), 'bet_slips', ['bet_id'], unique=False)
+    op.create_index(op.f('ix_bet_slips_game_id'), 'bet_slips', ['game_id'], unique=False)
+    op.create_index(op.f('ix_bet_slips_id'), 'bet_slips', ['id'], unique=False)
+    op.create_table('bets',
+    sa.Column('id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('user_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('bet_type', sa.Enum('SINGLE', 'COMBO', name='bettypeenum'), nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('potential_return', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('total_odds', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'WIN', 'LOSS', 'CANCELLED', name='betstatusenum'), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_bets_created_at'), 'bets', ['created_at'], unique=False)
+    op.create_index(op.f('ix_bets_id'), 'bets', ['id'], unique=False)
+    op.create_index(op.f('ix_bets_status'), 'bets', ['status'], unique=False)
+    op.create_index(op.f('ix_bets_user_id'), 'bets', ['user_id'], unique=False)
+    op.create_table('betting_options',
+    sa.Column('id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('game_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('option_type', sa.Enum('WIN_DRAW_LOSS', 'HANDICAP', 'OVER_UNDER', 'WINNER_PREDICTION', name='bettingoptiontypeenum'), nullable=False),
+    sa.Column('option_name', sa.String(length=100), nullable=False),
+    sa.Column('odds', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('handicap_value', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('over_under_line', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_betting_options_game_id'), 'betting_options', ['game_id'], unique=False)
+    op.create_index(op.f('ix_betting_options_id'), 'betting_options', ['id'], unique=False)
+    op.create_index(op.f('ix_betting_options_option_type'), 'betting_options', ['option_type'], unique=False)
+    op.create_table('favorites',
+    sa.Column('id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('user_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('game_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_favorites_game_id'), 'favorites', ['game_id'], unique=False)
+    op.create_index(op.f('ix_favorites_id'), 'favorites', ['id'], unique=False)
+    op.create_index(op.f('ix_favorites_user_id'), 'favorites', ['user_id'], unique=False)
+    op.create_table('games',
+    sa.Column('id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('league_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('external_id', sa.String(length=100), nullable=True),
+    sa.Column('sport_type', sa.Enum('SOCCER', 'BASEBALL', 'BASKETBALL', 'VOLLEYBALL', name='sporttypeenum'), nullable=False),
+    sa.Column('home_team', sa.String(length=100), nullable=False),
+    sa.Column('away_team', sa.String(length=100), nullable=False),
+    sa.Column('start_time', sa.DateTime(), nullable=False),
+    sa.Column('status', sa.Enum('SCHEDULED', 'LIVE', 'CLOSED', 'FINISHED', 'CANCELLED', name='gamestatusenum'), nullable=False),
+    sa.Column('final_score_home', sa.Numeric(precision=10, scale=0), nullable=True),
+    sa.Column('final_score_away', sa.Numeric(precision=10, scale=0), nullable=True),
+    sa.Column('betting_deadline', sa.DateTime(), nullable=False),
+    sa.Column('is_live', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_games_external_id'), 'games', ['external_id'], unique=False)
+    op.create_index(op.f('ix_games_id'), 'games', ['id'], unique=False)
+    op.create_index(op.f('ix_games_is_live'), 'games', ['is_live'], unique=False)
+    op.create_index(op.f('ix_games_league_id'), 'games', ['league_id'], unique=False)
+    op.create_index(op.f('ix_games_sport_type'), 'games', ['sport_type'], unique=False)
+    op.create_index(op.f('ix_games_start_time'), 'games', ['start_time'], unique=False)
+    op.create_index(op.f('ix_games_status'), 'games', ['status'], unique=False)
+    op.create_table('leagues',
+    sa.Column('id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('league_name', sa.String(length=100), nullable=False),
+    sa.Column('sport_type', sa.Enum('SOCCER', 'BASEBALL', 'BASKETBALL', 'VOLLEYBALL', name='sporttypeenum'), nullable=False),
+    sa.Column('country', sa.String(length=50), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_leagues_id'), 'leagues', ['id'], unique=False)
+    op.create_index(op.f('ix_leagues_is_active'), 'leagues', ['is_active'], unique=False)
+    op.create_index(op.f('ix_leagues_sport_type'), 'leagues', ['sport_type'], unique=False)
+    op.create_table('transactions',
+    sa.Column('id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('wallet_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('transaction_type', sa.Enum('DEPOSIT', 'WITHDRAW', 'BET', 'REFUND', name='transactiontypeenum'), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('balance_after', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_transactions_created_at'), 'transactions', ['created_at'], unique=False)
+    op.create_index(op.f('ix_transactions_id'), 'transactions', ['id'], unique=False)
+    op.create_index(op.f('ix_transactions_wallet_id'), 'transactions', ['wallet_id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('username', sa.String(length=50), nullable=False),
+    sa.Column('password_hash', sa.String(length=255), nullable=False),
+    sa.Column('nickname', sa.String(length=50), nullable=False),
+    sa.Column('bank_name', sa.String(length=50), nullable=True),
+    sa.Column('account_number', sa.String(length=50), nullable=True),
+    sa.Column('account_holder', sa.String(length=50), nullable=True),
+    sa.Column('role', sa.Enum('USER', 'ADMIN', name='userroleenum'), nullable=False),
+    sa.Column('daily_limit', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('today_total_bet', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('last_bet_date', sa.Date(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_restricted', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_index(op.f('ix_users_role'), 'users', ['role'], unique=False)
+    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+    op.create_table('wallets',
+    sa.Column('id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('user_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('balance', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_wallets_id'), 'wallets', ['id'], unique=False)
+    op.create_index(op.f('ix_wallets_user_id'), 'wallets', ['user_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_wallets_user_id'), table_name='wallets')
+    op.drop_index(op.f('ix_wallets_id'), table_name='wallets')
+    op.drop_table('wallets')
+    op.drop_index(op.f('ix_users_username'), table_name='users')
+    op.drop_index(op.f('ix_users_role'), table_name='users')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_transactions_wallet_id'), table_name='transactions')
+    op.drop_index(op.f('ix_transactions_id'), table_name='transactions')
+    op.drop_index(op.f('ix_transactions_created_at'), table_name='transactions')
+    op.drop_table('transactions')
+    op.drop_index(op.f('ix_leagues_sport_type'), table_name='leagues')
+    op.drop_index(op.f('ix_leagues_is_active'), table_name='leagues')
+    op.drop_index(op.f('ix_leagues_id'), table_name='leagues')
+    op.drop_table('leagues')
+    op.drop_index(op.f('ix_games_status'), table_name='games')
+    op.drop_index(op.f('ix_games_start_time'), table_name='games')
+    op.drop_index(op.f('ix_games_sport_type'), table_name='games')
+    op.drop_index(op.f('ix_games_league_id'), table_name='games')
+    op.drop_index(op.f('ix_games_is_live'), table_name='games')
+    op.drop_index(op.f('ix_games_id'), table_name='games')
+    op.drop_index(op.f('ix_games_external_id'), table_name='games')
+    op.drop_table('games')
+    op.drop_index(op.f('ix_favorites_user_id'), table_name='favorites')
+    op.drop_index(op.f('ix_favorites_id'), table_name='favorites')
+    op.drop_index(op.f('ix_favorites_game_id'), table_name='favorites')
+    op.drop_table('favorites')
+    op.drop_index(op.f('ix_betting_options_option_type'), table_name='betting_options')
+    op.drop_index(op.f('ix_betting_options_id'), table_name='betting_options')
+    op.drop_index(op.f('ix_betting_options_game_id'), table_name='betting_options')
+    op.drop_table('betting_options')
+    op.drop_index(op.f('ix_bets_user_id'), table_name='bets')
+    op.drop_index(op.f('ix_bets_status'), table_name='bets')
+    op.drop_index(op.f('ix_bets_id'), table_name='bets')
+    op.drop_index(op.f('ix_bets_created_at'), table_name='bets')
+    op.drop_table('bets')
+    op.drop_index(op.f('ix_bet_slips_id'), table_name='bet_slips')
+    op.drop_index(op.f('ix_bet_slips_game_id'), table_name='bet_slips')
+    op.drop_index(op.f('ix_bet_slips_bet_id'), table_name='bet_slips')
+    op.drop_table('bet_slips')
@@ -0,0 +1,31 @@
+"""픽스처 일괄 임포트 upsert 키
+
+- games.external_id: 고유 인덱스 (NULL은 중복 허용)
+- betting_options (game_id, option_type, option_name): 고유 인덱스
+
+기존 데이터에 중복이 있으면 인덱스 생성이 실패하므로 먼저 정리해야 합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 16:05:41.583920
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_games_external_id'), table_name='games')
+    op.create_index(op.f('ix_games_external_id'), 'games', ['external_id'], unique=True)
+    op.create_index('uq_betting_options_game_option', 'betting_options', ['game_id', 'option_type', 'option_name'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_betting_options_game_option', table_name='betting_options')
+    op.drop_index(op.f('ix_games_external_id'), table_name='games')
+    op.create_index(op.f('ix_games_external_id'), 'games', ['external_id'], unique=False)
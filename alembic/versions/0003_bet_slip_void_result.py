@@ -0,0 +1,33 @@
+"""배팅 슬립 결과에 무효(VOID) 추가
+
+적중특례(핸디캡/언오버 기준선과 같은 결과, 무승부 없는 승패의 무승부)와 취소 경기의
+슬립은 VOID로 기록하고 배당 1.0으로 정산합니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 18:12:07.331502
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OLD_RESULT = sa.Enum('PENDING', 'WIN', 'LOSS', name='betslipresultenum')
+NEW_RESULT = sa.Enum('PENDING', 'WIN', 'LOSS', 'VOID', name='betslipresultenum')
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('bet_slips') as batch_op:
+        batch_op.alter_column('result', existing_type=OLD_RESULT, type_=NEW_RESULT, existing_nullable=False)
+
+
+def downgrade() -> None:
+    # 이전 스키마에 없는 값이므로 대기로 되돌림
+    op.execute("UPDATE bet_slips SET result = 'PENDING' WHERE result = 'VOID'")
+    with op.batch_alter_table('bet_slips') as batch_op:
+        batch_op.alter_column('result', existing_type=NEW_RESULT, type_=OLD_RESULT, existing_nullable=False)
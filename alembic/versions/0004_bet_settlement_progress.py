@@ -0,0 +1,56 @@
+"""배팅 정산 진행 상태 (조합 배팅 부분 정산)
+
+- bets.pending_legs: 결과가 나오지 않은 슬립 수
+- bets.settled_odds: 결과가 나온 슬립 배당의 곱 (무효 슬립은 1.0)
+
+대기 중인 배팅은 현재 슬립 결과로 채웁니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 19:02:44.918270
+"""
+from collections import defaultdict
+from decimal import Decimal
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('bets', sa.Column('pending_legs', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('bets', sa.Column('settled_odds', sa.Numeric(precision=24, scale=12), server_default='1', nullable=False))
+
+    op.execute(
+        "UPDATE bets SET pending_legs = ("
+        "SELECT COUNT(*) FROM bet_slips WHERE bet_slips.bet_id = bets.id AND bet_slips.result = 'PENDING'"
+        ") WHERE status = 'PENDING'"
+    )
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT bet_slips.bet_id, bet_slips.odds FROM bet_slips "
+        "JOIN bets ON bets.id = bet_slips.bet_id "
+        "WHERE bets.status = 'PENDING' AND bet_slips.result = 'WIN'"
+    )).all()
+    settled_odds = defaultdict(lambda: Decimal("1"))
+    for bet_id, odds in rows:
+        settled_odds[bet_id] *= Decimal(str(odds))
+    if settled_odds:
+        bind.execute(
+            sa.text("UPDATE bets SET settled_odds = :settled_odds WHERE id = :bet_id").bindparams(
+                sa.bindparam("settled_odds", type_=sa.Numeric(precision=24, scale=12)),
+            ),
+            [{"bet_id": bet_id, "settled_odds": value} for bet_id, value in settled_odds.items()],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('bets') as batch_op:
+        batch_op.drop_column('settled_odds')
+        batch_op.drop_column('pending_legs')
@@ -0,0 +1,38 @@
+"""작업 샤딩 (부모/하위 작업)
+
+- jobs.parent_id: 하위 작업(정산 샤드)의 부모 작업
+- jobs.status에 WAITING(하위 작업 대기) 추가
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 21:04:52.617309
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OLD_STATUS = sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='jobstatusenum')
+NEW_STATUS = sa.Enum('QUEUED', 'RUNNING', 'WAITING', 'SUCCEEDED', 'FAILED', name='jobstatusenum')
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('parent_id', mysql.CHAR(length=36), nullable=True))
+        batch_op.alter_column('status', existing_type=OLD_STATUS, type_=NEW_STATUS, existing_nullable=False)
+        batch_op.create_index(batch_op.f('ix_jobs_parent_id'), ['parent_id'], unique=False)
+
+
+def downgrade() -> None:
+    # 이전 스키마에 없는 값이므로 실패로 정리
+    op.execute("UPDATE jobs SET status = 'FAILED' WHERE status = 'WAITING'")
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_jobs_parent_id'))
+        batch_op.alter_column('status', existing_type=NEW_STATUS, type_=OLD_STATUS, existing_nullable=False)
+        batch_op.drop_column('parent_id')
@@ -0,0 +1,89 @@
+"""배팅/슬립/거래 내역 월별 파티션과 아카이브 테이블
+
+- bet_slips.created_at: 배팅 시각 (배팅과 같은 월 파티션에 들어가도록 배팅의 created_at으로 채움)
+- MySQL: bets, bet_slips, transactions를 created_at 월 단위 RANGE COLUMNS 파티션으로 변경
+  - 파티션 키가 모든 고유 키에 포함되어야 하므로 기본 키를 (id, created_at)으로 변경
+  - 기존 데이터의 가장 이른 월부터 이번 달 + 3개월까지 만들고, 이후 월은 pmax에 쌓이지 않도록
+    scripts/archive_partitions.py가 미리 추가
+- MySQL: 파티션을 옮겨 둘 압축 아카이브 테이블 {table}_archive (파티션 없음, ROW_FORMAT=COMPRESSED)
+
+sqlite(로컬 벤치마크)는 파티션이 없으므로 컬럼만 추가합니다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 23:12:05.481920
+"""
+from datetime import date, datetime
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONED_TABLES = ('bets', 'bet_slips', 'transactions')
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_clause(first: date, last: date) -> str:
+    partitions: List[str] = []
+    month = first
+    while month <= last:
+        upper = _add_months(month, 1)
+        partitions.append(f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{upper:%Y-%m-%d}')")
+        month = upper
+    partitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    return "PARTITION BY RANGE COLUMNS(created_at) (\n    " + ",\n    ".join(partitions) + "\n)"
+
+
+def upgrade() -> None:
+    op.add_column('bet_slips', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.execute(
+        "UPDATE bet_slips SET created_at = ("
+        "SELECT bets.created_at FROM bets WHERE bets.id = bet_slips.bet_id"
+        ")"
+    )
+    op.execute("UPDATE bet_slips SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+    with op.batch_alter_table('bet_slips') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index(batch_op.f('ix_bet_slips_created_at'), ['created_at'], unique=False)
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'mysql':
+        return
+
+    this_month = datetime.utcnow().date().replace(day=1)
+    oldest = [
+        bind.execute(sa.text(f"SELECT MIN(created_at) FROM {table}")).scalar()
+        for table in PARTITIONED_TABLES
+    ]
+    first = min([value.date().replace(day=1) for value in oldest if value is not None] + [this_month])
+    partition_clause = _partition_clause(first, _add_months(this_month, MONTHS_AHEAD))
+
+    for table in PARTITIONED_TABLES:
+        op.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (id, created_at)")
+        op.execute(f"ALTER TABLE {table} {partition_clause}")
+        op.execute(f"CREATE TABLE {table}_archive LIKE {table}")
+        op.execute(f"ALTER TABLE {table}_archive REMOVE PARTITIONING")
+        op.execute(f"ALTER TABLE {table}_archive ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8")
+
+
+def downgrade() -> None:
+    # 아카이브 테이블로 옮긴 행은 원래 테이블로 되돌리지 않음 (필요하면 먼저 INSERT ... SELECT로 복원)
+    if op.get_bind().dialect.name == 'mysql':
+        for table in PARTITIONED_TABLES:
+            op.execute(f"DROP TABLE IF EXISTS {table}_archive")
+            op.execute(f"ALTER TABLE {table} REMOVE PARTITIONING")
+            op.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+
+    with op.batch_alter_table('bet_slips') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_bet_slips_created_at'))
+        batch_op.drop_column('created_at')
@@ -0,0 +1,42 @@
+"""사용자별 배팅 통계 요약 테이블
+
+배팅 접수와 정산에서 증분으로 갱신합니다. 기존 배팅은 마이그레이션 후
+`python -m scripts.rebuild_bet_stats`로 한 번 채웁니다.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-20 00:41:27.093518
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_bet_stats',
+    sa.Column('user_id', mysql.CHAR(length=36), nullable=False),
+    sa.Column('bets_placed', sa.Integer(), nullable=False),
+    sa.Column('total_staked', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('bets_won', sa.Integer(), nullable=False),
+    sa.Column('bets_lost', sa.Integer(), nullable=False),
+    sa.Column('bets_cancelled', sa.Integer(), nullable=False),
+    sa.Column('settled_staked', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('total_returned', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('current_streak', sa.Integer(), nullable=False),
+    sa.Column('longest_win_streak', sa.Integer(), nullable=False),
+    sa.Column('longest_loss_streak', sa.Integer(), nullable=False),
+    sa.Column('last_bet_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_bet_stats')
@@ -0,0 +1,85 @@
+"""보고서용 시간/일 단위 집계 테이블
+
+- bets.settled_at: 결과 확정 시각 (정산된 배팅이 속한 시간 집계를 다시 계산하기 위한 기준)
+  MySQL: 아카이브 테이블 bets_archive에도 같은 컬럼 추가 (파티션을 옮길 때 값을 보존)
+- bet_rollups_hourly / bet_rollups_daily: 배팅 시각(UTC) 시간/일 x 게임별 배팅 금액, 결과 확정 금액, 지급액
+  (조합 배팅은 금액을 슬립 수로 나눠 각 게임에 배분)
+- bet_rollup_bettors_daily: 일별 활성 배팅 사용자 수 (전체/스포츠/리그/게임별, 합산할 수 없는 값이라 따로 저장)
+- rollup_watermarks: 집계 작업 진행 시각 (bets_created: 배팅 시각, bets_settled: 결과 확정 시각)
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-20 02:05:13.662047
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SPORT_TYPE = sa.Enum('SOCCER', 'BASEBALL', 'BASKETBALL', 'VOLLEYBALL', name='sporttypeenum')
+
+
+def _has_archive(bind) -> bool:
+    return bind.dialect.name == 'mysql' and sa.inspect(bind).has_table('bets_archive')
+
+
+def _rollup_columns() -> list:
+    return [
+        sa.Column('game_id', mysql.CHAR(length=36), nullable=False),
+        sa.Column('league_id', mysql.CHAR(length=36), nullable=False),
+        sa.Column('sport_type', SPORT_TYPE, nullable=False),
+        sa.Column('selections', sa.Integer(), nullable=False),
+        sa.Column('stake', sa.Numeric(precision=20, scale=4), nullable=False),
+        sa.Column('settled_stake', sa.Numeric(precision=20, scale=4), nullable=False),
+        sa.Column('payout', sa.Numeric(precision=20, scale=4), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.add_column('bets', sa.Column('settled_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_bets_settled_at'), 'bets', ['settled_at'], unique=False)
+    if _has_archive(op.get_bind()):
+        op.execute("ALTER TABLE bets_archive ADD COLUMN settled_at DATETIME NULL, ADD INDEX ix_bets_settled_at (settled_at)")
+
+    op.create_table('bet_rollups_hourly',
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    *_rollup_columns(),
+    sa.PrimaryKeyConstraint('bucket_start', 'game_id')
+    )
+    op.create_table('bet_rollups_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    *_rollup_columns(),
+    sa.PrimaryKeyConstraint('day', 'game_id')
+    )
+    op.create_table('bet_rollup_bettors_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('scope', sa.String(length=10), nullable=False),
+    sa.Column('scope_key', sa.String(length=36), nullable=False),
+    sa.Column('bettors', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'scope', 'scope_key')
+    )
+    op.create_table('rollup_watermarks',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('value', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # 비어 있으면 첫 실행에서 가장 이른 배팅부터 전체 집계
+    op.execute("INSERT INTO rollup_watermarks (name) VALUES ('bets_created'), ('bets_settled')")
+
+
+def downgrade() -> None:
+    op.drop_table('rollup_watermarks')
+    op.drop_table('bet_rollup_bettors_daily')
+    op.drop_table('bet_rollups_daily')
+    op.drop_table('bet_rollups_hourly')
+    if _has_archive(op.get_bind()):
+        op.execute("ALTER TABLE bets_archive DROP INDEX ix_bets_settled_at, DROP COLUMN settled_at")
+    op.drop_index(op.f('ix_bets_settled_at'), table_name='bets')
+    op.drop_column('bets', 'settled_at')
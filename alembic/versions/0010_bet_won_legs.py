@@ -0,0 +1,44 @@
+"""적중 슬립 수 (모든 슬립 무효 판정)
+
+- bets.won_legs: 결과가 나온 슬립 중 적중한 슬립 수
+  (배당 1.00 슬립만 적중해 settled_odds가 1이어도 무효와 구분하기 위함, 0이면 모든 슬립이 무효)
+- MySQL: 아카이브 테이블 bets_archive에도 같은 컬럼 추가 (파티션을 옮길 때 값을 보존)
+
+대기 중인 배팅은 현재 슬립 결과로 채웁니다.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-20 09:41:27.305518
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_archive(bind) -> bool:
+    return bind.dialect.name == 'mysql' and sa.inspect(bind).has_table('bets_archive')
+
+
+def upgrade() -> None:
+    op.add_column('bets', sa.Column('won_legs', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE bets SET won_legs = ("
+        "SELECT COUNT(*) FROM bet_slips WHERE bet_slips.bet_id = bets.id AND bet_slips.result = 'WIN'"
+        ") WHERE status = 'PENDING'"
+    )
+
+    if _has_archive(op.get_bind()):
+        op.execute("ALTER TABLE bets_archive ADD COLUMN won_legs INTEGER NOT NULL DEFAULT 0")
+
+
+def downgrade() -> None:
+    if _has_archive(op.get_bind()):
+        op.execute("ALTER TABLE bets_archive DROP COLUMN won_legs")
+    with op.batch_alter_table('bets') as batch_op:
+        batch_op.drop_column('won_legs')
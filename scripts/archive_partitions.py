@@ -0,0 +1,75 @@
+"""월별 파티션 유지보수 (이후 월 파티션 추가 + 오래된 정산 완료 월 아카이브)
+
+    python -m scripts.archive_partitions                  # 파티션 추가 후 ARCHIVE_AFTER_MONTHS 지난 월 아카이브
+    python -m scripts.archive_partitions --dry-run        # 추가/아카이브할 월만 출력
+    python -m scripts.archive_partitions --after-months 12
+
+매일 한 번 cron 등으로 실행합니다. bets/bet_slips/transactions의 월 파티션을 PARTITION_MONTHS_AHEAD개월
+앞까지 만들어 두고, 대기 중인 배팅이 없는 오래된 월은 {table}_archive(압축 테이블)로 옮긴 뒤 파티션을
+삭제합니다. MySQL 전용입니다.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from src.config import settings
+from src.infrastructure.database.connection import AsyncSessionLocal, close_db
+from src.infrastructure.database.partitioning import (
+    PARTITIONED_TABLES,
+    ArchiveMismatchError,
+    PartitionManager,
+    partition_name,
+)
+
+
+async def run(after_months: int, months_ahead: int, dry_run: bool) -> int:
+    try:
+        async with AsyncSessionLocal() as session:
+            manager = PartitionManager(session)
+            months = await manager.archivable_months(after_months)
+            if dry_run:
+                for table in PARTITIONED_TABLES:
+                    existing = await manager.list_months(table)
+                    print(f"{table}: {', '.join(partition_name(month) for month in existing)}")
+                print(f"아카이브 대상: {', '.join(partition_name(month) for month in months) or '없음'}")
+                return 0
+
+            added = await manager.ensure_future_partitions(months_ahead)
+            for table, names in added.items():
+                print(f"파티션 추가 {table}: {', '.join(names)}")
+            for month in months:
+                try:
+                    moved = await manager.archive_month(month)
+                except ArchiveMismatchError as e:
+                    print(f"{partition_name(month)}: 아카이브 행 수가 맞지 않아 파티션을 삭제하지 않음 ({e})")
+                    return 1
+                if moved is None:
+                    print(f"{partition_name(month)}: 대기 중인 배팅이 있어 건너뜀")
+                else:
+                    print(f"{partition_name(month)}: " + ", ".join(f"{table} {rows}행" for table, rows in moved.items()))
+            await session.commit()
+        return 0
+    finally:
+        await close_db()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="월별 파티션 추가/아카이브")
+    parser.add_argument(
+        "--after-months", type=int, default=settings.ARCHIVE_AFTER_MONTHS,
+        help="이번 달보다 이 개월 수 넘게 지난 월을 아카이브 (기본: ARCHIVE_AFTER_MONTHS)",
+    )
+    parser.add_argument(
+        "--months-ahead", type=int, default=settings.PARTITION_MONTHS_AHEAD,
+        help="미리 만들 이후 월 파티션 수 (기본: PARTITION_MONTHS_AHEAD)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="대상만 출력하고 변경하지 않음")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    return asyncio.run(run(args.after_months, args.months_ahead, args.dry_run))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
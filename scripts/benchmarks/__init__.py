@@ -0,0 +1,5 @@
+"""성능 벤치마크 스크립트
+
+프로젝트 루트에서 모듈로 실행합니다.
+    python -m scripts.benchmarks.startup_time
+"""
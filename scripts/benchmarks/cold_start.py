@@ -0,0 +1,161 @@
+"""import 시간 및 콜드 스타트 프로파일링
+
+1. `python -X importtime -c "import src.main"` 결과를 모듈/패키지별로 집계
+2. 새 프로세스에서 import → lifespan startup → 첫 요청 응답까지의 시간(time-to-first-request)
+3. startup 직후 RSS
+
+    python -m scripts.benchmarks.cold_start                     # 리포트 출력
+    python -m scripts.benchmarks.cold_start --check             # 기준치 대비 회귀 시 종료 코드 1 (CI용)
+    python -m scripts.benchmarks.cold_start --update-baseline   # 현재 측정값을 기준치로 저장
+
+기준치(cold_start_baseline.json)는 측정 환경에 따라 다르므로 CI 러너에서 갱신해 사용합니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from scripts.benchmarks.standins import PROJECT_ROOT, configure_environment, upgrade_schema
+
+BASELINE_PATH = Path(__file__).with_name("cold_start_baseline.json")
+METRICS = ("import_ms", "first_request_ms", "time_to_first_request_ms", "rss_mb")
+# 측정 노이즈를 흡수하기 위한 절대 허용치 (비율 허용치에 더해짐)
+ABSOLUTE_SLACK = {"import_ms": 20.0, "first_request_ms": 5.0, "time_to_first_request_ms": 20.0, "rss_mb": 2.0}
+
+# 자식 프로세스에서 실행되는 측정 코드
+CHILD_CODE = """
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+from src.main import app
+t1 = time.perf_counter()
+
+def rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+async def main():
+    import httpx
+    async with app.router.lifespan_context(app):
+        t2 = time.perf_counter()
+        rss = rss_mb()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get(sys.argv[1])
+            response.raise_for_status()
+        t3 = time.perf_counter()
+    print(json.dumps({
+        "import_ms": (t1 - t0) * 1000,
+        "startup_ms": (t2 - t1) * 1000,
+        "first_request_ms": (t3 - t2) * 1000,
+        "time_to_first_request_ms": (t3 - t0) * 1000,
+        "rss_mb": rss,
+    }))
+
+asyncio.run(main())
+"""
+
+
+def profile_imports(env: dict, top: int) -> None:
+    """-X importtime 출력 집계"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    by_package = defaultdict(int)
+    for name, self_us, _ in modules:
+        parts = name.split(".")
+        key = ".".join(parts[:2]) if parts[0] == "src" else parts[0]
+        by_package[key] += self_us
+
+    total_ms = sum(self_us for _, self_us, _ in modules) / 1000
+    print(f"\n[import time] 총 {total_ms:.1f}ms, 모듈 {len(modules)}개")
+    print(f"\n{'package (self 합계)':<50} {'ms':>8}")
+    for key, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"{key:<50} {self_us / 1000:>8.1f}")
+    print(f"\n{'module (cumulative)':<50} {'ms':>8}")
+    for name, _, cumulative_us in sorted(modules, key=lambda item: -item[2])[:top]:
+        print(f"{name:<50} {cumulative_us / 1000:>8.1f}")
+
+
+def run_cold_start(env: dict, path: str) -> dict:
+    """콜드 스타트 1회 측정"""
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE, path],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="import 시간 및 콜드 스타트 프로파일링")
+    parser.add_argument("--runs", type=int, default=7, help="콜드 스타트 측정 횟수")
+    parser.add_argument("--path", default="/health", help="첫 요청 경로")
+    parser.add_argument("--top", type=int, default=15, help="출력할 상위 모듈 수")
+    parser.add_argument("--check", action="store_true", help="기준치 대비 회귀 검사")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 회귀 비율 (기본 20%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="측정값을 기준치로 저장")
+    args = parser.parse_args()
+
+    configure_environment()
+    upgrade_schema()
+    env = dict(os.environ)
+
+    profile_imports(env, args.top)
+
+    run_cold_start(env, args.path)  # 바이트코드 캐시 생성용 워밍업
+    samples = [run_cold_start(env, args.path) for _ in range(args.runs)]
+    medians = {key: statistics.median(s[key] for s in samples) for key in METRICS}
+
+    print(f"\n[cold start] {args.runs}회 중앙값")
+    for key in METRICS:
+        print(f"{key:<28} {medians[key]:>10.1f}")
+
+    if args.update_baseline:
+        BASELINE_PATH.write_text(json.dumps({k: round(v, 1) for k, v in medians.items()}, indent=2) + "\n")
+        print(f"\n기준치 저장: {BASELINE_PATH}")
+        return 0
+
+    if args.check:
+        baseline = json.loads(BASELINE_PATH.read_text())
+        failures = [
+            f"{key}: {medians[key]:.1f} > {baseline[key]:.1f} * {1 + args.tolerance:.2f} + {ABSOLUTE_SLACK[key]}"
+            for key in METRICS
+            if key in baseline and medians[key] > baseline[key] * (1 + args.tolerance) + ABSOLUTE_SLACK[key]
+        ]
+        if failures:
+            print("\nFAIL: 콜드 스타트 회귀")
+            for failure in failures:
+                print(f"  {failure}")
+            return 1
+        print("\nOK: 기준치 이내")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""응답 압축 CPU 비용 / 절약 바이트 벤치마크
+
+CompressionMiddleware와 같은 압축기(src.presentation.middleware.compression.create_encoder)로
+큰 목록 응답을 인코딩/레벨별로 압축해 CPU 시간과 줄어든 바이트를 비교합니다.
+
+- games: 게임 목록 한 페이지 JSON (trusted_response 경로, 단일 본문)
+- csv-rows: 보고서 CSV 스트림을 행마다 보낼 때 (청크마다 flush)
+- csv-chunks: 보고서 CSV 스트림을 CSV_CHUNK_ROWS행씩 보낼 때 (현재 엔드포인트)
+
+    python -m scripts.benchmarks.compression
+    python -m scripts.benchmarks.compression --items 500 --rows 20000 --runs 20
+
+CPU 시간은 time.process_time 중앙값이며, "us/KB"는 절약한 1KB당 CPU 시간입니다.
+"""
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, List, Tuple
+
+from scripts.benchmarks.serialization import make_page, render_orjson
+from src.application.report.dto import ReportRowDTO
+from src.presentation.api.v1.reports import CSV_CHUNK_ROWS, CSV_COLUMNS, _csv_line, _csv_row
+from src.presentation.middleware.compression import BROTLI, GZIP, CompressionLevel, brotli, create_encoder
+
+GZIP_LEVELS = (1, 3, 5, 6, 9)
+BROTLI_QUALITIES = (0, 1, 3, 4, 5, 7, 11)
+
+
+def make_report_rows(rows: int) -> List[ReportRowDTO]:
+    """시간 단위 게임별 보고서 행"""
+    start = datetime(2026, 10, 1)
+    return [
+        ReportRowDTO(
+            period_start=start + timedelta(hours=i // 50),
+            group_key=f"{i % 50:08d}-5a1e-4c3b-9d2f-{i % 50:012d}",
+            selections=i % 97 + 1,
+            stake=Decimal(1000 + i % 997 * 10) / 100,
+            settled_stake=Decimal(900 + i % 991 * 10) / 100,
+            payout=Decimal(800 + i % 983 * 10) / 100,
+            ggr=Decimal(100 + i % 89) / 100,
+            margin=Decimal(i % 1000) / 10000,
+            bettors=i % 31 + 1,
+        )
+        for i in range(rows)
+    ]
+
+
+def csv_chunks(rows: List[ReportRowDTO], chunk_rows: int) -> List[bytes]:
+    """엔드포인트와 같은 CSV를 chunk_rows행씩 묶은 청크"""
+    lines = [_csv_line(CSV_COLUMNS)] + [_csv_row(row) for row in rows]
+    return [
+        "".join(lines[i:i + chunk_rows]).encode("utf-8")
+        for i in range(0, len(lines), chunk_rows)
+    ]
+
+
+def compress(encoding: str, level: CompressionLevel, chunks: List[bytes]) -> int:
+    """미들웨어와 같은 방식으로 압축한 바이트 수 (단일 본문이면 finish만, 스트림이면 청크마다 flush)"""
+    encoder = create_encoder(encoding, level)
+    size = 0
+    for chunk in chunks[:-1]:
+        size += len(encoder.compress(chunk))
+    return size + len(encoder.finish(chunks[-1]))
+
+
+def measure(func: Callable[[], int], runs: int) -> Tuple[float, int]:
+    """(1회당 CPU 시간 중앙값 ms, 결과 바이트)"""
+    samples = []
+    size = 0
+    for _ in range(runs):
+        started = time.process_time()
+        size = func()
+        samples.append((time.process_time() - started) * 1000)
+    return statistics.median(samples), size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100, help="게임 목록 페이지당 게임 수")
+    parser.add_argument("--rows", type=int, default=10000, help="보고서 CSV 행 수")
+    parser.add_argument("--runs", type=int, default=10, help="조합별 반복 횟수")
+    args = parser.parse_args()
+
+    report_rows = make_report_rows(args.rows)
+    payloads = {
+        "games": [render_orjson(make_page(args.items))],
+        "csv-rows": csv_chunks(report_rows, 1),
+        "csv-chunks": csv_chunks(report_rows, CSV_CHUNK_ROWS),
+    }
+    levels = [(GZIP, CompressionLevel(level, 0)) for level in GZIP_LEVELS]
+    if brotli is not None:
+        levels += [(BROTLI, CompressionLevel(1, quality)) for quality in BROTLI_QUALITIES]
+    else:
+        print("brotli 패키지가 없어 gzip만 측정합니다.", file=sys.stderr)
+
+    print(f"{'payload':<12}{'encoding':<10}{'level':>6}{'chunks':>8}{'original':>11}{'encoded':>10}"
+          f"{'saved':>8}{'cpu(ms)':>10}{'us/KB':>8}")
+    for name, chunks in payloads.items():
+        original = sum(len(chunk) for chunk in chunks)
+        for encoding, level in levels:
+            cpu_ms, encoded = measure(lambda: compress(encoding, level, chunks), args.runs)
+            saved = original - encoded
+            level_value = level.gzip if encoding == GZIP else level.brotli
+            per_kb = cpu_ms * 1000 / (saved / 1024) if saved > 0 else float("inf")
+            print(f"{name:<12}{encoding:<10}{level_value:>6}{len(chunks):>8}{original:>11}{encoded:>10}"
+                  f"{saved / original:>8.1%}{cpu_ms:>10.2f}{per_kb:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""엔티티 매핑 마이크로 벤치마크
+
+게임 목록 한 페이지(기본 100행)를 엔티티로 읽는 비용을 경로별로 측정합니다.
+마이그레이션이 적용된 sqlite DB를 MySQL 대신 사용합니다.
+
+- orm: select(GameModel) → ORM 인스턴스(identity map 등록) → _to_entity (이전 find_all 경로)
+- columns: GameRepositoryImpl.find_all (컬럼 튜플 → slots 엔티티)
+
+    python -m scripts.benchmarks.entity_mapping
+    python -m scripts.benchmarks.entity_mapping --rows 100 --runs 300
+
+메모리는 조회 중 최대 할당량(tracemalloc peak, ORM 인스턴스 등 임시 객체 포함)을 행 수로 나눈 값입니다.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+from scripts.benchmarks.standins import configure_environment, upgrade_schema
+
+
+async def seed(rows: int) -> None:
+    from src.infrastructure.database.connection import AsyncSessionLocal
+    from src.infrastructure.database.models import GameModel
+
+    start = datetime(2026, 10, 20, 19, 30)
+    league_id = str(uuid.uuid4())
+    async with AsyncSessionLocal() as session:
+        session.add_all(
+            GameModel(
+                id=str(uuid.uuid4()),
+                league_id=league_id,
+                sport_type="SOCCER",
+                home_team=f"홈팀 {i}",
+                away_team=f"원정팀 {i}",
+                start_time=start + timedelta(minutes=i),
+                betting_deadline=start + timedelta(minutes=i - 5),
+            )
+            for i in range(rows)
+        )
+        await session.commit()
+
+
+async def find_all_orm(session, rows: int) -> list:
+    """이전 경로: ORM 인스턴스를 읽어 엔티티로 변환"""
+    from sqlalchemy import select
+    from src.infrastructure.database.models import GameModel
+    from src.infrastructure.database.repositories.game_repository import GameRepositoryImpl
+
+    repository = GameRepositoryImpl(session)
+    result = await session.execute(select(GameModel).limit(rows))
+    return [repository._to_entity(model) for model in result.scalars().all()]
+
+
+async def find_all_columns(session, rows: int) -> list:
+    from src.infrastructure.database.repositories.game_repository import GameRepositoryImpl
+
+    return await GameRepositoryImpl(session).find_all(limit=rows)
+
+
+async def measure(find, rows: int, runs: int) -> dict:
+    """호출당 시간 중앙값(us)과 행당 최대 할당량(bytes)"""
+    from src.infrastructure.database.connection import AsyncSessionLocal
+
+    samples = []
+    for _ in range(runs):
+        async with AsyncSessionLocal() as session:
+            started = time.perf_counter()
+            entities = await find(session, rows)
+            samples.append((time.perf_counter() - started) * 1_000_000)
+    assert len(entities) == rows
+
+    async with AsyncSessionLocal() as session:
+        # 커넥션 획득 비용을 빼기 위해 한 번 실행 후 측정
+        await find(session, rows)
+        session.expunge_all()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        entities = await find(session, rows)
+        peak = tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+    return {"us": statistics.median(samples), "bytes_per_row": peak / len(entities)}
+
+
+async def run(rows: int, runs: int) -> None:
+    from src.infrastructure.database.connection import close_db
+
+    await seed(rows)
+    results = {
+        "orm": await measure(find_all_orm, rows, runs),
+        "columns": await measure(find_all_columns, rows, runs),
+    }
+    await close_db()
+
+    print(f"게임 {rows}행, {runs}회 중앙값")
+    print(f"{'경로':<10}{'호출(us)':>12}{'행당(us)':>12}{'행당 메모리(B)':>18}")
+    for name, result in results.items():
+        print(f"{name:<10}{result['us']:>12.1f}{result['us'] / rows:>12.2f}{result['bytes_per_row']:>18.0f}")
+    orm, columns = results["orm"], results["columns"]
+    print(f"시간 {orm['us'] / columns['us']:.2f}x, 메모리 {orm['bytes_per_row'] / columns['bytes_per_row']:.2f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100, help="페이지당 행 수")
+    parser.add_argument("--runs", type=int, default=200, help="경로별 반복 횟수")
+    args = parser.parse_args()
+
+    configure_environment()
+    upgrade_schema()
+    asyncio.run(run(args.rows, args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
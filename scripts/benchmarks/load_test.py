@@ -0,0 +1,431 @@
+"""로컬 E2E 부하 테스트 (MySQL/Redis 대체 환경)
+
+src.main:app을 sqlite+aiosqlite / fakeredis 위에서 띄우고 httpx ASGITransport로
+실제 API 경로를 호출합니다. 시나리오별 처리량, p50/p95/p99, 요청당 DB 왕복(SQL 문) 수를
+측정하며, 결과를 JSON으로 저장해 이후 변경과 비교할 수 있습니다.
+
+    python -m scripts.benchmarks.load_test                              # 전체 시나리오
+    python -m scripts.benchmarks.load_test --settle-bets 5000           # 정산 규모 축소
+    python -m scripts.benchmarks.load_test --output baseline.json       # 결과 저장
+    python -m scripts.benchmarks.load_test --compare baseline.json      # 기준 결과와 비교
+
+시나리오:
+    register / login    회원가입·로그인 버스트 (bcrypt 비용 포함, --bcrypt-rounds로 조절)
+    browse              게임 목록 / 게임 상세 / 게임별 배팅 옵션 조회
+    bet_single          단일 배팅 POST /bets
+    bet_combo           조합 배팅 POST /bets (서로 다른 게임 3개)
+    settle              --settle-bets 건의 배팅이 걸린 게임 1건 정산
+                        (정산 작업 등록부터 작업 워커가 하위 작업까지 모두 처리할 때까지)
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional
+
+from scripts.benchmarks.standins import configure_environment, install_fake_redis, upgrade_schema
+
+if TYPE_CHECKING:
+    import httpx
+
+API = "/api/v1"
+PASSWORD = "Bench!pass1"
+WALLET_BALANCE = Decimal("1000000000.00")
+SEED_BATCH_SIZE = 5000
+COMPARE_KEYS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms", "statements_per_request")
+
+# 현재 요청에서 실행된 SQL 문 수 (요청을 보내는 태스크의 컨텍스트에 바인딩)
+_statement_counter: ContextVar[Optional[List[int]]] = ContextVar("statement_counter", default=None)
+
+
+def _count_statement(*_args) -> None:
+    counter = _statement_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """최근접 순위 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+@dataclass
+class ScenarioResult:
+    """시나리오 측정 결과"""
+    name: str
+    elapsed_s: float = 0.0
+    errors: int = 0
+    latencies_ms: List[float] = field(default_factory=list)
+    statements: List[int] = field(default_factory=list)
+    error_samples: List[str] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        latencies = sorted(self.latencies_ms)
+        count = len(latencies)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "throughput_rps": round(count / self.elapsed_s, 1) if self.elapsed_s else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "statements_per_request": round(sum(self.statements) / count, 1) if count else 0.0,
+        }
+
+
+RequestFactory = Callable[[], Awaitable["httpx.Response"]]
+
+
+async def run_scenario(name: str, requests: List[RequestFactory], concurrency: int) -> ScenarioResult:
+    """요청 목록을 concurrency 개의 워커로 실행"""
+    result = ScenarioResult(name=name)
+    pending = iter(requests)
+
+    async def worker() -> None:
+        for make_request in pending:
+            counter = [0]
+            token = _statement_counter.set(counter)
+            started = time.perf_counter()
+            try:
+                response = await make_request()
+            finally:
+                _statement_counter.reset(token)
+            result.latencies_ms.append((time.perf_counter() - started) * 1000)
+            result.statements.append(counter[0])
+            if response.status_code >= 400:
+                result.errors += 1
+                if len(result.error_samples) < 3:
+                    result.error_samples.append(f"{response.status_code} {response.text[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed_s = time.perf_counter() - started
+    return result
+
+
+def expect(response, status_code: int) -> dict:
+    """셋업 요청 결과 확인"""
+    if response.status_code != status_code:
+        raise RuntimeError(f"{response.request.method} {response.request.url} -> {response.status_code}: {response.text}")
+    return response.json() if response.content else {}
+
+
+class LoadTest:
+    """부하 테스트 실행기"""
+
+    def __init__(self, client, args: argparse.Namespace):
+        self.client = client
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.results: List[ScenarioResult] = []
+        self.users: List[dict] = []
+        self.games: List[dict] = []
+
+    async def record(self, name: str, requests: List[RequestFactory], concurrency: Optional[int] = None) -> None:
+        result = await run_scenario(name, requests, concurrency or self.args.concurrency)
+        self.results.append(result)
+        summary = result.summary()
+        print(
+            f"  {name:<12} {summary['requests']:>6} req  {summary['throughput_rps']:>8.1f} rps  "
+            f"p50 {summary['p50_ms']:>8.2f}  p95 {summary['p95_ms']:>8.2f}  p99 {summary['p99_ms']:>8.2f} ms  "
+            f"{summary['statements_per_request']:>7.1f} stmt/req  errors {result.errors}"
+        )
+        for sample in result.error_samples:
+            print(f"    ! {sample}")
+
+    async def setup_catalog(self) -> None:
+        """리그/게임/배팅 옵션 생성 (측정 제외)"""
+        league = expect(await self.client.post(f"{API}/leagues", json={
+            "league_name": "벤치마크 리그",
+            "sport_type": "축구",
+            "country": "KR",
+        }), 201)
+        self.league_id = league["league_id"]
+
+        start_time = datetime.utcnow() + timedelta(days=1)
+        for index in range(self.args.games):
+            game = await self.create_game(f"홈팀 {index}", f"원정팀 {index}", start_time)
+            self.games.append(game)
+
+    async def create_game(self, home_team: str, away_team: str, start_time: datetime) -> dict:
+        game = expect(await self.client.post(f"{API}/games", json={
+            "league_id": self.league_id,
+            "home_team": home_team,
+            "away_team": away_team,
+            "start_time": start_time.isoformat(),
+            "betting_deadline": (start_time - timedelta(minutes=10)).isoformat(),
+            "sport_type": "축구",
+        }), 201)
+        game["options"] = []
+        for option_name, odds in (("홈팀 승", "2.10"), ("무승부", "3.20"), ("원정팀 승", "3.50")):
+            option = expect(await self.client.post(f"{API}/betting-options", json={
+                "game_id": game["game_id"],
+                "option_type": "승무패",
+                "option_name": option_name,
+                "odds": odds,
+            }), 201)
+            game["options"].append(option["option_id"])
+        return game
+
+    async def scenario_auth(self) -> None:
+        """회원가입/로그인 버스트"""
+        run_id = uuid.uuid4().hex[:6]
+        usernames = [f"bench_{run_id}_{index}" for index in range(self.args.users)]
+
+        def register(username: str) -> RequestFactory:
+            return lambda: self.client.post(f"{API}/auth/register", json={
+                "username": username,
+                "password": PASSWORD,
+                "nickname": username[-20:],
+                "bank_name": "벤치은행",
+                "account_number": "000-0000-0000",
+                "account_holder": "벤치",
+            })
+
+        def login(username: str) -> RequestFactory:
+            async def _login():
+                response = await self.client.post(f"{API}/auth/login", json={
+                    "username": username,
+                    "password": PASSWORD,
+                })
+                if response.status_code == 200:
+                    body = response.json()
+                    self.users.append({
+                        "user_id": body["user"]["user_id"],
+                        "headers": {"Authorization": f"Bearer {body['access_token']}"},
+                    })
+                return response
+            return _login
+
+        await self.record("register", [register(username) for username in usernames])
+        await self.record("login", [login(username) for username in usernames])
+
+        if not self.users:
+            raise RuntimeError("로그인에 성공한 사용자가 없습니다")
+        await self.seed_wallets([user["user_id"] for user in self.users])
+
+    async def seed_wallets(self, user_ids: List[str]) -> None:
+        """배팅용 지갑 잔액 적재 (회원가입 API는 지갑을 만들지 않음)"""
+        from sqlalchemy import insert
+
+        from src.infrastructure.database.connection import AsyncSessionLocal
+        from src.infrastructure.database.models import WalletModel
+
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as session:
+            await session.execute(insert(WalletModel), [
+                {"id": str(uuid.uuid4()), "user_id": user_id, "balance": WALLET_BALANCE, "updated_at": now}
+                for user_id in user_ids
+            ])
+            await session.commit()
+
+    async def scenario_browse(self) -> None:
+        """게임/옵션 조회"""
+        total_pages = max(1, -(-len(self.games) // 20))
+
+        def make_request() -> RequestFactory:
+            kind = self.random.random()
+            game = self.random.choice(self.games)
+            if kind < 0.4:
+                page = self.random.randint(1, total_pages)
+                return lambda: self.client.get(f"{API}/games", params={"page": page, "limit": 20})
+            if kind < 0.7:
+                return lambda: self.client.get(f"{API}/games/{game['game_id']}")
+            return lambda: self.client.get(f"{API}/betting-options/game/{game['game_id']}")
+
+        await self.record("browse", [make_request() for _ in range(self.args.browse_requests)])
+
+    async def scenario_bets(self) -> None:
+        """단일/조합 배팅"""
+        def place_bet(option_ids: List[str], bet_type: str) -> RequestFactory:
+            user = self.random.choice(self.users)
+            return lambda: self.client.post(f"{API}/bets", headers=user["headers"], json={
+                "selections": [{"option_id": option_id} for option_id in option_ids],
+                "amount": "1000",
+                "bet_type": bet_type,
+            })
+
+        single = [
+            place_bet([self.random.choice(self.random.choice(self.games)["options"])], "단일")
+            for _ in range(self.args.bets)
+        ]
+        await self.record("bet_single", single)
+
+        legs = min(3, len(self.games))
+        combo = [
+            place_bet([self.random.choice(game["options"]) for game in self.random.sample(self.games, legs)], "조합")
+            for _ in range(self.args.bets)
+        ]
+        await self.record("bet_combo", combo)
+
+    async def scenario_settle(self) -> None:
+        """대량 배팅이 걸린 게임 정산"""
+        if self.args.settle_bets <= 0:
+            return
+        game = await self.create_game("정산 홈팀", "정산 원정팀", datetime.utcnow() + timedelta(hours=1))
+        winning_option, losing_option = game["options"][0], game["options"][1]
+
+        started = time.perf_counter()
+        await self.seed_bets(game["game_id"], [winning_option, losing_option], self.args.settle_bets)
+        print(f"  (정산 대상 배팅 {self.args.settle_bets}건 적재 {time.perf_counter() - started:.1f}s)")
+
+        await self.record("settle", [
+            lambda: self.settle_and_drain(game["game_id"], winning_option),
+        ], concurrency=1)
+
+    async def settle_and_drain(self, game_id: str, winning_option: str) -> "httpx.Response":
+        """정산 작업을 등록하고 작업 워커로 끝까지 처리한 뒤 작업 상태 조회
+
+        POST /games/{id}/settle은 작업 등록만 하므로, 같은 측정 구간에서 워커를 돌려 정산 전체 시간을 잽니다.
+        """
+        from src.domain.job.enums import JobStatusEnum
+        from src.infrastructure.jobs.worker import create_job_worker
+
+        response = await self.client.post(
+            f"{API}/games/{game_id}/settle",
+            json={"winning_option_ids": [winning_option]},
+        )
+        if response.status_code != 202:
+            return response
+        worker = create_job_worker()
+        while await worker.run_once():
+            pass
+        job = await self.client.get(f"{API}/jobs/{response.json()['job_id']}")
+        body = expect(job, 200)
+        if body["status"] != JobStatusEnum.SUCCEEDED.value:
+            raise RuntimeError(f"정산 작업이 완료되지 않았습니다: {body['status']} {body.get('error')}")
+        print(f"  (정산 결과 {body['result']})")
+        return job
+
+    async def seed_bets(self, game_id: str, option_ids: List[str], count: int) -> None:
+        """정산 시나리오용 배팅/슬립 직접 적재"""
+        from sqlalchemy import insert
+
+        from src.infrastructure.database.connection import AsyncSessionLocal
+        from src.infrastructure.database.models import (
+            BetModel,
+            BetSlipModel,
+            BetStatusEnum,
+            BetSlipResultEnum,
+            BetTypeEnum,
+        )
+
+        user_ids = itertools.cycle([user["user_id"] for user in self.users])
+        odds = Decimal("2.00")
+        amount = Decimal("1000.00")
+        async with AsyncSessionLocal() as session:
+            for offset in range(0, count, SEED_BATCH_SIZE):
+                bets, slips = [], []
+                for index in range(offset, min(count, offset + SEED_BATCH_SIZE)):
+                    bet_id = str(uuid.uuid4())
+                    bets.append({
+                        "id": bet_id,
+                        "user_id": next(user_ids),
+                        "bet_type": BetTypeEnum.SINGLE,
+                        "total_amount": amount,
+                        "potential_return": amount * odds,
+                        "total_odds": odds,
+                        "status": BetStatusEnum.PENDING,
+                    })
+                    slips.append({
+                        "id": str(uuid.uuid4()),
+                        "bet_id": bet_id,
+                        "game_id": game_id,
+                        "option_id": option_ids[index % len(option_ids)],
+                        "odds": odds,
+                        "result": BetSlipResultEnum.PENDING,
+                    })
+                await session.execute(insert(BetModel), bets)
+                await session.execute(insert(BetSlipModel), slips)
+            await session.commit()
+
+
+def compare(current: Dict[str, dict], baseline_path: Path) -> None:
+    """기준 결과 대비 변화 출력"""
+    baseline = json.loads(baseline_path.read_text())["scenarios"]
+    print(f"\n[compare] 기준: {baseline_path}")
+    print(f"  {'scenario':<12} " + " ".join(f"{key:>24}" for key in COMPARE_KEYS))
+    for name, summary in current.items():
+        if name not in baseline:
+            continue
+        cells = []
+        for key in COMPARE_KEYS:
+            before, after = baseline[name][key], summary[key]
+            change = f"{(after - before) / before * 100:+.0f}%" if before else "n/a"
+            cells.append(f"{before:>9} → {after:<9} {change:>4}")
+        print(f"  {name:<12} " + " ".join(f"{cell:>24}" for cell in cells))
+
+
+async def run(args: argparse.Namespace) -> Dict[str, dict]:
+    import httpx
+    from sqlalchemy import event
+
+    from src.infrastructure.database.connection import engine
+    from src.main import app
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+
+    install_fake_redis()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            load_test = LoadTest(client, args)
+            await load_test.setup_catalog()
+            print(f"\n[load test] users={args.users} games={args.games} concurrency={args.concurrency}")
+            await load_test.scenario_auth()
+            await load_test.scenario_browse()
+            await load_test.scenario_bets()
+            await load_test.scenario_settle()
+
+    return {result.name: result.summary() for result in load_test.results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="로컬 E2E 부하 테스트")
+    parser.add_argument("--users", type=int, default=30, help="회원가입/로그인 사용자 수")
+    parser.add_argument("--games", type=int, default=40, help="조회/배팅 대상 게임 수")
+    parser.add_argument("--browse-requests", type=int, default=1000, help="조회 요청 수")
+    parser.add_argument("--bets", type=int, default=300, help="단일/조합 배팅 요청 수 (각각)")
+    parser.add_argument("--settle-bets", type=int, default=50000, help="정산 게임에 걸린 배팅 수 (0이면 생략)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--bcrypt-rounds", type=int, help="BCRYPT_ROUNDS 재정의 (기본: 설정값)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--db-path", help="sqlite 파일 경로 (기본: 임시 파일)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 기준 결과 JSON")
+    args = parser.parse_args()
+
+    # 사용자 등록/로그인이 모두 같은 IP에서 오므로 속도 제한은 끄고 측정
+    # 보고서 집계는 sqlite 파일 전체를 잠그므로 측정 중에는 돌리지 않음
+    # 정산 작업은 settle 시나리오가 측정 구간 안에서 직접 처리하므로 내장 작업 워커는 끔
+    overrides = {"RATE_LIMIT_ENABLED": "false", "ROLLUP_INTERVAL_SECONDS": "0", "JOB_WORKER_EMBEDDED": "false"}
+    if args.bcrypt_rounds:
+        overrides["BCRYPT_ROUNDS"] = args.bcrypt_rounds
+    configure_environment(args.db_path, **overrides)
+    upgrade_schema()
+
+    scenarios = asyncio.run(run(args))
+
+    if args.output:
+        config = {key: value for key, value in vars(args).items() if key not in ("output", "compare")}
+        args.output.write_text(json.dumps({"config": config, "scenarios": scenarios}, indent=2, default=str) + "\n")
+        print(f"\n결과 저장: {args.output}")
+    if args.compare:
+        compare(scenarios, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
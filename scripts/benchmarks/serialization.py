@@ -0,0 +1,112 @@
+"""응답 직렬화 마이크로 벤치마크
+
+게임 목록 한 페이지(기본 100개)를 응답 바이트로 만드는 비용을 경로별로 측정합니다.
+
+- pydantic: GameResponse.model_validate → GameListResponse → response_model 재검증
+  (fastapi.routing.serialize_response) → json.dumps (이전 엔드포인트 경로)
+- orjson: GameDTO를 그대로 src.presentation.responses.dumps (trusted_response 경로)
+
+    python -m scripts.benchmarks.serialization
+    python -m scripts.benchmarks.serialization --items 100 --runs 2000
+
+두 경로의 출력 바이트가 다르면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.application.game.dto import GameDTO
+from src.presentation.responses import dumps
+from src.presentation.schemas.common import PaginationInfo
+from src.presentation.schemas.game import GameListResponse, GameResponse
+
+RESPONSE_FIELD = create_response_field(name="Response_get_games", type_=GameListResponse, mode="serialization")
+
+
+def make_page(items: int) -> list:
+    """게임 DTO 목록 (DB에서 읽은 값과 같은 타입)"""
+    start = datetime(2026, 10, 20, 19, 30)
+    return [
+        GameDTO(
+            game_id=str(uuid.uuid4()),
+            league_id=str(uuid.uuid4()),
+            home_team=f"홈팀 {i}",
+            away_team=f"원정팀 {i}",
+            start_time=start + timedelta(minutes=i),
+            betting_deadline=start + timedelta(minutes=i - 5),
+            sport_type="축구",
+            status="예정",
+            is_live=False,
+            final_score_home=None,
+            final_score_away=None,
+            created_at=start - timedelta(days=1, microseconds=i),
+            updated_at=start - timedelta(hours=1, microseconds=i),
+        )
+        for i in range(items)
+    ]
+
+
+def pagination(items: int) -> dict:
+    return {"total": items * 10, "page": 1, "size": items, "total_pages": 10}
+
+
+def render_pydantic(dtos: list) -> bytes:
+    """이전 경로: 스키마 변환 → response_model 재검증 → json.dumps"""
+    content = GameListResponse(
+        items=[GameResponse.model_validate(dto) for dto in dtos],
+        pagination=PaginationInfo(**pagination(len(dtos))),
+    )
+    data = asyncio.run(serialize_response(field=RESPONSE_FIELD, response_content=content))
+    # starlette JSONResponse.render와 같은 옵션
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def render_orjson(dtos: list) -> bytes:
+    """trusted_response 경로"""
+    return dumps({"items": dtos, "pagination": pagination(len(dtos))})
+
+
+def measure(render, dtos: list, runs: int) -> float:
+    """1회당 중앙값 (마이크로초)"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        render(dtos)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100, help="페이지당 게임 수")
+    parser.add_argument("--runs", type=int, default=500, help="경로별 반복 횟수")
+    args = parser.parse_args()
+
+    dtos = make_page(args.items)
+    if render_pydantic(dtos) != render_orjson(dtos):
+        print("두 경로의 응답 바이트가 다릅니다.", file=sys.stderr)
+        return 1
+
+    # serialize_response는 코루틴이므로 이벤트 루프 생성 비용을 빼고 비교
+    loop_us = measure(lambda _: asyncio.run(asyncio.sleep(0)), dtos, args.runs)
+    pydantic_us = measure(render_pydantic, dtos, args.runs) - loop_us
+    orjson_us = measure(render_orjson, dtos, args.runs)
+
+    print(f"게임 {args.items}개 페이지, {args.runs}회 중앙값")
+    print(f"{'경로':<10}{'페이지(us)':>14}{'항목당(us)':>14}")
+    for name, value in (("pydantic", pydantic_us), ("orjson", orjson_us)):
+        print(f"{name:<10}{value:>14.1f}{value / args.items:>14.2f}")
+    print(f"속도 향상: {pydantic_us / orjson_us:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
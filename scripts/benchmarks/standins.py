@@ -0,0 +1,49 @@
+"""로컬 벤치마크용 MySQL/Redis 대체 환경 (sqlite+aiosqlite, fakeredis)
+
+src 모듈을 import 하기 전에 configure_environment()를 호출해야 합니다.
+(src.config.settings는 import 시점의 환경 변수를 읽습니다)
+"""
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def configure_environment(db_path: Optional[str] = None, **overrides) -> str:
+    """벤치마크용 환경 변수 설정
+
+    Args:
+        db_path: sqlite 파일 경로 (없으면 임시 디렉토리에 생성)
+        overrides: 추가로 설정할 환경 변수
+
+    Returns:
+        str: 사용한 sqlite 파일 경로
+    """
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix="betting_bench_"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+    os.environ.setdefault("DEBUG", "false")
+    for key, value in overrides.items():
+        os.environ[key] = str(value)
+    return db_path
+
+
+def upgrade_schema() -> None:
+    """Alembic 마이그레이션을 head까지 적용 (이벤트 루프 밖에서 호출)"""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    command.upgrade(config, "head")
+
+
+def install_fake_redis() -> None:
+    """redis_client 싱글톤을 fakeredis로 교체 (같은 이벤트 루프 안에서 호출)"""
+    from fakeredis import aioredis as fake_aioredis
+
+    from src.infrastructure.cache.redis_client import redis_client
+
+    redis_client.redis = fake_aioredis.FakeRedis(decode_responses=True)
@@ -0,0 +1,90 @@
+"""워커 시작 시간 벤치마크
+
+새 파이썬 프로세스에서 `src.main:app`을 import 하고 lifespan startup을 완료하기까지의
+시간을 반복 측정합니다. 마이그레이션이 적용된 sqlite DB를 MySQL 대신 사용합니다.
+
+    python -m scripts.benchmarks.startup_time --runs 10 --budget-ms 1000
+    python -m scripts.benchmarks.startup_time --prewarm 5
+
+중앙값이 --budget-ms를 넘으면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from scripts.benchmarks.standins import PROJECT_ROOT, configure_environment, upgrade_schema
+
+# 자식 프로세스에서 실행되는 측정 코드
+CHILD_CODE = """
+import asyncio, json, time
+t0 = time.perf_counter()
+from src.main import app
+t1 = time.perf_counter()
+
+async def main():
+    async with app.router.lifespan_context(app):
+        t2 = time.perf_counter()
+    print(json.dumps({"import_ms": (t1 - t0) * 1000, "lifespan_ms": (t2 - t1) * 1000}))
+
+asyncio.run(main())
+"""
+
+
+def run_once(env: dict) -> dict:
+    """자식 프로세스 1회 실행"""
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["ready_ms"] = result["import_ms"] + result["lifespan_ms"]
+    result["wall_ms"] = wall_ms
+    return result
+
+
+def summarize(samples: list, key: str) -> dict:
+    values = sorted(s[key] for s in samples)
+    return {
+        "median": statistics.median(values),
+        "min": values[0],
+        "max": values[-1],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="워커 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=10, help="측정 횟수")
+    parser.add_argument("--prewarm", type=int, default=0, help="DB_POOL_PREWARM 값")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="ready_ms 중앙값 허용치")
+    args = parser.parse_args()
+
+    configure_environment(DB_POOL_PREWARM=args.prewarm)
+    upgrade_schema()
+    env = dict(os.environ)
+
+    run_once(env)  # 바이트코드 캐시 생성용 워밍업
+    samples = [run_once(env) for _ in range(args.runs)]
+
+    report = {key: summarize(samples, key) for key in ("import_ms", "lifespan_ms", "ready_ms", "wall_ms")}
+    print(f"{'metric':<12} {'median':>10} {'min':>10} {'max':>10}")
+    for key, stats in report.items():
+        print(f"{key:<12} {stats['median']:>10.1f} {stats['min']:>10.1f} {stats['max']:>10.1f}")
+
+    if report["ready_ms"]["median"] > args.budget_ms:
+        print(f"FAIL: ready_ms 중앙값 {report['ready_ms']['median']:.1f}ms > {args.budget_ms:.0f}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
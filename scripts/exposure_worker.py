@@ -0,0 +1,56 @@
+"""노출 집계 대조 워커
+
+    python -m scripts.exposure_worker           # EXPOSURE_RECONCILE_INTERVAL_SECONDS마다 계속 대조
+    python -m scripts.exposure_worker --once    # 한 번 대조하고 종료 (cron용)
+
+API 서버의 내장 대조를 끄면(BACKGROUND_TASKS_EMBEDDED=false, 이미지 기본값) 이 워커를 하나 띄웁니다.
+정산이 끝난 게임은 정산 작업이 바로 대조하므로, 주기 대조는 커밋에 실패한 배팅의 노출 정리용입니다.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from src.config import settings
+from src.infrastructure.cache.redis_client import redis_client
+from src.infrastructure.database.connection import close_db
+from src.infrastructure.jobs.exposure import ExposureReconciler, reconcile_exposure
+
+
+async def run(once: bool) -> int:
+    try:
+        if once:
+            games = await reconcile_exposure()
+            print(f"노출이 있는 게임 수: {games}")
+            return 0
+
+        reconciler = ExposureReconciler()
+        reconciler.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await reconciler.stop()
+        return 0
+    finally:
+        await close_db()
+        await redis_client.disconnect()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="노출 집계 대조")
+    parser.add_argument("--once", action="store_true", help="한 번 대조하고 종료")
+    args = parser.parse_args()
+    if not settings.EXPOSURE_TRACKING_ENABLED:
+        parser.error("EXPOSURE_TRACKING_ENABLED가 꺼져 있으면 대조할 노출이 없습니다.")
+    if not args.once and settings.EXPOSURE_RECONCILE_INTERVAL_SECONDS <= 0:
+        parser.error("EXPOSURE_RECONCILE_INTERVAL_SECONDS가 0이면 --once로 실행하세요.")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        return asyncio.run(run(args.once))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""로컬 개발/부하 확인용 가짜 스포츠 피드 서버
+
+SportsAPIClient가 사용하는 피드 API를 메모리 상태로 흉내 냅니다.
+ETag/Last-Modified 조건부 요청(304)을 지원하고, 주기적으로 일부 배당과 경기 상태를 바꿉니다.
+
+    python -m scripts.fake_sports_feed --leagues epl=2000,kbo=500 --tick-seconds 5 --change-rate 0.02
+    SPORTS_FEED_LEAGUES=epl=<league_id>,kbo=<league_id> python -m scripts.sports_feed_worker
+
+`create_app()`은 httpx.ASGITransport에 바로 연결해 프로세스 안에서도 사용할 수 있습니다.
+"""
+import argparse
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+
+OPTION_TEMPLATES = [
+    ("WIN_DRAW_LOSS", "홈팀 승", None, None),
+    ("WIN_DRAW_LOSS", "무승부", None, None),
+    ("WIN_DRAW_LOSS", "원정팀 승", None, None),
+    ("HANDICAP", "홈팀 -1.5", Decimal("-1.5"), None),
+    ("HANDICAP", "원정팀 +1.5", Decimal("1.5"), None),
+    ("OVER_UNDER", "오버 2.5", None, Decimal("2.5")),
+    ("OVER_UNDER", "언더 2.5", None, Decimal("2.5")),
+    ("WINNER_PREDICTION", "홈팀", None, None),
+    ("WINNER_PREDICTION", "원정팀", None, None),
+    ("OVER_UNDER", "오버 3.5", None, Decimal("3.5")),
+]
+
+
+class FakeSportsFeed:
+    """리그별 경기/배당 메모리 상태"""
+
+    def __init__(self, leagues: Dict[str, int], options_per_game: int = 5, seed: int = 42):
+        self.random = random.Random(seed)
+        self.fixtures: Dict[str, List[Dict[str, Any]]] = {}
+        self.odds: Dict[str, List[Dict[str, Any]]] = {}
+        # (리그 키, 엔드포인트) → (버전, 마지막 변경 시각)
+        self.versions: Dict[tuple, tuple] = {}
+        base = datetime.utcnow().replace(microsecond=0) + timedelta(days=1)
+        for league_key, games in leagues.items():
+            fixtures = []
+            odds = []
+            for index in range(games):
+                external_id = f"{league_key}-{index:06d}"
+                start_time = base + timedelta(minutes=15 * index)
+                fixtures.append({
+                    "external_id": external_id,
+                    "sport_type": "SOCCER",
+                    "home_team": f"{league_key.upper()} 홈 {index}",
+                    "away_team": f"{league_key.upper()} 원정 {index}",
+                    "start_time": start_time.isoformat() + "Z",
+                    "betting_deadline": (start_time - timedelta(minutes=5)).isoformat() + "Z",
+                    "status": "SCHEDULED",
+                    "home_score": None,
+                    "away_score": None,
+                })
+                for option_type, option_name, handicap_value, over_under_line in OPTION_TEMPLATES[:options_per_game]:
+                    odds.append({
+                        "game_external_id": external_id,
+                        "option_type": option_type,
+                        "option_name": option_name,
+                        "odds": Decimal(self.random.randint(110, 600)) / 100,
+                        "handicap_value": handicap_value,
+                        "over_under_line": over_under_line,
+                    })
+            self.fixtures[league_key] = fixtures
+            self.odds[league_key] = odds
+            self._bump(league_key, "fixtures")
+            self._bump(league_key, "odds")
+
+    def _bump(self, league_key: str, endpoint: str) -> None:
+        version, _ = self.versions.get((league_key, endpoint), (0, None))
+        self.versions[(league_key, endpoint)] = (version + 1, datetime.utcnow())
+
+    def tick(self, change_rate: float) -> int:
+        """배당 일부와 경기 상태 일부 변경 (변경 항목 수 반환)"""
+        changes = 0
+        for league_key, odds in self.odds.items():
+            count = int(len(odds) * change_rate)
+            for item in self.random.sample(odds, count):
+                item["odds"] = max(Decimal("1.01"), item["odds"] + Decimal(self.random.choice((-5, -2, 2, 5))) / 100)
+            if count:
+                self._bump(league_key, "odds")
+                changes += count
+        for league_key, fixtures in self.fixtures.items():
+            count = max(1, int(len(fixtures) * change_rate / 10)) if fixtures else 0
+            for fixture in self.random.sample(fixtures, count):
+                if fixture["status"] == "SCHEDULED":
+                    fixture.update(status="LIVE", home_score=0, away_score=0)
+                elif fixture["status"] == "LIVE":
+                    side = self.random.choice(("home_score", "away_score"))
+                    fixture[side] += 1
+            if count:
+                self._bump(league_key, "fixtures")
+                changes += count
+        return changes
+
+    def respond(self, request: Request, league_key: str, endpoint: str, items: List[Dict[str, Any]]) -> Response:
+        """조건부 요청 처리 (If-None-Match가 있으면 If-Modified-Since보다 우선)"""
+        version, modified_at = self.versions[(league_key, endpoint)]
+        etag = f'W/"{league_key}-{endpoint}-{version}"'
+        last_modified = format_datetime(modified_at.replace(microsecond=0, tzinfo=timezone.utc), usegmt=True)
+        headers = {"ETag": etag, "Last-Modified": last_modified}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match == etag:
+                return Response(status_code=304, headers=headers)
+        elif request.headers.get("if-modified-since"):
+            try:
+                since = parsedate_to_datetime(request.headers["if-modified-since"])
+                if modified_at.replace(microsecond=0) <= since.astimezone(timezone.utc).replace(tzinfo=None):
+                    return Response(status_code=304, headers=headers)
+            except (TypeError, ValueError):
+                pass
+        return JSONResponse({"items": _jsonable(items)}, headers=headers)
+
+
+def _jsonable(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {key: (float(value) if isinstance(value, Decimal) else value) for key, value in item.items()}
+        for item in items
+    ]
+
+
+def create_app(
+    feed: FakeSportsFeed,
+    tick_seconds: float = 0.0,
+    change_rate: float = 0.02,
+    api_key: Optional[str] = None,
+) -> FastAPI:
+    """피드 서버 앱 (tick_seconds > 0이면 주기적으로 상태 변경)"""
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        task = None
+        if tick_seconds > 0:
+            async def ticker():
+                while True:
+                    await asyncio.sleep(tick_seconds)
+                    feed.tick(change_rate)
+
+            task = asyncio.create_task(ticker())
+        yield
+        if task is not None:
+            task.cancel()
+
+    app = FastAPI(title="Fake Sports Feed", lifespan=lifespan)
+
+    def authorize(request: Request) -> None:
+        if api_key and request.headers.get("x-api-key") != api_key:
+            raise HTTPException(status_code=401, detail="invalid api key")
+
+    def league_items(store: Dict[str, List[Dict[str, Any]]], league_key: str) -> List[Dict[str, Any]]:
+        if league_key not in store:
+            raise HTTPException(status_code=404, detail=f"unknown league: {league_key}")
+        return store[league_key]
+
+    @app.get("/leagues/{league_key}/fixtures")
+    async def fixtures(league_key: str, request: Request) -> Response:
+        authorize(request)
+        return feed.respond(request, league_key, "fixtures", league_items(feed.fixtures, league_key))
+
+    @app.get("/leagues/{league_key}/odds")
+    async def odds(league_key: str, request: Request) -> Response:
+        authorize(request)
+        return feed.respond(request, league_key, "odds", league_items(feed.odds, league_key))
+
+    @app.post("/_tick")
+    async def tick(rate: float = change_rate) -> Dict[str, int]:
+        return {"changes": feed.tick(rate)}
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="가짜 스포츠 피드 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--leagues", default="epl=500", help="리그 키=경기 수, 쉼표 구분")
+    parser.add_argument("--options", type=int, default=5, help="경기당 배팅 옵션 수 (최대 10)")
+    parser.add_argument("--tick-seconds", type=float, default=5.0, help="상태 변경 주기 (0이면 POST /_tick으로만 변경)")
+    parser.add_argument("--change-rate", type=float, default=0.02, help="주기마다 바뀌는 배당 비율")
+    parser.add_argument("--api-key", help="지정 시 X-API-Key 헤더 검사")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    leagues = {}
+    for entry in args.leagues.split(","):
+        league_key, _, games = entry.partition("=")
+        leagues[league_key.strip()] = int(games or 100)
+
+    feed = FakeSportsFeed(leagues, options_per_game=args.options, seed=args.seed)
+    app = create_app(feed, args.tick_seconds, args.change_rate, args.api_key)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""픽스처(게임 + 배팅 옵션) 일괄 임포트 CLI
+
+POST /games/import와 같은 검증/upsert 로직을 HTTP 없이 DB에 직접 실행합니다.
+
+    python -m scripts.import_fixtures fixtures/2026-w43.ndjson
+    python -m scripts.import_fixtures fixtures/2026-w43.csv --dry-run
+    python -m scripts.import_fixtures fixtures.txt --format csv --report report.json
+
+오류가 있는 게임은 제외하고 나머지를 한 트랜잭션으로 기록하며,
+오류가 하나라도 있으면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from src.application.game.dto import ImportResultDTO
+from src.application.game.fixture_import import FIXTURE_FORMATS, detect_format
+from src.application.game.use_cases import FixtureImportUseCase
+from src.infrastructure.database.connection import AsyncSessionLocal, close_db
+from src.infrastructure.database.repositories.betting_repository import BettingOptionRepositoryImpl
+from src.infrastructure.database.repositories.game_repository import GameRepositoryImpl
+from src.infrastructure.database.repositories.league_repository import SQLAlchemyLeagueRepository
+
+
+async def run(path: Path, fmt: str, dry_run: bool) -> ImportResultDTO:
+    """파일 임포트 (dry_run이 아니면 커밋)"""
+    text = path.read_text(encoding="utf-8-sig")
+    try:
+        async with AsyncSessionLocal() as session:
+            use_case = FixtureImportUseCase(
+                GameRepositoryImpl(session),
+                BettingOptionRepositoryImpl(session),
+                SQLAlchemyLeagueRepository(session),
+            )
+            result = await use_case.execute(text, fmt, dry_run=dry_run)
+            if not dry_run:
+                await session.commit()
+        return result
+    finally:
+        await close_db()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="게임/배팅 옵션 일괄 임포트")
+    parser.add_argument("path", type=Path, help="NDJSON 또는 CSV 파일")
+    parser.add_argument("--format", choices=FIXTURE_FORMATS, help="파일 형식 (생략 시 확장자로 판단)")
+    parser.add_argument("--dry-run", action="store_true", help="검증만 수행하고 저장하지 않음")
+    parser.add_argument("--report", type=Path, help="행별 오류 보고서를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    fmt = args.format or detect_format(args.path.name, None)
+    if fmt is None:
+        parser.error("파일 형식을 알 수 없습니다. --format을 지정하세요.")
+
+    try:
+        result = asyncio.run(run(args.path, fmt, args.dry_run))
+    except ValueError as e:
+        print(f"임포트 실패: {e}", file=sys.stderr)
+        return 2
+
+    report = asdict(result)
+    if args.report:
+        args.report.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    mode = "검증" if result.dry_run else "임포트"
+    print(
+        f"{mode} 완료: 게임 {result.total_games}개 중 {result.imported_games}개 기록, "
+        f"배팅 옵션 {result.imported_options}개 기록, 실패 {result.failed_games}개"
+    )
+    for error in result.errors[:20]:
+        location = f"{error.row}행" + (f" [{error.external_id}]" if error.external_id else "")
+        print(f"  {location} {error.field or ''}: {error.message}")
+    if len(result.errors) > 20:
+        print(f"  ... 외 {len(result.errors) - 20}건 (--report로 전체 확인)")
+    return 1 if result.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,7 @@ CREATE DATABASE IF NOT EXISTS betting_db CHARACTER SET utf8mb4 COLLATE utf8mb4_u
 
 USE betting_db;
 
--- 테이블들은 추후 Alembic 마이그레이션으로 생성할 예정
+-- 테이블은 Alembic 마이그레이션으로 생성 (docker-compose의 migrate 서비스)
 -- 여기서는 기본적인 DB 설정만 수행
 
 -- 타임존 설정
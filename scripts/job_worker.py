@@ -0,0 +1,80 @@
+"""백그라운드 작업(정산 등) 워커 실행
+
+    python -m scripts.job_worker                     # JOB_WORKER_CONCURRENCY개 태스크로 계속 폴링
+    python -m scripts.job_worker --concurrency 4
+    python -m scripts.job_worker --processes 4       # 프로세스 4개 x 태스크 JOB_WORKER_CONCURRENCY개
+    python -m scripts.job_worker --drain             # 실행 가능한 작업을 모두 처리하고 종료
+
+운영은 API 프로세스의 내장 워커를 끄므로(BACKGROUND_TASKS_EMBEDDED=false, 이미지 기본값) 이 프로세스를 따로 띄웁니다.
+여러 프로세스를 띄워도 SKIP LOCKED로 작업을 나눠 가집니다. 대형 경기 정산은 배팅 ID 범위별 하위
+작업으로 나뉘므로, 프로세스마다 자기 커넥션 풀로 샤드를 동시에 정산해 코어 수만큼 처리량이 늘어납니다.
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import sys
+
+from src.infrastructure.database.connection import close_db
+from src.infrastructure.jobs.worker import create_job_worker
+
+
+async def run(concurrency: int, drain: bool) -> int:
+    worker = create_job_worker(concurrency)
+    try:
+        if drain:
+            count = await worker.drain()
+            print(f"작업 {count}개 실행")
+            return 0
+        await worker.run()
+        return 0
+    finally:
+        await close_db()
+
+
+def _process_main(concurrency: int, drain: bool) -> None:
+    """워커 프로세스 진입점 (spawn으로 시작해 엔진/커넥션 풀을 프로세스마다 새로 생성)"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(levelname)s %(name)s: %(message)s")
+    try:
+        sys.exit(asyncio.run(run(concurrency, drain)))
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
+def run_processes(processes: int, concurrency: int, drain: bool) -> int:
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=_process_main, args=(concurrency, drain), name=f"job-worker-{index}")
+        for index in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        # Ctrl+C는 자식 프로세스에도 전달되므로 종료를 기다림
+        for worker in workers:
+            worker.join()
+    return max((worker.exitcode or 0) for worker in workers)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="백그라운드 작업 워커")
+    parser.add_argument("--concurrency", type=int, default=0, help="동시 실행 작업 수 (기본: JOB_WORKER_CONCURRENCY)")
+    parser.add_argument("--processes", type=int, default=1, help="워커 프로세스 수")
+    parser.add_argument("--drain", action="store_true", help="실행 가능한 작업을 모두 처리하고 종료")
+    args = parser.parse_args()
+
+    if args.processes > 1:
+        return run_processes(args.processes, args.concurrency, args.drain)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        return asyncio.run(run(args.concurrency, args.drain))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""사용자 배팅 통계(user_bet_stats) 재계산
+
+    python -m scripts.rebuild_bet_stats                        # 배팅한 모든 사용자
+    python -m scripts.rebuild_bet_stats --user-id <id> --user-id <id>
+    python -m scripts.rebuild_bet_stats --batch-size 200
+
+배팅 내역(MySQL은 아카이브 테이블 포함)으로 통계를 처음부터 다시 계산해 교체합니다.
+마이그레이션 직후 기존 배팅을 채우거나, 증분 갱신과 어긋난 통계를 바로잡을 때 사용합니다.
+사용자 배치마다 통계 행을 잠그고 한 트랜잭션으로 교체하므로 서비스 중에 실행할 수 있습니다.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import List, Optional
+
+from src.infrastructure.database.connection import AsyncSessionLocal, close_db
+from src.infrastructure.database.repositories.betting_repository import UserBetStatsRepositoryImpl
+
+
+async def run(user_ids: Optional[List[str]], batch_size: int) -> int:
+    started = time.perf_counter()
+    rebuilt = 0
+    try:
+        if user_ids:
+            async with AsyncSessionLocal() as session:
+                rebuilt = await UserBetStatsRepositoryImpl(session).rebuild(user_ids)
+                await session.commit()
+        else:
+            after = None
+            while True:
+                async with AsyncSessionLocal() as session:
+                    repository = UserBetStatsRepositoryImpl(session)
+                    batch = await repository.list_bettor_ids(after, batch_size)
+                    if not batch:
+                        break
+                    rebuilt += await repository.rebuild(batch)
+                    await session.commit()
+                after = batch[-1]
+                print(f"사용자 {rebuilt}명 재계산")
+    finally:
+        await close_db()
+    print(f"완료: 사용자 {rebuilt}명 ({time.perf_counter() - started:.1f}s)")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="사용자 배팅 통계 재계산")
+    parser.add_argument("--user-id", action="append", dest="user_ids", help="재계산할 사용자 ID (여러 번 지정 가능)")
+    parser.add_argument("--batch-size", type=int, default=500, help="트랜잭션당 사용자 수")
+    args = parser.parse_args()
+    return asyncio.run(run(args.user_ids, args.batch_size))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""보고서 집계 테이블 갱신 워커
+
+    python -m scripts.rollup_worker                                    # ROLLUP_INTERVAL_SECONDS마다 계속 집계
+    python -m scripts.rollup_worker --once                             # 밀린 구간까지 한 번 집계 (cron용)
+    python -m scripts.rollup_worker --rebuild 2026-10-01 2026-10-19    # 날짜 범위 집계를 처음부터 다시 계산
+
+API 서버의 내장 집계를 끄면(BACKGROUND_TASKS_EMBEDDED=false, 이미지 기본값) 이 워커를 하나 띄웁니다.
+--rebuild는 집계 방식이 바뀌었거나 집계 테이블을 복구할 때 쓰며 진행 시각은 바꾸지 않습니다.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import date
+from typing import Optional, Tuple
+
+from src.config import settings
+from src.infrastructure.database.connection import close_db
+from src.infrastructure.jobs.rollup import RollupScheduler, rebuild_rollups, run_rollup
+
+
+async def run(once: bool, rebuild: Optional[Tuple[date, date]]) -> int:
+    try:
+        if rebuild is not None:
+            days = await rebuild_rollups(*rebuild)
+            print(f"다시 계산한 일 수: {days}")
+            return 0
+        if once:
+            result = await run_rollup()
+            print(f"집계한 시간 수: {result.hours}, 반영 시각: {result.watermark}")
+            return 0
+
+        scheduler = RollupScheduler()
+        scheduler.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await scheduler.stop()
+        return 0
+    finally:
+        await close_db()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="보고서 집계 테이블 갱신")
+    parser.add_argument("--once", action="store_true", help="밀린 구간까지 한 번 집계하고 종료")
+    parser.add_argument(
+        "--rebuild", nargs=2, metavar=("START", "END"), type=date.fromisoformat,
+        help="START ~ END 날짜(UTC, 포함)의 집계를 처음부터 다시 계산",
+    )
+    args = parser.parse_args()
+    if args.rebuild is None and not args.once and settings.ROLLUP_INTERVAL_SECONDS <= 0:
+        parser.error("ROLLUP_INTERVAL_SECONDS가 0이면 --once 또는 --rebuild로 실행하세요.")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    rebuild = tuple(args.rebuild) if args.rebuild else None
+    try:
+        return asyncio.run(run(args.once, rebuild))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
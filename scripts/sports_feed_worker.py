@@ -0,0 +1,58 @@
+"""스포츠 피드 수집 워커 실행
+
+    python -m scripts.sports_feed_worker            # SPORTS_FEED_INTERVAL_SECONDS마다 수집
+    python -m scripts.sports_feed_worker --once     # 한 번만 동기화하고 결과 출력
+
+리그 매핑은 SPORTS_FEED_LEAGUES(예: epl=<league_id>,kbo=<league_id>)로 지정합니다.
+로컬에서는 scripts/fake_sports_feed.py를 피드 서버로 사용할 수 있습니다.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from dataclasses import asdict
+
+from src.config import settings
+from src.infrastructure.database.connection import close_db
+from src.infrastructure.external.feed_worker import SportsFeedWorker, parse_league_map
+from src.infrastructure.external.sports_api import SportsAPIClient, SportsAPIError
+
+
+async def run(once: bool) -> int:
+    leagues = parse_league_map(settings.SPORTS_FEED_LEAGUES)
+    if not leagues:
+        print("SPORTS_FEED_LEAGUES가 비어 있습니다 (예: epl=<league_id>)", file=sys.stderr)
+        return 2
+
+    worker = SportsFeedWorker(SportsAPIClient(), leagues)
+    try:
+        if once:
+            try:
+                results = await worker.sync_once()
+            except SportsAPIError as e:
+                print(f"동기화 실패: {e}", file=sys.stderr)
+                return 1
+            for league_key, result in results.items():
+                print(league_key, asdict(result))
+            return 0 if len(results) == len(leagues) else 1
+        await worker.run()
+        return 0
+    finally:
+        await worker.stop()
+        await close_db()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="스포츠 피드 수집 워커")
+    parser.add_argument("--once", action="store_true", help="한 번만 동기화")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        return asyncio.run(run(args.once))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
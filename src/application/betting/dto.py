@@ -1,5 +1,6 @@
 """Betting DTOs"""
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List
 
@@ -73,3 +74,54 @@ class BetDTO:
     total_odds: Decimal
     status: str
     slips: List[BetSlipDTO]
+
+
+@dataclass
+class UserBetStatsDTO:
+    """사용자 배팅 통계 DTO"""
+    user_id: str
+    bets_placed: int
+    bets_pending: int
+    bets_won: int
+    bets_lost: int
+    bets_cancelled: int
+    total_staked: Decimal
+    total_returned: Decimal
+    net_profit: Decimal
+    # 적중 / (적중 + 미적중), 순손익 / 결과가 확정된 배팅 금액 (확정된 배팅이 없으면 None)
+    win_rate: Optional[Decimal]
+    roi: Optional[Decimal]
+    current_streak: int
+    longest_win_streak: int
+    longest_loss_streak: int
+    last_bet_at: Optional[datetime]
+
+
+@dataclass
+class OptionExposureDTO:
+    """옵션 노출 DTO"""
+    option_id: str
+    stake: Decimal
+    payout: Decimal
+    bets: int
+
+
+@dataclass
+class GameExposureDTO:
+    """게임 노출 DTO"""
+    game_id: str
+    stake: Decimal
+    payout: Decimal
+    max_option_payout: Decimal
+    bets: int
+    options: List[OptionExposureDTO]
+
+
+@dataclass
+class LeagueExposureDTO:
+    """리그 노출 DTO (노출이 있는 게임만)"""
+    league_id: str
+    stake: Decimal
+    payout: Decimal
+    bets: int
+    games: List[GameExposureDTO]
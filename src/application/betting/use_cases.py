@@ -1,9 +1,21 @@
 """Betting Use Cases"""
+from decimal import Decimal
 from typing import List, Optional
 
 from src.domain.betting.entity import BettingOption
-from src.domain.betting.repository import BettingOptionRepository, BetRepository
-from src.domain.betting.service import BettingService
+from src.domain.betting.exposure import GameExposure
+from src.domain.betting.repository import (
+    BettingOptionRepository,
+    BetRepository,
+    ExposureRepository,
+    UserBetStatsRepository,
+)
+from src.domain.betting.service import BettingService, ExposureService
+from src.domain.betting.stats import UserBetStats
+from src.domain.common.exceptions import ExposureLimitExceededException
+from src.config import settings
+from src.infrastructure.database.partitioning import history_start
+from src.infrastructure.monitoring.metrics import BETS_PLACED_TOTAL, BET_AMOUNT_TOTAL, BETS_REJECTED_EXPOSURE_TOTAL
 from .dto import (
     BettingOptionDTO,
     CreateBettingOptionDTO,
@@ -11,6 +23,10 @@ from .dto import (
     PlaceBetRequestDTO,
     BetDTO,
     BetSlipDTO,
+    UserBetStatsDTO,
+    OptionExposureDTO,
+    GameExposureDTO,
+    LeagueExposureDTO,
 )
 
 
@@ -82,20 +98,49 @@ class BettingUseCases:
         self,
         betting_service: BettingService,
         bet_repository: BetRepository,
+        bet_stats_repository: Optional[UserBetStatsRepository] = None,
     ):
         self.betting_service = betting_service
         self.bet_repository = bet_repository
+        self.bet_stats_repository = bet_stats_repository
 
     async def place_bet(self, user_id: str, request_dto: PlaceBetRequestDTO) -> BetDTO:
         """배팅하기"""
-        bet = await self.betting_service.place_bet(user_id, request_dto)
+        try:
+            bet = await self.betting_service.place_bet(user_id, request_dto)
+        except ExposureLimitExceededException:
+            BETS_REJECTED_EXPOSURE_TOTAL.labels(request_dto.bet_type.value).inc()
+            raise
+        BETS_PLACED_TOTAL.labels(bet.bet_type.value).inc()
+        BET_AMOUNT_TOTAL.labels(bet.bet_type.value).inc(float(bet.total_amount))
         return self._to_bet_dto(bet)
     
     async def get_my_bets(self, user_id: str) -> List[BetDTO]:
-        """내 배팅 내역 조회"""
-        bets = await self.bet_repository.find_by_user_id(user_id)
+        """내 배팅 내역 조회 (BET_HISTORY_MONTHS를 두면 이번 달과 이전 N개월 + 대기 중인 배팅)"""
+        bets = await self.bet_repository.find_by_user_id(user_id, since=history_start(settings.BET_HISTORY_MONTHS))
         return [self._to_bet_dto(bet) for bet in bets]
 
+    async def get_bet_stats(self, user_id: str) -> UserBetStatsDTO:
+        """사용자 배팅 통계 조회 (요약 테이블 기본 키 조회 1회, 배팅이 없으면 0)"""
+        stats = await self.bet_stats_repository.find_by_user_id(user_id) or UserBetStats(user_id=user_id)
+        return UserBetStatsDTO(
+            user_id=stats.user_id,
+            bets_placed=stats.bets_placed,
+            bets_pending=stats.bets_pending,
+            bets_won=stats.bets_won,
+            bets_lost=stats.bets_lost,
+            bets_cancelled=stats.bets_cancelled,
+            total_staked=stats.total_staked,
+            total_returned=stats.total_returned,
+            net_profit=stats.net_profit,
+            win_rate=stats.win_rate,
+            roi=stats.roi,
+            current_streak=stats.current_streak,
+            longest_win_streak=stats.longest_win_streak,
+            longest_loss_streak=stats.longest_loss_streak,
+            last_bet_at=stats.last_bet_at,
+        )
+
     def _to_bet_dto(self, bet) -> BetDTO:
         return BetDTO(
             bet_id=bet.id,
@@ -116,3 +161,58 @@ class BettingUseCases:
                 ) for slip in bet.slips
             ]
         )
+
+
+class ExposureUseCases:
+    """노출(책임) 조회 Use Cases"""
+
+    def __init__(
+        self,
+        exposure_repository: ExposureRepository,
+        exposure_service: ExposureService,
+    ):
+        self.exposure_repository = exposure_repository
+        self.exposure_service = exposure_service
+
+    async def get_game_exposure(self, game_id: str) -> GameExposureDTO:
+        """게임 노출 조회 (Redis 집계, DB 조회 없음)"""
+        exposures = await self.exposure_repository.find_by_game_ids([game_id])
+        return self._to_game_dto(exposures[0])
+
+    async def get_league_exposure(self, league_id: str) -> LeagueExposureDTO:
+        """리그 노출 조회 (Redis의 리그별 노출 게임 목록으로 게임별 집계 합산, DB 조회 없음)"""
+        exposures = [
+            exposure
+            for exposure in await self.exposure_repository.find_by_league_id(league_id)
+            if exposure.bets > 0
+        ]
+        exposures.sort(key=lambda exposure: exposure.max_option_payout, reverse=True)
+        return LeagueExposureDTO(
+            league_id=league_id,
+            stake=sum((exposure.stake for exposure in exposures), Decimal("0")),
+            payout=sum((exposure.payout for exposure in exposures), Decimal("0")),
+            bets=sum(exposure.bets for exposure in exposures),
+            games=[self._to_game_dto(exposure) for exposure in exposures],
+        )
+
+    async def reconcile(self, game_ids: Optional[List[str]] = None) -> int:
+        """DB와 즉시 대조 (노출이 있는 게임 수 반환)"""
+        return len(await self.exposure_service.reconcile(game_ids))
+
+    def _to_game_dto(self, exposure: GameExposure) -> GameExposureDTO:
+        options = sorted(exposure.options.values(), key=lambda option: option.payout, reverse=True)
+        return GameExposureDTO(
+            game_id=exposure.game_id,
+            stake=exposure.stake,
+            payout=exposure.payout,
+            max_option_payout=exposure.max_option_payout,
+            bets=exposure.bets,
+            options=[
+                OptionExposureDTO(
+                    option_id=option.option_id,
+                    stake=option.stake,
+                    payout=option.payout,
+                    bets=option.bets,
+                ) for option in options
+            ],
+        )
@@ -1,8 +1,10 @@
 """Game DTOs"""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional, List
 
+from src.domain.betting.enums import BettingOptionTypeEnum
 from src.domain.game.enums import GameStatusEnum, SportTypeEnum
 
 
@@ -65,5 +67,86 @@ class GameListDTO:
 
 @dataclass
 class SettleGameRequestDTO:
-    """게임 정산 요청 DTO"""
-    winning_option_ids: List[str]
+    """게임 정산 요청 DTO (winning_option_ids가 없으면 최종 스코어로 자동 판정)"""
+    winning_option_ids: Optional[List[str]] = None
+
+
+@dataclass
+class ImportOptionDTO:
+    """임포트할 배팅 옵션 DTO"""
+    option_type: BettingOptionTypeEnum
+    option_name: str
+    odds: Decimal
+    handicap_value: Optional[Decimal] = None
+    over_under_line: Optional[Decimal] = None
+
+
+@dataclass
+class ImportGameDTO:
+    """임포트할 게임 DTO (검증 완료)"""
+    row: int
+    external_id: str
+    league_id: str
+    home_team: str
+    away_team: str
+    start_time: datetime
+    betting_deadline: datetime
+    sport_type: SportTypeEnum
+    options: List[ImportOptionDTO] = field(default_factory=list)
+
+
+@dataclass
+class ImportRowErrorDTO:
+    """임포트 행 오류 DTO"""
+    row: int
+    external_id: Optional[str]
+    field: Optional[str]
+    message: str
+
+
+@dataclass
+class ImportResultDTO:
+    """임포트 결과 DTO"""
+    total_games: int
+    imported_games: int
+    imported_options: int
+    failed_games: int
+    dry_run: bool
+    errors: List[ImportRowErrorDTO]
+
+
+@dataclass
+class FeedFixtureDTO:
+    """외부 피드 경기 DTO (일정, 상태, 스코어)"""
+    external_id: str
+    home_team: str
+    away_team: str
+    start_time: datetime
+    betting_deadline: datetime
+    sport_type: SportTypeEnum
+    status: GameStatusEnum
+    home_score: Optional[int] = None
+    away_score: Optional[int] = None
+
+
+@dataclass
+class FeedOddsDTO:
+    """외부 피드 배당 DTO"""
+    game_external_id: str
+    option_type: BettingOptionTypeEnum
+    option_name: str
+    odds: Decimal
+    handicap_value: Optional[Decimal] = None
+    over_under_line: Optional[Decimal] = None
+
+
+@dataclass
+class FeedSyncResultDTO:
+    """피드 동기화 결과 DTO"""
+    created_games: int = 0
+    updated_games: int = 0
+    created_options: int = 0
+    updated_options: int = 0
+    deactivated_options: int = 0
+    # 종료/취소로 바뀌어 등록한 정산 작업 수
+    settlement_jobs: int = 0
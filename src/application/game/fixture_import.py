@@ -0,0 +1,274 @@
+"""픽스처(게임 + 배팅 옵션) 임포트 파일 파싱 및 검증
+
+NDJSON: 한 줄에 게임 하나, 배팅 옵션은 "options" 배열로 중첩
+    {"external_id": "epl-2026-w9-001", "league_id": "...", "sport_type": "축구",
+     "home_team": "아스널", "away_team": "첼시", "start_time": "2026-10-24T19:00:00",
+     "betting_deadline": "2026-10-24T18:55:00",
+     "options": [{"option_type": "승무패", "option_name": "홈팀 승", "odds": 1.85}]}
+
+CSV: 한 줄에 배팅 옵션 하나, 게임 컬럼은 같은 external_id의 행마다 반복
+    external_id,league_id,sport_type,home_team,away_team,start_time,betting_deadline,
+    option_type,option_name,odds,handicap_value,over_under_line
+
+모든 레코드를 한 번에 훑어 오류를 빠짐없이 모으고(첫 오류에서 멈추지 않음), 리그 존재 여부처럼
+DB가 필요한 검증은 호출 측에서 집합 단위 쿼리 한 번으로 처리합니다.
+배팅 옵션이 하나라도 잘못된 게임은 통째로 제외합니다 (일부 마켓만 열리는 것을 방지).
+"""
+import csv
+import io
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.domain.betting.enums import BettingOptionTypeEnum
+from src.domain.game.enums import SportTypeEnum
+from .dto import ImportGameDTO, ImportOptionDTO, ImportRowErrorDTO
+
+FIXTURE_FORMATS = ("ndjson", "csv")
+
+GAME_FIELDS = ("external_id", "league_id", "sport_type", "home_team", "away_team", "start_time", "betting_deadline")
+OPTION_FIELDS = ("option_type", "option_name", "odds", "handicap_value", "over_under_line")
+
+
+@dataclass
+class FixtureRecord:
+    """파싱된 게임 레코드 (검증 전)"""
+    row: int
+    fields: Dict[str, Any]
+    # (행 번호, 필드 접두사, 옵션 필드)
+    options: List[Tuple[int, str, Dict[str, Any]]] = field(default_factory=list)
+    # 파싱 단계에서 발견한 오류 (CSV 행 간 게임 정보 불일치 등)
+    errors: List[ImportRowErrorDTO] = field(default_factory=list)
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str]) -> Optional[str]:
+    """파일 이름/Content-Type으로 형식 추정"""
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    content_type = (content_type or "").lower()
+    if "csv" in content_type:
+        return "csv"
+    if "ndjson" in content_type or "jsonl" in content_type:
+        return "ndjson"
+    return None
+
+
+def parse_fixtures(text: str, fmt: str) -> Tuple[List[FixtureRecord], List[ImportRowErrorDTO]]:
+    """임포트 파일 파싱
+
+    Raises:
+        ValueError: 지원하지 않는 형식이거나 CSV 헤더에 필수 컬럼이 없는 경우
+    """
+    if fmt == "ndjson":
+        return _parse_ndjson(text)
+    if fmt == "csv":
+        return _parse_csv(text)
+    raise ValueError(f"지원하지 않는 임포트 형식입니다: {fmt} (사용 가능: {', '.join(FIXTURE_FORMATS)})")
+
+
+def _parse_ndjson(text: str) -> Tuple[List[FixtureRecord], List[ImportRowErrorDTO]]:
+    records: List[FixtureRecord] = []
+    errors: List[ImportRowErrorDTO] = []
+    for row, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            # 배당률 등을 float로 거치지 않도록 Decimal로 파싱
+            data = json.loads(line, parse_float=Decimal)
+        except json.JSONDecodeError as e:
+            errors.append(ImportRowErrorDTO(row=row, external_id=None, field=None, message=f"JSON 파싱 실패: {e.msg}"))
+            continue
+        if not isinstance(data, dict):
+            errors.append(ImportRowErrorDTO(row=row, external_id=None, field=None, message="한 줄에 JSON 객체 하나여야 합니다"))
+            continue
+        options = data.get("options") or []
+        if not isinstance(options, list):
+            errors.append(ImportRowErrorDTO(
+                row=row, external_id=_external_id(data), field="options", message="배열이어야 합니다",
+            ))
+            continue
+        records.append(FixtureRecord(
+            row=row,
+            fields={name: data.get(name) for name in GAME_FIELDS},
+            options=[
+                (row, f"options[{index}].", option if isinstance(option, dict) else {})
+                for index, option in enumerate(options)
+            ],
+        ))
+    return records, errors
+
+
+def _parse_csv(text: str) -> Tuple[List[FixtureRecord], List[ImportRowErrorDTO]]:
+    reader = csv.DictReader(io.StringIO(text))
+    missing = [name for name in GAME_FIELDS if name not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"CSV 헤더에 필수 컬럼이 없습니다: {', '.join(missing)}")
+    has_options = "option_type" in reader.fieldnames
+
+    records: Dict[str, FixtureRecord] = {}
+    # 헤더가 1행이므로 데이터는 2행부터
+    for row, data in enumerate(reader, start=2):
+        game_fields = {name: data.get(name) for name in GAME_FIELDS}
+        external_id = _external_id(game_fields)
+        record = records.get(external_id) if external_id else None
+        if record is None:
+            record = FixtureRecord(row=row, fields=game_fields)
+            # external_id가 없는 행은 각각 별도 레코드로 두고 검증 단계에서 오류 처리
+            records[external_id or f"#row-{row}"] = record
+        else:
+            for name in GAME_FIELDS:
+                if (game_fields[name] or "").strip() != (record.fields[name] or "").strip():
+                    record.errors.append(ImportRowErrorDTO(
+                        row=row,
+                        external_id=external_id,
+                        field=name,
+                        message=f"같은 external_id의 {record.row}행과 값이 다릅니다",
+                    ))
+        if has_options and any((data.get(name) or "").strip() for name in OPTION_FIELDS):
+            record.options.append((row, "", {name: data.get(name) for name in OPTION_FIELDS}))
+    return list(records.values()), []
+
+
+def validate_fixtures(records: List[FixtureRecord]) -> Tuple[List[ImportGameDTO], List[ImportRowErrorDTO]]:
+    """레코드 전체 검증 (모든 오류 수집, 오류가 있는 게임은 제외)"""
+    external_id_counts = Counter(_external_id(record.fields) for record in records)
+    games: List[ImportGameDTO] = []
+    errors: List[ImportRowErrorDTO] = []
+
+    for record in records:
+        external_id = _external_id(record.fields)
+        record_errors: List[ImportRowErrorDTO] = list(record.errors)
+
+        def check(row: int, name: str, converter: Callable[[Any], Any], value: Any) -> Any:
+            try:
+                return converter(value)
+            except ValueError as e:
+                record_errors.append(ImportRowErrorDTO(row=row, external_id=external_id, field=name, message=str(e)))
+                return None
+
+        values = {
+            "external_id": check(record.row, "external_id", lambda v: _text(v, 100), record.fields["external_id"]),
+            "league_id": check(record.row, "league_id", lambda v: _text(v, 36), record.fields["league_id"]),
+            "sport_type": check(record.row, "sport_type", lambda v: _enum(SportTypeEnum, v), record.fields["sport_type"]),
+            "home_team": check(record.row, "home_team", lambda v: _text(v, 100), record.fields["home_team"]),
+            "away_team": check(record.row, "away_team", lambda v: _text(v, 100), record.fields["away_team"]),
+            "start_time": check(record.row, "start_time", _datetime, record.fields["start_time"]),
+            "betting_deadline": check(record.row, "betting_deadline", _datetime, record.fields["betting_deadline"]),
+        }
+        if external_id and external_id_counts[external_id] > 1:
+            record_errors.append(ImportRowErrorDTO(
+                row=record.row, external_id=external_id, field="external_id", message="파일 안에서 중복되었습니다",
+            ))
+        if values["home_team"] and values["home_team"] == values["away_team"]:
+            record_errors.append(ImportRowErrorDTO(
+                row=record.row, external_id=external_id, field="away_team", message="홈팀과 어웨이팀이 같습니다",
+            ))
+        if values["start_time"] and values["betting_deadline"] and values["betting_deadline"] > values["start_time"]:
+            record_errors.append(ImportRowErrorDTO(
+                row=record.row, external_id=external_id, field="betting_deadline",
+                message="배팅 마감 시간은 경기 시작 시간보다 늦을 수 없습니다",
+            ))
+
+        options: List[ImportOptionDTO] = []
+        option_keys = set()
+        for row, prefix, option in record.options:
+            option_type = check(row, f"{prefix}option_type", lambda v: _enum(BettingOptionTypeEnum, v), option.get("option_type"))
+            option_name = check(row, f"{prefix}option_name", lambda v: _text(v, 100), option.get("option_name"))
+            odds = check(row, f"{prefix}odds", lambda v: _decimal(v, 10, positive=True), option.get("odds"))
+            handicap_value = check(row, f"{prefix}handicap_value", lambda v: _optional_decimal(v, 5), option.get("handicap_value"))
+            over_under_line = check(row, f"{prefix}over_under_line", lambda v: _optional_decimal(v, 5), option.get("over_under_line"))
+            if option_type is None or option_name is None or odds is None:
+                continue
+            if (option_type, option_name) in option_keys:
+                record_errors.append(ImportRowErrorDTO(
+                    row=row, external_id=external_id, field=f"{prefix}option_name", message="같은 게임에 중복된 배팅 옵션입니다",
+                ))
+                continue
+            option_keys.add((option_type, option_name))
+            options.append(ImportOptionDTO(
+                option_type=option_type,
+                option_name=option_name,
+                odds=odds,
+                handicap_value=handicap_value,
+                over_under_line=over_under_line,
+            ))
+
+        if record_errors:
+            errors.extend(record_errors)
+            continue
+        games.append(ImportGameDTO(row=record.row, options=options, **values))
+
+    return games, errors
+
+
+def _external_id(fields: Dict[str, Any]) -> Optional[str]:
+    value = fields.get("external_id")
+    if value is None:
+        return None
+    return str(value).strip() or None
+
+
+def _text(value: Any, max_length: int) -> str:
+    text = "" if value is None else str(value).strip()
+    if not text:
+        raise ValueError("필수 값입니다")
+    if len(text) > max_length:
+        raise ValueError(f"{max_length}자 이하여야 합니다")
+    return text
+
+
+def _enum(enum_class, value: Any):
+    """Enum 값("축구") 또는 이름("SOCCER") 허용"""
+    text = _text(value, 50)
+    try:
+        return enum_class(text)
+    except ValueError:
+        pass
+    try:
+        return enum_class[text.upper()]
+    except KeyError:
+        allowed = ", ".join(member.value for member in enum_class)
+        raise ValueError(f"허용되지 않는 값입니다: {text} (사용 가능: {allowed})")
+
+
+def _datetime(value: Any) -> datetime:
+    """ISO 8601 시각 (시간대가 있으면 UTC로 변환 후 시간대 제거)"""
+    text = _text(value, 40)
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"ISO 8601 형식이 아닙니다: {text}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _decimal(value: Any, precision: int, positive: bool = False) -> Decimal:
+    """소수점 둘째 자리까지의 Decimal (Numeric(precision, 2) 범위)"""
+    if value is None or isinstance(value, bool) or (isinstance(value, str) and not value.strip()):
+        raise ValueError("필수 값입니다")
+    try:
+        number = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError(f"숫자가 아닙니다: {value}")
+    if not number.is_finite():
+        raise ValueError(f"숫자가 아닙니다: {value}")
+    if number != number.quantize(Decimal("0.01")):
+        raise ValueError("소수점 둘째 자리까지만 허용됩니다")
+    if abs(number) >= Decimal(10) ** (precision - 2):
+        raise ValueError("허용 범위를 벗어났습니다")
+    if positive and number <= 0:
+        raise ValueError("0보다 커야 합니다")
+    return number
+
+
+def _optional_decimal(value: Any, precision: int) -> Optional[Decimal]:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return _decimal(value, precision)
@@ -1,10 +1,18 @@
 """Game Use Cases"""
+import logging
 import math
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
+from src.config import settings
+from src.domain.betting.entity import BettingOption
+from src.domain.betting.repository import BettingOptionRepository
 from src.domain.game.entity import Game
+from src.domain.game.enums import GameStatusEnum
 from src.domain.game.repository import GameRepository
 from src.domain.game.service import GameService
+from src.domain.job.enums import JobTypeEnum
+from src.domain.league.repository import LeagueRepository
 from .dto import (
     GameDTO,
     CreateGameDTO,
@@ -12,15 +20,26 @@ from .dto import (
     SetFinalScoreDTO,
     GameListDTO,
     SettleGameRequestDTO,
+    ImportResultDTO,
+    ImportRowErrorDTO,
+    FeedFixtureDTO,
+    FeedOddsDTO,
+    FeedSyncResultDTO,
 )
+from .fixture_import import parse_fixtures, validate_fixtures
+from src.application.job.dto import JobDTO
+from src.application.job.use_cases import JobUseCases
+
+logger = logging.getLogger(__name__)
 
 
 class GameUseCases:
     """게임 관련 Use Cases"""
 
-    def __init__(self, game_repository: GameRepository, game_service: GameService):
+    def __init__(self, game_repository: GameRepository, game_service: GameService, job_use_cases: JobUseCases):
         self.game_repository = game_repository
         self.game_service = game_service
+        self.job_use_cases = job_use_cases
 
     async def create_game(self, create_dto: CreateGameDTO) -> GameDTO:
         """게임 생성"""
@@ -93,22 +112,32 @@ class GameUseCases:
         return self._to_dto(game)
 
     async def set_final_score(self, game_id: str, score_dto: SetFinalScoreDTO) -> GameDTO:
-        """최종 스코어 설정"""
+        """최종 스코어 설정 (SETTLEMENT_AUTO_ON_FINAL_SCORE면 자동 정산 작업 등록)"""
         game = await self.game_repository.find_by_id(game_id)
         if not game:
             raise ValueError("게임을 찾을 수 없습니다.")
         
         game.set_final_score(score_dto.home_score, score_dto.away_score)
         await self.game_repository.save(game)
+        if settings.SETTLEMENT_AUTO_ON_FINAL_SCORE:
+            await self.settle_game(game_id, SettleGameRequestDTO())
         return self._to_dto(game)
 
     async def delete_game(self, game_id: str) -> bool:
         """게임 삭제"""
         return await self.game_repository.delete(game_id)
 
-    async def settle_game(self, game_id: str, request_dto: SettleGameRequestDTO):
-        """게임 정산"""
-        await self.game_service.settle_game(game_id, request_dto.winning_option_ids)
+    async def settle_game(self, game_id: str, request_dto: SettleGameRequestDTO) -> JobDTO:
+        """게임 정산 작업 등록 (정산은 작업 워커가 청크 단위로 실행)"""
+        game = await self.game_repository.find_by_id(game_id)
+        if not game:
+            raise ValueError("게임을 찾을 수 없습니다.")
+        job = await self.job_use_cases.enqueue(
+            JobTypeEnum.SETTLEMENT,
+            {"game_id": game_id, "winning_option_ids": request_dto.winning_option_ids},
+        )
+        logger.info("게임 %s 정산 작업 등록: %s", game_id, job.job_id)
+        return job
 
     def _to_dto(self, game: Game) -> GameDTO:
         """Game 엔티티를 GameDTO로 변환"""
@@ -127,3 +156,278 @@ class GameUseCases:
             created_at=game.created_at,
             updated_at=game.updated_at,
         )
+
+
+class FixtureImportUseCase:
+    """픽스처(게임 + 배팅 옵션) 일괄 임포트 Use Case
+
+    파일 전체를 검증한 뒤 유효한 게임만 external_id 기준으로 upsert합니다.
+    게임과 배팅 옵션은 IMPORT_CHUNK_SIZE 행씩 다중 행 upsert 한 문장으로 기록하므로
+    SQL 문 수는 행 수가 아니라 청크 수에 비례합니다.
+    """
+
+    def __init__(
+        self,
+        game_repository: GameRepository,
+        betting_option_repository: BettingOptionRepository,
+        league_repository: LeagueRepository,
+    ):
+        self.game_repository = game_repository
+        self.betting_option_repository = betting_option_repository
+        self.league_repository = league_repository
+
+    async def execute(self, text: str, fmt: str, dry_run: bool = False) -> ImportResultDTO:
+        """임포트 실행 (dry_run이면 검증만 수행)
+
+        Raises:
+            ValueError: 형식 오류 또는 최대 게임 수 초과
+        """
+        records, errors = parse_fixtures(text, fmt)
+        if len(records) > settings.IMPORT_MAX_GAMES:
+            raise ValueError(f"한 번에 최대 {settings.IMPORT_MAX_GAMES}개 게임까지 임포트할 수 있습니다 (요청: {len(records)})")
+        # 파싱에 실패한 줄도 게임 하나로 집계
+        total_games = len(records) + len(errors)
+        games, validation_errors = validate_fixtures(records)
+        errors.extend(validation_errors)
+
+        # 리그 존재 여부는 쿼리 한 번으로 확인
+        existing_league_ids = await self.league_repository.find_existing_ids(game.league_id for game in games)
+        valid_games = []
+        for game in games:
+            if game.league_id not in existing_league_ids:
+                errors.append(ImportRowErrorDTO(
+                    row=game.row,
+                    external_id=game.external_id,
+                    field="league_id",
+                    message=f"리그를 찾을 수 없습니다: {game.league_id}",
+                ))
+                continue
+            valid_games.append(game)
+        errors.sort(key=lambda error: error.row)
+
+        imported_options = 0
+        if valid_games and not dry_run:
+            game_ids = await self.game_repository.bulk_upsert([
+                Game(
+                    league_id=game.league_id,
+                    external_id=game.external_id,
+                    home_team=game.home_team,
+                    away_team=game.away_team,
+                    start_time=game.start_time,
+                    betting_deadline=game.betting_deadline,
+                    sport_type=game.sport_type,
+                )
+                for game in valid_games
+            ])
+            imported_options = await self.betting_option_repository.bulk_upsert([
+                BettingOption(
+                    game_id=game_ids[game.external_id],
+                    option_type=option.option_type,
+                    option_name=option.option_name,
+                    odds=option.odds,
+                    handicap_value=option.handicap_value,
+                    over_under_line=option.over_under_line,
+                )
+                for game in valid_games
+                for option in game.options
+            ])
+
+        return ImportResultDTO(
+            total_games=total_games,
+            imported_games=0 if dry_run else len(valid_games),
+            imported_options=imported_options,
+            failed_games=total_games - len(valid_games),
+            dry_run=dry_run,
+            errors=errors,
+        )
+
+
+class FeedSyncUseCase:
+    """외부 스포츠 피드 동기화 Use Case
+
+    피드 스냅샷을 현재 상태와 비교해 실제로 바뀐 게임/배팅 옵션만 일괄 기록합니다.
+    조회는 external_id/게임 ID 목록 단위로, 기록은 신규(upsert)와 변경(UPDATE)을
+    각각 청크 단위로 묶어 실행하므로 변경이 없으면 SELECT만 실행됩니다.
+
+    피드가 게임을 종료(스코어 있음)/취소로 바꾸면 set_final_score와 같은 정산 작업을 같은 트랜잭션에 등록합니다
+    (SETTLEMENT_AUTO_ON_FINAL_SCORE).
+    """
+
+    # 종료/취소된 게임은 정산 대상이므로 피드로 덮어쓰지 않음
+    FROZEN_STATUSES = (GameStatusEnum.FINISHED, GameStatusEnum.CANCELLED)
+
+    def __init__(
+        self,
+        game_repository: GameRepository,
+        betting_option_repository: BettingOptionRepository,
+        job_use_cases: JobUseCases,
+    ):
+        self.game_repository = game_repository
+        self.betting_option_repository = betting_option_repository
+        self.job_use_cases = job_use_cases
+
+    async def execute(
+        self,
+        league_id: str,
+        fixtures: Optional[List[FeedFixtureDTO]],
+        odds: Optional[List[FeedOddsDTO]],
+    ) -> FeedSyncResultDTO:
+        """피드 스냅샷 반영 (None이면 해당 피드는 변경 없음)"""
+        result = FeedSyncResultDTO()
+        external_ids = {fixture.external_id for fixture in fixtures or []}
+        external_ids.update(item.game_external_id for item in odds or [])
+        if not external_ids:
+            return result
+
+        games = {
+            game.external_id: game
+            for game in await self.game_repository.find_by_external_ids(sorted(external_ids))
+        }
+        if fixtures:
+            await self._sync_fixtures(league_id, fixtures, games, result)
+        if odds:
+            await self._sync_odds(odds, games, result)
+        return result
+
+    async def _sync_fixtures(
+        self,
+        league_id: str,
+        fixtures: List[FeedFixtureDTO],
+        games: Dict[str, Game],
+        result: FeedSyncResultDTO,
+    ) -> None:
+        created: List[Game] = []
+        changed: List[Game] = []
+        now = datetime.utcnow()
+        for fixture in fixtures:
+            game = games.get(fixture.external_id)
+            if game is None:
+                created.append(Game(
+                    league_id=league_id,
+                    external_id=fixture.external_id,
+                    home_team=fixture.home_team,
+                    away_team=fixture.away_team,
+                    start_time=fixture.start_time,
+                    betting_deadline=fixture.betting_deadline,
+                    sport_type=fixture.sport_type,
+                    status=fixture.status,
+                    is_live=fixture.status == GameStatusEnum.LIVE,
+                    final_score_home=fixture.home_score,
+                    final_score_away=fixture.away_score,
+                ))
+                continue
+            # 스코어 없이 종료된 게임은 스코어가 올 때까지 갱신
+            if self._is_settleable(game):
+                continue
+            incoming = {
+                "home_team": fixture.home_team,
+                "away_team": fixture.away_team,
+                "start_time": fixture.start_time,
+                "betting_deadline": fixture.betting_deadline,
+                "status": fixture.status,
+                "is_live": fixture.status == GameStatusEnum.LIVE,
+                "final_score_home": fixture.home_score,
+                "final_score_away": fixture.away_score,
+            }
+            if all(getattr(game, name) == value for name, value in incoming.items()):
+                continue
+            for name, value in incoming.items():
+                setattr(game, name, value)
+            game.updated_at = now
+            changed.append(game)
+
+        if created:
+            game_ids = await self.game_repository.bulk_upsert(created)
+            for game in created:
+                game.id = game_ids[game.external_id]
+                games[game.external_id] = game
+        if changed:
+            await self.game_repository.bulk_update(changed)
+        result.created_games = len(created)
+        result.updated_games = len(changed)
+
+        # 변경된 게임은 이전에 정산할 수 있는 상태가 아니었으므로 여기서 정산할 수 있으면 이번에 바뀐 것
+        if settings.SETTLEMENT_AUTO_ON_FINAL_SCORE:
+            for game in changed:
+                if self._is_settleable(game):
+                    job = await self.job_use_cases.enqueue(
+                        JobTypeEnum.SETTLEMENT,
+                        {"game_id": game.id, "winning_option_ids": None},
+                    )
+                    logger.info("피드 종료 게임 %s 정산 작업 등록: %s", game.id, job.job_id)
+                    result.settlement_jobs += 1
+
+    @staticmethod
+    def _is_settleable(game: Game) -> bool:
+        """자동 판정할 수 있는 종료(스코어 있음)/취소 상태인지"""
+        if game.status == GameStatusEnum.CANCELLED:
+            return True
+        return (
+            game.status == GameStatusEnum.FINISHED
+            and game.final_score_home is not None
+            and game.final_score_away is not None
+        )
+
+    async def _sync_odds(self, odds: List[FeedOddsDTO], games: Dict[str, Game], result: FeedSyncResultDTO) -> None:
+        # 아직 경기 정보가 없는 배당은 다음 동기화에서 반영
+        feed_games = {
+            item.game_external_id: games[item.game_external_id]
+            for item in odds
+            if item.game_external_id in games and games[item.game_external_id].status not in self.FROZEN_STATUSES
+        }
+        if not feed_games:
+            return
+        current: Dict[Tuple[str, str, str], BettingOption] = {
+            (option.game_id, option.option_type, option.option_name): option
+            for option in await self.betting_option_repository.find_by_game_ids(
+                [game.id for game in feed_games.values()]
+            )
+        }
+
+        created: List[BettingOption] = []
+        changed: List[BettingOption] = []
+        seen = set()
+        for item in odds:
+            game = feed_games.get(item.game_external_id)
+            if game is None:
+                continue
+            key = (game.id, item.option_type, item.option_name)
+            if key in seen:
+                continue
+            seen.add(key)
+            option = current.get(key)
+            if option is None:
+                created.append(BettingOption(
+                    game_id=game.id,
+                    option_type=item.option_type,
+                    option_name=item.option_name,
+                    odds=item.odds,
+                    handicap_value=item.handicap_value,
+                    over_under_line=item.over_under_line,
+                ))
+                continue
+            if (
+                option.odds == item.odds
+                and option.handicap_value == item.handicap_value
+                and option.over_under_line == item.over_under_line
+                and option.is_active
+            ):
+                continue
+            option.odds = item.odds
+            option.handicap_value = item.handicap_value
+            option.over_under_line = item.over_under_line
+            option.is_active = True
+            changed.append(option)
+
+        # 피드 스냅샷에서 빠진 옵션은 판매 중지 (삭제하지 않음)
+        deactivated = [option for key, option in current.items() if key not in seen and option.is_active]
+        for option in deactivated:
+            option.deactivate()
+
+        if created:
+            await self.betting_option_repository.bulk_upsert(created)
+        if changed or deactivated:
+            await self.betting_option_repository.bulk_update(changed + deactivated)
+        result.created_options = len(created)
+        result.updated_options = len(changed)
+        result.deactivated_options = len(deactivated)
@@ -0,0 +1 @@
+"""Job 애플리케이션 계층 패키지"""
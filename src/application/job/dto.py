@@ -0,0 +1,21 @@
+"""Job DTOs"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class JobDTO:
+    """작업 정보 DTO"""
+    job_id: str
+    job_type: str
+    status: str
+    total: int
+    processed: int
+    progress: float
+    attempts: int
+    created_at: datetime
+    result: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,52 @@
+"""Job Use Cases"""
+from typing import Any, Dict, Optional
+
+from src.domain.job.entity import Job
+from src.domain.job.enums import JobStatusEnum, JobTypeEnum
+from src.domain.job.repository import JobRepository
+from .dto import JobDTO
+
+
+class JobUseCases:
+    """백그라운드 작업 관련 Use Cases"""
+
+    def __init__(self, job_repository: JobRepository):
+        self.job_repository = job_repository
+
+    async def enqueue(self, job_type: JobTypeEnum, payload: Dict[str, Any]) -> JobDTO:
+        """작업 등록 (요청 트랜잭션이 커밋되면 워커가 가져감)"""
+        job = Job(job_type=job_type, payload=payload)
+        await self.job_repository.save(job)
+        return self._to_dto(job)
+
+    async def get_job(self, job_id: str) -> Optional[JobDTO]:
+        """ID로 작업 조회 (하위 작업을 기다리는 작업은 하위 작업 진행 상황을 합산)"""
+        job = await self.job_repository.find_by_id(job_id)
+        if job is None:
+            return None
+        if job.status == JobStatusEnum.WAITING:
+            children = await self.job_repository.find_children(job.id)
+            job.processed = sum(child.processed for child in children)
+            job.result["settled_bets"] = sum(child.result.get("settled_bets", 0) for child in children)
+        return self._to_dto(job)
+
+    def _to_dto(self, job: Job) -> JobDTO:
+        """Job 엔티티를 JobDTO로 변환"""
+        if job.status == JobStatusEnum.SUCCEEDED:
+            progress = 1.0
+        else:
+            progress = min(job.processed / job.total, 1.0) if job.total else 0.0
+        return JobDTO(
+            job_id=job.id,
+            job_type=job.job_type.value,
+            status=job.status.value,
+            total=job.total,
+            processed=job.processed,
+            progress=round(progress, 4),
+            attempts=job.attempts,
+            created_at=job.created_at,
+            result=job.result,
+            error=job.error,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
@@ -0,0 +1,41 @@
+"""Report DTOs"""
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+
+
+@dataclass
+class ReportQueryDTO:
+    """보고서 조회 조건 DTO (start ~ end 날짜 포함, UTC)"""
+    start: date
+    end: date
+    granularity: str = "daily"
+    group_by: str = "all"
+
+
+@dataclass
+class ReportRowDTO:
+    """보고서 행 DTO"""
+    period_start: datetime
+    group_key: Optional[str]
+    selections: int
+    stake: Decimal
+    settled_stake: Decimal
+    payout: Decimal
+    # 결과가 확정된 배팅 금액 - 지급액, GGR / 결과가 확정된 배팅 금액
+    ggr: Decimal
+    margin: Optional[Decimal]
+    bettors: Optional[int]
+
+
+@dataclass
+class TurnoverReportDTO:
+    """배팅 보고서 DTO"""
+    granularity: str
+    group_by: str
+    start: date
+    end: date
+    # 이 시각 이전의 배팅/결과 확정이 집계에 반영됨 (집계 전이면 None)
+    generated_through: Optional[datetime]
+    rows: List[ReportRowDTO] = field(default_factory=list)
@@ -0,0 +1,82 @@
+"""Report Use Cases"""
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional, Tuple
+
+from src.config import settings
+from src.domain.common.exceptions import ValidationException
+from src.domain.report.entity import ReportRow
+from src.domain.report.enums import ReportGranularityEnum, ReportGroupByEnum
+from src.domain.report.repository import ReportRepository
+from src.domain.report.service import day_start
+from .dto import ReportQueryDTO, ReportRowDTO, TurnoverReportDTO
+
+
+class ReportUseCases:
+    """보고서 관련 Use Cases (집계 테이블만 조회)"""
+
+    def __init__(self, report_repository: ReportRepository):
+        self.report_repository = report_repository
+
+    async def get_turnover_report(self, query: ReportQueryDTO) -> TurnoverReportDTO:
+        """기간 × 묶음별 배팅 금액/지급액/GGR 보고서"""
+        granularity, group_by, start, end = self._validate(query)
+        report = TurnoverReportDTO(
+            granularity=granularity.value,
+            group_by=group_by.value,
+            start=query.start,
+            end=query.end,
+            generated_through=await self.get_generated_through(),
+        )
+        async for row in self.report_repository.iter_rows(granularity, group_by, start, end):
+            report.rows.append(self._to_row_dto(row))
+        return report
+
+    async def iter_turnover_rows(self, query: ReportQueryDTO) -> AsyncIterator[ReportRowDTO]:
+        """보고서 행 스트리밍 (CSV 내보내기용)"""
+        granularity, group_by, start, end = self._validate(query)
+        async for row in self.report_repository.iter_rows(granularity, group_by, start, end):
+            yield self._to_row_dto(row)
+
+    async def get_generated_through(self) -> Optional[datetime]:
+        """집계가 반영된 시각"""
+        return await self.report_repository.get_watermark()
+
+    def validate(self, query: ReportQueryDTO) -> None:
+        """조회 조건 확인 (스트리밍 응답을 시작하기 전에 호출)
+
+        Raises:
+            ValidationException: 집계 단위/묶음 기준이 잘못되었거나 기간이 REPORT_MAX_DAYS를 넘는 경우
+        """
+        self._validate(query)
+
+    def _validate(
+        self, query: ReportQueryDTO
+    ) -> Tuple[ReportGranularityEnum, ReportGroupByEnum, datetime, datetime]:
+        try:
+            granularity = ReportGranularityEnum(query.granularity)
+        except ValueError:
+            raise ValidationException("granularity는 hourly 또는 daily만 지원합니다.")
+        try:
+            group_by = ReportGroupByEnum(query.group_by)
+        except ValueError:
+            raise ValidationException("group_by는 all, sport, league, game만 지원합니다.")
+        if query.end < query.start:
+            raise ValidationException("종료 날짜가 시작 날짜보다 앞설 수 없습니다.")
+        days = (query.end - query.start).days + 1
+        if days > settings.REPORT_MAX_DAYS:
+            raise ValidationException(f"조회 기간은 최대 {settings.REPORT_MAX_DAYS}일입니다.")
+        return granularity, group_by, day_start(query.start), day_start(query.end) + timedelta(days=1)
+
+    @staticmethod
+    def _to_row_dto(row: ReportRow) -> ReportRowDTO:
+        return ReportRowDTO(
+            period_start=row.period_start,
+            group_key=row.group_key,
+            selections=row.selections,
+            stake=row.stake,
+            settled_stake=row.settled_stake,
+            payout=row.payout,
+            ggr=row.ggr,
+            margin=row.margin,
+            bettors=row.bettors,
+        )
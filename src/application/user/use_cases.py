@@ -1,4 +1,5 @@
 """User 및 Auth Use Cases"""
+import logging
 from uuid import UUID
 from typing import Optional
 
@@ -12,7 +13,11 @@ from src.domain.common.exceptions import (
 from src.domain.common.value_objects import Email, Username, Password
 from src.infrastructure.auth.password_hasher import password_hasher
 from src.infrastructure.auth.jwt_handler import jwt_handler
-from src.infrastructure.auth.token_repository import token_repository
+from src.infrastructure.auth.token_repository import (
+    token_repository,
+    RefreshTokenReusedError,
+    RefreshTokenUserInactiveError,
+)
 from .dto import (
     UserDTO,
     RegisterUserDTO,
@@ -22,6 +27,8 @@ from .dto import (
     UpdateProfileDTO,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class RegisterUserUseCase:
     """회원가입 Use Case"""
@@ -96,17 +103,22 @@ class LoginUseCase:
         if not user.is_active:
             raise AuthenticationException("비활성화된 계정입니다")
 
+        # Refresh Token 패밀리 발급 (갱신 시 DB 조회가 없도록 사용자 클레임 포함)
+        refresh_token, family_id = await token_repository.issue_refresh_token(
+            user_id=user.user_id,
+            username=user.username,
+            role=user.role.value,
+            is_active=user.is_active,
+        )
+
         # Access Token 생성
         access_token = jwt_handler.create_access_token(
             user_id=user.user_id,
             username=user.username,
             role=user.role.value,
+            family_id=family_id,
         )
 
-        # Refresh Token 생성 및 저장
-        refresh_token = token_repository.generate_refresh_token()
-        await token_repository.save_refresh_token(user.user_id, refresh_token)
-
         # 토큰 DTO
         auth_token = AuthTokenDTO(
             access_token=access_token,
@@ -135,37 +147,34 @@ class LoginUseCase:
 
 
 class RefreshTokenUseCase:
-    """토큰 갱신 Use Case"""
+    """토큰 갱신 Use Case
 
-    def __init__(self, user_repository: UserRepository):
-        self.user_repository = user_repository
+    Refresh Token 검증과 교체를 Redis Lua 스크립트 한 번으로 처리하며,
+    패밀리에 저장된 사용자 클레임을 사용하므로 MySQL을 조회하지 않습니다.
+    """
 
-    async def execute(self, user_id: UUID, refresh_token: str) -> AuthTokenDTO:
+    async def execute(self, refresh_token: str) -> AuthTokenDTO:
         """토큰 갱신 실행"""
-        # Refresh Token 검증
-        is_valid = await token_repository.verify_refresh_token(user_id, refresh_token)
-        if not is_valid:
+        try:
+            session = await token_repository.rotate_refresh_token(refresh_token)
+        except RefreshTokenReusedError as e:
+            logger.warning("Refresh Token 재사용 감지, 패밀리 폐기: family_id=%s", e)
+            raise AuthenticationException("이미 사용된 Refresh Token입니다. 다시 로그인하세요")
+        except RefreshTokenUserInactiveError:
+            raise AuthenticationException("비활성화된 계정입니다")
+        if session is None:
             raise AuthenticationException("유효하지 않은 Refresh Token입니다")
 
-        # 사용자 조회
-        user = await self.user_repository.find_by_id(user_id)
-        if not user:
-            raise EntityNotFoundException("사용자를 찾을 수 없습니다")
-
-        # 새로운 Access Token 생성
         access_token = jwt_handler.create_access_token(
-            user_id=user.user_id,
-            username=user.username,
-            role=user.role.value,
+            user_id=session.user_id,
+            username=session.username,
+            role=session.role,
+            family_id=session.family_id,
         )
 
-        # 새로운 Refresh Token 생성 및 저장 (선택사항)
-        new_refresh_token = token_repository.generate_refresh_token()
-        await token_repository.save_refresh_token(user.user_id, new_refresh_token)
-
         return AuthTokenDTO(
             access_token=access_token,
-            refresh_token=new_refresh_token,
+            refresh_token=session.refresh_token,
         )
 
 
@@ -174,11 +183,14 @@ class LogoutUseCase:
 
     async def execute(self, user_id: UUID, access_token: str) -> None:
         """로그아웃 실행"""
-        # Refresh Token 삭제
-        await token_repository.delete_refresh_token(user_id)
-
-        # Access Token을 블랙리스트에 추가
-        await token_repository.add_to_blacklist(access_token)
+        # Refresh Token 패밀리 폐기 및 Access Token 블랙리스트 등록 (파이프라인)
+        payload = jwt_handler.decode_token(access_token)
+        await token_repository.revoke_session(
+            user_id,
+            jwt_handler.get_token_id(access_token, payload),
+            payload.get("exp"),
+            payload.get("fid"),
+        )
 
 
 class ChangePasswordUseCase:
@@ -289,7 +301,7 @@ class UserUseCases:
         self.user_repository = user_repository
         self.register_user = RegisterUserUseCase(user_repository)
         self.login = LoginUseCase(user_repository)
-        self.refresh_token = RefreshTokenUseCase(user_repository)
+        self.refresh_token = RefreshTokenUseCase()
         self.logout = LogoutUseCase()
         self.change_password = ChangePasswordUseCase(user_repository)
         self.get_user_profile = GetUserProfileUseCase(user_repository)
@@ -11,17 +11,133 @@ class Settings(BaseSettings):
     MYSQL_USER: str = "betting_user"
     MYSQL_PASSWORD: str = "betting_pass"
     MYSQL_DATABASE: str = "betting_db"
+    # 지정 시 MYSQL_* 대신 사용 (예: 로컬 벤치마크용 sqlite+aiosqlite:///...)
+    DATABASE_URL: Optional[str] = None
+
+    # Database Pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PREWARM: int = 0  # 시작 시 미리 열어둘 커넥션 수 (0이면 지연 연결)
+    DB_VERIFY_SCHEMA_ON_STARTUP: bool = True
+    # 요청당 쿼리 예산 (초과 시 경고 로그)
+    DB_QUERY_BUDGET: int = 30
+    DB_QUERY_TIME_BUDGET_MS: float = 200.0
 
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_PASSWORD: Optional[str] = None
+    REDIS_PREWARM: bool = False  # 시작 시 Redis 커넥션을 미리 연결
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 1.0  # 초
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 1.0  # 초
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # 유휴 커넥션 재사용 전 PING 주기 (초)
 
     # JWT
     JWT_SECRET_KEY: str = "your-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: int = 10  # 직전 Refresh Token을 폐기 없이 거절하는 시간 (동시 갱신)
+    JWT_BACKEND: str = "jose"  # jose | pyjwt
+    JWT_DECODE_CACHE_SIZE: int = 10000  # 검증된 토큰 LRU 캐시 크기 (0이면 비활성화)
+
+    # Token Revocation (로컬 Bloom 필터 + Redis pub/sub 동기화)
+    REVOCATION_SYNC_ENABLED: bool = True  # False면 매 요청 Redis 조회
+    REVOCATION_FILTER_CAPACITY: int = 100000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    REVOCATION_SNAPSHOT_INTERVAL: int = 60  # 스냅샷 재구성 주기 (초)
+
+    # Rate Limit (Redis GCRA + 프로세스 내 토큰 버킷)
+    RATE_LIMIT_ENABLED: bool = True
+    # 규칙이름[@역할]=횟수/초, 쉼표 구분 (0이면 제한 없음). 횟수만큼은 한 번에 몰려도 허용
+    # login/register/refresh는 IP 기준, bets는 사용자 기준 (역할은 토큰의 role 클레임)
+    RATE_LIMITS: str = "login=10/60,register=5/600,refresh=30/60,bets=30/60,bets@admin=0"
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = 10000  # 프로세스 내 토큰 버킷 키 수 상한 (LRU)
+
+    # Fixture Import (POST /games/import, scripts/import_fixtures.py)
+    IMPORT_CHUNK_SIZE: int = 500  # upsert 한 문장당 행 수
+    IMPORT_MAX_GAMES: int = 20000  # 한 번에 임포트할 수 있는 최대 게임 수
+
+    # Settlement
+    SETTLEMENT_AUTO_ON_FINAL_SCORE: bool = True  # 최종 스코어 입력 시 자동 판정/정산 작업 등록
+    SETTLEMENT_CHUNK_SIZE: int = 2000  # 정산 작업 청크(트랜잭션)당 슬립 수, 정산 일괄 갱신 한 문장당 행 수
+    SETTLEMENT_SHARD_COUNT: int = 8  # 대형 경기 정산을 배팅 ID 범위로 나누는 최대 하위 작업 수
+    SETTLEMENT_LOCK_RETRIES: int = 3  # 청크 트랜잭션 교착/잠금 대기 초과 시 즉시 재시도 횟수
+
+    # Partitions (bets/bet_slips/transactions 월별 파티션, scripts/archive_partitions.py)
+    PARTITION_MONTHS_AHEAD: int = 3  # 미리 만들어 둘 이후 월 파티션 수
+    ARCHIVE_AFTER_MONTHS: int = 6  # 이번 달보다 이 개월 수 넘게 지난 정산 완료 월을 아카이브 테이블로 이동
+    BET_HISTORY_MONTHS: int = 0  # 내 배팅 내역 조회 범위 (이번 달과 이전 N개월, 0이면 전체, 대기 중인 배팅은 항상 포함)
+
+    # Reports (시간/일 단위 배팅 집계 테이블, scripts/rollup_worker.py)
+    ROLLUP_INTERVAL_SECONDS: float = 300.0  # 집계 주기 (API 프로세스 내장 또는 rollup_worker, 0이면 주기 집계 안 함)
+    ROLLUP_LAG_SECONDS: float = 60.0  # 이 시간 이전까지만 집계 (커밋이 늦게 보이는 배팅을 건너뛰지 않도록)
+    ROLLUP_MAX_HOURS_PER_RUN: int = 168  # 한 트랜잭션에서 집계할 최대 시간 수 (밀린 구간은 나눠 처리)
+    REPORT_MAX_DAYS: int = 366  # 보고서 조회 최대 기간 (일)
+
+    # Exposure (옵션/게임별 노출 집계, Redis)
+    EXPOSURE_TRACKING_ENABLED: bool = True  # 배팅 접수 시 노출 증분/한도 검사
+    EXPOSURE_OPTION_PAYOUT_CAP: int = 0  # 옵션 하나의 예상 지급액 한도 (0이면 없음)
+    EXPOSURE_GAME_PAYOUT_CAP: int = 0  # 게임 하나의 예상 지급액 합 한도 (0이면 없음)
+    EXPOSURE_RECONCILE_INTERVAL_SECONDS: float = 300.0  # DB 대조 주기 (0이면 백그라운드 대조 안 함)
+    # 접수 중 노출 기록 유지 시간 (배팅 트랜잭션 최대 시간보다 길게, 지나면 커밋/롤백이 끝난 것으로 보고 대조에서 제외)
+    EXPOSURE_RESERVATION_TTL_SECONDS: float = 120.0
+
+    # HTTP Cache (리그/게임/배팅 옵션 조회의 ETag/Last-Modified, Cache-Control)
+    CATALOG_CACHE_ENABLED: bool = True  # Redis 버전 스탬프로 조건부 GET(304) 처리
+    CATALOG_CACHE_MAX_AGE: int = 5  # Cache-Control max-age (초, 배당이 자주 바뀌므로 짧게)
+    CATALOG_CACHE_STALE_WHILE_REVALIDATE: int = 30  # 만료 후 재검증하는 동안 이전 응답을 내줄 수 있는 시간 (초)
+    CATALOG_VERSION_TTL_SECONDS: int = 600  # 버전 스탬프 만료 (갱신 누락 시 최대 이 시간 뒤 새 스탬프)
+
+    # Compression (응답 gzip/brotli 압축, scripts/benchmarks/compression.py로 레벨별 CPU 비용 측정)
+    COMPRESSION_ENABLED: bool = True  # 앞단 프록시가 압축하면 끔
+    COMPRESSION_MIN_SIZE: int = 1024  # 이보다 작은 응답은 압축하지 않음 (바이트, 스트리밍은 Content-Length가 있을 때만 비교)
+    COMPRESSION_GZIP_LEVEL: int = 5  # gzip 기본 레벨 (1~9)
+    COMPRESSION_BROTLI_QUALITY: int = 4  # brotli 기본 품질 (0~11, brotli 패키지가 없으면 gzip만 사용)
+    # 라우트 템플릿=gzip레벨/brotli품질, 쉼표 구분 (0이면 압축 안 함)
+    COMPRESSION_ROUTE_LEVELS: str = "/api/v1/reports/turnover=1/1"
+
+    # Background Tasks (API 프로세스 lifespan의 작업 워커/노출 대조/보고서 집계)
+    # None이면 실행 (python -m src.main, uvicorn 단일 프로세스). python -m src.server는 워커가 여럿이면 지정해야 시작
+    # (false면 워커마다 같은 주기 작업이 중복되지 않도록 scripts/job_worker.py, exposure_worker.py, rollup_worker.py로 분리,
+    #  이미지 기본값은 false이고 docker-compose가 각 워커를 띄움)
+    BACKGROUND_TASKS_EMBEDDED: Optional[bool] = None
+
+    # Background Jobs (jobs 테이블, scripts/job_worker.py)
+    JOB_WORKER_EMBEDDED: bool = True  # 내장 백그라운드 작업 중 작업 워커 실행 여부 (BACKGROUND_TASKS_EMBEDDED가 꺼져 있으면 무시)
+    JOB_WORKER_CONCURRENCY: int = 2  # 프로세스당 동시 실행 작업 수
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_LEASE_SECONDS: float = 60.0  # 청크마다 연장, 만료되면 다른 워커가 이어받음
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_DELAY_SECONDS: float = 5.0  # 재시도마다 두 배
+
+    # Sports Feed (scripts/sports_feed_worker.py)
+    SPORTS_FEED_BASE_URL: str = "http://localhost:8090"
+    SPORTS_FEED_API_KEY: Optional[str] = None
+    SPORTS_FEED_LEAGUES: str = ""  # 피드 리그 키=리그 ID, 쉼표 구분 (예: epl=<league_id>,kbo=<league_id>)
+    SPORTS_FEED_INTERVAL_SECONDS: float = 10.0
+    SPORTS_FEED_MAX_CONCURRENCY: int = 8  # 동시 피드 요청 수
+    SPORTS_FEED_MAX_CONNECTIONS: int = 10  # HTTP/2는 커넥션 하나에 요청을 다중화
+    SPORTS_FEED_TIMEOUT: float = 10.0  # 초
+
+    # Server (python -m src.server: gunicorn + uvicorn 워커, uvloop/httptools)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0  # 0이면 사용 가능한 CPU 수 (cgroup CPU 제한 반영)
+    SERVER_MAX_WORKERS: int = 8  # 자동 산정 상한 (워커마다 DB 풀을 가지므로 MySQL max_connections 고려)
+    SERVER_PRELOAD_APP: bool = True  # 마스터에서 앱을 import 한 뒤 fork (copy-on-write로 메모리 공유)
+    SERVER_MAX_REQUESTS: int = 10000  # 워커가 이만큼 요청을 처리하면 재시작 (0이면 재시작 안 함)
+    SERVER_MAX_REQUESTS_JITTER: int = 1000  # 워커들이 동시에 재시작하지 않도록 더하는 임의 값 상한
+    SERVER_GRACEFUL_TIMEOUT: int = 30  # SIGTERM 후 처리 중 요청을 마치고 종료할 때까지 기다리는 시간 (초)
+    SERVER_TIMEOUT: int = 60  # 응답 없는 워커를 재시작하기까지의 시간 (초)
+    SERVER_KEEPALIVE: int = 5  # keep-alive 커넥션 유휴 시간 (초)
+    # X-Forwarded-For/Proto를 믿을 앞단 프록시(로드밸런서) IP, 쉼표 구분 ("*"면 모두 신뢰, CIDR 미지원)
+    # 여기서 온 요청은 X-Forwarded-For의 클라이언트 IP를 request.client로 사용 (IP 기준 속도 제한 등)
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+    # 워커들이 Prometheus 메트릭 값을 공유할 디렉터리 (시작 시 비움, 비우면 임시 디렉터리)
+    PROMETHEUS_MULTIPROC_DIR: Optional[str] = None
 
     # Password Hashing
     BCRYPT_ROUNDS: int = 12
@@ -38,6 +154,13 @@ class Settings(BaseSettings):
         """MySQL 데이터베이스 URL"""
         return f"mysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}?charset=utf8mb4"
 
+    @property
+    def async_database_url(self) -> str:
+        """비동기 드라이버 데이터베이스 URL"""
+        if self.DATABASE_URL:
+            return self.DATABASE_URL
+        return self.database_url.replace("mysql://", "mysql+asyncmy://")
+
     @property
     def redis_url(self) -> str:
         """Redis URL"""
@@ -1,13 +1,14 @@
 """Betting 엔티티"""
 from dataclasses import dataclass, field
-from decimal import Decimal
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional, List
 import uuid
 
 from src.domain.betting.enums import BettingOptionTypeEnum, BetTypeEnum, BetStatusEnum, BetSlipResultEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class BettingOption:
     """배팅 옵션 엔티티"""
     game_id: str
@@ -30,7 +31,7 @@ class BettingOption:
         self.odds = new_odds
 
 
-@dataclass
+@dataclass(slots=True)
 class BetSlip:
     """배팅 슬립 엔티티"""
     bet_id: str
@@ -39,9 +40,11 @@ class BetSlip:
     odds: Decimal
     result: BetSlipResultEnum = BetSlipResultEnum.PENDING
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # 배팅 시각 (배팅의 created_at과 같은 값)
+    created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class Bet:
     """배팅 엔티티"""
     user_id: str
@@ -51,7 +54,12 @@ class Bet:
     total_odds: Decimal
     status: BetStatusEnum = BetStatusEnum.PENDING
     slips: List[BetSlip] = field(default_factory=list)
+    # 결과가 나오지 않은 슬립 수, 결과가 나온 슬립 배당의 곱, 적중한 슬립 수 (정산 진행 상태)
+    pending_legs: int = 0
+    settled_odds: Decimal = Decimal("1")
+    won_legs: int = 0
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: datetime = field(default_factory=datetime.utcnow)
 
     def win(self):
         """배팅 적중"""
@@ -64,3 +72,37 @@ class Bet:
     def cancel(self):
         """배팅 취소"""
         self.status = BetStatusEnum.CANCELLED
+
+    def settle_leg(self, result: BetSlipResultEnum, odds: Decimal) -> Optional[Decimal]:
+        """슬립 하나의 결과 반영 (배팅 결과가 확정되면 지급액 반환, 아니면 None)
+
+        - 미적중 슬립이 나오면 남은 경기와 무관하게 미적중
+        - 적중 슬립은 배당을 settled_odds에 곱하고, 무효 슬립은 배당 1.0
+        - 남은 슬립이 없으면 확정: 적중한 슬립이 없으면(모든 슬립이 무효) 취소 후 원금 반환
+          (배당 1.00 슬립만 적중해 결과 배당이 1이어도 적중)
+        """
+        if self.status != BetStatusEnum.PENDING:
+            return None
+        self.pending_legs -= 1
+        if result == BetSlipResultEnum.LOSS:
+            self.lose()
+            return Decimal("0")
+        if result == BetSlipResultEnum.WIN:
+            self.settled_odds *= odds
+            self.won_legs += 1
+        if self.pending_legs > 0:
+            return None
+        if self.won_legs == 0:
+            self.cancel()
+            return self.total_amount
+        self.win()
+        return self.payout()
+
+    def payout(self) -> Decimal:
+        """결과가 확정된 배팅의 지급액 (적중: 원금 × 결과 배당, 취소: 원금, 미적중/대기: 0)"""
+        if self.status == BetStatusEnum.WIN:
+            # potential_return과 같은 방식(소수 둘째 자리 반올림)으로 계산
+            return (self.total_amount * self.settled_odds).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        if self.status == BetStatusEnum.CANCELLED:
+            return self.total_amount
+        return Decimal("0")
@@ -29,3 +29,12 @@ class BetSlipResultEnum(str, enum.Enum):
     PENDING = "대기"
     WIN = "적중"
     LOSS = "미적중"
+    VOID = "무효"
+
+
+class OptionGradeEnum(str, enum.Enum):
+    """배팅 옵션 판정 결과 Enum"""
+    WIN = "적중"
+    LOSS = "미적중"
+    PUSH = "적중특례"
+    VOID = "무효"
@@ -0,0 +1,74 @@
+"""배팅 노출(책임) 집계
+
+옵션이 적중하면 지급해야 할 금액을 옵션/게임 단위로 집계합니다.
+
+- stake: 옵션을 포함한 대기 배팅의 배팅 금액 합
+- payout: 옵션을 포함한 대기 배팅의 예상 지급액 합 (옵션이 적중했을 때의 최대 지급액)
+
+조합 배팅은 다른 경기 결과와 무관하게 최악의 경우를 가정해 모든 선택 옵션에 예상 지급액 전체를 더합니다.
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from src.domain.betting.entity import Bet
+
+
+@dataclass
+class ExposureLine:
+    """배팅 하나가 옵션 하나에 더하는 노출"""
+    game_id: str
+    option_id: str
+    stake: Decimal
+    payout: Decimal
+    league_id: Optional[str] = None  # 있으면 리그별 노출 게임 목록에 추가
+
+
+@dataclass
+class OptionExposure:
+    """옵션 노출"""
+    option_id: str
+    stake: Decimal = Decimal("0")
+    payout: Decimal = Decimal("0")
+    bets: int = 0
+
+
+@dataclass
+class GameExposure:
+    """게임 노출 (옵션별 노출 포함)"""
+    game_id: str
+    league_id: Optional[str] = None
+    stake: Decimal = Decimal("0")
+    payout: Decimal = Decimal("0")
+    bets: int = 0
+    options: Dict[str, OptionExposure] = field(default_factory=dict)
+
+    @property
+    def max_option_payout(self) -> Decimal:
+        """가장 큰 옵션 지급액 (한 옵션이 적중했을 때의 최대 손실)"""
+        return max((option.payout for option in self.options.values()), default=Decimal("0"))
+
+    def add(self, option_id: str, stake: Decimal, payout: Decimal, bets: int = 1) -> None:
+        """옵션 노출 누적"""
+        option = self.options.setdefault(option_id, OptionExposure(option_id=option_id))
+        option.stake += stake
+        option.payout += payout
+        option.bets += bets
+        self.stake += stake
+        self.payout += payout
+        self.bets += bets
+
+
+def exposure_lines(bet: Bet, league_ids: Optional[Dict[str, str]] = None) -> List[ExposureLine]:
+    """배팅의 선택 옵션별 노출 (league_ids: 게임 ID → 리그 ID)"""
+    league_ids = league_ids or {}
+    return [
+        ExposureLine(
+            game_id=slip.game_id,
+            option_id=slip.option_id,
+            stake=bet.total_amount,
+            payout=bet.potential_return,
+            league_id=league_ids.get(slip.game_id),
+        )
+        for slip in bet.slips
+    ]
@@ -0,0 +1,167 @@
+"""배팅 옵션 자동 판정
+
+경기 최종 스코어로 한 경기의 배팅 옵션 전체를 한 번에 판정합니다 (API_SPEC 부록 A).
+
+- 승무패: "홈팀 승" / "무승부" / "원정팀 승", 무승부 없는 종목은 "홈팀" / "원정팀" 또는 "홈팀 승" / "원정팀 승"
+  (경기의 승무패 옵션 중 무승부 옵션이 없는데 비기면 적중특례, 무승부 옵션이 있으면 팀 옵션은 미적중)
+- 핸디캡: 옵션이 가리키는 팀 스코어에 handicap_value를 더해 비교, 같으면 적중특례
+- 언오버: 총 득점과 over_under_line 비교, 같으면 적중특례
+- 취소된 경기: 모든 옵션 무효
+
+승자예상(리그/토너먼트 우승자)처럼 경기 스코어로 판정할 수 없는 옵션과 옵션명/기준값을
+해석할 수 없는 옵션은 판정하지 않고 ungraded로 돌려줍니다. 해당 슬립은 대기로 남아
+수동 정산(winning_option_ids) 대상이 됩니다.
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from src.domain.betting.entity import BettingOption
+from src.domain.betting.enums import BettingOptionTypeEnum, BetSlipResultEnum, OptionGradeEnum
+from src.domain.game.entity import Game
+from src.domain.game.enums import GameStatusEnum
+
+HOME = "home"
+AWAY = "away"
+DRAW = "draw"
+
+_HOME_PREFIXES = ("홈", "home")
+_AWAY_PREFIXES = ("원정", "어웨이", "away")
+_DRAW_PREFIXES = ("무승부", "무", "draw")
+_OVER_PREFIXES = ("오버", "over")
+_UNDER_PREFIXES = ("언더", "under")
+
+# 판정 결과 → 슬립 결과 (적중특례/무효는 배당 1.0으로 원금 반환)
+SLIP_RESULT_BY_GRADE = {
+    OptionGradeEnum.WIN: BetSlipResultEnum.WIN,
+    OptionGradeEnum.LOSS: BetSlipResultEnum.LOSS,
+    OptionGradeEnum.PUSH: BetSlipResultEnum.VOID,
+    OptionGradeEnum.VOID: BetSlipResultEnum.VOID,
+}
+
+
+@dataclass
+class GradingResult:
+    """경기 하나의 옵션 판정 결과"""
+    # 옵션 ID → 판정
+    grades: Dict[str, OptionGradeEnum] = field(default_factory=dict)
+    # 자동 판정하지 못한 옵션 ID
+    ungraded: List[str] = field(default_factory=list)
+
+    def slip_results(self) -> Dict[str, BetSlipResultEnum]:
+        """옵션 ID → 슬립 결과"""
+        return {option_id: SLIP_RESULT_BY_GRADE[grade] for option_id, grade in self.grades.items()}
+
+
+def grade_options(game: Game, options: List[BettingOption]) -> GradingResult:
+    """경기의 배팅 옵션 전체 판정
+
+    Raises:
+        ValueError: 종료(스코어 있음) 또는 취소 상태가 아닌 경기
+    """
+    result = GradingResult()
+    if game.status == GameStatusEnum.CANCELLED:
+        result.grades = {option.id: OptionGradeEnum.VOID for option in options}
+        return result
+    if game.status != GameStatusEnum.FINISHED or game.final_score_home is None or game.final_score_away is None:
+        raise ValueError("최종 스코어가 입력된 종료 경기만 자동 판정할 수 있습니다.")
+
+    home_score = int(game.final_score_home)
+    away_score = int(game.final_score_away)
+    # 무승부 옵션이 없는 승무패 시장은 승패만 고르므로 비기면 원금 반환 (옵션명 표기와 무관)
+    two_way = not any(
+        option.option_type == BettingOptionTypeEnum.WIN_DRAW_LOSS and _side(option.option_name, game) == DRAW
+        for option in options
+    )
+    for option in options:
+        grade = _grade(option, game, home_score, away_score, two_way)
+        if grade is None:
+            result.ungraded.append(option.id)
+        else:
+            result.grades[option.id] = grade
+    return result
+
+
+def manual_grades(options: List[BettingOption], winning_option_ids: List[str]) -> GradingResult:
+    """수동 정산: 지정한 옵션은 적중, 나머지는 미적중
+
+    Raises:
+        ValueError: 경기에 속하지 않은 옵션 ID가 있는 경우
+    """
+    option_ids = {option.id for option in options}
+    unknown = [option_id for option_id in winning_option_ids if option_id not in option_ids]
+    if unknown:
+        raise ValueError(f"경기에 속하지 않은 배팅 옵션입니다: {', '.join(unknown)}")
+    winners = set(winning_option_ids)
+    return GradingResult(grades={
+        option.id: OptionGradeEnum.WIN if option.id in winners else OptionGradeEnum.LOSS
+        for option in options
+    })
+
+
+def _grade(
+    option: BettingOption, game: Game, home_score: int, away_score: int, two_way: bool
+) -> Optional[OptionGradeEnum]:
+    if option.option_type == BettingOptionTypeEnum.WIN_DRAW_LOSS:
+        side = _side(option.option_name, game)
+        if side is None:
+            return None
+        if home_score == away_score:
+            if side == DRAW:
+                return OptionGradeEnum.WIN
+            # 무승부 옵션이 없는 시장의 무승부는 원금 반환
+            return OptionGradeEnum.PUSH if two_way else OptionGradeEnum.LOSS
+        winner = HOME if home_score > away_score else AWAY
+        return OptionGradeEnum.WIN if side == winner else OptionGradeEnum.LOSS
+
+    if option.option_type == BettingOptionTypeEnum.HANDICAP:
+        side = _side(option.option_name, game)
+        line = option.handicap_value
+        if side not in (HOME, AWAY) or line is None or _is_quarter(line):
+            return None
+        margin = home_score - away_score if side == HOME else away_score - home_score
+        return _compare(margin + line)
+
+    if option.option_type == BettingOptionTypeEnum.OVER_UNDER:
+        line = option.over_under_line
+        if line is None or _is_quarter(line):
+            return None
+        name = option.option_name.strip().lower()
+        if name.startswith(_OVER_PREFIXES):
+            return _compare(home_score + away_score - line)
+        if name.startswith(_UNDER_PREFIXES):
+            return _compare(line - (home_score + away_score))
+        return None
+
+    # 승자예상은 리그/토너먼트 종료 시 판정
+    return None
+
+
+def _side(option_name: str, game: Game) -> Optional[str]:
+    """옵션명이 가리키는 쪽 (팀 이름 우선, 다음으로 홈/원정/무승부 접두어)"""
+    name = option_name.strip()
+    # 팀 이름이 서로의 접두어일 수 있으므로 긴 이름부터 비교
+    for team, side in sorted(((game.home_team, HOME), (game.away_team, AWAY)), key=lambda item: -len(item[0])):
+        if team and name.startswith(team):
+            return side
+    lowered = name.lower()
+    if lowered.startswith(_DRAW_PREFIXES):
+        return DRAW
+    if lowered.startswith(_HOME_PREFIXES):
+        return HOME
+    if lowered.startswith(_AWAY_PREFIXES):
+        return AWAY
+    return None
+
+
+def _is_quarter(line: Decimal) -> bool:
+    """0.25 단위 분할 기준선 (절반 적중/절반 미적중은 지원하지 않음)"""
+    return (line * 4) % 2 != 0
+
+
+def _compare(value: Decimal) -> OptionGradeEnum:
+    if value > 0:
+        return OptionGradeEnum.WIN
+    if value < 0:
+        return OptionGradeEnum.LOSS
+    return OptionGradeEnum.PUSH
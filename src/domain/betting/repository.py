@@ -1,7 +1,15 @@
 """Betting Repository 인터페이스"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from .entity import BettingOption, Bet, BetSlip
+from .enums import BetSlipResultEnum
+from .exposure import ExposureLine, GameExposure
+from .stats import UserBetStats
+
+# 배팅 ID 범위 [시작, 끝) - None이면 그쪽 경계 없음 (정산 샤드 단위)
+BetIdRange = Tuple[Optional[str], Optional[str]]
 
 
 class BettingOptionRepository(ABC):
@@ -27,6 +35,21 @@ class BettingOptionRepository(ABC):
         """배팅 옵션을 삭제"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def bulk_upsert(self, options: List[BettingOption]) -> int:
+        """(game_id, option_type, option_name) 기준 일괄 upsert (기록한 옵션 수 반환)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_game_ids(self, game_ids: List[str]) -> List[BettingOption]:
+        """여러 게임의 배팅 옵션 목록 조회"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bulk_update(self, options: List[BettingOption]) -> None:
+        """여러 배팅 옵션의 변경 사항을 일괄 반영"""
+        raise NotImplementedError
+
 
 class BetRepository(ABC):
     """배팅 리포지토리 인터페이스"""
@@ -42,8 +65,8 @@ class BetRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_by_user_id(self, user_id: str) -> List[Bet]:
-        """사용자 ID로 배팅 목록 조회"""
+    async def find_by_user_id(self, user_id: str, since: Optional[datetime] = None) -> List[Bet]:
+        """사용자 ID로 배팅 목록 조회 (since를 주면 그 시각 이후 배팅과 대기 중인 배팅만)"""
         raise NotImplementedError
 
     @abstractmethod
@@ -51,6 +74,21 @@ class BetRepository(ABC):
         """게임 ID로 배팅 목록 조회"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def lock_pending_by_ids(self, bet_ids: List[str]) -> List[Bet]:
+        """ID 목록 중 대기 상태인 배팅을 행 잠금과 함께 조회"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bulk_update_settlement(self, bets: List[Bet]) -> None:
+        """여러 배팅의 상태와 정산 진행 상태를 일괄 반영"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_existing_ids(self, bet_ids: List[str]) -> Set[str]:
+        """ID 목록 중 저장된 배팅의 ID"""
+        raise NotImplementedError
+
 
 class BetSlipRepository(ABC):
     """배팅 슬립 리포지토리 인터페이스"""
@@ -64,3 +102,101 @@ class BetSlipRepository(ABC):
     async def find_by_bet_id(self, bet_id: str) -> List[BetSlip]:
         """배팅 ID로 슬립 목록 조회"""
         raise NotImplementedError
+
+    @abstractmethod
+    async def count_pending(
+        self, game_id: str, option_ids: List[str], bet_id_range: Optional[BetIdRange] = None
+    ) -> int:
+        """게임의 대기 슬립 중 지정한 옵션의 슬립 수 (bet_id_range를 주면 그 범위 배팅의 슬립만)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bulk_set_results(
+        self,
+        game_id: str,
+        results: Dict[str, BetSlipResultEnum],
+        after_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        bet_id_range: Optional[BetIdRange] = None,
+    ) -> List[BetSlip]:
+        """게임의 대기 슬립에 옵션별 결과 일괄 기록 (슬립 ID 순 청크, 결과가 기록된 슬립 반환)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def aggregate_pending_exposure(self, game_ids: Optional[List[str]] = None) -> List[GameExposure]:
+        """대기 배팅의 대기 슬립으로 게임/옵션별 노출 계산 (game_ids가 없으면 전체)"""
+        raise NotImplementedError
+
+
+class UserBetStatsRepository(ABC):
+    """사용자별 배팅 통계 리포지토리 인터페이스 (배팅 접수/정산과 같은 트랜잭션에서 증분 갱신)"""
+
+    @abstractmethod
+    async def add_placed(self, user_id: str, amount: Decimal, placed_at: datetime) -> None:
+        """배팅 접수를 원자적으로 더함 (통계가 없으면 생성)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def lock_by_user_ids(self, user_ids: List[str]) -> Dict[str, UserBetStats]:
+        """사용자 ID 순으로 잠가 조회 (통계가 없는 사용자는 빈 통계)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_all(self, stats: List[UserBetStats]) -> None:
+        """통계를 일괄 저장 (없으면 생성, 있으면 덮어씀)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_user_id(self, user_id: str) -> Optional[UserBetStats]:
+        """사용자 통계 조회"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild(self, user_ids: List[str]) -> int:
+        """배팅 내역으로 사용자 통계를 다시 계산해 교체 (교체한 사용자 수 반환)"""
+        raise NotImplementedError
+
+
+class ExposureRepository(ABC):
+    """노출 집계 저장소 인터페이스 (배팅 접수 시 증분 갱신, 주기적으로 DB와 대조)"""
+
+    @abstractmethod
+    async def reserve(self, bet_id: str, lines: List[ExposureLine]) -> Optional[ExposureLine]:
+        """한도 안이면 노출을 더하고 None, 한도를 넘는 줄이 있으면 아무것도 더하지 않고 그 줄을 반환
+
+        더한 노출은 배팅이 커밋될 때까지 대조에서 지우지 않도록 접수 중 기록으로도 남깁니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release(self, bet_id: str, lines: List[ExposureLine]) -> None:
+        """reserve로 더한 노출과 접수 중 기록을 되돌림 (배팅 저장 실패 시)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_reservation_ids(self) -> List[str]:
+        """접수 중 기록이 남아 있는 배팅 ID (커밋 여부와 무관)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_game_ids(self, game_ids: List[str]) -> List[GameExposure]:
+        """게임별 노출 조회 (노출이 없는 게임은 0으로 채움)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_league_id(self, league_id: str) -> List[GameExposure]:
+        """리그에서 노출이 기록된 게임의 노출 조회"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace(
+        self,
+        exposures: List[GameExposure],
+        game_ids: Optional[List[str]] = None,
+        committed_ids: Iterable[str] = (),
+    ) -> int:
+        """DB에서 다시 계산한 노출로 교체 (game_ids가 없으면 전체, 반환값은 비운 게임 수)
+
+        committed_ids에 없는 접수 중 배팅의 노출은 DB 계산 결과에 없으므로 교체 후 다시 더합니다.
+        """
+        raise NotImplementedError
@@ -1,13 +1,29 @@
 """Betting 도메인 서비스"""
+import logging
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
-from src.domain.betting.repository import BetRepository, BetSlipRepository, BettingOptionRepository
+from src.domain.betting.repository import (
+    BetRepository,
+    BetSlipRepository,
+    BettingOptionRepository,
+    ExposureRepository,
+    UserBetStatsRepository,
+)
 from src.domain.betting.entity import Bet, BetSlip
+from src.domain.betting.exposure import GameExposure, exposure_lines
+from src.domain.game.repository import GameRepository
 from src.domain.wallet.service import WalletService
-from src.domain.common.exceptions import InsufficientFundsException, ValidationException
+from src.domain.common.value_objects import Money
+from src.domain.common.exceptions import (
+    ExposureLimitExceededException,
+    InsufficientFundsException,
+    ValidationException,
+)
 from src.application.betting.dto import PlaceBetRequestDTO
 
+logger = logging.getLogger(__name__)
+
 
 class BettingService:
     def __init__(
@@ -16,11 +32,20 @@ class BettingService:
         bet_slip_repository: BetSlipRepository,
         betting_option_repository: BettingOptionRepository,
         wallet_service: WalletService,
+        exposure_repository: Optional[ExposureRepository] = None,
+        bet_stats_repository: Optional[UserBetStatsRepository] = None,
+        game_repository: Optional[GameRepository] = None,
     ):
         self.bet_repository = bet_repository
         self.bet_slip_repository = bet_slip_repository
         self.betting_option_repository = betting_option_repository
         self.wallet_service = wallet_service
+        # 없으면 노출 집계/한도 검사를 하지 않음
+        self.exposure_repository = exposure_repository
+        # 없으면 사용자 배팅 통계를 갱신하지 않음
+        self.bet_stats_repository = bet_stats_repository
+        # 없으면 리그별 노출 게임 목록을 접수 시 갱신하지 않음 (대조에서 채움)
+        self.game_repository = game_repository
 
     async def place_bet(self, user_id: str, place_bet_dto: PlaceBetRequestDTO) -> Bet:
         # 1. Validate bet selections
@@ -28,18 +53,16 @@ class BettingService:
             raise ValidationException("하나 이상의 배팅을 선택해야 합니다.")
 
         total_odds = Decimal(1.0)
+        options = []
         for selection in place_bet_dto.selections:
             option = await self.betting_option_repository.find_by_id(selection.option_id)
             if not option or not option.is_active:
                 raise ValidationException(f"유효하지 않은 배팅 옵션입니다: {selection.option_id}")
             total_odds *= option.odds
+            options.append(option)
 
         # 2. Check user's balance
-        await self.wallet_service.withdraw(
-            user_id=user_id,
-            amount=place_bet_dto.amount,
-            transaction_type="BET", # This should be an enum
-        )
+        await self.wallet_service.withdraw_from_wallet(user_id, Money(place_bet_dto.amount))
 
         # 3. Create Bet and BetSlips
         potential_return = place_bet_dto.amount * total_odds
@@ -49,18 +72,70 @@ class BettingService:
             total_amount=place_bet_dto.amount,
             potential_return=potential_return,
             total_odds=total_odds,
+            pending_legs=len(place_bet_dto.selections),
         )
-        await self.bet_repository.save(new_bet)
-
-        for selection in place_bet_dto.selections:
-            option = await self.betting_option_repository.find_by_id(selection.option_id)
-            new_slip = BetSlip(
+        for option in options:
+            new_bet.slips.append(BetSlip(
                 bet_id=new_bet.id,
                 game_id=option.game_id,
-                option_id=selection.option_id,
+                option_id=option.id,
                 odds=option.odds,
-            )
-            await self.bet_slip_repository.save(new_slip)
-            new_bet.slips.append(new_slip)
+                created_at=new_bet.created_at,
+            ))
+
+        # 4. Reserve exposure (한도를 넘으면 거절, 출금은 요청 트랜잭션과 함께 롤백)
+        lines = exposure_lines(new_bet)
+        if self.exposure_repository is not None:
+            if self.game_repository is not None:
+                league_ids = await self.game_repository.find_league_ids([slip.game_id for slip in new_bet.slips])
+                lines = exposure_lines(new_bet, league_ids)
+            rejected = await self.exposure_repository.reserve(new_bet.id, lines)
+            if rejected is not None:
+                raise ExposureLimitExceededException(
+                    f"배팅 한도를 초과해 배팅할 수 없습니다: {rejected.option_id}"
+                )
+
+        try:
+            await self.bet_repository.save(new_bet)
+            for slip in new_bet.slips:
+                await self.bet_slip_repository.save(slip)
+            if self.bet_stats_repository is not None:
+                await self.bet_stats_repository.add_placed(user_id, new_bet.total_amount, new_bet.created_at)
+        except Exception:
+            if self.exposure_repository is not None:
+                await self.exposure_repository.release(new_bet.id, lines)
+            raise
 
         return new_bet
+
+
+class ExposureService:
+    """노출 집계 대조 서비스
+
+    배팅 접수 시 증분으로 갱신한 노출을 DB의 대기 배팅으로 다시 계산해 교체합니다.
+    커밋에 실패한 배팅의 증분(접수 중 기록 만료 후), 정산/취소로 줄어든 노출이 여기서 정리됩니다.
+    """
+
+    def __init__(
+        self,
+        bet_repository: BetRepository,
+        bet_slip_repository: BetSlipRepository,
+        exposure_repository: ExposureRepository,
+    ):
+        self.bet_repository = bet_repository
+        self.bet_slip_repository = bet_slip_repository
+        self.exposure_repository = exposure_repository
+
+    async def reconcile(self, game_ids: Optional[List[str]] = None) -> List[GameExposure]:
+        """노출 재계산 (game_ids가 없으면 노출이 기록된 전체 게임)
+
+        접수 중 기록 → 커밋 여부 → 대기 배팅 집계 순으로 읽습니다. 커밋 여부를 확인한 뒤 커밋된 배팅은
+        집계와 접수 중 노출 양쪽에 잡혀 다음 대조까지 많게 잡힐 뿐이고(한도 쪽으로 보수적),
+        집계에 없는 접수 중 배팅의 노출이 교체로 사라지지는 않습니다.
+        """
+        reservation_ids = await self.exposure_repository.find_reservation_ids()
+        committed_ids = await self.bet_repository.find_existing_ids(reservation_ids)
+        exposures = await self.bet_slip_repository.aggregate_pending_exposure(game_ids)
+        cleared = await self.exposure_repository.replace(exposures, game_ids, committed_ids)
+        logger.info("노출 대조: 게임 %d개 갱신, %d개 비움", len(exposures), cleared)
+        return exposures
@@ -0,0 +1,90 @@
+"""사용자별 배팅 통계
+
+배팅 접수(record_placed)와 결과 확정(record_settled)마다 증분으로 누적하므로
+조회할 때 배팅 테이블을 다시 집계하지 않습니다.
+
+- 적중률: 적중 / (적중 + 미적중) (취소는 제외)
+- 순손익: 지급액 합 - 결과가 확정된 배팅 금액 합 (취소는 원금 환급이므로 0)
+- ROI: 순손익 / 결과가 확정된 배팅 금액 합
+- 연속 기록: 정산 순서 기준 (취소는 연속 기록을 끊지 않음)
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from src.domain.betting.entity import Bet
+from src.domain.betting.enums import BetStatusEnum
+
+
+@dataclass
+class UserBetStats:
+    """사용자 배팅 통계 요약"""
+    user_id: str
+    bets_placed: int = 0
+    total_staked: Decimal = Decimal("0")
+    bets_won: int = 0
+    bets_lost: int = 0
+    bets_cancelled: int = 0
+    settled_staked: Decimal = Decimal("0")
+    total_returned: Decimal = Decimal("0")
+    # 양수: 연속 적중 수, 음수: 연속 미적중 수
+    current_streak: int = 0
+    longest_win_streak: int = 0
+    longest_loss_streak: int = 0
+    last_bet_at: Optional[datetime] = None
+
+    @property
+    def bets_pending(self) -> int:
+        return self.bets_placed - self.bets_won - self.bets_lost - self.bets_cancelled
+
+    @property
+    def win_rate(self) -> Optional[Decimal]:
+        decided = self.bets_won + self.bets_lost
+        if decided == 0:
+            return None
+        return (Decimal(self.bets_won) / decided).quantize(Decimal("0.0001"))
+
+    @property
+    def net_profit(self) -> Decimal:
+        return self.total_returned - self.settled_staked
+
+    @property
+    def roi(self) -> Optional[Decimal]:
+        if self.settled_staked == 0:
+            return None
+        return (self.net_profit / self.settled_staked).quantize(Decimal("0.0001"))
+
+    def record_placed(self, amount: Decimal, placed_at: datetime) -> None:
+        """배팅 접수 반영"""
+        self.bets_placed += 1
+        self.total_staked += amount
+        if self.last_bet_at is None or placed_at > self.last_bet_at:
+            self.last_bet_at = placed_at
+
+    def record_settled(self, status: BetStatusEnum, stake: Decimal, payout: Decimal) -> None:
+        """배팅 결과 확정 반영 (status: 적중/미적중/취소)"""
+        self.settled_staked += stake
+        self.total_returned += payout
+        if status == BetStatusEnum.WIN:
+            self.bets_won += 1
+            self.current_streak = self.current_streak + 1 if self.current_streak > 0 else 1
+            self.longest_win_streak = max(self.longest_win_streak, self.current_streak)
+        elif status == BetStatusEnum.LOSS:
+            self.bets_lost += 1
+            self.current_streak = self.current_streak - 1 if self.current_streak < 0 else -1
+            self.longest_loss_streak = max(self.longest_loss_streak, -self.current_streak)
+        elif status == BetStatusEnum.CANCELLED:
+            self.bets_cancelled += 1
+        else:
+            raise ValueError(f"결과가 확정되지 않은 배팅입니다: {status.value}")
+
+
+def build_stats(user_id: str, bets: Iterable[Bet]) -> UserBetStats:
+    """배팅 목록으로 통계를 처음부터 계산 (재계산용, bets는 시간 순)"""
+    stats = UserBetStats(user_id=user_id)
+    for bet in bets:
+        stats.record_placed(bet.total_amount, bet.created_at)
+        if bet.status != BetStatusEnum.PENDING:
+            stats.record_settled(bet.status, bet.total_amount, bet.payout())
+    return stats
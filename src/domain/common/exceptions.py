@@ -34,3 +34,8 @@ class AuthorizationException(DomainException):
 class InsufficientFundsException(DomainException):
     """잔액 부족"""
     pass
+
+
+class ExposureLimitExceededException(DomainException):
+    """노출(책임) 한도 초과"""
+    pass
@@ -7,7 +7,7 @@ import uuid
 from src.domain.game.enums import GameStatusEnum, SportTypeEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     """경기 엔티티"""
     league_id: str
@@ -1,6 +1,6 @@
 """Game Repository 인터페이스"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from .entity import Game
 
 
@@ -43,3 +43,27 @@ class GameRepository(ABC):
     async def delete(self, game_id: str) -> bool:
         """게임을 삭제"""
         raise NotImplementedError
+
+    @abstractmethod
+    async def bulk_upsert(self, games: List[Game]) -> Dict[str, str]:
+        """external_id 기준 일괄 upsert
+
+        Returns:
+            Dict[str, str]: external_id → 게임 ID (이미 있던 게임은 기존 ID)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_external_ids(self, external_ids: List[str]) -> List[Game]:
+        """external_id 목록으로 게임 조회"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bulk_update(self, games: List[Game]) -> None:
+        """여러 게임의 변경 사항을 일괄 반영"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_league_ids(self, game_ids: List[str]) -> Dict[str, str]:
+        """게임 ID → 리그 ID (없는 게임은 빠짐)"""
+        raise NotImplementedError
@@ -1,11 +1,34 @@
 """Game 도메인 서비스"""
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from src.config import settings
 from src.domain.game.repository import GameRepository
-from src.domain.betting.repository import BetRepository, BetSlipRepository
+from src.domain.betting.repository import (
+    BetIdRange,
+    BetRepository,
+    BetSlipRepository,
+    BettingOptionRepository,
+    UserBetStatsRepository,
+)
+from src.domain.betting.entity import Bet, BetSlip
+from src.domain.betting.enums import BetSlipResultEnum
+from src.domain.betting.grading import GradingResult, grade_options, manual_grades
 from src.domain.wallet.service import WalletService
-from src.domain.game.entity import Game
-from src.domain.betting.entity import Bet, BetSlip, BettingOption
-from src.domain.betting.enums import BetStatusEnum, BetSlipResultEnum
-from typing import List
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SettlementChunk:
+    """정산 청크 하나의 처리 결과"""
+    slips: int = 0
+    settled_bets: int = 0
+    # 처리한 마지막 슬립 ID (다음 청크의 시작점)
+    last_slip_id: Optional[str] = None
 
 
 class GameService:
@@ -14,39 +37,112 @@ class GameService:
         game_repository: GameRepository,
         bet_repository: BetRepository,
         bet_slip_repository: BetSlipRepository,
+        betting_option_repository: BettingOptionRepository,
         wallet_service: WalletService,
+        bet_stats_repository: Optional[UserBetStatsRepository] = None,
     ):
         self.game_repository = game_repository
         self.bet_repository = bet_repository
         self.bet_slip_repository = bet_slip_repository
+        self.betting_option_repository = betting_option_repository
         self.wallet_service = wallet_service
+        # 없으면 사용자 배팅 통계를 갱신하지 않음
+        self.bet_stats_repository = bet_stats_repository
 
-    async def settle_game(self, game_id: str, winning_option_ids: List[str]):
+    async def grade_game(self, game_id: str, winning_option_ids: Optional[List[str]] = None) -> GradingResult:
+        """게임의 배팅 옵션 판정 (winning_option_ids를 생략하면 최종 스코어로 자동 판정)"""
         game = await self.game_repository.find_by_id(game_id)
         if not game:
             raise ValueError("게임을 찾을 수 없습니다.")
 
-        bets_to_settle = await self.bet_repository.find_by_game_id(game_id) # This method needs to be added to the repository
-
-        for bet in bets_to_settle:
-            slips = await self.bet_slip_repository.find_by_bet_id(bet.id)
-            is_win = True
-            for slip in slips:
-                if slip.option_id in winning_option_ids:
-                    slip.result = BetSlipResultEnum.WIN
-                else:
-                    slip.result = BetSlipResultEnum.LOSS
-                    is_win = False
-                await self.bet_slip_repository.save(slip)
-            
-            if is_win:
-                bet.win()
-                await self.wallet_service.deposit(
-                    user_id=bet.user_id,
-                    amount=bet.potential_return,
-                    transaction_type="REFUND", # This should be an enum
-                )
-            else:
-                bet.lose()
-            
-            await self.bet_repository.save(bet)
+        options = await self.betting_option_repository.find_by_game_id(game_id)
+        if winning_option_ids is not None:
+            return manual_grades(options, winning_option_ids)
+
+        grading = grade_options(game, options)
+        if grading.ungraded:
+            logger.warning(
+                "게임 %s: 자동 판정하지 못한 배팅 옵션 %d개는 수동 정산이 필요합니다: %s",
+                game_id, len(grading.ungraded), ", ".join(grading.ungraded),
+            )
+        return grading
+
+    async def count_pending_slips(
+        self,
+        game_id: str,
+        slip_results: Dict[str, BetSlipResultEnum],
+        bet_id_range: Optional[BetIdRange] = None,
+    ) -> int:
+        """정산할 대기 슬립 수 (진행률 표시용)"""
+        return await self.bet_slip_repository.count_pending(game_id, list(slip_results), bet_id_range)
+
+    async def settle_game(
+        self,
+        game_id: str,
+        winning_option_ids: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """게임 정산을 한 트랜잭션에서 끝까지 실행 (결과가 확정된 배팅 수 반환)
+
+        API는 정산 작업(jobs)으로 청크마다 커밋하며 실행하고, 이 메서드는 스크립트/운영 도구용입니다.
+        chunk_size를 생략하면 정산 작업과 같은 SETTLEMENT_CHUNK_SIZE를 사용합니다.
+        """
+        chunk_size = chunk_size or settings.SETTLEMENT_CHUNK_SIZE
+        slip_results = (await self.grade_game(game_id, winning_option_ids)).slip_results()
+        settled = 0
+        last_slip_id = None
+        while True:
+            chunk = await self.settle_chunk(game_id, slip_results, last_slip_id, chunk_size)
+            if not chunk.slips:
+                return settled
+            settled += chunk.settled_bets
+            last_slip_id = chunk.last_slip_id
+
+    async def settle_chunk(
+        self,
+        game_id: str,
+        slip_results: Dict[str, BetSlipResultEnum],
+        after_slip_id: Optional[str],
+        limit: int,
+        bet_id_range: Optional[BetIdRange] = None,
+    ) -> SettlementChunk:
+        """슬립 ID 순으로 after_slip_id 다음 limit개 정산
+
+        이 게임의 슬립만으로 배팅 진행 상태를 갱신하고 남은 슬립이 없는 배팅만 확정합니다.
+        조합 배팅의 다른 경기 슬립은 다시 읽지 않으므로 전체 정산 비용은 슬립 수에 비례합니다.
+        bet_id_range로 배팅 ID 범위를 나누면 범위(샤드)끼리는 같은 배팅을 다루지 않으므로 동시에 실행할 수 있고,
+        잠금은 슬립 → 배팅(ID 순) → 지갑(사용자 ID 순) → 배팅 통계(사용자 ID 순)로 잡아 샤드/경기 간 교착을 피합니다.
+        """
+        slips = await self.bet_slip_repository.bulk_set_results(
+            game_id, slip_results, after_id=after_slip_id, limit=limit, bet_id_range=bet_id_range
+        )
+        if not slips:
+            return SettlementChunk()
+
+        slips_by_bet: Dict[str, List[BetSlip]] = defaultdict(list)
+        for slip in slips:
+            slips_by_bet[slip.bet_id].append(slip)
+        bets = await self.bet_repository.lock_pending_by_ids(list(slips_by_bet))
+
+        settled: List[Tuple[Bet, Decimal]] = []
+        credits: Dict[str, Decimal] = defaultdict(Decimal)
+        for bet in bets:
+            for slip in slips_by_bet[bet.id]:
+                payout = bet.settle_leg(slip.result, slip.odds)
+                if payout is not None:
+                    settled.append((bet, payout))
+                    if payout > 0:
+                        credits[bet.user_id] += payout
+
+        await self.bet_repository.bulk_update_settlement(bets)
+        await self.wallet_service.bulk_deposit(credits)
+        if self.bet_stats_repository is not None and settled:
+            await self._record_settled_stats(settled)
+        return SettlementChunk(slips=len(slips), settled_bets=len(settled), last_slip_id=slips[-1].id)
+
+    async def _record_settled_stats(self, settled: List[Tuple[Bet, Decimal]]) -> None:
+        """확정된 배팅을 사용자 배팅 통계에 반영 (사용자 ID 순으로 잠근 뒤 일괄 저장)"""
+        stats = await self.bet_stats_repository.lock_by_user_ids(list({bet.user_id for bet, _ in settled}))
+        for bet, payout in settled:
+            stats[bet.user_id].record_settled(bet.status, bet.total_amount, payout)
+        await self.bet_stats_repository.save_all(list(stats.values()))
@@ -0,0 +1 @@
+"""Job 도메인 패키지"""
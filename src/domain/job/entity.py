@@ -0,0 +1,95 @@
+"""Job 엔티티"""
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+import uuid
+
+from src.domain.job.enums import JobStatusEnum, JobTypeEnum
+
+
+@dataclass
+class Job:
+    """백그라운드 작업 엔티티
+
+    작업은 청크 단위로 진행하며, 청크마다 processed/checkpoint를 같은 트랜잭션에 기록합니다.
+    실행 중인 워커는 lease_expires_at까지 작업을 점유하고, 만료되면 다른 워커가 이어받습니다.
+    작업을 하위 작업(샤드)으로 나누면 부모는 하위 작업이 모두 끝날 때까지 WAITING 상태로 남습니다.
+    """
+    job_type: JobTypeEnum
+    payload: Dict[str, Any] = field(default_factory=dict)
+    status: JobStatusEnum = JobStatusEnum.QUEUED
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    parent_id: Optional[str] = None
+    total: int = 0
+    processed: int = 0
+    checkpoint: Optional[str] = None
+    result: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    attempts: int = 0
+    locked_by: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    available_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatusEnum.SUCCEEDED, JobStatusEnum.FAILED)
+
+    def claim(self, worker_id: str, lease_seconds: float) -> None:
+        """워커가 작업 점유"""
+        now = datetime.utcnow()
+        self.status = JobStatusEnum.RUNNING
+        self.locked_by = worker_id
+        self.lease_expires_at = now + timedelta(seconds=lease_seconds)
+        self.attempts += 1
+        if self.started_at is None:
+            self.started_at = now
+
+    def advance(self, processed: int, checkpoint: Optional[str], lease_seconds: float) -> None:
+        """청크 하나 처리 (점유 기간 연장)"""
+        self.processed += processed
+        self.checkpoint = checkpoint
+        self.lease_expires_at = datetime.utcnow() + timedelta(seconds=lease_seconds)
+
+    def wait_for_children(self, count: int) -> None:
+        """하위 작업 count개로 나누고 점유 해제 (하위 작업이 끝날 때 child_finished로 완료)"""
+        self.status = JobStatusEnum.WAITING
+        self.payload["pending_children"] = count
+        self.locked_by = None
+        self.lease_expires_at = None
+
+    def child_finished(self, child: "Job") -> None:
+        """하위 작업 종료 반영 (하나라도 실패하면 실패, 모두 끝나면 완료)"""
+        self.processed += child.processed
+        self.result["settled_bets"] = self.result.get("settled_bets", 0) + child.result.get("settled_bets", 0)
+        self.payload["pending_children"] = self.payload.get("pending_children", 1) - 1
+        if self.is_finished:
+            return
+        if child.status == JobStatusEnum.FAILED:
+            self.status = JobStatusEnum.FAILED
+            self.error = f"하위 작업 {child.id} 실패: {child.error}"
+            self.finished_at = datetime.utcnow()
+        elif self.payload["pending_children"] <= 0:
+            self.succeed()
+
+    def succeed(self) -> None:
+        """작업 완료"""
+        self.status = JobStatusEnum.SUCCEEDED
+        self.finished_at = datetime.utcnow()
+        self.locked_by = None
+        self.lease_expires_at = None
+        self.error = None
+
+    def fail(self, error: str, max_attempts: int, retry_delay_seconds: float) -> None:
+        """작업 실패 (시도 횟수가 남아 있으면 지연 후 재시도 대기열로)"""
+        self.error = error
+        self.locked_by = None
+        self.lease_expires_at = None
+        if self.attempts >= max_attempts:
+            self.status = JobStatusEnum.FAILED
+            self.finished_at = datetime.utcnow()
+        else:
+            self.status = JobStatusEnum.QUEUED
+            self.available_at = datetime.utcnow() + timedelta(seconds=retry_delay_seconds)
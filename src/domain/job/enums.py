@@ -0,0 +1,16 @@
+"""Job 도메인 관련 Enums"""
+import enum
+
+
+class JobTypeEnum(str, enum.Enum):
+    """작업 종류 Enum"""
+    SETTLEMENT = "정산"
+
+
+class JobStatusEnum(str, enum.Enum):
+    """작업 상태 Enum"""
+    QUEUED = "대기"
+    RUNNING = "실행중"
+    WAITING = "하위작업대기"  # 하위(샤드) 작업이 모두 끝나기를 기다림
+    SUCCEEDED = "완료"
+    FAILED = "실패"
@@ -0,0 +1,33 @@
+"""Job Repository 인터페이스"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from .entity import Job
+
+
+class JobRepository(ABC):
+    """작업 리포지토리 인터페이스"""
+
+    @abstractmethod
+    async def save(self, job: Job) -> None:
+        """작업을 저장 (존재하면 수정)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_id(self, job_id: str) -> Optional[Job]:
+        """ID로 작업 조회"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_id_for_update(self, job_id: str) -> Optional[Job]:
+        """ID로 작업 조회 (트랜잭션 종료까지 행 잠금)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_children(self, parent_id: str) -> List[Job]:
+        """하위 작업 목록"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_next(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """실행할 작업 하나를 점유 (대기 중이거나 점유 기간이 만료된 작업)"""
+        raise NotImplementedError
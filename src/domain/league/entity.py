@@ -5,7 +5,7 @@ from typing import Optional
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class League:
     """리그 엔티티
 
@@ -1,6 +1,6 @@
 """League Repository 인터페이스"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 from .entity import League
 
 
@@ -31,6 +31,18 @@ class LeagueRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_existing_ids(self, league_ids: Iterable[str]) -> Set[str]:
+        """주어진 ID 중 존재하는 리그 ID 조회
+
+        Args:
+            league_ids: 확인할 리그 ID 목록
+
+        Returns:
+            Set[str]: 존재하는 리그 ID
+        """
+        pass
+
     @abstractmethod
     async def find_all(
         self,
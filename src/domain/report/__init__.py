@@ -0,0 +1 @@
+"""Report 도메인 패키지"""
@@ -0,0 +1,51 @@
+"""Report 도메인 엔티티
+
+집계 금액은 배팅 시각(UTC)의 시간/일에 쌓입니다. 조합 배팅은 배팅 금액과 지급액을
+슬립 수로 나눠 각 게임에 배분하므로 게임/리그/스포츠별 합이 전체와 같습니다
+(나눈 몫은 소수 넷째 자리까지라 조합 배팅 하나당 최대 0.0001 차이).
+
+- stake: 배팅 금액
+- settled_stake: 결과가 확정된(적중/미적중/취소) 배팅 금액
+- payout: 지급액 (적중: 원금 × 결과 배당, 취소: 원금 환급)
+- GGR: settled_stake - payout
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+
+@dataclass
+class ReportRow:
+    """보고서 한 행 (기간 × 묶음)"""
+    period_start: datetime
+    # 묶음 키 (스포츠 종류/리그 ID/게임 ID, 전체는 None)
+    group_key: Optional[str]
+    selections: int = 0
+    stake: Decimal = Decimal("0")
+    settled_stake: Decimal = Decimal("0")
+    payout: Decimal = Decimal("0")
+    # 활성 배팅 사용자 수 (일 단위만, 시간 단위는 None)
+    bettors: Optional[int] = None
+
+    @property
+    def ggr(self) -> Decimal:
+        return self.settled_stake - self.payout
+
+    @property
+    def margin(self) -> Optional[Decimal]:
+        """GGR / 결과가 확정된 배팅 금액 (확정된 배팅이 없으면 None)"""
+        if self.settled_stake == 0:
+            return None
+        return (self.ggr / self.settled_stake).quantize(Decimal("0.0001"))
+
+
+@dataclass
+class RollupResult:
+    """집계 작업 한 번의 결과"""
+    hours: int = 0
+    days: int = 0
+    # 이 시각 이전의 배팅/결과 확정이 집계에 반영됨
+    watermark: Optional[datetime] = None
+    # 처리 한도에 걸려 밀린 구간이 남았는지
+    has_more: bool = False
@@ -0,0 +1,16 @@
+"""Report 도메인 관련 Enums"""
+import enum
+
+
+class ReportGranularityEnum(str, enum.Enum):
+    """보고서 집계 단위 Enum (UTC 기준)"""
+    HOURLY = "hourly"
+    DAILY = "daily"
+
+
+class ReportGroupByEnum(str, enum.Enum):
+    """보고서 묶음 기준 Enum"""
+    ALL = "all"
+    SPORT = "sport"
+    LEAGUE = "league"
+    GAME = "game"
@@ -0,0 +1,66 @@
+"""Report Repository 인터페이스"""
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional, Tuple
+
+from .entity import ReportRow
+from .enums import ReportGranularityEnum, ReportGroupByEnum
+
+# 집계 진행 시각 이름
+CREATED_WATERMARK = "bets_created"
+SETTLED_WATERMARK = "bets_settled"
+
+
+class ReportRepository(ABC):
+    """보고서 조회 리포지토리 인터페이스 (집계 테이블만 읽음)"""
+
+    @abstractmethod
+    def iter_rows(
+        self,
+        granularity: ReportGranularityEnum,
+        group_by: ReportGroupByEnum,
+        start: datetime,
+        end: datetime,
+    ) -> AsyncIterator[ReportRow]:
+        """[start, end) 기간의 보고서 행을 기간, 묶음 키 순으로 스트리밍"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_watermark(self) -> Optional[datetime]:
+        """집계가 반영된 시각 (배팅/결과 확정 진행 시각 중 이른 쪽, 집계 전이면 None)"""
+        raise NotImplementedError
+
+
+class RollupRepository(ABC):
+    """집계 테이블 갱신 리포지토리 인터페이스"""
+
+    @abstractmethod
+    async def lock_watermarks(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """집계 진행 시각 (배팅 시각, 결과 확정 시각)을 잠그고 조회 (동시에 한 작업만 집계)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_watermarks(self, created: datetime, settled: datetime) -> None:
+        """집계 진행 시각 저장"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_earliest_bet_at(self) -> Optional[datetime]:
+        """가장 이른 배팅 시각 (배팅이 없으면 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_settled_hours(self, since: Optional[datetime], until: datetime, before: datetime) -> List[datetime]:
+        """[since, until)에 결과가 확정된 배팅 중 before 이전에 접수된 배팅의 배팅 시간 목록"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild_hours(self, hours: List[datetime]) -> int:
+        """시간 집계를 배팅 테이블에서 다시 계산해 교체 (교체한 행 수 반환)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild_days(self, days: List[date]) -> int:
+        """일 집계(시간 집계의 합)와 일별 활성 배팅 사용자 수를 다시 계산해 교체 (교체한 행 수 반환)"""
+        raise NotImplementedError
+
@@ -0,0 +1,96 @@
+"""Report 도메인 서비스 (집계 테이블 증분 갱신)
+
+배팅 시각과 결과 확정 시각 두 가지 진행 시각(watermark)을 둡니다.
+
+1. 배팅 시각 진행 시각의 시간부터 (지금 - 지연)의 시간까지 시간 집계를 다시 계산
+   (진행 시각이 걸친 시간은 이미 집계한 배팅이 섞여 있으므로 그 시간 전체를 다시 계산)
+2. 그 사이 결과가 확정된 배팅 중 1의 범위보다 먼저 접수된 배팅의 시간도 다시 계산
+3. 다시 계산한 시간이 속한 날의 일 집계를 시간 집계의 합으로 교체
+4. 두 진행 시각을 (지금 - 지연)으로 옮김
+
+시간마다 삭제 후 다시 넣으므로 같은 구간을 여러 번 실행해도 결과가 같습니다.
+밀린 구간이 max_hours보다 길면 그만큼만 처리하고 배팅 시각 진행 시각을 그 끝으로 옮깁니다.
+"""
+import logging
+from datetime import date, datetime, timedelta
+from typing import List
+
+from .entity import RollupResult
+from .repository import RollupRepository
+
+logger = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+
+def hour_floor(value: datetime) -> datetime:
+    """그 시간의 시작 (분/초 버림)"""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def day_start(value: date) -> datetime:
+    """그 날 0시"""
+    return datetime(value.year, value.month, value.day)
+
+
+class RollupService:
+    """시간/일 집계 갱신"""
+
+    def __init__(self, rollup_repository: RollupRepository):
+        self.rollup_repository = rollup_repository
+
+    async def run_once(self, now: datetime, lag_seconds: float, max_hours: int) -> RollupResult:
+        """집계 한 구간 (호출한 쪽이 트랜잭션을 커밋)"""
+        until = now - timedelta(seconds=lag_seconds)
+        created_wm, settled_wm = await self.rollup_repository.lock_watermarks()
+
+        start = created_wm
+        if start is None:
+            start = await self.rollup_repository.find_earliest_bet_at()
+            if start is None:
+                # 배팅이 없으면 진행 시각만 옮김
+                await self.rollup_repository.save_watermarks(until, until)
+                return RollupResult(watermark=until)
+        first_hour = hour_floor(start)
+        if created_wm is not None and until <= created_wm:
+            return RollupResult(watermark=min(created_wm, settled_wm or created_wm))
+
+        hours: List[datetime] = []
+        hour = first_hour
+        while hour <= until and len(hours) < max_hours:
+            hours.append(hour)
+            hour += HOUR
+        has_more = hour <= until
+        created_until = hour if has_more else until
+
+        # 결과 확정은 처리한 구간과 관계없이 until까지 반영 (새 배팅 시간은 위 구간에서 다시 계산)
+        settled_hours = await self.rollup_repository.find_settled_hours(settled_wm, until, first_hour)
+        touched = sorted(set(hours) | set(settled_hours))
+
+        await self.rollup_repository.rebuild_hours(touched)
+        days = sorted({hour.date() for hour in touched})
+        await self.rollup_repository.rebuild_days(days)
+        await self.rollup_repository.save_watermarks(created_until, until)
+        logger.info(
+            "배팅 집계: %s ~ %s (시간 %d개, 결과 확정으로 다시 계산한 시간 %d개, 일 %d개)",
+            hours[0], created_until, len(hours), len(set(settled_hours) - set(hours)), len(days),
+        )
+        return RollupResult(
+            hours=len(touched),
+            days=len(days),
+            watermark=min(created_until, until),
+            has_more=has_more,
+        )
+
+    async def rebuild(self, start: date, end: date) -> RollupResult:
+        """[start, end] 날짜의 시간/일 집계를 처음부터 다시 계산 (진행 시각은 그대로)"""
+        hours: List[datetime] = []
+        hour = day_start(start)
+        end_at = day_start(end) + timedelta(days=1)
+        while hour < end_at:
+            hours.append(hour)
+            hour += HOUR
+        await self.rollup_repository.rebuild_hours(hours)
+        days = sorted({hour.date() for hour in hours})
+        await self.rollup_repository.rebuild_days(days)
+        return RollupResult(hours=len(hours), days=len(days))
@@ -13,7 +13,7 @@ class UserRole(str, Enum):
     ADMIN = "admin"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """사용자 엔티티"""
     user_id: UUID = field(default_factory=uuid4)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from decimal import Decimal
 from uuid import UUID
-from typing import Optional
+from typing import Dict, Optional
 
 from src.domain.wallet.entity import Wallet
 
@@ -33,4 +34,9 @@ class WalletRepository(ABC):
     @abstractmethod
     async def delete(self, wallet_id: UUID) -> None:
         """지갑 ID로 지갑을 삭제합니다."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def bulk_credit(self, credits: Dict[str, Decimal]) -> int:
+        """여러 사용자 지갑에 금액을 일괄 입금하고 반영된 지갑 수를 반환합니다."""
+        pass
@@ -1,5 +1,6 @@
+import logging
 from uuid import UUID
-from typing import Optional
+from typing import Dict, Optional
 from decimal import Decimal
 
 from src.domain.wallet.entity import Wallet
@@ -7,6 +8,8 @@ from src.domain.wallet.repository import WalletRepository
 from src.domain.common.value_objects import Money
 from src.domain.common.exceptions import EntityNotFoundException, DomainException
 
+logger = logging.getLogger(__name__)
+
 
 class WalletService:
     """
@@ -38,6 +41,19 @@ class WalletService:
         except ValueError as e:
             raise DomainException(str(e))
 
+    async def bulk_deposit(self, credits: Dict[str, Decimal]) -> int:
+        """
+        여러 사용자 지갑에 금액을 일괄 입금합니다 (정산 지급용).
+        지갑을 조회하지 않고 잔액을 원자적으로 증가시킵니다.
+        """
+        payable = {user_id: amount for user_id, amount in credits.items() if amount > 0}
+        if not payable:
+            return 0
+        updated = await self.wallet_repository.bulk_credit(payable)
+        if updated != len(payable):
+            logger.warning("일괄 입금 대상 지갑 %d개 중 %d개만 반영되었습니다.", len(payable), updated)
+        return updated
+
     async def withdraw_from_wallet(self, user_id: UUID, amount: Money) -> Wallet:
         """
         사용자 지갑에서 금액을 출금합니다.
@@ -1,30 +1,89 @@
 """JWT 토큰 생성 및 검증"""
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from uuid import UUID
-
-from jose import JWTError, jwt
+from typing import Optional, Dict, Any, Tuple
+from uuid import UUID, uuid4
 
 from src.config import settings
 from src.domain.common.exceptions import AuthenticationException
 
+JWT_BACKENDS = ("jose", "pyjwt")
+
+
+class DecodedTokenCache:
+    """검증을 마친 토큰의 LRU 캐시
+
+    키는 토큰 원문 대신 SHA-256 다이제스트를 사용하고, 항목은 토큰의 exp 시각에 만료됩니다.
+    서명 검증 결과만 캐시하므로 무효화(블랙리스트) 확인은 별도로 수행해야 합니다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """캐시된 페이로드 조회 (만료 시 제거)"""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        payload, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        """검증된 페이로드 저장 (exp가 없는 토큰은 저장하지 않음)"""
+        if self.max_size <= 0:
+            return
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+        key = self._key(token)
+        self._entries[key] = (payload, float(expires_at))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self._entries.clear()
+
 
 class JWTHandler:
-    """JWT 토큰 핸들러"""
+    """JWT 토큰 핸들러
+
+    JWT_BACKEND 설정으로 JOSE 구현을 선택합니다.
+    - jose: python-jose (기본값)
+    - pyjwt: PyJWT (HS256 디코드가 더 빠름)
+    """
 
     def __init__(self):
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        if settings.JWT_BACKEND not in JWT_BACKENDS:
+            raise ValueError(f"지원하지 않는 JWT_BACKEND입니다: {settings.JWT_BACKEND} (사용 가능: {JWT_BACKENDS})")
+        self.backend = settings.JWT_BACKEND
+        self.cache = DecodedTokenCache(settings.JWT_DECODE_CACHE_SIZE)
 
     def create_access_token(
         self,
         user_id: UUID,
         username: str,
         role: str,
-        expires_delta: Optional[timedelta] = None
+        expires_delta: Optional[timedelta] = None,
+        family_id: Optional[str] = None,
     ) -> str:
-        """Access Token 생성"""
+        """Access Token 생성 (family_id: 발급 근거가 된 Refresh Token 패밀리)"""
         if expires_delta:
             expire = datetime.utcnow() + expires_delta
         else:
@@ -36,20 +95,58 @@ class JWTHandler:
             "role": role,
             "exp": expire,
             "iat": datetime.utcnow(),
+            "jti": uuid4().hex,
             "type": "access"
         }
-
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        if family_id:
+            to_encode["fid"] = family_id
+        return self._encode(to_encode)
 
     def decode_token(self, token: str) -> Dict[str, Any]:
-        """토큰 디코드 및 검증"""
+        """토큰 디코드 및 검증 (최근 검증한 토큰은 캐시에서 반환)
+
+        반환된 페이로드는 캐시와 공유되므로 수정하지 않아야 합니다.
+        """
+        payload = self.cache.get(token)
+        if payload is None:
+            payload = self._decode(token)
+            self.cache.put(token, payload)
+        return payload
+
+    def _encode(self, claims: Dict[str, Any]) -> str:
+        # JOSE 백엔드(cryptography 등) 로드는 첫 사용 시점으로 지연
+        if self.backend == "pyjwt":
+            import jwt
+
+            return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+        from jose import jwt
+
+        return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+    def _decode(self, token: str) -> Dict[str, Any]:
+        if self.backend == "pyjwt":
+            import jwt
+
+            try:
+                return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            except jwt.PyJWTError as e:
+                raise AuthenticationException(f"토큰 검증 실패: {str(e)}")
+
+        from jose import JWTError, jwt
+
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
+            return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
         except JWTError as e:
             raise AuthenticationException(f"토큰 검증 실패: {str(e)}")
 
+    def get_token_id(self, token: str, payload: Dict[str, Any]) -> str:
+        """블랙리스트 키로 쓰는 토큰 ID (jti, jti가 없는 이전 토큰은 SHA-256 해시)"""
+        jti = payload.get("jti")
+        if jti:
+            return jti
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
     def verify_token(self, token: str) -> bool:
         """토큰 유효성 검증"""
         try:
@@ -1,18 +1,30 @@
 """비밀번호 해싱 유틸리티"""
-from passlib.context import CryptContext
+from typing import Optional, TYPE_CHECKING
 
 from src.config import settings
 
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
 
 class PasswordHasher:
     """bcrypt를 사용한 비밀번호 해싱"""
 
     def __init__(self):
-        self.pwd_context = CryptContext(
-            schemes=["bcrypt"],
-            deprecated="auto",
-            bcrypt__rounds=settings.BCRYPT_ROUNDS
-        )
+        self._pwd_context: Optional["CryptContext"] = None
+
+    @property
+    def pwd_context(self) -> "CryptContext":
+        """CryptContext (passlib/bcrypt 백엔드는 첫 사용 시 로드)"""
+        if self._pwd_context is None:
+            from passlib.context import CryptContext
+
+            self._pwd_context = CryptContext(
+                schemes=["bcrypt"],
+                deprecated="auto",
+                bcrypt__rounds=settings.BCRYPT_ROUNDS
+            )
+        return self._pwd_context
 
     def hash(self, password: str) -> str:
         """비밀번호 해싱"""
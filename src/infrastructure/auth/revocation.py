@@ -0,0 +1,186 @@
+"""Access Token 무효화(블랙리스트) 레지스트리
+
+무효화된 토큰 ID(jti)를 프로세스 내 Bloom 필터로 유지해, 대부분을 차지하는
+"무효화되지 않은 토큰" 확인을 네트워크 I/O 없이 처리합니다.
+필터가 "있을 수도 있음"이라고 답할 때만 Redis의 원본 키를 확인합니다.
+
+Redis 구조:
+    blacklist:{jti}    원본 키 (TTL = 토큰의 남은 유효 시간)
+    blacklist:index    sorted set (member=jti, score=exp) — 스냅샷용
+    blacklist:events   pub/sub 채널 — 다른 워커에 무효화 전파
+
+동기화:
+    구독을 먼저 시작한 뒤 스냅샷을 읽어 공백 없이 필터를 구성하고,
+    REVOCATION_SNAPSHOT_INTERVAL마다 스냅샷으로 필터를 재구성합니다 (만료 항목 정리 포함).
+    구독이 끊겼거나 스냅샷이 오래되면 필터를 신뢰하지 않고 Redis를 직접 조회합니다.
+"""
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from src.config import settings
+from src.infrastructure.cache.redis_client import RedisClient, redis_client
+from src.infrastructure.monitoring.metrics import TOKEN_REVOCATION_CHECKS
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import Pipeline
+
+logger = logging.getLogger(__name__)
+
+BLACKLIST_KEY_PREFIX = "blacklist:"
+BLACKLIST_INDEX_KEY = "blacklist:index"
+BLACKLIST_CHANNEL = "blacklist:events"
+
+# 구독 오류 시 재시도 대기 (초, 실패할 때마다 두 배로 늘림)
+RECONNECT_DELAY_SECONDS = 1.0
+MAX_RECONNECT_DELAY_SECONDS = 30.0
+# 구독 메시지 대기 타임아웃 (소켓 타임아웃보다 짧아야 함)
+POLL_TIMEOUT_SECONDS = 0.5
+
+
+class BloomFilter:
+    """Bloom 필터 (거짓 양성만 있고 거짓 음성은 없음)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevocationRegistry:
+    """토큰 무효화 레지스트리 (Bloom 필터 + Redis 동기화)"""
+
+    def __init__(self, redis: RedisClient):
+        self.redis = redis
+        self.capacity = settings.REVOCATION_FILTER_CAPACITY
+        self.error_rate = settings.REVOCATION_FILTER_ERROR_RATE
+        self.snapshot_interval = settings.REVOCATION_SNAPSHOT_INTERVAL
+        self._filter = BloomFilter(self.capacity, self.error_rate)
+        # 스냅샷으로 재구성 중인 필터 (재구성 중 도착한 무효화도 반영)
+        self._next_filter: Optional[BloomFilter] = None
+        self._subscribed = False
+        self._synced_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_synced(self) -> bool:
+        """필터를 신뢰할 수 있는지 (구독 중이고 스냅샷이 최신)"""
+        return (
+            self._subscribed
+            and self._synced_at is not None
+            and time.monotonic() - self._synced_at < self.snapshot_interval * 2
+        )
+
+    def start(self) -> None:
+        """백그라운드 동기화 시작 (첫 스냅샷 전까지는 Redis 직접 조회)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="revocation-sync")
+
+    async def stop(self) -> None:
+        """백그라운드 동기화 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._subscribed = False
+        self._synced_at = None
+
+    def queue_revoke(self, pipe: "Pipeline", token_id: str, expires_at: Optional[int]) -> None:
+        """무효화 명령을 파이프라인에 추가 (원본 키, 스냅샷 인덱스, 전파)"""
+        expires_at = expires_at or int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        ttl = max(1, int(expires_at - time.time()))
+        pipe.set(f"{BLACKLIST_KEY_PREFIX}{token_id}", "1", ex=ttl)
+        pipe.zadd(BLACKLIST_INDEX_KEY, {token_id: expires_at})
+        pipe.publish(BLACKLIST_CHANNEL, token_id)
+
+    async def revoke(self, token_id: str, expires_at: Optional[int] = None) -> None:
+        """토큰 무효화"""
+        async with self.redis.pipeline() as pipe:
+            self.queue_revoke(pipe, token_id, expires_at)
+        self.add_local(token_id)
+
+    def add_local(self, token_id: str) -> None:
+        """로컬 필터에 반영"""
+        self._filter.add(token_id)
+        if self._next_filter is not None:
+            self._next_filter.add(token_id)
+
+    async def is_revoked(self, token_id: str) -> bool:
+        """토큰 무효화 여부 (필터에 없으면 I/O 없이 False)"""
+        if self.is_synced and token_id not in self._filter:
+            TOKEN_REVOCATION_CHECKS.labels("filter").inc()
+            return False
+        TOKEN_REVOCATION_CHECKS.labels("redis").inc()
+        return await self.redis.exists(f"{BLACKLIST_KEY_PREFIX}{token_id}")
+
+    async def _rebuild(self) -> None:
+        """스냅샷으로 필터 재구성 (만료된 인덱스 항목 정리)"""
+        now = int(time.time())
+        self._next_filter = BloomFilter(self.capacity, self.error_rate)
+        try:
+            async with self.redis.pipeline() as pipe:
+                pipe.zremrangebyscore(BLACKLIST_INDEX_KEY, "-inf", now)
+                pipe.zrange(BLACKLIST_INDEX_KEY, 0, -1)
+                _, token_ids = await pipe.execute()
+            for token_id in token_ids:
+                self._next_filter.add(token_id)
+            self._filter = self._next_filter
+            self._synced_at = time.monotonic()
+        finally:
+            self._next_filter = None
+        if len(token_ids) > self.capacity:
+            logger.warning("무효화 토큰 수(%d)가 필터 용량(%d)을 초과해 오탐률이 높아집니다", len(token_ids), self.capacity)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        delay = RECONNECT_DELAY_SECONDS
+        while True:
+            try:
+                pubsub = self.redis.client.pubsub(ignore_subscribe_messages=True)
+                try:
+                    # 구독 후 스냅샷: 그 사이의 무효화는 메시지로 수신
+                    await pubsub.subscribe(BLACKLIST_CHANNEL)
+                    self._subscribed = True
+                    await self._rebuild()
+                    delay = RECONNECT_DELAY_SECONDS
+                    next_snapshot = loop.time() + self.snapshot_interval
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=POLL_TIMEOUT_SECONDS)
+                        if message and message["type"] == "message":
+                            self.add_local(message["data"])
+                        if loop.time() >= next_snapshot:
+                            await self._rebuild()
+                            next_snapshot = loop.time() + self.snapshot_interval
+                finally:
+                    self._subscribed = False
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("토큰 무효화 동기화 실패, %.0f초 후 재시도 (그동안 Redis 직접 조회): %s", delay, e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+
+# 싱글톤 인스턴스
+revocation_registry = RevocationRegistry(redis_client)
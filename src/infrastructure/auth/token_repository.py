@@ -1,9 +1,112 @@
-"""토큰 저장소 (Redis)"""
+"""토큰 저장소 (Redis)
+
+Refresh Token은 로그인 세션 단위의 "패밀리"로 관리합니다.
+
+    토큰 형식              {family_id}.{secret}
+    refresh_family:{id}    hash (current=현재 secret의 SHA-256, retired=교체된 이전 secret 해시(최근 순),
+                           rotated_at=마지막 교체 시각, user_id, username, role, is_active)
+    refresh_families:{uid} set (사용자의 패밀리 ID 목록, 전체 무효화용)
+
+갱신 시 검증과 교체를 Lua 스크립트 하나로 원자적으로 처리하며, 이미 교체된 이전 토큰이
+다시 사용되면 탈취로 보고 패밀리 전체를 폐기합니다. 발급한 적 없는 secret은 유효하지 않은 토큰으로만
+처리하고, 직전 secret은 REFRESH_TOKEN_REUSE_GRACE_SECONDS 동안 폐기 없이 거절합니다(여러 탭의 동시 갱신). 사용자 클레임을 패밀리에 함께 저장하므로
+갱신에 MySQL 조회가 필요 없습니다. 역할이나 활성 상태가 바뀌면 revoke_all_refresh_tokens()로
+기존 패밀리를 폐기해야 합니다.
+"""
+import hashlib
+import secrets
+import time
+from dataclasses import dataclass
 from uuid import UUID, uuid4
 from typing import Optional
 
 from src.config import settings
 from src.infrastructure.cache.redis_client import redis_client
+from src.infrastructure.auth.revocation import revocation_registry
+
+FAMILY_KEY_PREFIX = "refresh_family:"
+USER_FAMILIES_KEY_PREFIX = "refresh_families:"
+RETIRED_SECRETS_KEPT = 20  # 재사용을 감지할 이전 secret 수 (더 오래된 secret은 유효하지 않은 토큰으로 처리)
+
+# KEYS[1]=패밀리 키, ARGV[1]=제시된 secret 해시, ARGV[2]=새 secret 해시, ARGV[3]=TTL(초),
+# ARGV[4]=사용자 패밀리 목록 키 접두사, ARGV[5]=패밀리 ID, ARGV[6]=현재 시각(초),
+# ARGV[7]=직전 secret 유예 시간(초), ARGV[8]=보관할 이전 secret 해시 수
+# (사용자 ID는 패밀리에서 읽으므로 목록 키를 스크립트 안에서 만듦)
+ROTATE_SCRIPT = """
+local family = redis.call('HMGET', KEYS[1], 'current', 'user_id', 'username', 'role', 'is_active', 'retired', 'rotated_at')
+if not family[1] then
+    return {'invalid'}
+end
+local user_families = ARGV[4] .. family[2]
+local retired = {}
+if family[6] then
+    for hash in string.gmatch(family[6], '%S+') do
+        retired[#retired + 1] = hash
+    end
+end
+if family[1] ~= ARGV[1] then
+    -- 동시에 갱신한 다른 탭이 방금 교체한 secret이면 폐기하지 않음
+    if retired[1] == ARGV[1] and tonumber(ARGV[6]) - tonumber(family[7] or '0') < tonumber(ARGV[7]) then
+        return {'stale'}
+    end
+    for _, hash in ipairs(retired) do
+        if hash == ARGV[1] then
+            redis.call('DEL', KEYS[1])
+            redis.call('SREM', user_families, ARGV[5])
+            return {'reused', family[2]}
+        end
+    end
+    -- 발급한 적 없는 secret은 패밀리 ID만 아는 요청이 패밀리를 폐기하지 못하도록 무시
+    return {'invalid'}
+end
+if family[5] ~= '1' then
+    redis.call('DEL', KEYS[1])
+    redis.call('SREM', user_families, ARGV[5])
+    return {'inactive', family[2]}
+end
+local kept = {ARGV[1]}
+for _, hash in ipairs(retired) do
+    if #kept >= tonumber(ARGV[8]) then
+        break
+    end
+    kept[#kept + 1] = hash
+end
+redis.call('HSET', KEYS[1], 'current', ARGV[2], 'retired', table.concat(kept, ' '), 'rotated_at', ARGV[6])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+-- 교체로 늘어난 패밀리 TTL보다 목록이 먼저 만료되면 전체 무효화에서 빠지므로 함께 연장
+redis.call('EXPIRE', user_families, ARGV[3])
+return {'ok', family[2], family[3], family[4]}
+"""
+
+# KEYS[1]=사용자 패밀리 목록 키, ARGV[1]=패밀리 키 접두사
+REVOKE_ALL_SCRIPT = """
+local families = redis.call('SMEMBERS', KEYS[1])
+for _, family_id in ipairs(families) do
+    redis.call('DEL', ARGV[1] .. family_id)
+end
+redis.call('DEL', KEYS[1])
+return #families
+"""
+
+
+class RefreshTokenReusedError(Exception):
+    """이미 교체된 Refresh Token이 다시 사용됨 (패밀리 폐기됨)"""
+    pass
+
+
+class RefreshTokenUserInactiveError(Exception):
+    """비활성화된 사용자의 Refresh Token (패밀리 폐기됨)"""
+    pass
+
+
+@dataclass
+class RefreshSession:
+    """Refresh Token 교체 결과"""
+    user_id: UUID
+    username: str
+    role: str
+    family_id: str
+    refresh_token: str
 
 
 class TokenRepository:
@@ -13,40 +116,119 @@ class TokenRepository:
         self.redis = redis_client
         self.refresh_token_ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60  # 초 단위
         self.access_token_ttl = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60  # 초 단위
+        self._rotate = self.redis.register_script(ROTATE_SCRIPT)
+        self._revoke_all = self.redis.register_script(REVOKE_ALL_SCRIPT)
+
+    @staticmethod
+    def _hash_secret(secret: str) -> str:
+        return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _new_secret() -> str:
+        return secrets.token_urlsafe(32)
+
+    async def issue_refresh_token(self, user_id: UUID, username: str, role: str, is_active: bool) -> tuple[str, str]:
+        """새 패밀리의 Refresh Token 발급 (로그인 시)
+
+        Returns:
+            tuple[str, str]: (refresh_token, family_id)
+        """
+        family_id = uuid4().hex
+        secret = self._new_secret()
+        family_key = f"{FAMILY_KEY_PREFIX}{family_id}"
+        user_families_key = f"{USER_FAMILIES_KEY_PREFIX}{user_id}"
+        async with self.redis.transaction() as pipe:
+            pipe.hset(family_key, mapping={
+                "current": self._hash_secret(secret),
+                "user_id": str(user_id),
+                "username": username,
+                "role": role,
+                "is_active": "1" if is_active else "0",
+            })
+            pipe.expire(family_key, self.refresh_token_ttl)
+            pipe.sadd(user_families_key, family_id)
+            pipe.expire(user_families_key, self.refresh_token_ttl)
+        return f"{family_id}.{secret}", family_id
+
+    async def rotate_refresh_token(self, refresh_token: str) -> Optional[RefreshSession]:
+        """Refresh Token 검증 및 교체 (Lua 스크립트 1회 왕복)
+
+        Returns:
+            Optional[RefreshSession]: 유효하지 않거나 만료된 토큰, 유예 시간 안의 직전 토큰이면 None
+
+        Raises:
+            RefreshTokenReusedError: 이미 교체된 토큰 재사용 (패밀리 폐기)
+            RefreshTokenUserInactiveError: 비활성화된 사용자 (패밀리 폐기)
+        """
+        family_id, _, secret = refresh_token.partition(".")
+        if not family_id or not secret:
+            return None
+
+        new_secret = self._new_secret()
+        result = await self._rotate(
+            keys=[f"{FAMILY_KEY_PREFIX}{family_id}"],
+            args=[
+                self._hash_secret(secret),
+                self._hash_secret(new_secret),
+                self.refresh_token_ttl,
+                USER_FAMILIES_KEY_PREFIX,
+                family_id,
+                int(time.time()),
+                settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS,
+                RETIRED_SECRETS_KEPT,
+            ],
+        )
+        status = result[0]
+        if status in ("invalid", "stale"):
+            return None
+        if status == "reused":
+            raise RefreshTokenReusedError(family_id)
+        if status == "inactive":
+            raise RefreshTokenUserInactiveError(family_id)
+
+        _, user_id, username, role = result
+        return RefreshSession(
+            user_id=UUID(user_id),
+            username=username,
+            role=role,
+            family_id=family_id,
+            refresh_token=f"{family_id}.{new_secret}",
+        )
+
+    async def revoke_all_refresh_tokens(self, user_id: UUID) -> int:
+        """사용자의 모든 Refresh Token 패밀리 폐기 (폐기한 패밀리 수 반환)"""
+        return await self._revoke_all(
+            keys=[f"{USER_FAMILIES_KEY_PREFIX}{user_id}"],
+            args=[FAMILY_KEY_PREFIX],
+        )
+
+    async def add_to_blacklist(self, token_id: str, expires_at: Optional[int] = None) -> None:
+        """Access Token을 블랙리스트에 추가 (로그아웃 시, 토큰 ID(jti) 기준)"""
+        await revocation_registry.revoke(token_id, expires_at)
+
+    async def is_blacklisted(self, token_id: str) -> bool:
+        """토큰 ID(jti)가 블랙리스트에 있는지 확인 (대부분 로컬 필터에서 I/O 없이 판정)"""
+        return await revocation_registry.is_revoked(token_id)
+
+    async def revoke_session(
+        self,
+        user_id: UUID,
+        token_id: str,
+        expires_at: Optional[int] = None,
+        family_id: Optional[str] = None,
+    ) -> None:
+        """Refresh Token 패밀리 폐기와 Access Token 블랙리스트 등록을 한 번의 왕복으로 처리
 
-    async def save_refresh_token(self, user_id: UUID, token: str) -> None:
-        """Refresh Token 저장"""
-        key = f"refresh_token:{user_id}"
-        await self.redis.set(key, token, expire=self.refresh_token_ttl)
-
-    async def get_refresh_token(self, user_id: UUID) -> Optional[str]:
-        """Refresh Token 조회"""
-        key = f"refresh_token:{user_id}"
-        return await self.redis.get(key)
-
-    async def delete_refresh_token(self, user_id: UUID) -> None:
-        """Refresh Token 삭제"""
-        key = f"refresh_token:{user_id}"
-        await self.redis.delete(key)
-
-    async def verify_refresh_token(self, user_id: UUID, token: str) -> bool:
-        """Refresh Token 검증"""
-        stored_token = await self.get_refresh_token(user_id)
-        return stored_token == token
-
-    async def add_to_blacklist(self, token: str) -> None:
-        """Access Token을 블랙리스트에 추가 (로그아웃 시)"""
-        key = f"blacklist:{token}"
-        await self.redis.set(key, "1", expire=self.access_token_ttl)
-
-    async def is_blacklisted(self, token: str) -> bool:
-        """토큰이 블랙리스트에 있는지 확인"""
-        key = f"blacklist:{token}"
-        return await self.redis.exists(key)
-
-    def generate_refresh_token(self) -> str:
-        """Refresh Token 생성 (UUID)"""
-        return str(uuid4())
+        family_id가 없는 이전 Access Token이면 사용자의 모든 패밀리를 폐기합니다.
+        """
+        if family_id is None:
+            await self.revoke_all_refresh_tokens(user_id)
+        async with self.redis.pipeline() as pipe:
+            if family_id is not None:
+                pipe.delete(f"{FAMILY_KEY_PREFIX}{family_id}")
+                pipe.srem(f"{USER_FAMILIES_KEY_PREFIX}{user_id}", family_id)
+            revocation_registry.queue_revoke(pipe, token_id, expires_at)
+        revocation_registry.add_local(token_id)
 
 
 # 싱글톤 인스턴스
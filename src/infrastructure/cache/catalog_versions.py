@@ -0,0 +1,113 @@
+"""카탈로그(리그/게임/배팅 옵션) 버전 스탬프
+
+    catalog:version:{scope}   string (마지막 변경 시각, 마이크로초)
+
+scope: leagues, games, game:{game_id}, options:{game_id}
+
+조회 API는 응답에 쓰는 scope들의 스탬프로 ETag/Last-Modified를 만들고, 클라이언트가 보낸 검증자와
+같으면 DB를 조회하지 않고 304를 돌려줍니다 (src/presentation/http_cache.py).
+
+리포지토리는 쓰기 메서드에서 mark_catalog_changed()로 바뀐 scope를 세션에 기록하고, 세션이 커밋된 뒤에
+스탬프를 갱신합니다. 커밋 전에 갱신하면 그 사이 조회가 이전 데이터를 새 스탬프로 내보낼 수 있으므로
+조회는 스탬프를 먼저 읽고 DB를 나중에 읽으며, 갱신은 커밋 뒤에 합니다. 커밋 직후 프로세스가 끝나
+갱신이 빠지더라도 스탬프는 CATALOG_VERSION_TTL_SECONDS 뒤 만료되어 새 스탬프로 바뀝니다.
+"""
+import asyncio
+import logging
+import time
+from typing import Iterable, List, Optional, Sequence, Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.infrastructure.cache.redis_client import RedisClient, redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "catalog:version:"
+LEAGUES_SCOPE = "leagues"
+GAMES_SCOPE = "games"
+
+_SESSION_KEY = "catalog_changed"
+
+
+def game_scope(game_id: str) -> str:
+    return f"game:{game_id}"
+
+
+def options_scope(game_id: str) -> str:
+    return f"options:{game_id}"
+
+
+def _now_stamp() -> int:
+    return time.time_ns() // 1000
+
+
+class CatalogVersionStore:
+    """scope별 버전 스탬프 조회/갱신"""
+
+    def __init__(self, redis: RedisClient = redis_client, ttl: int = settings.CATALOG_VERSION_TTL_SECONDS):
+        self.redis = redis
+        self.ttl = ttl
+        # 커밋 후 갱신 태스크 (완료 전 GC 방지)
+        self._pending: Set[asyncio.Task] = set()
+
+    async def get(self, scopes: Sequence[str]) -> List[int]:
+        """scope별 스탬프 (없으면 지금 시각으로 만든 뒤 반환, 조회 1회 + 없는 scope가 있을 때만 1회)"""
+        keys = [f"{KEY_PREFIX}{scope}" for scope in scopes]
+        values = await self.redis.mget(keys)
+        missing = [key for key, value in zip(keys, values) if value is None]
+        if missing:
+            stamp = str(_now_stamp())
+            async with self.redis.pipeline() as pipe:
+                for key in missing:
+                    pipe.set(key, stamp, ex=self.ttl, nx=True)
+            values = await self.redis.mget(keys)
+        return [int(value) if value is not None else _now_stamp() for value in values]
+
+    async def bump(self, scopes: Iterable[str]) -> None:
+        """scope 스탬프를 지금 시각으로 갱신"""
+        stamp = str(_now_stamp())
+        async with self.redis.pipeline() as pipe:
+            for scope in scopes:
+                pipe.set(f"{KEY_PREFIX}{scope}", stamp, ex=self.ttl)
+
+    def bump_later(self, scopes: Set[str]) -> None:
+        """커밋 후 이벤트에서 스탬프 갱신 예약 (실행 중인 이벤트 루프가 없으면 TTL 만료에 맡김)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._bump_quietly(scopes))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _bump_quietly(self, scopes: Set[str]) -> None:
+        try:
+            await self.bump(scopes)
+        except Exception as e:
+            logger.warning("카탈로그 버전 스탬프 갱신 실패 (TTL 만료 후 반영): %s: %s", sorted(scopes), e)
+
+
+def mark_catalog_changed(session: AsyncSession, *scopes: str) -> None:
+    """세션 커밋 후 갱신할 scope 기록 (리포지토리 쓰기 메서드에서 호출)"""
+    if settings.CATALOG_CACHE_ENABLED:
+        session.info.setdefault(_SESSION_KEY, set()).update(scopes)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_after_commit(session: Session) -> None:
+    scopes: Optional[Set[str]] = session.info.pop(_SESSION_KEY, None)
+    if scopes:
+        catalog_versions.bump_later(scopes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_SESSION_KEY, None)
+
+
+# 싱글톤 인스턴스
+catalog_versions = CatalogVersionStore()
@@ -0,0 +1,320 @@
+"""배팅 노출 집계 저장소 (Redis)
+
+    exposure:game:{game_id}       hash
+        stake, payout, bets                          게임 합계
+        {option_id}:stake, {option_id}:payout,
+        {option_id}:bets                             옵션별
+        league                                       리그 ID (리그 목록에서 뺄 때 사용)
+    exposure:games                set (노출이 기록된 게임 ID, 대조용)
+    exposure:league:{league_id}   set (리그에서 노출이 기록된 게임 ID, 리그 노출 조회용)
+    exposure:reservations         sorted set (접수 중 배팅 ID, 점수는 접수 시각)
+    exposure:reservation_lines    hash (배팅 ID → 더한 노출 줄 "game_id option_id stake payout ...")
+
+금액은 소수 오차가 쌓이지 않도록 1/100 단위 정수로 저장하고 HINCRBY로 더합니다.
+한도 검사와 증분은 Lua 스크립트 하나로 원자적으로 처리하므로, 배팅 접수가 몰려도 한도를 넘겨
+더해지지 않으며 검사 비용은 선택 옵션 수에만 비례합니다 (노출 계산에 DB를 읽지 않음).
+
+배팅 접수 트랜잭션이 커밋되기 전에 더하므로, 대조가 DB 집계로 교체할 때 아직 커밋되지 않은 배팅의
+노출이 지워지지 않도록 접수 중 기록을 EXPOSURE_RESERVATION_TTL_SECONDS 동안 남기고, 교체 스크립트가
+커밋되지 않은 접수 중 배팅의 노출을 다시 더합니다. 커밋에 실패한 배팅은 기록이 만료된 뒤의 대조까지
+노출이 실제보다 크게 잡힙니다 (한도 쪽으로 보수적). 정산/취소로 줄어든 노출도 대조에서 정리됩니다.
+"""
+import time
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, List, Optional
+
+from src.config import settings
+from src.domain.betting.exposure import ExposureLine, GameExposure
+from src.domain.betting.repository import ExposureRepository
+from src.infrastructure.cache.redis_client import RedisClient, redis_client
+
+GAME_KEY_PREFIX = "exposure:game:"
+GAMES_KEY = "exposure:games"
+LEAGUE_KEY_PREFIX = "exposure:league:"
+RESERVATIONS_KEY = "exposure:reservations"
+RESERVATION_LINES_KEY = "exposure:reservation_lines"
+
+_UNIT = Decimal("100")
+
+# 만료된 접수 중 기록 정리 (한 번에 최대 1000건, 호출마다 조금씩)
+# KEYS[2]=접수 중 배팅 키, KEYS[3]=접수 중 노출 줄 키, cutoff보다 이전에 접수한 기록 삭제
+# 리그 목록 키는 리그 ID로 스크립트 안에서 만듦 (단일 Redis 기준)
+PRUNE_RESERVATIONS = f"""
+local LEAGUE_KEY_PREFIX = '{LEAGUE_KEY_PREFIX}'
+local function prune_reservations(cutoff)
+    local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', '(' .. cutoff, 'LIMIT', 0, 1000)
+    for _, bet_id in ipairs(expired) do
+        redis.call('ZREM', KEYS[2], bet_id)
+        redis.call('HDEL', KEYS[3], bet_id)
+    end
+end
+"""
+
+# KEYS[1]=게임 목록 키, KEYS[2]=접수 중 배팅 키, KEYS[3]=접수 중 노출 줄 키, KEYS[4..]=줄마다 게임 키
+# ARGV[1]=옵션 지급액 한도, ARGV[2]=게임 지급액 한도 (1/100 단위, 0이면 없음)
+# ARGV[3]=bet_id, ARGV[4]=접수 시각, ARGV[5]=만료 기준 시각
+# ARGV[6..]=줄마다 game_id, league_id(모르면 빈 문자열), option_id, stake, payout
+# 반환: 0(반영) 또는 한도를 넘는 줄 번호(1부터)
+RESERVE_SCRIPT = PRUNE_RESERVATIONS + """
+local option_cap = tonumber(ARGV[1])
+local game_cap = tonumber(ARGV[2])
+local planned = {}
+for i = 4, #KEYS do
+    local base = 5 + (i - 4) * 5
+    local option_id = ARGV[base + 3]
+    local payout = tonumber(ARGV[base + 5])
+    if option_cap > 0 then
+        local current = tonumber(redis.call('HGET', KEYS[i], option_id .. ':payout') or '0')
+        if current + payout > option_cap then
+            return i - 3
+        end
+    end
+    if game_cap > 0 then
+        local total = planned[KEYS[i]] or tonumber(redis.call('HGET', KEYS[i], 'payout') or '0')
+        total = total + payout
+        if total > game_cap then
+            return i - 3
+        end
+        planned[KEYS[i]] = total
+    end
+end
+local lines = {}
+for i = 4, #KEYS do
+    local base = 5 + (i - 4) * 5
+    local game_id, league_id, option_id = ARGV[base + 1], ARGV[base + 2], ARGV[base + 3]
+    redis.call('HINCRBY', KEYS[i], option_id .. ':stake', ARGV[base + 4])
+    redis.call('HINCRBY', KEYS[i], option_id .. ':payout', ARGV[base + 5])
+    redis.call('HINCRBY', KEYS[i], option_id .. ':bets', 1)
+    redis.call('HINCRBY', KEYS[i], 'stake', ARGV[base + 4])
+    redis.call('HINCRBY', KEYS[i], 'payout', ARGV[base + 5])
+    redis.call('HINCRBY', KEYS[i], 'bets', 1)
+    redis.call('SADD', KEYS[1], game_id)
+    if league_id ~= '' then
+        redis.call('HSET', KEYS[i], 'league', league_id)
+        redis.call('SADD', LEAGUE_KEY_PREFIX .. league_id, game_id)
+    end
+    table.insert(lines, table.concat({game_id, option_id, ARGV[base + 4], ARGV[base + 5]}, ' '))
+end
+prune_reservations(ARGV[5])
+redis.call('ZADD', KEYS[2], ARGV[4], ARGV[3])
+redis.call('HSET', KEYS[3], ARGV[3], table.concat(lines, ' '))
+return 0
+"""
+
+# KEYS[1]=게임 목록 키, KEYS[2]=접수 중 배팅 키, KEYS[3]=접수 중 노출 줄 키, KEYS[4..]=교체할 게임 키
+# ARGV[1]=만료 기준 시각, ARGV[2]=커밋된 배팅 수 n, ARGV[3..n+2]=커밋된 배팅 ID
+# 이어서 게임 키마다 game_id, 필드 수 m, 필드/값 m쌍 (m이 0이면 노출 없음)
+# 노출이 남은 게임은 게임 목록/리그 목록에 넣고, 없는 게임은 키를 지우고 목록에서 뺌
+# 반환: 비운 게임 수
+REPLACE_SCRIPT = PRUNE_RESERVATIONS + """
+prune_reservations(ARGV[1])
+local committed = {}
+local n = tonumber(ARGV[2])
+for i = 3, n + 2 do
+    committed[ARGV[i]] = true
+end
+local targets = {}
+local pos = n + 3
+for i = 4, #KEYS do
+    local game_id = ARGV[pos]
+    local m = tonumber(ARGV[pos + 1])
+    local league_id = redis.call('HGET', KEYS[i], 'league')
+    redis.call('DEL', KEYS[i])
+    if league_id then
+        redis.call('HSET', KEYS[i], 'league', league_id)
+    end
+    for j = 0, m - 1 do
+        redis.call('HSET', KEYS[i], ARGV[pos + 2 + j * 2], ARGV[pos + 3 + j * 2])
+    end
+    targets[game_id] = KEYS[i]
+    pos = pos + 2 + m * 2
+end
+-- DB 집계에 없는 접수 중 배팅의 노출을 다시 더함
+for _, bet_id in ipairs(redis.call('ZRANGE', KEYS[2], 0, -1)) do
+    local encoded = redis.call('HGET', KEYS[3], bet_id)
+    if not committed[bet_id] and encoded then
+        local fields = {}
+        for token in string.gmatch(encoded, '%S+') do
+            table.insert(fields, token)
+        end
+        for k = 1, #fields, 4 do
+            local key = targets[fields[k]]
+            if key then
+                local option_id = fields[k + 1]
+                redis.call('HINCRBY', key, option_id .. ':stake', fields[k + 2])
+                redis.call('HINCRBY', key, option_id .. ':payout', fields[k + 3])
+                redis.call('HINCRBY', key, option_id .. ':bets', 1)
+                redis.call('HINCRBY', key, 'stake', fields[k + 2])
+                redis.call('HINCRBY', key, 'payout', fields[k + 3])
+                redis.call('HINCRBY', key, 'bets', 1)
+            end
+        end
+    end
+end
+local cleared = 0
+for game_id, key in pairs(targets) do
+    local league_id = redis.call('HGET', key, 'league')
+    if tonumber(redis.call('HGET', key, 'bets') or '0') > 0 then
+        redis.call('SADD', KEYS[1], game_id)
+        if league_id then
+            redis.call('SADD', LEAGUE_KEY_PREFIX .. league_id, game_id)
+        end
+    else
+        redis.call('DEL', key)
+        redis.call('SREM', KEYS[1], game_id)
+        if league_id then
+            redis.call('SREM', LEAGUE_KEY_PREFIX .. league_id, game_id)
+        end
+        cleared = cleared + 1
+    end
+end
+return cleared
+"""
+
+
+def _to_units(amount: Decimal) -> int:
+    return int((amount * _UNIT).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _from_units(value: Optional[str]) -> Decimal:
+    return Decimal(int(value or 0)) / _UNIT
+
+
+def _game_key(game_id: str) -> str:
+    return f"{GAME_KEY_PREFIX}{game_id}"
+
+
+def _league_key(league_id: str) -> str:
+    return f"{LEAGUE_KEY_PREFIX}{league_id}"
+
+
+class ExposureRepositoryImpl(ExposureRepository):
+    """노출 집계 저장소 구현"""
+
+    def __init__(self, redis: RedisClient = redis_client):
+        self.redis = redis
+        self.option_cap = _to_units(Decimal(settings.EXPOSURE_OPTION_PAYOUT_CAP))
+        self.game_cap = _to_units(Decimal(settings.EXPOSURE_GAME_PAYOUT_CAP))
+        self._reserve = self.redis.register_script(RESERVE_SCRIPT)
+        self._replace = self.redis.register_script(REPLACE_SCRIPT)
+
+    async def reserve(self, bet_id: str, lines: List[ExposureLine]) -> Optional[ExposureLine]:
+        """한도 안이면 노출을 더하고 None, 한도를 넘는 줄이 있으면 아무것도 더하지 않고 그 줄을 반환
+
+        더한 노출은 접수 중 기록(bet_id)으로도 남겨 대조가 커밋 전 배팅의 노출을 지우지 않게 합니다.
+        """
+        if not lines:
+            return None
+        now = time.time()
+        keys = [GAMES_KEY, RESERVATIONS_KEY, RESERVATION_LINES_KEY, *(_game_key(line.game_id) for line in lines)]
+        args: List[object] = [self.option_cap, self.game_cap, bet_id, now, self._expire_before(now)]
+        for line in lines:
+            args.extend((
+                line.game_id, line.league_id or "", line.option_id, _to_units(line.stake), _to_units(line.payout),
+            ))
+        rejected = int(await self._reserve(keys, args))
+        return lines[rejected - 1] if rejected else None
+
+    async def release(self, bet_id: str, lines: List[ExposureLine]) -> None:
+        """reserve로 더한 노출과 접수 중 기록을 되돌림"""
+        async with self.redis.transaction() as pipe:
+            pipe.zrem(RESERVATIONS_KEY, bet_id)
+            pipe.hdel(RESERVATION_LINES_KEY, bet_id)
+            for line in lines:
+                key = _game_key(line.game_id)
+                stake, payout = _to_units(line.stake), _to_units(line.payout)
+                pipe.hincrby(key, f"{line.option_id}:stake", -stake)
+                pipe.hincrby(key, f"{line.option_id}:payout", -payout)
+                pipe.hincrby(key, f"{line.option_id}:bets", -1)
+                pipe.hincrby(key, "stake", -stake)
+                pipe.hincrby(key, "payout", -payout)
+                pipe.hincrby(key, "bets", -1)
+
+    async def find_by_game_ids(self, game_ids: List[str]) -> List[GameExposure]:
+        """게임별 노출 조회 (한 번의 왕복, 노출이 없는 게임은 0)"""
+        if not game_ids:
+            return []
+        async with self.redis.pipeline() as pipe:
+            for game_id in game_ids:
+                pipe.hgetall(_game_key(game_id))
+            rows = await pipe.execute()
+        return [self._to_exposure(game_id, row) for game_id, row in zip(game_ids, rows)]
+
+    async def find_by_league_id(self, league_id: str) -> List[GameExposure]:
+        """리그 노출 게임 목록의 게임별 노출 조회 (리그의 전체 게임을 읽지 않음)"""
+        game_ids = sorted(await self.redis.client.smembers(_league_key(league_id)))
+        return await self.find_by_game_ids(game_ids)
+
+    async def find_reservation_ids(self) -> List[str]:
+        """만료되지 않은 접수 중 기록의 배팅 ID"""
+        return await self.redis.client.zrangebyscore(RESERVATIONS_KEY, self._expire_before(time.time()), "+inf")
+
+    async def replace(
+        self,
+        exposures: List[GameExposure],
+        game_ids: Optional[List[str]] = None,
+        committed_ids: Iterable[str] = (),
+    ) -> int:
+        """DB에서 다시 계산한 노출로 교체 (Lua 스크립트 하나, 반환값은 비운 게임 수)
+
+        교체와 같은 스크립트에서 committed_ids에 없는 접수 중 배팅의 노출을 다시 더하므로,
+        DB 집계 이후에 커밋되는 배팅이나 교체 직전에 접수된 배팅의 노출이 사라지지 않습니다.
+        """
+        computed = {exposure.game_id: exposure for exposure in exposures}
+        if game_ids is None:
+            tracked = set(await self.redis.client.smembers(GAMES_KEY))
+        else:
+            tracked = set(game_ids)
+        targets = sorted(tracked | set(computed))
+        if not targets:
+            return 0
+
+        committed = list(committed_ids)
+        keys = [GAMES_KEY, RESERVATIONS_KEY, RESERVATION_LINES_KEY, *(_game_key(game_id) for game_id in targets)]
+        args: List[object] = [self._expire_before(time.time()), len(committed), *committed]
+        for game_id in targets:
+            mapping = self._to_mapping(computed[game_id]) if game_id in computed else {}
+            args.extend((game_id, len(mapping)))
+            for field, value in mapping.items():
+                args.extend((field, value))
+        return int(await self._replace(keys, args))
+
+    @staticmethod
+    def _expire_before(now: float) -> float:
+        """이 시각 이전의 접수 중 기록은 커밋/롤백이 끝난 것으로 봄"""
+        return now - settings.EXPOSURE_RESERVATION_TTL_SECONDS
+
+    @staticmethod
+    def _to_mapping(exposure: GameExposure) -> Dict[str, object]:
+        mapping: Dict[str, object] = {
+            "stake": _to_units(exposure.stake),
+            "payout": _to_units(exposure.payout),
+            "bets": exposure.bets,
+        }
+        if exposure.league_id is not None:
+            mapping["league"] = exposure.league_id
+        for option in exposure.options.values():
+            mapping[f"{option.option_id}:stake"] = _to_units(option.stake)
+            mapping[f"{option.option_id}:payout"] = _to_units(option.payout)
+            mapping[f"{option.option_id}:bets"] = option.bets
+        return mapping
+
+    @staticmethod
+    def _to_exposure(game_id: str, row: Dict[str, str]) -> GameExposure:
+        exposure = GameExposure(game_id=game_id, league_id=row.get("league"))
+        option_ids = {field.rsplit(":", 1)[0] for field in row if ":" in field}
+        for option_id in sorted(option_ids):
+            bets = int(row.get(f"{option_id}:bets") or 0)
+            if bets <= 0:
+                continue
+            exposure.add(
+                option_id,
+                _from_units(row.get(f"{option_id}:stake")),
+                _from_units(row.get(f"{option_id}:payout")),
+                bets,
+            )
+        # 게임 합계는 저장된 값 사용
+        exposure.stake = _from_units(row.get("stake"))
+        exposure.payout = _from_units(row.get("payout"))
+        exposure.bets = int(row.get("bets") or 0)
+        return exposure
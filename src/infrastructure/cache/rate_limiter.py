@@ -0,0 +1,168 @@
+"""요청 속도 제한 (Redis GCRA + 프로세스 내 토큰 버킷)
+
+    ratelimit:{rule}:{identity}   string (TAT, 밀리초)
+
+GCRA(Generic Cell Rate Algorithm)는 키마다 "다음 요청이 도착해야 할 이론적 시각"(TAT) 하나만 저장합니다.
+count회 / period초 속도로 허용하면서 count회까지는 한 번에 몰려도 허용하며(버스트), 고정 창처럼
+창 경계에서 한도의 두 배가 통과하는 문제가 없습니다. 검사와 갱신은 Lua 스크립트 하나로 원자적으로
+처리하고, 시각은 Redis TIME을 써서 워커/서버 간 시계 차이의 영향을 받지 않습니다.
+
+프로세스마다 같은 한도의 토큰 버킷을 앞에 둡니다. 이 프로세스에서만으로 한도를 넘긴 키는 전체로도
+넘긴 것이므로 Redis를 거치지 않고 거절해, 폭주하는 클라이언트가 Redis 왕복을 늘리지 못합니다.
+Redis 오류 시에는 로컬 버킷만으로 판단합니다 (가용성 우선, 워커 수만큼 한도가 느슨해짐).
+"""
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from src.config import settings
+from src.infrastructure.cache.redis_client import RedisClient, redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "ratelimit:"
+
+# KEYS[1]=키, ARGV[1]=요청 간격(ms), ARGV[2]=버스트 허용 폭(ms, 간격 × 한도)
+# 반환: 0(허용) 또는 다음 요청이 허용될 때까지 남은 시간(ms)
+GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - burst
+if allow_at > now then
+    return allow_at - now
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """count회 / period초 (count회까지는 한 번에 허용)"""
+    count: int
+    period: float
+
+    @property
+    def interval(self) -> float:
+        """요청 간격 (초)"""
+        return self.period / self.count
+
+
+@dataclass
+class RateLimitResult:
+    """속도 제한 판단 결과"""
+    allowed: bool
+    # 다음 요청이 허용될 때까지 남은 시간 (초)
+    retry_after: float = 0.0
+    # 거절한 곳: local(프로세스 내 버킷) / redis
+    source: str = "redis"
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Optional[RateLimit]]:
+    """RATE_LIMITS 설정 파싱
+
+    "login=10/60,bets=30/60,bets@admin=0" → {"login": RateLimit(10, 60), ..., "bets@admin": None}
+    (0이면 제한 없음)
+
+    Raises:
+        ValueError: 형식이 잘못된 규칙
+    """
+    limits: Dict[str, Optional[RateLimit]] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, sep, value = item.partition("=")
+        name, value = name.strip(), value.strip()
+        if not sep or not name:
+            raise ValueError(f"속도 제한 규칙 형식이 잘못되었습니다: {item} (이름[@역할]=횟수/초)")
+        if value == "0":
+            limits[name] = None
+            continue
+        count, sep, period = value.partition("/")
+        try:
+            limit = RateLimit(int(count), float(period))
+        except ValueError:
+            raise ValueError(f"속도 제한 규칙 형식이 잘못되었습니다: {item} (이름[@역할]=횟수/초)") from None
+        if not sep or limit.count <= 0 or limit.period <= 0:
+            raise ValueError(f"속도 제한 규칙 형식이 잘못되었습니다: {item} (이름[@역할]=횟수/초)")
+        limits[name] = limit
+    return limits
+
+
+class LocalTokenBuckets:
+    """키별 토큰 버킷 (프로세스 내, LRU로 키 수 제한)"""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # 키 → (남은 토큰, 마지막 갱신 시각)
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def take(self, key: str, limit: RateLimit, now: float) -> float:
+        """토큰 하나를 쓰고 0, 토큰이 없으면 다음 토큰까지 남은 시간(초) 반환"""
+        tokens, updated_at = self._buckets.get(key, (float(limit.count), now))
+        tokens = min(float(limit.count), tokens + (now - updated_at) / limit.interval)
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) * limit.interval
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+class RateLimiter:
+    """로컬 토큰 버킷 → Redis GCRA 순서로 검사하는 속도 제한기"""
+
+    def __init__(
+        self,
+        redis: RedisClient = redis_client,
+        limits: str = settings.RATE_LIMITS,
+        local_max_keys: int = settings.RATE_LIMIT_LOCAL_MAX_KEYS,
+    ):
+        self.redis = redis
+        self.limits = parse_rate_limits(limits)
+        self.local = LocalTokenBuckets(local_max_keys)
+        self._gcra = self.redis.register_script(GCRA_SCRIPT)
+
+    def limit_for(self, rule: str, role: Optional[str] = None) -> Optional[RateLimit]:
+        """규칙의 한도 ("규칙@역할"이 있으면 우선, 없으면 None = 제한 없음)"""
+        if role is not None and f"{rule}@{role}" in self.limits:
+            return self.limits[f"{rule}@{role}"]
+        return self.limits.get(rule)
+
+    async def hit(self, rule: str, identity: str, limit: RateLimit) -> RateLimitResult:
+        """요청 한 번을 기록하고 허용 여부 반환"""
+        key = f"{rule}:{identity}"
+        wait = self.local.take(key, limit, time.monotonic())
+        if wait > 0:
+            return RateLimitResult(allowed=False, retry_after=wait, source="local")
+
+        interval_ms = max(1, round(limit.interval * 1000))
+        try:
+            retry_ms = int(await self._gcra([f"{KEY_PREFIX}{key}"], [interval_ms, interval_ms * limit.count]))
+        except Exception as e:
+            logger.warning("속도 제한 Redis 검사 실패, 로컬 버킷으로만 판단합니다 (%s): %s", rule, e)
+            return RateLimitResult(allowed=True)
+        if retry_ms > 0:
+            return RateLimitResult(allowed=False, retry_after=retry_ms / 1000, source="redis")
+        return RateLimitResult(allowed=True)
+
+
+# 싱글톤 인스턴스
+rate_limiter = RateLimiter()
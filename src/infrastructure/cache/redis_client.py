@@ -1,52 +1,136 @@
 """Redis 클라이언트"""
-from typing import Optional
-import redis.asyncio as aioredis
+import hashlib
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, TYPE_CHECKING
 
 from src.config import settings
 
+if TYPE_CHECKING:
+    import redis.asyncio as aioredis
+    from redis.asyncio.client import Pipeline
+
+
+class RedisScript:
+    """등록된 Lua 스크립트 (EVALSHA 우선 실행, 서버에 없으면 로드 후 재시도)"""
+
+    def __init__(self, client: "RedisClient", source: str):
+        self.client = client
+        self.source = source
+        self.sha = hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    async def __call__(self, keys: Sequence[str] = (), args: Sequence[Any] = ()) -> Any:
+        """스크립트 실행"""
+        return await self.client.evalsha(self, keys, args)
+
 
 class RedisClient:
-    """Redis 클라이언트"""
+    """Redis 클라이언트
+
+    커넥션 풀 설정(최대 커넥션 수, 소켓 타임아웃, 헬스 체크 주기)을 명시적으로 구성하며,
+    실제 커넥션은 풀이 첫 명령 시점에 지연 연결합니다.
+    """
 
     def __init__(self):
-        self.redis: Optional[aioredis.Redis] = None
+        self.redis: Optional["aioredis.Redis"] = None
+
+    @property
+    def client(self) -> "aioredis.Redis":
+        """Redis 클라이언트 (첫 사용 시 커넥션 풀 생성, 네트워크 I/O 없음)"""
+        if self.redis is None:
+            import redis.asyncio as aioredis
+
+            pool = aioredis.ConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+                encoding="utf-8",
+                decode_responses=True,
+            )
+            self.redis = aioredis.Redis(connection_pool=pool)
+        return self.redis
 
     async def connect(self):
         """Redis 연결"""
-        self.redis = await aioredis.from_url(
-            settings.redis_url,
-            encoding="utf-8",
-            decode_responses=True
-        )
+        await self.client.ping()
+
+    async def ping(self) -> bool:
+        """커넥션 사전 연결 및 상태 확인"""
+        return await self.client.ping()
 
     async def disconnect(self):
         """Redis 연결 해제"""
         if self.redis:
             await self.redis.close()
+            await self.redis.connection_pool.disconnect()
+            self.redis = None
 
     async def get(self, key: str) -> Optional[str]:
         """값 조회"""
-        if not self.redis:
-            await self.connect()
-        return await self.redis.get(key)
+        return await self.client.get(key)
 
     async def set(self, key: str, value: str, expire: Optional[int] = None):
         """값 저장"""
-        if not self.redis:
-            await self.connect()
-        await self.redis.set(key, value, ex=expire)
+        await self.client.set(key, value, ex=expire)
 
-    async def delete(self, key: str):
+    async def delete(self, *keys: str):
         """값 삭제"""
-        if not self.redis:
-            await self.connect()
-        await self.redis.delete(key)
+        await self.client.delete(*keys)
 
     async def exists(self, key: str) -> bool:
         """키 존재 여부 확인"""
-        if not self.redis:
-            await self.connect()
-        return await self.redis.exists(key) > 0
+        return await self.client.exists(key) > 0
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """여러 값 조회 (한 번의 왕복)"""
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
+    async def mset(self, mapping: Dict[str, str], expire: Optional[int] = None):
+        """여러 값 저장 (한 번의 왕복, 만료 시간 지정 시 파이프라인 SET EX)"""
+        if not mapping:
+            return
+        if expire is None:
+            await self.client.mset(mapping)
+            return
+        async with self.pipeline() as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=expire)
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = False) -> AsyncIterator["Pipeline"]:
+        """파이프라인 (블록 종료 시 쌓인 명령을 한 번의 왕복으로 실행)
+
+            async with redis_client.pipeline() as pipe:
+                pipe.delete(key)
+                pipe.set(other_key, "1", ex=60)
+
+        결과가 필요하면 블록 안에서 `await pipe.execute()`를 호출합니다.
+        """
+        async with self.client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+            if pipe.command_stack:
+                await pipe.execute()
+
+    def transaction(self) -> AsyncIterator["Pipeline"]:
+        """MULTI/EXEC 트랜잭션 파이프라인"""
+        return self.pipeline(transaction=True)
+
+    def register_script(self, source: str) -> RedisScript:
+        """Lua 스크립트 등록 (SHA1은 로컬에서 계산, 서버 로드는 첫 실행 시)"""
+        return RedisScript(self, source)
+
+    async def evalsha(self, script: RedisScript, keys: Sequence[str] = (), args: Sequence[Any] = ()) -> Any:
+        """등록된 스크립트 실행 (NOSCRIPT 시 SCRIPT LOAD 후 재시도)"""
+        from redis.exceptions import NoScriptError
+
+        try:
+            return await self.client.evalsha(script.sha, len(keys), *keys, *args)
+        except NoScriptError:
+            await self.client.script_load(script.source)
+            return await self.client.evalsha(script.sha, len(keys), *keys, *args)
 
 
 # 싱글톤 인스턴스
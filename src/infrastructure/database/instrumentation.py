@@ -0,0 +1,81 @@
+"""요청 단위 SQL 실행 통계
+
+SQLAlchemy cursor 실행 이벤트를 요청 컨텍스트(ContextVar)에 묶어
+요청마다 실행된 SQL 문 수, 총 DB 시간, 가장 느린 문을 기록합니다.
+"""
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# 로그에 남길 SQL 문 최대 길이
+MAX_STATEMENT_LENGTH = 300
+
+
+@dataclass
+class QueryStats:
+    """요청 하나에서 실행된 SQL 통계"""
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """SQL 문 실행 기록"""
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms >= self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값"""
+        return f'db;dur={self.total_ms:.2f};desc="{self.count} queries", db-slowest;dur={self.slowest_ms:.2f}'
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> tuple[QueryStats, Token]:
+    """현재 컨텍스트에서 SQL 통계 수집 시작"""
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def stop_query_stats(token: Token) -> None:
+    """SQL 통계 수집 종료"""
+    _query_stats.reset(token)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """현재 컨텍스트의 SQL 통계 (수집 중이 아니면 None)"""
+    return _query_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _query_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _query_stats.get()
+    if stats is None:
+        return
+    started = conn.info.get("query_started_at")
+    if not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    stats.record(statement[:MAX_STATEMENT_LENGTH], elapsed_ms)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진에 SQL 통계 이벤트 리스너 등록"""
+    sync_engine: Engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
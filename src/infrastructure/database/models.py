@@ -1,6 +1,6 @@
 """SQLAlchemy 데이터베이스 모델"""
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, Numeric, Date, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, Integer, Numeric, Date, DateTime, Index, JSON, Text, Enum as SQLEnum
 from sqlalchemy.dialects.mysql import CHAR
 import enum
 
@@ -79,7 +79,7 @@ class GameModel(Base):
 
     id = Column(CHAR(36), primary_key=True, index=True)
     league_id = Column(CHAR(36), nullable=False, index=True)
-    external_id = Column(String(100), nullable=True, index=True)
+    external_id = Column(String(100), nullable=True, unique=True, index=True)
     sport_type = Column(SQLEnum(SportTypeEnum), nullable=False, index=True)
     home_team = Column(String(100), nullable=False)
     away_team = Column(String(100), nullable=False)
@@ -114,6 +114,11 @@ class BettingOptionModel(Base):
     over_under_line = Column(Numeric(5, 2), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
 
+    __table_args__ = (
+        # 일괄 임포트 upsert 키
+        Index("uq_betting_options_game_option", "game_id", "option_type", "option_name", unique=True),
+    )
+
 
 class FavoriteModel(Base):
     """즐겨찾기 테이블"""
@@ -140,7 +145,11 @@ class BetStatusEnum(str, enum.Enum):
 
 
 class BetModel(Base):
-    """배팅 테이블"""
+    """배팅 테이블
+
+    MySQL에서는 created_at 월 단위 파티션 테이블이며 기본 키는 (id, created_at)입니다 (0007 마이그레이션).
+    id는 UUID로 그 자체로 고유하므로 ORM에서는 id만 식별자로 사용합니다.
+    """
     __tablename__ = "bets"
 
     id = Column(CHAR(36), primary_key=True, index=True)
@@ -150,7 +159,14 @@ class BetModel(Base):
     potential_return = Column(Numeric(15, 2), nullable=False)
     total_odds = Column(Numeric(10, 2), nullable=False)
     status = Column(SQLEnum(BetStatusEnum), default=BetStatusEnum.PENDING, nullable=False, index=True)
+    # 정산 진행 상태: 결과가 나오지 않은 슬립 수, 결과가 나온 슬립 배당의 곱 (무효는 1.0)
+    pending_legs = Column(Integer, default=0, nullable=False)
+    settled_odds = Column(Numeric(24, 12), default=1, nullable=False)
+    # 적중한 슬립 수 (결과가 모두 나왔을 때 0이면 모든 슬립이 무효 → 취소)
+    won_legs = Column(Integer, default=0, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # 결과 확정 시각 (적중/미적중/취소, 보고서 집계 재계산 기준)
+    settled_at = Column(DateTime, nullable=True, index=True)
 
 
 class BetSlipResultEnum(str, enum.Enum):
@@ -158,10 +174,11 @@ class BetSlipResultEnum(str, enum.Enum):
     PENDING = "대기"
     WIN = "적중"
     LOSS = "미적중"
+    VOID = "무효"
 
 
 class BetSlipModel(Base):
-    """배팅 슬립 테이블"""
+    """배팅 슬립 테이블 (배팅과 같은 created_at 월 파티션, 기본 키는 BetModel과 같음)"""
     __tablename__ = "bet_slips"
 
     id = Column(CHAR(36), primary_key=True, index=True)
@@ -170,6 +187,77 @@ class BetSlipModel(Base):
     option_id = Column(CHAR(36), nullable=False)
     odds = Column(Numeric(10, 2), nullable=False)
     result = Column(SQLEnum(BetSlipResultEnum), default=BetSlipResultEnum.PENDING, nullable=False)
+    # 배팅 시각 (파티션 키, 배팅의 created_at과 같은 값)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+class UserBetStatsModel(Base):
+    """사용자별 배팅 통계 요약 (배팅 접수/정산 시 증분 갱신, scripts/rebuild_bet_stats.py로 재계산)"""
+    __tablename__ = "user_bet_stats"
+
+    user_id = Column(CHAR(36), primary_key=True)
+    bets_placed = Column(Integer, default=0, nullable=False)
+    total_staked = Column(Numeric(18, 2), default=0, nullable=False)
+    bets_won = Column(Integer, default=0, nullable=False)
+    bets_lost = Column(Integer, default=0, nullable=False)
+    bets_cancelled = Column(Integer, default=0, nullable=False)
+    # 결과가 확정된 배팅의 배팅 금액 합, 지급액 합 (취소 환급 포함)
+    settled_staked = Column(Numeric(18, 2), default=0, nullable=False)
+    total_returned = Column(Numeric(18, 2), default=0, nullable=False)
+    # 양수: 연속 적중 수, 음수: 연속 미적중 수 (정산 순서 기준, 취소는 제외)
+    current_streak = Column(Integer, default=0, nullable=False)
+    longest_win_streak = Column(Integer, default=0, nullable=False)
+    longest_loss_streak = Column(Integer, default=0, nullable=False)
+    last_bet_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class BetRollupHourlyModel(Base):
+    """시간(UTC) x 게임별 배팅 집계 (조합 배팅 금액은 슬립 수로 나눠 배분)"""
+    __tablename__ = "bet_rollups_hourly"
+
+    bucket_start = Column(DateTime, primary_key=True)
+    game_id = Column(CHAR(36), primary_key=True)
+    league_id = Column(CHAR(36), nullable=False)
+    sport_type = Column(SQLEnum(SportTypeEnum), nullable=False)
+    selections = Column(Integer, default=0, nullable=False)
+    stake = Column(Numeric(20, 4), default=0, nullable=False)
+    # 결과가 확정된 배팅 금액과 지급액 (GGR = settled_stake - payout)
+    settled_stake = Column(Numeric(20, 4), default=0, nullable=False)
+    payout = Column(Numeric(20, 4), default=0, nullable=False)
+
+
+class BetRollupDailyModel(Base):
+    """일(UTC) x 게임별 배팅 집계 (시간 집계의 합)"""
+    __tablename__ = "bet_rollups_daily"
+
+    day = Column(Date, primary_key=True)
+    game_id = Column(CHAR(36), primary_key=True)
+    league_id = Column(CHAR(36), nullable=False)
+    sport_type = Column(SQLEnum(SportTypeEnum), nullable=False)
+    selections = Column(Integer, default=0, nullable=False)
+    stake = Column(Numeric(20, 4), default=0, nullable=False)
+    settled_stake = Column(Numeric(20, 4), default=0, nullable=False)
+    payout = Column(Numeric(20, 4), default=0, nullable=False)
+
+
+class BettorRollupDailyModel(Base):
+    """일별 활성 배팅 사용자 수 (scope: all/sport/league/game, scope_key: 스포츠 종류/리그 ID/게임 ID)"""
+    __tablename__ = "bet_rollup_bettors_daily"
+
+    day = Column(Date, primary_key=True)
+    scope = Column(String(10), primary_key=True)
+    scope_key = Column(String(36), primary_key=True)
+    bettors = Column(Integer, default=0, nullable=False)
+
+
+class RollupWatermarkModel(Base):
+    """집계 작업 진행 시각 (이 시각 이전의 배팅/결과 확정은 집계에 반영됨)"""
+    __tablename__ = "rollup_watermarks"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
 
 
 class TransactionTypeEnum(str, enum.Enum):
@@ -181,7 +269,7 @@ class TransactionTypeEnum(str, enum.Enum):
 
 
 class TransactionModel(Base):
-    """거래 내역 테이블"""
+    """거래 내역 테이블 (created_at 월 단위 파티션, 기본 키는 BetModel과 같음)"""
     __tablename__ = "transactions"
 
     id = Column(CHAR(36), primary_key=True, index=True)
@@ -190,3 +278,47 @@ class TransactionModel(Base):
     amount = Column(Numeric(15, 2), nullable=False)
     balance_after = Column(Numeric(15, 2), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+class JobTypeEnum(str, enum.Enum):
+    """작업 종류 Enum"""
+    SETTLEMENT = "정산"
+
+
+class JobStatusEnum(str, enum.Enum):
+    """작업 상태 Enum"""
+    QUEUED = "대기"
+    RUNNING = "실행중"
+    WAITING = "하위작업대기"
+    SUCCEEDED = "완료"
+    FAILED = "실패"
+
+
+class JobModel(Base):
+    """백그라운드 작업 테이블 (정산 등)"""
+    __tablename__ = "jobs"
+
+    id = Column(CHAR(36), primary_key=True, index=True)
+    # 샤드로 나눈 하위 작업의 부모 작업
+    parent_id = Column(CHAR(36), nullable=True, index=True)
+    job_type = Column(SQLEnum(JobTypeEnum), nullable=False)
+    status = Column(SQLEnum(JobStatusEnum), default=JobStatusEnum.QUEUED, nullable=False)
+    payload = Column(JSON, nullable=False)
+    result = Column(JSON, nullable=True)
+    total = Column(Integer, default=0, nullable=False)
+    processed = Column(Integer, default=0, nullable=False)
+    checkpoint = Column(String(64), nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    locked_by = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # 워커 폴링: 상태별 실행 가능 시각 순
+        Index("ix_jobs_status_available_at", "status", "available_at"),
+    )
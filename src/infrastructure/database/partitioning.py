@@ -0,0 +1,211 @@
+"""월별 파티션 관리와 아카이브 (MySQL)
+
+bets, bet_slips, transactions는 created_at 월 단위 RANGE COLUMNS 파티션(p202610, ..., pmax)입니다
+(0007 마이그레이션). 슬립은 배팅과 created_at이 같으므로 배팅과 같은 월 파티션에 들어갑니다.
+
+- ensure_future_partitions(): 이후 월 파티션을 pmax에서 미리 나눠 둠 (pmax에 행이 쌓이면 나눌 때 복사 비용)
+- archive_month(): 정산이 끝난 월의 파티션 행을 압축 아카이브 테이블({table}_archive)로 옮기고 파티션 삭제
+  - 원래 테이블의 컬럼 목록으로 INSERT ... SELECT ... ON DUPLICATE KEY UPDATE를 커밋한 뒤,
+    파티션 행이 모두 아카이브에 있는지 행 수로 확인하고 DROP PARTITION 실행
+  - 중간에 실패하면 다시 실행해 이어감 (이미 옮긴 행은 파티션의 값으로 덮어씀)
+  - 대기 중인 배팅이 남은 월은 옮기지 않음
+
+이력/정산 쿼리의 인덱스는 최근 월 파티션에만 남아 버퍼 풀에 머무르고, 오래된 행은 아카이브 테이블에서 조회합니다.
+"""
+import logging
+import re
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import MetaData, Table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# 아카이브 순서 (배팅 상태로 정산 완료 여부를 판단하므로 슬립/배팅을 함께 옮김)
+PARTITIONED_TABLES = ("bets", "bet_slips", "transactions")
+ARCHIVE_SUFFIX = "_archive"
+MAX_PARTITION = "pmax"
+
+_PARTITION_NAME = re.compile(r"^p(\d{4})(\d{2})$")
+
+
+def month_start(value: datetime) -> date:
+    """그 달 1일"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """월 더하기 (1일 기준)"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def history_start(months: int, now: Optional[datetime] = None) -> Optional[datetime]:
+    """이번 달과 이전 months개월 조회의 시작 시각 (months가 0이면 None = 전체)"""
+    if months <= 0:
+        return None
+    start = add_months(month_start(now or datetime.utcnow()), -months)
+    return datetime(start.year, start.month, 1)
+
+
+_ARCHIVE_METADATA = MetaData()
+
+
+def archive_table(table: Table) -> Table:
+    """아카이브 테이블 정의 (원래 테이블과 같은 컬럼, MySQL에만 존재)"""
+    return table.to_metadata(_ARCHIVE_METADATA, name=f"{table.name}{ARCHIVE_SUFFIX}")
+
+
+class ArchiveMismatchError(RuntimeError):
+    """아카이브 테이블에 옮긴 행 수가 파티션 행 수와 다름 (파티션을 삭제하지 않음)"""
+    pass
+
+
+def _quote(name: str) -> str:
+    return f"`{name}`"
+
+
+def copy_statement(table: str, columns: List[str], partition: str) -> str:
+    """파티션 행을 아카이브 테이블로 복사하는 문장 (컬럼을 이름으로 맞추고, 이미 있는 행은 덮어씀)"""
+    column_list = ", ".join(_quote(column) for column in columns)
+    select_list = ", ".join(f"src.{_quote(column)}" for column in columns)
+    updates = ", ".join(f"{_quote(column)} = src.{_quote(column)}" for column in columns)
+    return (
+        f"INSERT INTO {table}{ARCHIVE_SUFFIX} ({column_list}) "
+        f"SELECT {select_list} FROM {table} PARTITION ({partition}) AS src "
+        f"ON DUPLICATE KEY UPDATE {updates}"
+    )
+
+
+def _partition_definition(month: date) -> str:
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d}')"
+
+
+class PartitionManager:
+    """월별 파티션 추가/아카이브 (MySQL 전용)"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        dialect = session.get_bind().dialect.name
+        if dialect != "mysql":
+            raise NotImplementedError(f"파티션 관리를 지원하지 않는 DB 방언입니다: {dialect}")
+
+    async def list_months(self, table: str) -> List[date]:
+        """테이블의 월 파티션 목록 (pmax 제외, 오래된 순)"""
+        result = await self.session.execute(
+            text(
+                "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL"
+            ),
+            {"table": table},
+        )
+        months = []
+        for (name,) in result.all():
+            match = _PARTITION_NAME.match(name)
+            if match:
+                months.append(date(int(match.group(1)), int(match.group(2)), 1))
+        return sorted(months)
+
+    async def ensure_future_partitions(self, months_ahead: int, today: Optional[date] = None) -> Dict[str, List[str]]:
+        """이번 달부터 months_ahead개월 뒤까지 없는 월 파티션을 pmax에서 나눠 추가
+
+        Returns:
+            테이블 → 추가한 파티션 이름 목록
+        """
+        this_month = month_start(today or datetime.utcnow())
+        added: Dict[str, List[str]] = {}
+        for table in PARTITIONED_TABLES:
+            existing = await self.list_months(table)
+            start = add_months(existing[-1], 1) if existing else this_month
+            missing = []
+            month = start
+            while month <= add_months(this_month, months_ahead):
+                missing.append(month)
+                month = add_months(month, 1)
+            if not missing:
+                continue
+            definitions = ", ".join(_partition_definition(month) for month in missing)
+            await self.session.execute(text(
+                f"ALTER TABLE {table} REORGANIZE PARTITION {MAX_PARTITION} INTO "
+                f"({definitions}, PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE))"
+            ))
+            added[table] = [partition_name(month) for month in missing]
+            logger.info("파티션 추가: %s %s", table, added[table])
+        return added
+
+    async def archivable_months(self, after_months: int, today: Optional[date] = None) -> List[date]:
+        """이번 달보다 after_months개월 넘게 지난 월 파티션 (오래된 순, 일부 테이블만 남은 월 포함)"""
+        cutoff = add_months(month_start(today or datetime.utcnow()), -after_months)
+        months = set()
+        for table in PARTITIONED_TABLES:
+            months.update(month for month in await self.list_months(table) if month < cutoff)
+        return sorted(months)
+
+    async def list_columns(self, table: str) -> List[str]:
+        """테이블 컬럼 이름 (정의 순서)"""
+        result = await self.session.execute(
+            text(
+                "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table ORDER BY ORDINAL_POSITION"
+            ),
+            {"table": table},
+        )
+        return [name for (name,) in result.all()]
+
+    async def _count_rows(self, table: str, partition: str) -> Dict[str, int]:
+        """파티션 행 수와 그중 아카이브 테이블에 있는 행 수"""
+        result = await self.session.execute(text(
+            f"SELECT COUNT(*), COUNT(dst.id) FROM {table} PARTITION ({partition}) AS src "
+            f"LEFT JOIN {table}{ARCHIVE_SUFFIX} AS dst ON dst.id = src.id AND dst.created_at = src.created_at"
+        ))
+        total, archived = result.one()
+        return {"partition": total, "archived": archived}
+
+    async def has_pending_bets(self, month: date) -> bool:
+        """그 월 파티션에 대기 중인 배팅이 있는지 (bets 파티션을 이미 옮겼으면 False)"""
+        if month not in await self.list_months("bets"):
+            return False
+        result = await self.session.execute(text(
+            f"SELECT 1 FROM bets PARTITION ({partition_name(month)}) WHERE status = 'PENDING' LIMIT 1"
+        ))
+        return result.first() is not None
+
+    async def archive_month(self, month: date) -> Optional[Dict[str, int]]:
+        """월 파티션 행을 아카이브 테이블로 옮기고 파티션 삭제
+
+        Returns:
+            테이블 → 옮긴 행 수 (대기 중인 배팅이 있어 옮기지 않았으면 None)
+
+        Raises:
+            ArchiveMismatchError: 아카이브 테이블에 없는 파티션 행이 있음 (복사는 커밋, 파티션은 그대로)
+        """
+        name = partition_name(month)
+        if await self.has_pending_bets(month):
+            logger.info("대기 중인 배팅이 있어 아카이브하지 않음: %s", name)
+            return None
+
+        moved: Dict[str, int] = {}
+        for table in PARTITIONED_TABLES:
+            if month not in await self.list_months(table):
+                continue
+            columns = await self.list_columns(table)
+            await self.session.execute(text(copy_statement(table, columns, name)))
+            moved[table] = 0
+        # DDL은 암묵적으로 커밋하므로 복사를 먼저 확정
+        await self.session.commit()
+        for table in moved:
+            counts = await self._count_rows(table, name)
+            if counts["archived"] != counts["partition"]:
+                raise ArchiveMismatchError(
+                    f"{table} {name}: 파티션 {counts['partition']}행 중 아카이브 {counts['archived']}행"
+                )
+            moved[table] = counts["partition"]
+        for table in moved:
+            await self.session.execute(text(f"ALTER TABLE {table} DROP PARTITION {name}"))
+        logger.info("파티션 아카이브: %s %s", name, moved)
+        return moved
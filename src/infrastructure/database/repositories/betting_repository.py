@@ -1,13 +1,73 @@
 """Betting Repository 구현"""
-from typing import List, Optional
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Set
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.betting.entity import BettingOption, Bet, BetSlip
 from src.domain.betting.enums import BettingOptionTypeEnum, BetTypeEnum, BetStatusEnum, BetSlipResultEnum
-from src.domain.betting.repository import BettingOptionRepository, BetRepository, BetSlipRepository
-from src.infrastructure.database.models import BettingOptionModel, BetModel, BetSlipModel
+from src.domain.betting.exposure import GameExposure
+from src.domain.betting.repository import (
+    BetIdRange,
+    BettingOptionRepository,
+    BetRepository,
+    BetSlipRepository,
+    UserBetStatsRepository,
+)
+from src.domain.betting.stats import UserBetStats, build_stats
+from src.config import settings
+from src.infrastructure.cache.catalog_versions import mark_catalog_changed, options_scope
+from src.infrastructure.database.models import (
+    BettingOptionModel,
+    BetModel,
+    BetSlipModel,
+    GameModel,
+    UserBetStatsModel,
+)
+from src.infrastructure.database.partitioning import archive_table
+from src.infrastructure.database.upsert import chunked, upsert_rows
+
+# 임포트로 갱신하는 배팅 옵션 컬럼 (활성 여부는 운영 중 변경되므로 덮어쓰지 않음)
+OPTION_UPSERT_UPDATE_COLUMNS = ("odds", "handicap_value", "over_under_line")
+
+# 읽기 전용 조회 컬럼 (각 _row_to_entity의 언패킹 순서와 같음)
+OPTION_COLUMNS = (
+    BettingOptionModel.id, BettingOptionModel.game_id, BettingOptionModel.option_type,
+    BettingOptionModel.option_name, BettingOptionModel.odds, BettingOptionModel.is_active,
+    BettingOptionModel.handicap_value, BettingOptionModel.over_under_line,
+)
+BET_COLUMNS = (
+    BetModel.id, BetModel.user_id, BetModel.bet_type, BetModel.total_amount, BetModel.potential_return,
+    BetModel.total_odds, BetModel.status, BetModel.pending_legs, BetModel.settled_odds, BetModel.won_legs,
+    BetModel.created_at,
+)
+SLIP_COLUMNS = (
+    BetSlipModel.id, BetSlipModel.bet_id, BetSlipModel.game_id, BetSlipModel.option_id,
+    BetSlipModel.odds, BetSlipModel.result, BetSlipModel.created_at,
+)
+
+STATS_COLUMNS = (
+    UserBetStatsModel.user_id, UserBetStatsModel.bets_placed, UserBetStatsModel.total_staked,
+    UserBetStatsModel.bets_won, UserBetStatsModel.bets_lost, UserBetStatsModel.bets_cancelled,
+    UserBetStatsModel.settled_staked, UserBetStatsModel.total_returned, UserBetStatsModel.current_streak,
+    UserBetStatsModel.longest_win_streak, UserBetStatsModel.longest_loss_streak, UserBetStatsModel.last_bet_at,
+)
+
+
+def _bet_id_range_filter(bet_id_range: Optional[BetIdRange]) -> list:
+    """배팅 ID 범위 [시작, 끝) 조건"""
+    if bet_id_range is None:
+        return []
+    start, end = bet_id_range
+    conditions = []
+    if start is not None:
+        conditions.append(BetSlipModel.bet_id >= start)
+    if end is not None:
+        conditions.append(BetSlipModel.bet_id < end)
+    return conditions
 
 
 class BettingOptionRepositoryImpl(BettingOptionRepository):
@@ -17,18 +77,27 @@ class BettingOptionRepositoryImpl(BettingOptionRepository):
         self.session = session
 
     async def save(self, option: BettingOption) -> None:
-        """배팅 옵션을 저장"""
-        option_model = BettingOptionModel(
-            id=option.id,
-            game_id=option.game_id,
-            option_type=option.option_type,
-            option_name=option.option_name,
-            odds=option.odds,
-            handicap_value=option.handicap_value,
-            over_under_line=option.over_under_line,
-            is_active=option.is_active,
-        )
-        self.session.add(option_model)
+        """배팅 옵션을 저장 (존재하면 수정)"""
+        mark_catalog_changed(self.session, options_scope(option.game_id))
+        option_model = await self.session.get(BettingOptionModel, option.id)
+        if option_model:
+            option_model.option_name = option.option_name
+            option_model.odds = option.odds
+            option_model.handicap_value = option.handicap_value
+            option_model.over_under_line = option.over_under_line
+            option_model.is_active = option.is_active
+        else:
+            option_model = BettingOptionModel(
+                id=option.id,
+                game_id=option.game_id,
+                option_type=option.option_type,
+                option_name=option.option_name,
+                odds=option.odds,
+                handicap_value=option.handicap_value,
+                over_under_line=option.over_under_line,
+                is_active=option.is_active,
+            )
+            self.session.add(option_model)
         await self.session.flush()
 
     async def find_by_id(self, option_id: str) -> Optional[BettingOption]:
@@ -39,10 +108,10 @@ class BettingOptionRepositoryImpl(BettingOptionRepository):
         return self._to_entity(model) if model else None
 
     async def find_by_game_id(self, game_id: str) -> List[BettingOption]:
-        """게임 ID로 배팅 옵션 목록 조회"""
-        stmt = select(BettingOptionModel).where(BettingOptionModel.game_id == game_id)
+        """게임 ID로 배팅 옵션 목록 조회 (읽기 전용, 컬럼 튜플로 조회)"""
+        stmt = select(*OPTION_COLUMNS).where(BettingOptionModel.game_id == game_id)
         result = await self.session.execute(stmt)
-        return [self._to_entity(model) for model in result.scalars().all()]
+        return [self._row_to_entity(row) for row in result.all()]
 
     async def delete(self, option_id: str) -> bool:
         """배팅 옵션을 삭제"""
@@ -52,9 +121,63 @@ class BettingOptionRepositoryImpl(BettingOptionRepository):
         if model:
             await self.session.delete(model)
             await self.session.flush()
+            mark_catalog_changed(self.session, options_scope(model.game_id))
             return True
         return False
 
+    async def bulk_upsert(self, options: List[BettingOption]) -> int:
+        """(game_id, option_type, option_name) 기준 일괄 upsert (청크당 1문장)"""
+        mark_catalog_changed(self.session, *{options_scope(option.game_id) for option in options})
+        for chunk in chunked(options, settings.IMPORT_CHUNK_SIZE):
+            rows = [
+                {
+                    "id": option.id,
+                    "game_id": option.game_id,
+                    "option_type": option.option_type,
+                    "option_name": option.option_name,
+                    "odds": option.odds,
+                    "handicap_value": option.handicap_value,
+                    "over_under_line": option.over_under_line,
+                    "is_active": option.is_active,
+                }
+                for option in chunk
+            ]
+            await upsert_rows(
+                self.session,
+                BettingOptionModel,
+                rows,
+                ("game_id", "option_type", "option_name"),
+                OPTION_UPSERT_UPDATE_COLUMNS,
+            )
+        return len(options)
+
+    async def find_by_game_ids(self, game_ids: List[str]) -> List[BettingOption]:
+        """여러 게임의 배팅 옵션 목록 조회 (청크당 쿼리 1회, 변경은 bulk_update로 반영)"""
+        options: List[BettingOption] = []
+        for chunk in chunked(list(game_ids), settings.IMPORT_CHUNK_SIZE):
+            stmt = select(*OPTION_COLUMNS).where(BettingOptionModel.game_id.in_(chunk))
+            result = await self.session.execute(stmt)
+            options.extend(self._row_to_entity(row) for row in result.all())
+        return options
+
+    async def bulk_update(self, options: List[BettingOption]) -> None:
+        """기본 키 기준 일괄 UPDATE (청크당 executemany 1회)"""
+        mark_catalog_changed(self.session, *{options_scope(option.game_id) for option in options})
+        for chunk in chunked(options, settings.IMPORT_CHUNK_SIZE):
+            await self.session.execute(
+                update(BettingOptionModel),
+                [
+                    {
+                        "id": option.id,
+                        "odds": option.odds,
+                        "handicap_value": option.handicap_value,
+                        "over_under_line": option.over_under_line,
+                        "is_active": option.is_active,
+                    }
+                    for option in chunk
+                ],
+            )
+
     def _to_entity(self, model: BettingOptionModel) -> BettingOption:
         """BettingOptionModel을 BettingOption 엔티티로 변환"""
         return BettingOption(
@@ -68,6 +191,21 @@ class BettingOptionRepositoryImpl(BettingOptionRepository):
             is_active=model.is_active,
         )
 
+    @staticmethod
+    def _row_to_entity(row: Row) -> BettingOption:
+        """OPTION_COLUMNS 행 튜플을 BettingOption 엔티티로 변환"""
+        option_id, game_id, option_type, option_name, odds, is_active, handicap_value, over_under_line = row
+        return BettingOption(
+            id=option_id,
+            game_id=game_id,
+            option_type=BettingOptionTypeEnum(option_type),
+            option_name=option_name,
+            odds=odds,
+            is_active=is_active,
+            handicap_value=handicap_value,
+            over_under_line=over_under_line,
+        )
+
 
 class BetRepositoryImpl(BetRepository):
     """Bet Repository 구현"""
@@ -76,16 +214,26 @@ class BetRepositoryImpl(BetRepository):
         self.session = session
 
     async def save(self, bet: Bet) -> None:
-        bet_model = BetModel(
-            id=bet.id,
-            user_id=bet.user_id,
-            bet_type=bet.bet_type,
-            total_amount=bet.total_amount,
-            potential_return=bet.potential_return,
-            total_odds=bet.total_odds,
-            status=bet.status,
-        )
-        self.session.add(bet_model)
+        bet_model = await self.session.get(BetModel, bet.id)
+        if bet_model:
+            bet_model.status = bet.status
+            if bet.status != BetStatusEnum.PENDING and bet_model.settled_at is None:
+                bet_model.settled_at = datetime.utcnow()
+        else:
+            bet_model = BetModel(
+                id=bet.id,
+                user_id=bet.user_id,
+                bet_type=bet.bet_type,
+                total_amount=bet.total_amount,
+                potential_return=bet.potential_return,
+                total_odds=bet.total_odds,
+                status=bet.status,
+                pending_legs=bet.pending_legs,
+                settled_odds=bet.settled_odds,
+                won_legs=bet.won_legs,
+                created_at=bet.created_at,
+            )
+            self.session.add(bet_model)
         await self.session.flush()
 
     async def find_by_id(self, bet_id: str) -> Optional[Bet]:
@@ -94,10 +242,39 @@ class BetRepositoryImpl(BetRepository):
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
-    async def find_by_user_id(self, user_id: str) -> List[Bet]:
-        stmt = select(BetModel).where(BetModel.user_id == user_id)
-        result = await self.session.execute(stmt)
-        return [self._to_entity(model) for model in result.scalars().all()]
+    async def find_by_user_id(self, user_id: str, since: Optional[datetime] = None) -> List[Bet]:
+        """사용자의 배팅 목록을 슬립과 함께 조회 (읽기 전용, 배팅/슬립 컬럼 튜플 쿼리 각 1회)
+
+        since를 주면 그 시각 이후 배팅과, 그 전이라도 대기 중인 배팅만 조회합니다
+        (결과가 나오지 않은 장기 배팅이 내역에서 빠지지 않도록).
+        """
+        in_range = None
+        if since is not None:
+            in_range = or_(BetModel.created_at >= since, BetModel.status == BetStatusEnum.PENDING)
+        stmt = select(*BET_COLUMNS).where(BetModel.user_id == user_id)
+        if in_range is not None:
+            stmt = stmt.where(in_range)
+        bets = {row[0]: self._row_to_entity(row) for row in (await self.session.execute(stmt)).all()}
+        if not bets:
+            return []
+
+        slip_stmt = (
+            select(*SLIP_COLUMNS)
+            .join(
+                BetModel,
+                (BetModel.id == BetSlipModel.bet_id) & (BetModel.created_at == BetSlipModel.created_at),
+            )
+            .where(BetModel.user_id == user_id)
+            .order_by(BetSlipModel.id)
+        )
+        if in_range is not None:
+            slip_stmt = slip_stmt.where(in_range)
+        for row in (await self.session.execute(slip_stmt)).all():
+            slip = BetSlipRepositoryImpl._row_to_entity(row)
+            bet = bets.get(slip.bet_id)
+            if bet is not None:
+                bet.slips.append(slip)
+        return list(bets.values())
 
     async def find_by_game_id(self, game_id: str) -> List[Bet]:
         # First, find all bet_ids from BetSlipModel for the given game_id
@@ -113,6 +290,54 @@ class BetRepositoryImpl(BetRepository):
         bet_result = await self.session.execute(bet_stmt)
         return [self._to_entity(model) for model in bet_result.scalars().all()]
 
+    async def lock_pending_by_ids(self, bet_ids: List[str]) -> List[Bet]:
+        """ID 목록 중 대기 상태인 배팅을 SELECT ... FOR UPDATE로 조회 (청크당 쿼리 1회)
+
+        여러 게임을 동시에 정산해도 같은 조합 배팅의 진행 상태를 덮어쓰지 않도록 잠그며,
+        교착을 피하도록 ID 순서로 잠급니다.
+        """
+        bets: List[Bet] = []
+        for chunk in chunked(sorted(set(bet_ids)), settings.SETTLEMENT_CHUNK_SIZE):
+            stmt = (
+                select(BetModel)
+                .where(BetModel.id.in_(chunk), BetModel.status == BetStatusEnum.PENDING)
+                .order_by(BetModel.id)
+                .with_for_update()
+            )
+            result = await self.session.execute(stmt)
+            bets.extend(self._to_entity(model) for model in result.scalars().all())
+        return bets
+
+    async def bulk_update_settlement(self, bets: List[Bet]) -> None:
+        """기본 키 기준 상태/정산 진행 상태 일괄 UPDATE (청크당 executemany 1회)
+
+        결과가 확정된 배팅은 settled_at을 기록합니다 (보고서 집계가 다시 계산할 시간을 찾는 기준).
+        """
+        settled_at = datetime.utcnow()
+        for chunk in chunked(bets, settings.SETTLEMENT_CHUNK_SIZE):
+            await self.session.execute(
+                update(BetModel),
+                [
+                    {
+                        "id": bet.id,
+                        "status": bet.status,
+                        "pending_legs": bet.pending_legs,
+                        "settled_odds": bet.settled_odds,
+                        "won_legs": bet.won_legs,
+                        "settled_at": settled_at if bet.status != BetStatusEnum.PENDING else None,
+                    }
+                    for bet in chunk
+                ],
+            )
+
+    async def find_existing_ids(self, bet_ids: List[str]) -> Set[str]:
+        """ID 목록 중 저장된 배팅의 ID (청크당 쿼리 1회, 상태 무관)"""
+        existing: Set[str] = set()
+        for chunk in chunked(sorted(set(bet_ids)), settings.IMPORT_CHUNK_SIZE):
+            result = await self.session.execute(select(BetModel.id).where(BetModel.id.in_(chunk)))
+            existing.update(result.scalars().all())
+        return existing
+
     def _to_entity(self, model: BetModel) -> Bet:
         return Bet(
             id=model.id,
@@ -122,6 +347,31 @@ class BetRepositoryImpl(BetRepository):
             potential_return=model.potential_return,
             total_odds=model.total_odds,
             status=BetStatusEnum(model.status),
+            pending_legs=model.pending_legs,
+            settled_odds=model.settled_odds,
+            won_legs=model.won_legs,
+            created_at=model.created_at,
+        )
+
+    @staticmethod
+    def _row_to_entity(row: Row) -> Bet:
+        """BET_COLUMNS 행 튜플을 Bet 엔티티로 변환 (슬립 제외)"""
+        (
+            bet_id, user_id, bet_type, total_amount, potential_return, total_odds, status,
+            pending_legs, settled_odds, won_legs, created_at,
+        ) = row
+        return Bet(
+            id=bet_id,
+            user_id=user_id,
+            bet_type=BetTypeEnum(bet_type),
+            total_amount=total_amount,
+            potential_return=potential_return,
+            total_odds=total_odds,
+            status=BetStatusEnum(status),
+            pending_legs=pending_legs,
+            settled_odds=settled_odds,
+            won_legs=won_legs,
+            created_at=created_at,
         )
 
 
@@ -132,21 +382,118 @@ class BetSlipRepositoryImpl(BetSlipRepository):
         self.session = session
 
     async def save(self, slip: BetSlip) -> None:
-        slip_model = BetSlipModel(
-            id=slip.id,
-            bet_id=slip.bet_id,
-            game_id=slip.game_id,
-            option_id=slip.option_id,
-            odds=slip.odds,
-            result=slip.result,
-        )
-        self.session.add(slip_model)
+        slip_model = await self.session.get(BetSlipModel, slip.id)
+        if slip_model:
+            slip_model.result = slip.result
+        else:
+            slip_model = BetSlipModel(
+                id=slip.id,
+                bet_id=slip.bet_id,
+                game_id=slip.game_id,
+                option_id=slip.option_id,
+                odds=slip.odds,
+                result=slip.result,
+                created_at=slip.created_at,
+            )
+            self.session.add(slip_model)
         await self.session.flush()
 
     async def find_by_bet_id(self, bet_id: str) -> List[BetSlip]:
-        stmt = select(BetSlipModel).where(BetSlipModel.bet_id == bet_id)
+        """배팅 ID로 슬립 목록 조회 (읽기 전용, 컬럼 튜플로 조회)"""
+        stmt = select(*SLIP_COLUMNS).where(BetSlipModel.bet_id == bet_id)
         result = await self.session.execute(stmt)
-        return [self._to_entity(model) for model in result.scalars().all()]
+        return [self._row_to_entity(row) for row in result.all()]
+
+    async def count_pending(
+        self, game_id: str, option_ids: List[str], bet_id_range: Optional[BetIdRange] = None
+    ) -> int:
+        """게임의 대기 슬립 중 지정한 옵션의 슬립 수 (bet_id_range를 주면 그 범위 배팅의 슬립만)"""
+        count = 0
+        for chunk in chunked(list(option_ids), settings.IMPORT_CHUNK_SIZE):
+            stmt = select(func.count(BetSlipModel.id)).where(
+                BetSlipModel.game_id == game_id,
+                BetSlipModel.result == BetSlipResultEnum.PENDING,
+                BetSlipModel.option_id.in_(chunk),
+                *_bet_id_range_filter(bet_id_range),
+            )
+            count += (await self.session.execute(stmt)).scalar_one()
+        return count
+
+    async def bulk_set_results(
+        self,
+        game_id: str,
+        results: Dict[str, BetSlipResultEnum],
+        after_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        bet_id_range: Optional[BetIdRange] = None,
+    ) -> List[BetSlip]:
+        """게임의 대기 슬립에 옵션별 결과 일괄 기록
+
+        대상 슬립을 잠근 뒤 대기 상태인 것만 결과 종류(적중/미적중/무효)별 UPDATE로 기록하므로
+        같은 게임을 동시에 또는 다시 정산해도 중복 처리되지 않습니다.
+        limit을 주면 슬립 ID 순으로 after_id 다음부터 limit개만 처리합니다 (청크 정산).
+        bet_id_range를 주면 그 범위 배팅의 슬립만 처리합니다 (샤드 정산).
+        """
+        if not results:
+            return []
+        stmt = select(BetSlipModel).where(
+            BetSlipModel.game_id == game_id,
+            BetSlipModel.result == BetSlipResultEnum.PENDING,
+            BetSlipModel.option_id.in_(list(results)),
+            *_bet_id_range_filter(bet_id_range),
+        )
+        if after_id is not None:
+            stmt = stmt.where(BetSlipModel.id > after_id)
+        if limit is not None:
+            stmt = stmt.order_by(BetSlipModel.id).limit(limit)
+        stmt = stmt.with_for_update()
+        slips = [self._to_entity(model) for model in (await self.session.execute(stmt)).scalars().all()]
+        if not slips:
+            return []
+
+        slip_ids_by_result: Dict[BetSlipResultEnum, List[str]] = {}
+        for slip in slips:
+            slip.result = results[slip.option_id]
+            slip_ids_by_result.setdefault(slip.result, []).append(slip.id)
+        for slip_result, slip_ids in slip_ids_by_result.items():
+            for chunk in chunked(slip_ids, settings.SETTLEMENT_CHUNK_SIZE):
+                await self.session.execute(
+                    update(BetSlipModel)
+                    .where(BetSlipModel.id.in_(chunk))
+                    .values(result=slip_result)
+                    .execution_options(synchronize_session=False)
+                )
+        return slips
+
+    async def aggregate_pending_exposure(self, game_ids: Optional[List[str]] = None) -> List[GameExposure]:
+        """대기 배팅의 대기 슬립으로 게임/옵션별 노출 계산 (game_ids가 없으면 전체, 리그 ID 포함)"""
+        stmt = (
+            select(
+                BetSlipModel.game_id,
+                GameModel.league_id,
+                BetSlipModel.option_id,
+                func.sum(BetModel.total_amount),
+                func.sum(BetModel.potential_return),
+                func.count(BetSlipModel.id),
+            )
+            .join(BetModel, BetModel.id == BetSlipModel.bet_id)
+            .join(GameModel, GameModel.id == BetSlipModel.game_id)
+            .where(
+                BetSlipModel.result == BetSlipResultEnum.PENDING,
+                BetModel.status == BetStatusEnum.PENDING,
+            )
+            .group_by(BetSlipModel.game_id, GameModel.league_id, BetSlipModel.option_id)
+        )
+        if game_ids is not None:
+            if not game_ids:
+                return []
+            stmt = stmt.where(BetSlipModel.game_id.in_(game_ids))
+
+        exposures: Dict[str, GameExposure] = {}
+        for game_id, league_id, option_id, stake, payout, bets in (await self.session.execute(stmt)).all():
+            exposure = exposures.setdefault(game_id, GameExposure(game_id=game_id, league_id=league_id))
+            exposure.add(option_id, Decimal(str(stake or 0)), Decimal(str(payout or 0)), bets)
+        return list(exposures.values())
 
     def _to_entity(self, model: BetSlipModel) -> BetSlip:
         return BetSlip(
@@ -156,4 +503,149 @@ class BetSlipRepositoryImpl(BetSlipRepository):
             option_id=model.option_id,
             odds=model.odds,
             result=BetSlipResultEnum(model.result),
+            created_at=model.created_at,
+        )
+
+    @staticmethod
+    def _row_to_entity(row: Row) -> BetSlip:
+        """SLIP_COLUMNS 행 튜플을 BetSlip 엔티티로 변환"""
+        slip_id, bet_id, game_id, option_id, odds, result, created_at = row
+        return BetSlip(
+            id=slip_id,
+            bet_id=bet_id,
+            game_id=game_id,
+            option_id=option_id,
+            odds=odds,
+            result=BetSlipResultEnum(result),
+            created_at=created_at,
+        )
+
+
+class UserBetStatsRepositoryImpl(UserBetStatsRepository):
+    """UserBetStats Repository 구현"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add_placed(self, user_id: str, amount: Decimal, placed_at: datetime) -> None:
+        """INSERT ... ON DUPLICATE KEY UPDATE bets_placed = bets_placed + 1 (쿼리 1회)"""
+        stats = UserBetStats(user_id=user_id)
+        stats.record_placed(amount, placed_at)
+        await upsert_rows(
+            self.session,
+            UserBetStatsModel,
+            [self._to_row(stats)],
+            conflict_columns=("user_id",),
+            update_columns=("last_bet_at", "updated_at"),
+            increment_columns=("bets_placed", "total_staked"),
+        )
+
+    async def lock_by_user_ids(self, user_ids: List[str]) -> Dict[str, UserBetStats]:
+        """사용자 ID 순으로 SELECT ... FOR UPDATE (지갑 적립과 같은 순서로 잠가 교착 방지)"""
+        stats = {user_id: UserBetStats(user_id=user_id) for user_id in user_ids}
+        for chunk in chunked(sorted(stats), settings.SETTLEMENT_CHUNK_SIZE):
+            stmt = (
+                select(*STATS_COLUMNS)
+                .where(UserBetStatsModel.user_id.in_(chunk))
+                .order_by(UserBetStatsModel.user_id)
+                .with_for_update()
+            )
+            for row in (await self.session.execute(stmt)).all():
+                stats[row[0]] = self._row_to_entity(row)
+        return stats
+
+    async def save_all(self, stats: List[UserBetStats]) -> None:
+        """사용자 ID 순 다중 행 upsert (청크당 쿼리 1회)"""
+        rows = [self._to_row(item) for item in sorted(stats, key=lambda item: item.user_id)]
+        update_columns = [column for column in rows[0] if column != "user_id"] if rows else []
+        for chunk in chunked(rows, settings.SETTLEMENT_CHUNK_SIZE):
+            await upsert_rows(self.session, UserBetStatsModel, list(chunk), ("user_id",), update_columns)
+
+    async def find_by_user_id(self, user_id: str) -> Optional[UserBetStats]:
+        """기본 키 조회 1회 (읽기 전용, 컬럼 튜플로 조회)"""
+        stmt = select(*STATS_COLUMNS).where(UserBetStatsModel.user_id == user_id)
+        row = (await self.session.execute(stmt)).first()
+        return self._row_to_entity(row) if row else None
+
+    async def list_bettor_ids(self, after: Optional[str], limit: int) -> List[str]:
+        """배팅한 사용자 ID를 ID 순으로 after 다음부터 limit개 (MySQL은 아카이브 포함, 재계산 배치용)"""
+        ids = set()
+        for table in self._bet_tables():
+            stmt = select(table.c.user_id).distinct().order_by(table.c.user_id).limit(limit)
+            if after is not None:
+                stmt = stmt.where(table.c.user_id > after)
+            ids.update((await self.session.execute(stmt)).scalars().all())
+        return sorted(ids)[:limit]
+
+    async def rebuild(self, user_ids: List[str]) -> int:
+        """사용자들의 배팅(MySQL은 아카이브 포함)을 시간 순으로 다시 누적해 통계 교체
+
+        통계 행을 먼저 잠가 재계산 중에 들어온 접수/정산 갱신이 덮어써지지 않게 합니다.
+        정산 순서는 남아 있지 않으므로 연속 기록은 배팅 시각 순서로 계산합니다.
+        """
+        if not user_ids:
+            return 0
+        await self.lock_by_user_ids(user_ids)
+
+        bets_by_user = defaultdict(list)
+        for table in self._bet_tables():
+            columns = [table.c[column.key] for column in BET_COLUMNS]
+            for chunk in chunked(sorted(set(user_ids)), settings.SETTLEMENT_CHUNK_SIZE):
+                stmt = select(*columns).where(table.c.user_id.in_(chunk))
+                for row in (await self.session.execute(stmt)).all():
+                    bet = BetRepositoryImpl._row_to_entity(row)
+                    bets_by_user[bet.user_id].append(bet)
+
+        stats = [
+            build_stats(user_id, sorted(bets_by_user[user_id], key=lambda bet: (bet.created_at, bet.id)))
+            for user_id in set(user_ids)
+        ]
+        await self.save_all(stats)
+        return len(stats)
+
+    def _bet_tables(self) -> list:
+        """배팅 테이블 (MySQL은 월 파티션을 옮긴 아카이브 테이블 포함)"""
+        tables = [BetModel.__table__]
+        if self.session.get_bind().dialect.name == "mysql":
+            tables.append(archive_table(BetModel.__table__))
+        return tables
+
+    @staticmethod
+    def _to_row(stats: UserBetStats) -> dict:
+        return {
+            "user_id": stats.user_id,
+            "bets_placed": stats.bets_placed,
+            "total_staked": stats.total_staked,
+            "bets_won": stats.bets_won,
+            "bets_lost": stats.bets_lost,
+            "bets_cancelled": stats.bets_cancelled,
+            "settled_staked": stats.settled_staked,
+            "total_returned": stats.total_returned,
+            "current_streak": stats.current_streak,
+            "longest_win_streak": stats.longest_win_streak,
+            "longest_loss_streak": stats.longest_loss_streak,
+            "last_bet_at": stats.last_bet_at,
+            "updated_at": datetime.utcnow(),
+        }
+
+    @staticmethod
+    def _row_to_entity(row: Row) -> UserBetStats:
+        """STATS_COLUMNS 행 튜플을 UserBetStats로 변환"""
+        (
+            user_id, bets_placed, total_staked, bets_won, bets_lost, bets_cancelled, settled_staked,
+            total_returned, current_streak, longest_win_streak, longest_loss_streak, last_bet_at,
+        ) = row
+        return UserBetStats(
+            user_id=user_id,
+            bets_placed=bets_placed,
+            total_staked=Decimal(str(total_staked)),
+            bets_won=bets_won,
+            bets_lost=bets_lost,
+            bets_cancelled=bets_cancelled,
+            settled_staked=Decimal(str(settled_staked)),
+            total_returned=Decimal(str(total_returned)),
+            current_streak=current_streak,
+            longest_win_streak=longest_win_streak,
+            longest_loss_streak=longest_loss_streak,
+            last_bet_at=last_bet_at,
         )
@@ -1,13 +1,30 @@
 """Game Repository 구현"""
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import Row, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.game.entity import Game
 from src.domain.game.enums import GameStatusEnum, SportTypeEnum
 from src.domain.game.repository import GameRepository
+from src.config import settings
+from src.infrastructure.cache.catalog_versions import GAMES_SCOPE, game_scope, mark_catalog_changed
 from src.infrastructure.database.models import GameModel
+from src.infrastructure.database.upsert import chunked, upsert_rows
+
+# 임포트로 갱신하는 컬럼 (상태, 스코어, 라이브 여부는 운영 중 변경되므로 덮어쓰지 않음)
+UPSERT_UPDATE_COLUMNS = (
+    "league_id", "sport_type", "home_team", "away_team", "start_time", "betting_deadline", "updated_at",
+)
+
+# 읽기 전용 조회 컬럼 (_row_to_entity의 언패킹 순서와 같음)
+ENTITY_COLUMNS = (
+    GameModel.id, GameModel.league_id, GameModel.external_id, GameModel.sport_type,
+    GameModel.home_team, GameModel.away_team, GameModel.start_time, GameModel.betting_deadline,
+    GameModel.status, GameModel.is_live, GameModel.final_score_home, GameModel.final_score_away,
+    GameModel.created_at, GameModel.updated_at,
+)
 
 
 class GameRepositoryImpl(GameRepository):
@@ -17,7 +34,22 @@ class GameRepositoryImpl(GameRepository):
         self.session = session
 
     async def save(self, game: Game) -> None:
-        """게임을 저장"""
+        """게임을 저장 (존재하면 수정)"""
+        mark_catalog_changed(self.session, GAMES_SCOPE, game_scope(game.id))
+        game_model = await self.session.get(GameModel, game.id)
+        if game_model:
+            game_model.home_team = game.home_team
+            game_model.away_team = game.away_team
+            game_model.start_time = game.start_time
+            game_model.status = game.status
+            game_model.final_score_home = game.final_score_home
+            game_model.final_score_away = game.final_score_away
+            game_model.betting_deadline = game.betting_deadline
+            game_model.is_live = game.is_live
+            game_model.updated_at = game.updated_at
+            await self.session.flush()
+            return
+
         game_model = GameModel(
             id=game.id,
             league_id=game.league_id,
@@ -52,8 +84,12 @@ class GameRepositoryImpl(GameRepository):
         page: int = 1,
         limit: int = 20
     ) -> List[Game]:
-        """조건에 맞는 게임 목록 조회"""
-        stmt = select(GameModel)
+        """조건에 맞는 게임 목록 조회 (읽기 전용)
+
+        ORM 인스턴스 대신 컬럼 튜플로 읽어 identity map 등록/상태 추적 없이 엔티티를 만듭니다.
+        반환한 엔티티를 수정해 save()하면 save()가 모델을 다시 읽습니다.
+        """
+        stmt = select(*ENTITY_COLUMNS)
         if league_id:
             stmt = stmt.where(GameModel.league_id == league_id)
         if status:
@@ -65,7 +101,7 @@ class GameRepositoryImpl(GameRepository):
         stmt = stmt.offset(offset).limit(limit)
         
         result = await self.session.execute(stmt)
-        return [self._to_entity(model) for model in result.scalars().all()]
+        return [self._row_to_entity(row) for row in result.all()]
 
     async def count_all(
         self,
@@ -93,9 +129,83 @@ class GameRepositoryImpl(GameRepository):
         if model:
             await self.session.delete(model)
             await self.session.flush()
+            mark_catalog_changed(self.session, GAMES_SCOPE, game_scope(game_id))
             return True
         return False
 
+    async def bulk_upsert(self, games: List[Game]) -> Dict[str, str]:
+        """external_id 기준 일괄 upsert (청크당 upsert 1회 + ID 조회 1회)"""
+        game_ids: Dict[str, str] = {}
+        now = datetime.utcnow()
+        for chunk in chunked(games, settings.IMPORT_CHUNK_SIZE):
+            rows = [
+                {
+                    "id": game.id,
+                    "league_id": game.league_id,
+                    "external_id": game.external_id,
+                    "sport_type": game.sport_type,
+                    "home_team": game.home_team,
+                    "away_team": game.away_team,
+                    "start_time": game.start_time,
+                    "status": game.status,
+                    "betting_deadline": game.betting_deadline,
+                    "is_live": game.is_live,
+                    "created_at": game.created_at,
+                    "updated_at": now,
+                }
+                for game in chunk
+            ]
+            await upsert_rows(self.session, GameModel, rows, ("external_id",), UPSERT_UPDATE_COLUMNS)
+            stmt = select(GameModel.external_id, GameModel.id).where(
+                GameModel.external_id.in_([game.external_id for game in chunk])
+            )
+            result = await self.session.execute(stmt)
+            game_ids.update({external_id: game_id for external_id, game_id in result.all()})
+        mark_catalog_changed(self.session, GAMES_SCOPE, *(game_scope(game_id) for game_id in game_ids.values()))
+        return game_ids
+
+    async def find_by_external_ids(self, external_ids: List[str]) -> List[Game]:
+        """external_id 목록으로 게임 조회 (청크당 쿼리 1회)"""
+        games: List[Game] = []
+        for chunk in chunked(list(external_ids), settings.IMPORT_CHUNK_SIZE):
+            stmt = select(GameModel).where(GameModel.external_id.in_(chunk))
+            result = await self.session.execute(stmt)
+            games.extend(self._to_entity(model) for model in result.scalars().all())
+        return games
+
+    async def find_league_ids(self, game_ids: List[str]) -> Dict[str, str]:
+        """게임 ID → 리그 ID (기본 키 조회, 청크당 쿼리 1회)"""
+        league_ids: Dict[str, str] = {}
+        for chunk in chunked(sorted(set(game_ids)), settings.IMPORT_CHUNK_SIZE):
+            stmt = select(GameModel.id, GameModel.league_id).where(GameModel.id.in_(chunk))
+            result = await self.session.execute(stmt)
+            league_ids.update({game_id: league_id for game_id, league_id in result.all()})
+        return league_ids
+
+    async def bulk_update(self, games: List[Game]) -> None:
+        """기본 키 기준 일괄 UPDATE (청크당 executemany 1회)"""
+        if games:
+            mark_catalog_changed(self.session, GAMES_SCOPE, *(game_scope(game.id) for game in games))
+        for chunk in chunked(games, settings.IMPORT_CHUNK_SIZE):
+            await self.session.execute(
+                update(GameModel),
+                [
+                    {
+                        "id": game.id,
+                        "home_team": game.home_team,
+                        "away_team": game.away_team,
+                        "start_time": game.start_time,
+                        "betting_deadline": game.betting_deadline,
+                        "status": game.status,
+                        "is_live": game.is_live,
+                        "final_score_home": game.final_score_home,
+                        "final_score_away": game.final_score_away,
+                        "updated_at": game.updated_at,
+                    }
+                    for game in chunk
+                ],
+            )
+
     def _to_entity(self, model: GameModel) -> Game:
         """GameModel을 Game 엔티티로 변환"""
         return Game(
@@ -114,3 +224,27 @@ class GameRepositoryImpl(GameRepository):
             created_at=model.created_at,
             updated_at=model.updated_at
         )
+
+    @staticmethod
+    def _row_to_entity(row: Row) -> Game:
+        """ENTITY_COLUMNS 행 튜플을 Game 엔티티로 변환"""
+        (
+            game_id, league_id, external_id, sport_type, home_team, away_team, start_time, betting_deadline,
+            status, is_live, final_score_home, final_score_away, created_at, updated_at,
+        ) = row
+        return Game(
+            id=game_id,
+            league_id=league_id,
+            external_id=external_id,
+            sport_type=SportTypeEnum(sport_type),
+            home_team=home_team,
+            away_team=away_team,
+            start_time=start_time,
+            betting_deadline=betting_deadline,
+            status=GameStatusEnum(status),
+            is_live=is_live,
+            final_score_home=int(final_score_home) if final_score_home is not None else None,
+            final_score_away=int(final_score_away) if final_score_away is not None else None,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
@@ -0,0 +1,133 @@
+"""Job Repository 구현"""
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.job.entity import Job
+from src.domain.job.enums import JobStatusEnum, JobTypeEnum
+from src.domain.job.repository import JobRepository
+from src.infrastructure.database.models import JobModel
+
+
+class JobRepositoryImpl(JobRepository):
+    """Job Repository 구현"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save(self, job: Job) -> None:
+        """작업을 저장 (존재하면 수정)"""
+        job_model = await self.session.get(JobModel, job.id)
+        if job_model is None:
+            job_model = JobModel(
+                id=job.id, parent_id=job.parent_id, job_type=job.job_type, created_at=job.created_at
+            )
+            self.session.add(job_model)
+        job_model.status = job.status
+        # JSON 컬럼은 내부 변경을 추적하지 않으므로 새 객체로 대입
+        job_model.payload = dict(job.payload)
+        job_model.result = dict(job.result)
+        job_model.total = job.total
+        job_model.processed = job.processed
+        job_model.checkpoint = job.checkpoint
+        job_model.error = job.error
+        job_model.attempts = job.attempts
+        job_model.locked_by = job.locked_by
+        job_model.lease_expires_at = job.lease_expires_at
+        job_model.available_at = job.available_at
+        job_model.started_at = job.started_at
+        job_model.finished_at = job.finished_at
+        await self.session.flush()
+
+    async def find_by_id(self, job_id: str) -> Optional[Job]:
+        """ID로 작업 조회"""
+        model = await self.session.get(JobModel, job_id, populate_existing=True)
+        return self._to_entity(model) if model else None
+
+    async def find_by_id_for_update(self, job_id: str) -> Optional[Job]:
+        """ID로 작업 조회 (트랜잭션 종료까지 행 잠금)
+
+        하위 작업이 동시에 끝나도 부모의 남은 하위 작업 수를 덮어쓰지 않도록 부모를 잠그고 읽습니다.
+        """
+        stmt = (
+            select(JobModel)
+            .where(JobModel.id == job_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        model = (await self.session.execute(stmt)).scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
+    async def find_children(self, parent_id: str) -> List[Job]:
+        """하위 작업 목록"""
+        stmt = select(JobModel).where(JobModel.parent_id == parent_id).order_by(JobModel.created_at)
+        return [self._to_entity(model) for model in (await self.session.execute(stmt)).scalars().all()]
+
+    async def claim_next(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """실행 가능한 가장 오래된 작업을 점유
+
+        SKIP LOCKED로 다른 워커가 점유 중인 행은 건너뛰므로 워커끼리 대기하지 않습니다.
+        행 잠금이 없는 DB(sqlite)에서도 두 워커가 같은 작업을 가져가지 않도록, 조회한 상태 그대로일
+        때만 점유하는 조건부 UPDATE로 확정합니다. 호출 측이 커밋해야 점유가 확정됩니다.
+        """
+        now = datetime.utcnow()
+        stmt = (
+            select(JobModel)
+            .where(
+                or_(
+                    and_(JobModel.status == JobStatusEnum.QUEUED, JobModel.available_at <= now),
+                    # 워커가 죽어 점유 기간이 만료된 작업은 이어받음
+                    and_(JobModel.status == JobStatusEnum.RUNNING, JobModel.lease_expires_at < now),
+                )
+            )
+            .order_by(JobModel.available_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        model = (await self.session.execute(stmt)).scalar_one_or_none()
+        if model is None:
+            return None
+        job = self._to_entity(model)
+        observed_attempts = job.attempts
+        job.claim(worker_id, lease_seconds)
+        result = await self.session.execute(
+            update(JobModel)
+            .where(JobModel.id == job.id, JobModel.attempts == observed_attempts)
+            .values(
+                status=job.status,
+                locked_by=job.locked_by,
+                lease_expires_at=job.lease_expires_at,
+                attempts=job.attempts,
+                started_at=job.started_at,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            # 다른 워커가 먼저 점유
+            return None
+        return job
+
+    def _to_entity(self, model: JobModel) -> Job:
+        """JobModel을 Job 엔티티로 변환"""
+        return Job(
+            id=model.id,
+            parent_id=model.parent_id,
+            job_type=JobTypeEnum(model.job_type),
+            status=JobStatusEnum(model.status),
+            payload=dict(model.payload or {}),
+            result=dict(model.result or {}),
+            total=model.total,
+            processed=model.processed,
+            checkpoint=model.checkpoint,
+            error=model.error,
+            attempts=model.attempts,
+            locked_by=model.locked_by,
+            lease_expires_at=model.lease_expires_at,
+            available_at=model.available_at,
+            created_at=model.created_at,
+            started_at=model.started_at,
+            finished_at=model.finished_at,
+        )
@@ -1,12 +1,19 @@
 """League Repository 구현"""
-from typing import List, Optional
-from sqlalchemy import select, func
+from typing import Iterable, List, Optional, Set
+from sqlalchemy import Row, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.league.entity import League
 from src.domain.league.repository import LeagueRepository
+from src.infrastructure.cache.catalog_versions import LEAGUES_SCOPE, mark_catalog_changed
 from ..models import LeagueModel
 
+# 읽기 전용 조회 컬럼 (_row_to_entity의 언패킹 순서와 같음)
+ENTITY_COLUMNS = (
+    LeagueModel.id, LeagueModel.league_name, LeagueModel.sport_type,
+    LeagueModel.country, LeagueModel.is_active, LeagueModel.created_at,
+)
+
 
 class SQLAlchemyLeagueRepository(LeagueRepository):
     """SQLAlchemy를 사용한 League Repository 구현"""
@@ -26,6 +33,7 @@ class SQLAlchemyLeagueRepository(LeagueRepository):
         )
         self.session.add(league_model)
         await self.session.flush()
+        mark_catalog_changed(self.session, LEAGUES_SCOPE)
         return league
 
     async def find_by_id(self, league_id: str) -> Optional[League]:
@@ -39,6 +47,15 @@ class SQLAlchemyLeagueRepository(LeagueRepository):
 
         return self._to_entity(league_model)
 
+    async def find_existing_ids(self, league_ids: Iterable[str]) -> Set[str]:
+        """주어진 ID 중 존재하는 리그 ID 조회 (한 번의 쿼리)"""
+        league_ids = list(set(league_ids))
+        if not league_ids:
+            return set()
+        query = select(LeagueModel.id).where(LeagueModel.id.in_(league_ids))
+        result = await self.session.execute(query)
+        return set(result.scalars().all())
+
     async def find_all(
         self,
         sport_type: Optional[str] = None,
@@ -46,9 +63,9 @@ class SQLAlchemyLeagueRepository(LeagueRepository):
         skip: int = 0,
         limit: int = 20
     ) -> tuple[List[League], int]:
-        """리그 목록 조회"""
+        """리그 목록 조회 (읽기 전용, 컬럼 튜플로 조회)"""
         # 기본 쿼리
-        query = select(LeagueModel)
+        query = select(*ENTITY_COLUMNS)
         count_query = select(func.count(LeagueModel.id))
 
         # 필터 적용
@@ -69,9 +86,7 @@ class SQLAlchemyLeagueRepository(LeagueRepository):
 
         # 결과 조회
         result = await self.session.execute(query)
-        league_models = result.scalars().all()
-
-        leagues = [self._to_entity(model) for model in league_models]
+        leagues = [self._row_to_entity(row) for row in result.all()]
         return leagues, total
 
     async def update(self, league: League) -> League:
@@ -89,6 +104,7 @@ class SQLAlchemyLeagueRepository(LeagueRepository):
         league_model.is_active = league.is_active
 
         await self.session.flush()
+        mark_catalog_changed(self.session, LEAGUES_SCOPE)
         return league
 
     async def delete(self, league_id: str) -> bool:
@@ -102,6 +118,7 @@ class SQLAlchemyLeagueRepository(LeagueRepository):
 
         await self.session.delete(league_model)
         await self.session.flush()
+        mark_catalog_changed(self.session, LEAGUES_SCOPE)
         return True
 
     @staticmethod
@@ -115,3 +132,16 @@ class SQLAlchemyLeagueRepository(LeagueRepository):
             is_active=model.is_active,
             created_at=model.created_at
         )
+
+    @staticmethod
+    def _row_to_entity(row: Row) -> League:
+        """ENTITY_COLUMNS 행 튜플을 엔티티로 변환"""
+        league_id, league_name, sport_type, country, is_active, created_at = row
+        return League(
+            league_id=league_id,
+            league_name=league_name,
+            sport_type=sport_type.value,
+            country=country,
+            is_active=is_active,
+            created_at=created_at
+        )
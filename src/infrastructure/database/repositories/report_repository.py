@@ -0,0 +1,353 @@
+"""Report Repository 구현
+
+- ReportRepositoryImpl: 보고서 조회 (bet_rollups_hourly/daily, bet_rollup_bettors_daily만 읽음)
+- RollupRepositoryImpl: 배팅/슬립/게임 테이블에서 집계 테이블을 다시 계산
+
+집계 쿼리는 배팅 시각 범위 조건으로 배팅과 슬립을 같은 월 파티션에서 읽고(슬립은 배팅과 created_at이 같음),
+MySQL은 월 파티션을 옮긴 아카이브 테이블도 함께 읽습니다. 조합 배팅의 슬립 수는 배팅별 윈도 함수로 셉니다.
+"""
+from datetime import date, datetime, timedelta
+from enum import Enum
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Tuple
+
+from sqlalchemy import Date, Float, case, cast, delete, func, insert, literal, select, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.domain.betting.enums import BetStatusEnum
+from src.domain.game.enums import SportTypeEnum
+from src.domain.report.entity import ReportRow
+from src.domain.report.enums import ReportGranularityEnum, ReportGroupByEnum
+from src.domain.report.repository import (
+    CREATED_WATERMARK,
+    SETTLED_WATERMARK,
+    ReportRepository,
+    RollupRepository,
+)
+from src.domain.report.service import HOUR, day_start
+from src.infrastructure.database.models import (
+    BetModel,
+    BetRollupDailyModel,
+    BetRollupHourlyModel,
+    BetSlipModel,
+    BettorRollupDailyModel,
+    GameModel,
+    RollupWatermarkModel,
+)
+from src.infrastructure.database.partitioning import archive_table
+from src.infrastructure.database.upsert import chunked
+
+# 일별 활성 배팅 사용자 수의 전체 묶음 키
+ALL_SCOPE_KEY = "*"
+
+_AMOUNT = Decimal("0.0001")
+_HOUR_FORMAT = "%Y-%m-%d %H:00:00"
+
+
+def _amount(value) -> Decimal:
+    """집계 금액 (sqlite는 float로 돌려주므로 문자열을 거쳐 변환)"""
+    return Decimal(str(value or 0)).quantize(_AMOUNT)
+
+
+def _contiguous_ranges(hours: List[datetime]) -> List[Tuple[datetime, datetime]]:
+    """시간 목록을 연속 구간 [시작, 끝) 목록으로"""
+    ranges: List[Tuple[datetime, datetime]] = []
+    for hour in sorted(set(hours)):
+        if ranges and ranges[-1][1] == hour:
+            ranges[-1] = (ranges[-1][0], hour + HOUR)
+        else:
+            ranges.append((hour, hour + HOUR))
+    return ranges
+
+
+class ReportRepositoryImpl(ReportRepository):
+    """Report Repository 구현"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def iter_rows(
+        self,
+        granularity: ReportGranularityEnum,
+        group_by: ReportGroupByEnum,
+        start: datetime,
+        end: datetime,
+    ) -> AsyncIterator[ReportRow]:
+        """기간 × 묶음별 합계를 서버 측 커서로 스트리밍 (일 단위는 활성 배팅 사용자 수를 함께 조회)"""
+        if granularity == ReportGranularityEnum.HOURLY:
+            model = BetRollupHourlyModel
+            period = BetRollupHourlyModel.bucket_start
+            period_range = (period >= start, period < end)
+        else:
+            model = BetRollupDailyModel
+            period = BetRollupDailyModel.day
+            period_range = (period >= start.date(), period < end.date())
+
+        group_column = {
+            ReportGroupByEnum.ALL: None,
+            ReportGroupByEnum.SPORT: model.sport_type,
+            ReportGroupByEnum.LEAGUE: model.league_id,
+            ReportGroupByEnum.GAME: model.game_id,
+        }[group_by]
+        key = group_column if group_column is not None else literal(ALL_SCOPE_KEY)
+        group_columns = [period] if group_column is None else [period, group_column]
+        totals = (
+            select(
+                period.label("period"),
+                key.label("group_key"),
+                func.sum(model.selections).label("selections"),
+                func.sum(model.stake).label("stake"),
+                func.sum(model.settled_stake).label("settled_stake"),
+                func.sum(model.payout).label("payout"),
+            )
+            .where(*period_range)
+            .group_by(*group_columns)
+            .subquery("totals")
+        )
+
+        if granularity == ReportGranularityEnum.DAILY:
+            bettors = BettorRollupDailyModel
+            stmt = select(totals, bettors.bettors).outerjoin(
+                bettors,
+                (bettors.day == totals.c.period)
+                & (bettors.scope == group_by.value)
+                & (bettors.scope_key == totals.c.group_key),
+            )
+        else:
+            stmt = select(totals, literal(None).label("bettors"))
+        stmt = stmt.order_by(totals.c.period, totals.c.group_key).execution_options(
+            yield_per=settings.IMPORT_CHUNK_SIZE
+        )
+
+        result = await self.session.stream(stmt)
+        async for period_value, group_key, selections, stake, settled_stake, payout, bettor_count in result:
+            yield ReportRow(
+                period_start=period_value if isinstance(period_value, datetime) else day_start(period_value),
+                group_key=self._group_key(group_by, group_key),
+                selections=int(selections or 0),
+                stake=_amount(stake),
+                settled_stake=_amount(settled_stake),
+                payout=_amount(payout),
+                bettors=None if granularity == ReportGranularityEnum.HOURLY else int(bettor_count or 0),
+            )
+
+    async def get_watermark(self) -> Optional[datetime]:
+        result = await self.session.execute(select(RollupWatermarkModel.value))
+        values = result.scalars().all()
+        if not values or any(value is None for value in values):
+            return None
+        return min(values)
+
+    @staticmethod
+    def _group_key(group_by: ReportGroupByEnum, value) -> Optional[str]:
+        """묶음 키 (스포츠는 다른 API와 같이 Enum 값, 전체는 None)"""
+        if group_by == ReportGroupByEnum.ALL:
+            return None
+        if group_by == ReportGroupByEnum.SPORT:
+            return value.value if isinstance(value, Enum) else SportTypeEnum[value].value
+        return value
+
+
+class RollupRepositoryImpl(RollupRepository):
+    """집계 테이블 갱신 Repository 구현"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.dialect = session.get_bind().dialect.name
+
+    async def lock_watermarks(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        stmt = (
+            select(RollupWatermarkModel.name, RollupWatermarkModel.value)
+            .where(RollupWatermarkModel.name.in_([CREATED_WATERMARK, SETTLED_WATERMARK]))
+            .order_by(RollupWatermarkModel.name)
+            .with_for_update()
+        )
+        values = dict((await self.session.execute(stmt)).all())
+        return values.get(CREATED_WATERMARK), values.get(SETTLED_WATERMARK)
+
+    async def save_watermarks(self, created: datetime, settled: datetime) -> None:
+        now = datetime.utcnow()
+        await self.session.execute(
+            update(RollupWatermarkModel),
+            [
+                {"name": CREATED_WATERMARK, "value": created, "updated_at": now},
+                {"name": SETTLED_WATERMARK, "value": settled, "updated_at": now},
+            ],
+        )
+
+    async def find_earliest_bet_at(self) -> Optional[datetime]:
+        values = [
+            (await self.session.execute(select(func.min(bets.c.created_at)))).scalar()
+            for bets, _ in self._sources()
+        ]
+        values = [value for value in values if value is not None]
+        return min(values) if values else None
+
+    async def find_settled_hours(self, since: Optional[datetime], until: datetime, before: datetime) -> List[datetime]:
+        """결과 확정 시각 인덱스로 찾은 배팅의 배팅 시간 (hot 테이블만, 대기 배팅이 남은 월은 아카이브하지 않음)"""
+        hour = self._hour(BetModel.created_at)
+        stmt = (
+            select(hour)
+            .where(BetModel.settled_at < until, BetModel.created_at < before)
+            .group_by(hour)
+        )
+        if since is not None:
+            stmt = stmt.where(BetModel.settled_at >= since)
+        return [datetime.strptime(value, "%Y-%m-%d %H:%M:%S") for value in (await self.session.execute(stmt)).scalars()]
+
+    async def rebuild_hours(self, hours: List[datetime]) -> int:
+        """연속 구간마다 시간 집계 삭제 후 배팅 테이블에서 다시 계산해 INSERT"""
+        written = 0
+        for start, end in _contiguous_ranges(hours):
+            legs = self._legs(start, end)
+            share = self._divide(legs.c.total_amount, legs.c.legs)
+            win_share = self._divide(func.round(legs.c.total_amount * legs.c.settled_odds, 2), legs.c.legs)
+            settled_share = case((legs.c.status != BetStatusEnum.PENDING, share), else_=0)
+            # 지급액: 적중은 원금 × 결과 배당(소수 둘째 자리 반올림), 취소는 원금 환급
+            payout_share = case(
+                (legs.c.status == BetStatusEnum.WIN, win_share),
+                (legs.c.status == BetStatusEnum.CANCELLED, share),
+                else_=0,
+            )
+            bucket = self._hour(legs.c.created_at)
+            stmt = (
+                select(
+                    bucket,
+                    legs.c.game_id,
+                    GameModel.league_id,
+                    GameModel.sport_type,
+                    func.count(),
+                    func.sum(share),
+                    func.sum(settled_share),
+                    func.sum(payout_share),
+                )
+                .join(GameModel, GameModel.id == legs.c.game_id)
+                .group_by(bucket, legs.c.game_id, GameModel.league_id, GameModel.sport_type)
+            )
+            rows = [
+                {
+                    "bucket_start": datetime.strptime(bucket_value, "%Y-%m-%d %H:%M:%S"),
+                    "game_id": game_id,
+                    "league_id": league_id,
+                    "sport_type": sport_type,
+                    "selections": selections,
+                    "stake": _amount(stake),
+                    "settled_stake": _amount(settled_stake),
+                    "payout": _amount(payout),
+                }
+                for bucket_value, game_id, league_id, sport_type, selections, stake, settled_stake, payout
+                in (await self.session.execute(stmt)).all()
+            ]
+            await self.session.execute(
+                delete(BetRollupHourlyModel).where(
+                    BetRollupHourlyModel.bucket_start >= start, BetRollupHourlyModel.bucket_start < end
+                )
+            )
+            for chunk in chunked(rows, settings.IMPORT_CHUNK_SIZE):
+                await self.session.execute(insert(BetRollupHourlyModel), list(chunk))
+            written += len(rows)
+        return written
+
+    async def rebuild_days(self, days: List[date]) -> int:
+        """날마다 일 집계를 시간 집계의 합으로 교체(INSERT ... SELECT)하고 활성 배팅 사용자 수 다시 계산"""
+        written = 0
+        for day in sorted(set(days)):
+            start = day_start(day)
+            end = start + timedelta(days=1)
+            hourly = BetRollupHourlyModel
+            await self.session.execute(delete(BetRollupDailyModel).where(BetRollupDailyModel.day == day))
+            result = await self.session.execute(
+                insert(BetRollupDailyModel).from_select(
+                    ["day", "game_id", "league_id", "sport_type", "selections", "stake", "settled_stake", "payout"],
+                    select(
+                        literal(day, Date),
+                        hourly.game_id,
+                        hourly.league_id,
+                        hourly.sport_type,
+                        func.sum(hourly.selections),
+                        func.sum(hourly.stake),
+                        func.sum(hourly.settled_stake),
+                        func.sum(hourly.payout),
+                    )
+                    .where(hourly.bucket_start >= start, hourly.bucket_start < end)
+                    .group_by(hourly.game_id, hourly.league_id, hourly.sport_type),
+                )
+            )
+            written += max(result.rowcount or 0, 0)
+            written += await self._rebuild_bettors(day, start, end)
+        return written
+
+    async def _rebuild_bettors(self, day: date, start: datetime, end: datetime) -> int:
+        """일별 활성 배팅 사용자 수 (합산할 수 없으므로 묶음마다 COUNT(DISTINCT))"""
+        legs = self._legs(start, end)
+        bettors = func.count(func.distinct(legs.c.user_id))
+        rows = [
+            {"scope": ReportGroupByEnum.ALL.value, "scope_key": ALL_SCOPE_KEY, "bettors": count}
+            for (count,) in (await self.session.execute(select(bettors).having(bettors > 0))).all()
+        ]
+        scopes = (
+            (ReportGroupByEnum.SPORT, GameModel.sport_type),
+            (ReportGroupByEnum.LEAGUE, GameModel.league_id),
+            (ReportGroupByEnum.GAME, legs.c.game_id),
+        )
+        for scope, column in scopes:
+            stmt = select(column, bettors).join(GameModel, GameModel.id == legs.c.game_id).group_by(column)
+            for scope_key, count in (await self.session.execute(stmt)).all():
+                if isinstance(scope_key, Enum):
+                    scope_key = scope_key.name
+                rows.append({"scope": scope.value, "scope_key": scope_key, "bettors": count})
+
+        await self.session.execute(delete(BettorRollupDailyModel).where(BettorRollupDailyModel.day == day))
+        for chunk in chunked(rows, settings.IMPORT_CHUNK_SIZE):
+            await self.session.execute(insert(BettorRollupDailyModel), [{"day": day, **row} for row in chunk])
+        return len(rows)
+
+    def _sources(self) -> list:
+        """(배팅, 슬립) 테이블 쌍 (MySQL은 월 파티션을 옮긴 아카이브 테이블 포함)"""
+        sources = [(BetModel.__table__, BetSlipModel.__table__)]
+        if self.dialect == "mysql":
+            sources.append((archive_table(BetModel.__table__), archive_table(BetSlipModel.__table__)))
+        return sources
+
+    def _legs(self, start: datetime, end: datetime):
+        """[start, end)에 접수된 배팅의 슬립 행 (배팅 컬럼 + 게임 ID + 배팅의 슬립 수)"""
+        selects = []
+        for bets, slips in self._sources():
+            selects.append(
+                select(
+                    bets.c.id.label("bet_id"),
+                    bets.c.user_id,
+                    bets.c.created_at,
+                    bets.c.status,
+                    bets.c.total_amount,
+                    bets.c.settled_odds,
+                    slips.c.game_id,
+                    func.count().over(partition_by=bets.c.id).label("legs"),
+                )
+                .join(slips, (slips.c.bet_id == bets.c.id) & (slips.c.created_at == bets.c.created_at))
+                .where(
+                    bets.c.created_at >= start,
+                    bets.c.created_at < end,
+                    slips.c.created_at >= start,
+                    slips.c.created_at < end,
+                )
+            )
+        if len(selects) == 1:
+            return selects[0].subquery("legs")
+        return union_all(*selects).subquery("legs")
+
+    def _hour(self, column):
+        """시간 시작 문자열 ('YYYY-MM-DD HH:00:00')"""
+        if self.dialect == "mysql":
+            return func.date_format(column, _HOUR_FORMAT)
+        if self.dialect == "sqlite":
+            return func.strftime(_HOUR_FORMAT, column)
+        raise NotImplementedError(f"집계를 지원하지 않는 DB 방언입니다: {self.dialect}")
+
+    def _divide(self, amount, legs):
+        """금액 / 슬립 수 (sqlite는 정수끼리 나누면 몫만 남으므로 실수로 변환)"""
+        if self.dialect == "sqlite":
+            amount = cast(amount, Float)
+        return amount / legs
+
@@ -1,13 +1,21 @@
 """User Repository 구현"""
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.user.entity import User, UserRole
 from src.domain.user.repository import UserRepository as UserRepositoryInterface
 from src.infrastructure.database.models import UserModel
 
+# 읽기 전용 조회 컬럼 (_row_to_entity의 언패킹 순서와 같음)
+ENTITY_COLUMNS = (
+    UserModel.id, UserModel.username, UserModel.password_hash, UserModel.nickname, UserModel.bank_name,
+    UserModel.account_number, UserModel.account_holder, UserModel.role, UserModel.daily_limit,
+    UserModel.today_total_bet, UserModel.last_bet_date, UserModel.created_at, UserModel.updated_at,
+    UserModel.is_active, UserModel.is_restricted,
+)
+
 
 class UserRepositoryImpl(UserRepositoryInterface):
     """User Repository 구현 클래스"""
@@ -35,6 +43,31 @@ class UserRepositoryImpl(UserRepositoryInterface):
             is_restricted=model.is_restricted,
         )
 
+    @staticmethod
+    def _row_to_entity(row: Row) -> User:
+        """ENTITY_COLUMNS 행 튜플을 도메인 엔티티로 변환"""
+        (
+            user_id, username, password_hash, nickname, bank_name, account_number, account_holder, role,
+            daily_limit, today_total_bet, last_bet_date, created_at, updated_at, is_active, is_restricted,
+        ) = row
+        return User(
+            user_id=UUID(user_id),
+            username=username,
+            password_hash=password_hash,
+            nickname=nickname,
+            bank_name=bank_name,
+            account_number=account_number,
+            account_holder=account_holder,
+            role=UserRole(role.value),
+            daily_limit=daily_limit,
+            today_total_bet=today_total_bet,
+            last_bet_date=last_bet_date,
+            created_at=created_at,
+            updated_at=updated_at,
+            is_active=is_active,
+            is_restricted=is_restricted,
+        )
+
     def _to_model(self, entity: User) -> UserModel:
         """도메인 엔티티를 SQLAlchemy 모델로 변환"""
         return UserModel(
@@ -64,18 +97,16 @@ class UserRepositoryImpl(UserRepositoryInterface):
         return self._to_entity(model)
 
     async def find_by_id(self, user_id: UUID) -> Optional[User]:
-        """ID로 사용자 조회"""
-        stmt = select(UserModel).where(UserModel.id == str(user_id))
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        """ID로 사용자 조회 (컬럼 튜플로 조회, 변경은 update()가 모델을 다시 읽어 반영)"""
+        stmt = select(*ENTITY_COLUMNS).where(UserModel.id == str(user_id))
+        row = (await self.session.execute(stmt)).one_or_none()
+        return self._row_to_entity(row) if row else None
 
     async def find_by_username(self, username: str) -> Optional[User]:
-        """사용자명으로 사용자 조회"""
-        stmt = select(UserModel).where(UserModel.username == username)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        """사용자명으로 사용자 조회 (컬럼 튜플로 조회)"""
+        stmt = select(*ENTITY_COLUMNS).where(UserModel.username == username)
+        row = (await self.session.execute(stmt)).one_or_none()
+        return self._row_to_entity(row) if row else None
 
     async def exists_by_username(self, username: str) -> bool:
         """사용자명 존재 여부 확인"""
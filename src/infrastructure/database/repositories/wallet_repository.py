@@ -1,13 +1,17 @@
+from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
-from typing import Optional
+from typing import Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 
 from src.domain.wallet.entity import Wallet
 from src.domain.wallet.repository import WalletRepository
 from src.domain.common.value_objects import Money
+from src.config import settings
 from src.infrastructure.database.models import WalletModel
+from src.infrastructure.database.upsert import chunked
 
 
 class WalletRepositoryImpl(WalletRepository):
@@ -65,6 +69,29 @@ class WalletRepositoryImpl(WalletRepository):
             await self.session.delete(wallet_model)
             await self.session.flush()
 
+    async def bulk_credit(self, credits: Dict[str, Decimal]) -> int:
+        """balance = balance + :amount 원자적 UPDATE (청크당 executemany 1회)
+
+        행 잠금 순서를 고정해 동시 정산 간 교착을 피하도록 user_id 순으로 갱신합니다.
+        """
+        table = WalletModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.user_id == bindparam("b_user_id"))
+            .values(balance=table.c.balance + bindparam("b_amount"), updated_at=bindparam("b_updated_at"))
+        )
+        now = datetime.utcnow()
+        rows = [
+            {"b_user_id": str(user_id), "b_amount": amount, "b_updated_at": now}
+            for user_id, amount in sorted(credits.items(), key=lambda item: str(item[0]))
+            if amount > 0
+        ]
+        updated = 0
+        for chunk in chunked(rows, settings.SETTLEMENT_CHUNK_SIZE):
+            result = await self.session.execute(stmt, list(chunk))
+            updated += max(result.rowcount, 0)
+        return updated
+
     def _to_entity(self, model: WalletModel) -> Wallet:
         return Wallet(
             id=UUID(model.id),
@@ -0,0 +1,61 @@
+"""방언별 다중 행 upsert
+
+MySQL은 `INSERT ... ON DUPLICATE KEY UPDATE`, sqlite(로컬 벤치마크용)는
+`INSERT ... ON CONFLICT DO UPDATE`로 한 문장에 여러 행을 기록합니다.
+"""
+from typing import Any, Dict, Iterator, List, Sequence, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """size개씩 나누기"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def upsert_rows(
+    session: AsyncSession,
+    model: Any,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+    increment_columns: Sequence[str] = (),
+) -> None:
+    """다중 행 upsert 한 문장 실행
+
+    Args:
+        model: 대상 ORM 모델
+        rows: 컬럼명 → 값 딕셔너리 목록 (모든 행이 같은 키를 가져야 함)
+        conflict_columns: 고유 키 컬럼 (sqlite ON CONFLICT 대상, MySQL은 모든 고유 키에 대해 동작)
+        update_columns: 충돌 시 갱신할 컬럼
+        increment_columns: 충돌 시 기존 값에 더할 컬럼 (카운터)
+    """
+    if not rows:
+        return
+    table = model.__table__
+    dialect = session.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+
+        stmt = insert(table).values(rows)
+        stmt = stmt.on_duplicate_key_update({
+            **{column: stmt.inserted[column] for column in update_columns},
+            **{column: table.c[column] + stmt.inserted[column] for column in increment_columns},
+        })
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={
+                **{column: stmt.excluded[column] for column in update_columns},
+                **{column: table.c[column] + stmt.excluded[column] for column in increment_columns},
+            },
+        )
+    else:
+        raise NotImplementedError(f"upsert를 지원하지 않는 DB 방언입니다: {dialect}")
+    await session.execute(stmt)
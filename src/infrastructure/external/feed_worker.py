@@ -0,0 +1,150 @@
+"""스포츠 피드 수집 워커
+
+SPORTS_FEED_INTERVAL_SECONDS마다 설정된 리그의 경기/배당 스냅샷을 받아 현재 상태와
+비교하고 바뀐 부분만 일괄 기록합니다 (FeedSyncUseCase).
+리그 하나의 동기화는 한 트랜잭션이며, 반영에 성공한 응답만 조건부 요청 검증자로 저장합니다.
+
+API 워커 프로세스마다 중복 수집하지 않도록 별도 프로세스로 실행합니다.
+
+    python -m scripts.sports_feed_worker
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from src.application.game.dto import FeedSyncResultDTO
+from src.application.game.use_cases import FeedSyncUseCase
+from src.application.job.use_cases import JobUseCases
+from src.config import settings
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.repositories.betting_repository import BettingOptionRepositoryImpl
+from src.infrastructure.database.repositories.game_repository import GameRepositoryImpl
+from src.infrastructure.database.repositories.job_repository import JobRepositoryImpl
+from src.infrastructure.external.sports_api import SportsAPIClient, SportsAPIError
+from src.infrastructure.monitoring.metrics import SPORTS_FEED_CHANGES_TOTAL, SPORTS_FEED_SYNC_DURATION
+
+logger = logging.getLogger(__name__)
+
+# 연속 실패 시 최대 대기 (초)
+MAX_BACKOFF_SECONDS = 300.0
+
+
+def parse_league_map(value: str) -> Dict[str, str]:
+    """"epl=<league_id>,kbo=<league_id>" 형식의 리그 매핑 파싱
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    leagues: Dict[str, str] = {}
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        league_key, separator, league_id = entry.partition("=")
+        if not separator or not league_key.strip() or not league_id.strip():
+            raise ValueError(f"SPORTS_FEED_LEAGUES 형식이 잘못되었습니다: {entry} (예: epl=<league_id>)")
+        leagues[league_key.strip()] = league_id.strip()
+    return leagues
+
+
+class SportsFeedWorker:
+    """스포츠 피드 수집 워커"""
+
+    def __init__(self, client: SportsAPIClient, leagues: Dict[str, str]):
+        self.client = client
+        # 피드 리그 키 → 리그 ID
+        self.leagues = leagues
+        self.interval = settings.SPORTS_FEED_INTERVAL_SECONDS
+        self._task: Optional[asyncio.Task] = None
+
+    async def sync_league(self, league_key: str, league_id: str) -> FeedSyncResultDTO:
+        """리그 하나 동기화 (경기/배당 요청은 동시에)"""
+        fixtures, odds = await asyncio.gather(
+            self.client.fetch_fixtures(league_key),
+            self.client.fetch_odds(league_key),
+        )
+        if fixtures.not_modified and odds.not_modified:
+            return FeedSyncResultDTO()
+
+        async with AsyncSessionLocal() as session:
+            use_case = FeedSyncUseCase(
+                GameRepositoryImpl(session),
+                BettingOptionRepositoryImpl(session),
+                JobUseCases(JobRepositoryImpl(session)),
+            )
+            result = await use_case.execute(league_id, fixtures.items, odds.items)
+            await session.commit()
+
+        self.client.mark_applied(fixtures)
+        self.client.mark_applied(odds)
+        for kind in (
+            "created_games",
+            "updated_games",
+            "created_options",
+            "updated_options",
+            "deactivated_options",
+            "settlement_jobs",
+        ):
+            SPORTS_FEED_CHANGES_TOTAL.labels(kind).inc(getattr(result, kind))
+        return result
+
+    async def sync_once(self) -> Dict[str, FeedSyncResultDTO]:
+        """설정된 모든 리그 동기화 (실패한 리그는 로그만 남기고 결과에서 제외)
+
+        Raises:
+            SportsAPIError: 모든 리그가 실패한 경우
+        """
+        started = time.perf_counter()
+        keys: List[str] = list(self.leagues)
+        outcomes = await asyncio.gather(
+            *(self.sync_league(key, self.leagues[key]) for key in keys),
+            return_exceptions=True,
+        )
+        SPORTS_FEED_SYNC_DURATION.observe(time.perf_counter() - started)
+
+        results: Dict[str, FeedSyncResultDTO] = {}
+        for key, outcome in zip(keys, outcomes):
+            if isinstance(outcome, SportsAPIError):
+                logger.warning("피드 수집 실패 (%s): %s", key, outcome)
+            elif isinstance(outcome, Exception):
+                logger.error("피드 반영 실패 (%s)", key, exc_info=outcome)
+            else:
+                results[key] = outcome
+        if keys and not results:
+            # 전부 실패하면 피드 장애로 보고 재시도 간격을 늘림
+            raise SportsAPIError(f"리그 {len(keys)}개 모두 동기화 실패")
+        return results
+
+    def start(self) -> None:
+        """백그라운드 수집 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(), name="sports-feed")
+
+    async def stop(self) -> None:
+        """백그라운드 수집 중지 및 커넥션 풀 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.client.close()
+
+    async def run(self) -> None:
+        """주기적 수집 (실패가 이어지면 대기 시간을 두 배씩 늘림)"""
+        loop = asyncio.get_running_loop()
+        delay = self.interval
+        while True:
+            next_run = loop.time() + self.interval
+            try:
+                results = await self.sync_once()
+                delay = self.interval
+                changed = {key: result for key, result in results.items() if result != FeedSyncResultDTO()}
+                if changed:
+                    logger.info("피드 변경 반영: %s", changed)
+                await asyncio.sleep(max(0.0, next_run - loop.time()))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("피드 동기화 실패, %.0f초 후 재시도: %s", delay, e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_BACKOFF_SECONDS)
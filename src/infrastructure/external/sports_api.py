@@ -0,0 +1,210 @@
+"""외부 스포츠 데이터 피드 클라이언트
+
+피드 API (리그 키 단위 스냅샷):
+    GET /leagues/{league_key}/fixtures   경기 일정, 상태, 스코어
+    GET /leagues/{league_key}/odds       배팅 옵션별 배당
+
+- HTTP/2 커넥션 풀: 요청이 한 커넥션에서 다중화되어 연결/TLS 비용을 줄임
+- 조건부 요청: 직전 응답의 ETag/Last-Modified를 If-None-Match/If-Modified-Since로 보내고,
+  304면 본문 없이 "변경 없음"으로 처리
+- 동시 요청 수는 세마포어로 제한
+
+검증자(ETag 등)는 호출 측이 변경 사항을 DB에 반영한 뒤 mark_applied()로 저장합니다.
+반영에 실패하면 다음 요청에서 전체 스냅샷을 다시 받습니다.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar, TYPE_CHECKING
+
+from src.application.game.dto import FeedFixtureDTO, FeedOddsDTO
+from src.config import settings
+from src.domain.betting.enums import BettingOptionTypeEnum
+from src.domain.game.enums import GameStatusEnum, SportTypeEnum
+from src.infrastructure.monitoring.metrics import SPORTS_FEED_REQUESTS_TOTAL
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SportsAPIError(Exception):
+    """피드 요청 실패"""
+    pass
+
+
+@dataclass
+class FeedPage(Generic[T]):
+    """피드 응답 (변경 없으면 items가 None)"""
+    path: str
+    items: Optional[List[T]]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # 형식이 잘못되어 건너뛴 항목 수
+    skipped: int = field(default=0)
+
+    @property
+    def not_modified(self) -> bool:
+        return self.items is None
+
+
+class SportsAPIClient:
+    """스포츠 피드 HTTP 클라이언트"""
+
+    def __init__(self, transport: Optional["httpx.AsyncBaseTransport"] = None):
+        self.base_url = settings.SPORTS_FEED_BASE_URL
+        self.api_key = settings.SPORTS_FEED_API_KEY
+        self._transport = transport
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._semaphore = asyncio.Semaphore(settings.SPORTS_FEED_MAX_CONCURRENCY)
+        # 경로 → (ETag, Last-Modified)
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """HTTP/2 클라이언트 (첫 사용 시 생성)"""
+        if self._client is None:
+            import httpx
+
+            headers = {"Accept": "application/json"}
+            if self.api_key:
+                headers["X-API-Key"] = self.api_key
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                headers=headers,
+                timeout=settings.SPORTS_FEED_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=settings.SPORTS_FEED_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.SPORTS_FEED_MAX_CONNECTIONS,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """커넥션 풀 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch_fixtures(self, league_key: str) -> FeedPage[FeedFixtureDTO]:
+        """경기 일정/상태/스코어 스냅샷"""
+        return await self._fetch(f"/leagues/{league_key}/fixtures", "fixtures", _parse_fixture)
+
+    async def fetch_odds(self, league_key: str) -> FeedPage[FeedOddsDTO]:
+        """배당 스냅샷"""
+        return await self._fetch(f"/leagues/{league_key}/odds", "odds", _parse_odds)
+
+    def mark_applied(self, page: FeedPage) -> None:
+        """응답을 반영했으므로 다음 요청부터 조건부 요청에 사용"""
+        if not page.not_modified:
+            self._validators[page.path] = (page.etag, page.last_modified)
+
+    async def _fetch(self, path: str, endpoint: str, parse: Callable[[Dict[str, Any]], T]) -> FeedPage[T]:
+        import httpx
+
+        headers = {}
+        etag, last_modified = self._validators.get(path, (None, None))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        async with self._semaphore:
+            try:
+                response = await self.client.get(path, headers=headers)
+            except httpx.HTTPError as e:
+                SPORTS_FEED_REQUESTS_TOTAL.labels(endpoint, "error").inc()
+                raise SportsAPIError(f"피드 요청 실패 ({path}): {e}") from e
+
+        if response.status_code == 304:
+            SPORTS_FEED_REQUESTS_TOTAL.labels(endpoint, "not_modified").inc()
+            return FeedPage(path=path, items=None)
+        if response.status_code != 200:
+            SPORTS_FEED_REQUESTS_TOTAL.labels(endpoint, "error").inc()
+            raise SportsAPIError(f"피드 응답 오류 ({path}): HTTP {response.status_code}")
+        SPORTS_FEED_REQUESTS_TOTAL.labels(endpoint, "ok").inc()
+
+        try:
+            # 배당을 float로 거치지 않도록 Decimal로 파싱
+            payload = response.json(parse_float=Decimal)
+        except ValueError as e:
+            raise SportsAPIError(f"피드 응답 JSON 파싱 실패 ({path}): {e}") from e
+        raw_items = payload.get("items", []) if isinstance(payload, dict) else payload
+
+        items: List[T] = []
+        skipped = 0
+        for raw in raw_items:
+            try:
+                items.append(parse(raw))
+            except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+                skipped += 1
+                logger.debug("피드 항목 형식 오류 (%s): %s", path, e)
+        if skipped:
+            logger.warning("피드 항목 %d개를 형식 오류로 건너뜀 (%s)", skipped, path)
+
+        return FeedPage(
+            path=path,
+            items=items,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            skipped=skipped,
+        )
+
+
+def _enum(enum_class, value: Any):
+    """Enum 값("축구") 또는 이름("SOCCER", "soccer") 허용"""
+    try:
+        return enum_class(value)
+    except ValueError:
+        return enum_class[str(value).upper()]
+
+
+def _datetime(value: str) -> datetime:
+    """ISO 8601 시각 → UTC naive datetime"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _optional_decimal(value: Any) -> Optional[Decimal]:
+    return None if value is None else Decimal(str(value))
+
+
+def _parse_fixture(raw: Dict[str, Any]) -> FeedFixtureDTO:
+    return FeedFixtureDTO(
+        external_id=str(raw["external_id"]),
+        home_team=raw["home_team"],
+        away_team=raw["away_team"],
+        start_time=_datetime(raw["start_time"]),
+        betting_deadline=_datetime(raw.get("betting_deadline") or raw["start_time"]),
+        sport_type=_enum(SportTypeEnum, raw["sport_type"]),
+        status=_enum(GameStatusEnum, raw["status"]),
+        home_score=_optional_int(raw.get("home_score")),
+        away_score=_optional_int(raw.get("away_score")),
+    )
+
+
+def _parse_odds(raw: Dict[str, Any]) -> FeedOddsDTO:
+    odds = Decimal(str(raw["odds"])).quantize(Decimal("0.01"))
+    if odds <= 0:
+        raise ValueError(f"배당률은 0보다 커야 합니다: {odds}")
+    return FeedOddsDTO(
+        game_external_id=str(raw["game_external_id"]),
+        option_type=_enum(BettingOptionTypeEnum, raw["option_type"]),
+        option_name=raw["option_name"],
+        odds=odds,
+        handicap_value=_optional_decimal(raw.get("handicap_value")),
+        over_under_line=_optional_decimal(raw.get("over_under_line")),
+    )
@@ -0,0 +1,63 @@
+"""노출 집계 주기 대조
+
+EXPOSURE_RECONCILE_INTERVAL_SECONDS마다 대기 배팅으로 노출을 다시 계산해 Redis 집계를 교체합니다.
+단일 API 프로세스에서는 lifespan에서, python -m src.server(멀티 워커)에서는 scripts/exposure_worker.py
+프로세스 하나에서 실행합니다 (워커마다 대조하면 같은 전체 집계 쿼리가 워커 수만큼 반복됨).
+"""
+import asyncio
+import logging
+from typing import List, Optional
+
+from src.config import settings
+from src.domain.betting.service import ExposureService
+from src.infrastructure.cache.exposure_repository import ExposureRepositoryImpl
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.repositories.betting_repository import BetRepositoryImpl, BetSlipRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_exposure(game_ids: Optional[List[str]] = None) -> int:
+    """노출 대조 (game_ids가 없으면 전체, 반환값은 노출이 있는 게임 수)"""
+    async with AsyncSessionLocal() as session:
+        service = ExposureService(
+            BetRepositoryImpl(session), BetSlipRepositoryImpl(session), ExposureRepositoryImpl()
+        )
+        return len(await service.reconcile(game_ids))
+
+
+class ExposureReconciler:
+    """노출 집계 주기 대조 (백그라운드 태스크)"""
+
+    def __init__(self):
+        self.interval = settings.EXPOSURE_RECONCILE_INTERVAL_SECONDS
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """백그라운드 대조 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="exposure-reconcile")
+
+    async def stop(self) -> None:
+        """백그라운드 대조 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await reconcile_exposure()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("노출 대조 실패, %.0f초 후 재시도: %s", self.interval, e)
+            await asyncio.sleep(self.interval)
+
+
+# 싱글톤 인스턴스
+exposure_reconciler = ExposureReconciler()
@@ -0,0 +1,85 @@
+"""보고서 집계 테이블 주기 갱신
+
+ROLLUP_INTERVAL_SECONDS마다 새 배팅과 결과가 확정된 배팅의 시간을 다시 집계합니다 (RollupService).
+구간마다 집계 진행 시각 행을 잠근 트랜잭션으로 커밋하므로 API 워커 여러 개나 scripts/rollup_worker.py가
+동시에 실행해도 한 곳만 집계하고, 나머지는 잠금이 풀린 뒤 남은 구간이 없으면 바로 끝납니다.
+"""
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from src.config import settings
+from src.domain.report.entity import RollupResult
+from src.domain.report.service import RollupService
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.repositories.report_repository import RollupRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+async def run_rollup(now: Optional[datetime] = None) -> RollupResult:
+    """밀린 구간이 없을 때까지 집계 (구간마다 커밋, 마지막 구간 결과 반환)"""
+    now = now or datetime.utcnow()
+    total_hours = 0
+    while True:
+        async with AsyncSessionLocal() as session:
+            result = await RollupService(RollupRepositoryImpl(session)).run_once(
+                now, settings.ROLLUP_LAG_SECONDS, settings.ROLLUP_MAX_HOURS_PER_RUN
+            )
+            await session.commit()
+        total_hours += result.hours
+        if not result.has_more:
+            result.hours = total_hours
+            return result
+
+
+async def rebuild_rollups(start: date, end: date, days_per_commit: int = 7) -> int:
+    """[start, end] 날짜의 집계를 처음부터 다시 계산 (days_per_commit일마다 커밋, 다시 계산한 일 수 반환)"""
+    rebuilt = 0
+    day = start
+    while day <= end:
+        chunk_end = min(day + timedelta(days=days_per_commit - 1), end)
+        async with AsyncSessionLocal() as session:
+            result = await RollupService(RollupRepositoryImpl(session)).rebuild(day, chunk_end)
+            await session.commit()
+        rebuilt += result.days
+        day = chunk_end + timedelta(days=1)
+    return rebuilt
+
+
+class RollupScheduler:
+    """보고서 집계 주기 갱신 (백그라운드 태스크)"""
+
+    def __init__(self):
+        self.interval = settings.ROLLUP_INTERVAL_SECONDS
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """백그라운드 집계 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="report-rollup")
+
+    async def stop(self) -> None:
+        """백그라운드 집계 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await run_rollup()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("보고서 집계 실패, %.0f초 후 재시도: %s", self.interval, e)
+            await asyncio.sleep(self.interval)
+
+
+# 싱글톤 인스턴스
+rollup_scheduler = RollupScheduler()
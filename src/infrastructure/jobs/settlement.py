@@ -0,0 +1,201 @@
+"""게임 정산 작업
+
+payload: {"game_id": ..., "winning_option_ids": [...] | None}
+
+1. 옵션을 판정해 옵션별 슬립 결과를 payload에 저장하고 대상 슬립 수를 total로 기록 (커밋)
+2. 대상 슬립이 청크 하나보다 많으면 배팅 ID 범위로 나눈 하위 작업(샤드)을 등록하고 부모는 WAITING
+   - 하위 작업 payload: {"game_id", "slip_results", "bet_id_range": [시작, 끝)}
+   - 워커 프로세스/태스크들이 SKIP LOCKED로 샤드를 나눠 가져가 각자의 커넥션으로 동시에 정산
+   - 마지막 샤드가 끝날 때 부모를 완료 처리 (JobWorker)
+3. 슬립 ID 순으로 SETTLEMENT_CHUNK_SIZE개씩 정산하고, 같은 트랜잭션에 processed/checkpoint 기록
+4. 워커가 중간에 죽으면 다른 워커가 마지막 checkpoint 다음 청크부터 이어서 실행
+
+한 배팅의 이 경기 슬립은 모두 같은 샤드에 속하므로 샤드끼리는 같은 배팅을 갱신하지 않습니다.
+지갑 적립은 사용자 ID 순으로 갱신해 같은 사용자를 적립하는 샤드끼리 교착하지 않고, 그래도
+교착/잠금 대기 초과가 나면 청크 트랜잭션만 다시 실행합니다.
+
+판정 결과를 저장해 두므로 재시도해도 같은 결과로 정산하며, 결과가 기록된 슬립은 다시 처리하지
+않으므로 청크를 다시 실행해도 중복 지급되지 않습니다.
+"""
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.domain.betting.enums import BetSlipResultEnum
+from src.domain.betting.repository import BetIdRange
+from src.domain.game.service import GameService
+from src.domain.job.entity import Job
+from src.domain.wallet.service import WalletService
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.jobs.exposure import reconcile_exposure
+from src.infrastructure.database.repositories.betting_repository import (
+    BettingOptionRepositoryImpl,
+    BetRepositoryImpl,
+    BetSlipRepositoryImpl,
+    UserBetStatsRepositoryImpl,
+)
+from src.infrastructure.database.repositories.game_repository import GameRepositoryImpl
+from src.infrastructure.database.repositories.job_repository import JobRepositoryImpl
+from src.infrastructure.database.repositories.wallet_repository import WalletRepositoryImpl
+from src.infrastructure.monitoring.metrics import SETTLEMENT_DURATION, SETTLEMENT_ROWS_TOTAL
+
+logger = logging.getLogger(__name__)
+
+# 교착(1213)/잠금 대기 초과(1205) - 트랜잭션을 다시 실행하면 되는 오류
+_LOCK_CONFLICT_ERRORS = (1205, 1213)
+
+
+def _game_service(session: AsyncSession) -> GameService:
+    return GameService(
+        GameRepositoryImpl(session),
+        BetRepositoryImpl(session),
+        BetSlipRepositoryImpl(session),
+        BettingOptionRepositoryImpl(session),
+        WalletService(WalletRepositoryImpl(session)),
+        UserBetStatsRepositoryImpl(session),
+    )
+
+
+def bet_id_ranges(shard_count: int) -> List[BetIdRange]:
+    """배팅 ID(UUID4) 공간을 앞 8자리 16진수 기준으로 shard_count개 구간으로 균등 분할
+
+    첫 구간은 시작, 마지막 구간은 끝 경계가 없으므로 UUID 형식이 아닌 ID도 빠짐없이 어느 한 구간에 속합니다.
+    """
+    boundaries = [f"{index * 0x100000000 // shard_count:08x}" for index in range(1, shard_count)]
+    starts: List[Optional[str]] = [None, *boundaries]
+    ends: List[Optional[str]] = [*boundaries, None]
+    return list(zip(starts, ends))
+
+
+def _is_lock_conflict(error: DBAPIError) -> bool:
+    args = getattr(error.orig, "args", ())
+    return bool(args) and args[0] in _LOCK_CONFLICT_ERRORS
+
+
+class SettlementJobHandler:
+    """게임 정산 작업 실행기"""
+
+    async def __call__(self, job: Job) -> None:
+        started = time.perf_counter()
+        game_id = job.payload["game_id"]
+        if "slip_results" not in job.payload:
+            await self._grade(job, game_id)
+
+        if job.parent_id is None and job.checkpoint is None:
+            shard_count = min(settings.SETTLEMENT_SHARD_COUNT, math.ceil(job.total / settings.SETTLEMENT_CHUNK_SIZE))
+            if shard_count > 1 and await self._split(job, game_id, shard_count):
+                return
+
+        slip_results: Dict[str, BetSlipResultEnum] = {
+            option_id: BetSlipResultEnum[name] for option_id, name in job.payload["slip_results"].items()
+        }
+        bet_id_range = job.payload.get("bet_id_range")
+        if bet_id_range is not None:
+            bet_id_range = tuple(bet_id_range)
+        while await self._settle_chunk(job, game_id, slip_results, bet_id_range):
+            pass
+        if settings.EXPOSURE_TRACKING_ENABLED:
+            try:
+                # 정산된 배팅의 노출을 주기 대조 전에 정리
+                await reconcile_exposure([game_id])
+            except Exception as e:
+                logger.warning("게임 %s 노출 대조 실패 (주기 대조에서 정리): %s", game_id, e)
+
+        SETTLEMENT_DURATION.observe(time.perf_counter() - started)
+        logger.info(
+            "게임 %s 정산 작업 %s: 슬립 %d개, 배팅 %d건 확정 (%.3fs)",
+            game_id, job.id, job.processed, job.result.get("settled_bets", 0), time.perf_counter() - started,
+        )
+
+    async def _settle_chunk(
+        self,
+        job: Job,
+        game_id: str,
+        slip_results: Dict[str, BetSlipResultEnum],
+        bet_id_range: Optional[BetIdRange],
+    ) -> bool:
+        """청크 하나를 정산하고 진행 상황과 함께 커밋 (남은 슬립이 없으면 False)"""
+        attempt = 0
+        while True:
+            attempt += 1
+            # 커밋에 실패하면 작업의 진행 상황을 되돌려 DB의 체크포인트와 맞춤
+            processed, checkpoint = job.processed, job.checkpoint
+            settled_bets = job.result.get("settled_bets", 0)
+            try:
+                async with AsyncSessionLocal() as session:
+                    chunk = await _game_service(session).settle_chunk(
+                        game_id, slip_results, job.checkpoint, settings.SETTLEMENT_CHUNK_SIZE, bet_id_range
+                    )
+                    if not chunk.slips:
+                        return False
+                    job.advance(chunk.slips, chunk.last_slip_id, settings.JOB_LEASE_SECONDS)
+                    job.result["settled_bets"] = settled_bets + chunk.settled_bets
+                    await JobRepositoryImpl(session).save(job)
+                    await session.commit()
+            except BaseException as e:
+                job.processed, job.checkpoint = processed, checkpoint
+                job.result["settled_bets"] = settled_bets
+                retryable = isinstance(e, DBAPIError) and _is_lock_conflict(e)
+                if not retryable or attempt > settings.SETTLEMENT_LOCK_RETRIES:
+                    raise
+                logger.warning("정산 작업 %s 청크 잠금 충돌, 다시 실행 (%d회): %s", job.id, attempt, e.orig)
+                await asyncio.sleep(0.05 * attempt)
+                continue
+            SETTLEMENT_ROWS_TOTAL.inc(chunk.settled_bets)
+            return True
+
+    async def _split(self, job: Job, game_id: str, shard_count: int) -> bool:
+        """배팅 ID 범위별 하위 작업 등록 (부모는 하위 작업이 모두 끝날 때까지 대기)
+
+        하위 작업 등록과 부모의 WAITING 전환을 한 트랜잭션으로 커밋합니다. 대상 슬립이 없으면 False.
+        """
+        slip_results = {
+            option_id: BetSlipResultEnum[name] for option_id, name in job.payload["slip_results"].items()
+        }
+        async with AsyncSessionLocal() as session:
+            service = _game_service(session)
+            repository = JobRepositoryImpl(session)
+            children = []
+            for bet_id_range in bet_id_ranges(shard_count):
+                total = await service.count_pending_slips(game_id, slip_results, bet_id_range)
+                if not total:
+                    continue
+                children.append(Job(
+                    job_type=job.job_type,
+                    parent_id=job.id,
+                    payload={
+                        "game_id": game_id,
+                        "slip_results": job.payload["slip_results"],
+                        "bet_id_range": list(bet_id_range),
+                    },
+                    total=total,
+                ))
+            if not children:
+                return False
+            for child in children:
+                await repository.save(child)
+            job.total = sum(child.total for child in children)
+            job.wait_for_children(len(children))
+            await repository.save(job)
+            await session.commit()
+        logger.info("게임 %s 정산 작업 %s: 하위 작업 %d개로 분할 (슬립 %d개)", game_id, job.id, len(children), job.total)
+        return True
+
+    async def _grade(self, job: Job, game_id: str) -> None:
+        """옵션 판정 결과와 대상 슬립 수 기록"""
+        async with AsyncSessionLocal() as session:
+            service = _game_service(session)
+            grading = await service.grade_game(game_id, job.payload.get("winning_option_ids"))
+            slip_results = grading.slip_results()
+            job.payload["slip_results"] = {option_id: result.name for option_id, result in slip_results.items()}
+            job.total = await service.count_pending_slips(game_id, slip_results)
+            job.result = {"settled_bets": 0, "ungraded_option_ids": grading.ungraded}
+            job.advance(0, None, settings.JOB_LEASE_SECONDS)
+            await JobRepositoryImpl(session).save(job)
+            await session.commit()
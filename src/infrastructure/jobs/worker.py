@@ -0,0 +1,142 @@
+"""백그라운드 작업 워커
+
+jobs 테이블을 폴링해 SELECT ... FOR UPDATE SKIP LOCKED로 작업을 하나씩 점유하고 실행합니다.
+워커(프로세스/태스크)가 여러 개여도 같은 작업을 동시에 점유하지 않으며, 실행 중 죽은 워커의
+작업은 점유 기간(JOB_LEASE_SECONDS)이 지나면 다른 워커가 마지막 checkpoint부터 이어받습니다.
+
+처리기가 작업을 하위 작업으로 나누면(WAITING) 부모는 점유하지 않은 채 남고, 하위 작업이 끝날 때마다
+같은 트랜잭션에서 부모를 잠가 결과를 합치며 마지막 하위 작업이 부모를 완료(또는 실패) 처리합니다.
+
+- 개발: API lifespan에서 함께 실행 (단일 프로세스, JOB_WORKER_EMBEDDED=true)
+- 운영: API 워커와 분리해 실행 (`python -m scripts.job_worker`)
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.config import settings
+from src.domain.job.entity import Job
+from src.domain.job.enums import JobStatusEnum, JobTypeEnum
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.repositories.job_repository import JobRepositoryImpl
+from src.infrastructure.monitoring.metrics import JOB_DURATION, JOB_RUNS_TOTAL
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Job], Awaitable[None]]
+
+
+class JobWorker:
+    """작업 워커 (asyncio 태스크 concurrency개)"""
+
+    def __init__(self, handlers: Dict[JobTypeEnum, JobHandler], concurrency: Optional[int] = None):
+        self.handlers = handlers
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: List[asyncio.Task] = []
+
+    async def run_once(self, worker_id: Optional[str] = None) -> bool:
+        """작업 하나를 점유해 실행 (실행할 작업이 없으면 False)"""
+        worker_id = worker_id or f"{self.name}:0"
+        async with AsyncSessionLocal() as session:
+            job = await JobRepositoryImpl(session).claim_next(worker_id, settings.JOB_LEASE_SECONDS)
+            await session.commit()
+        if job is None:
+            return False
+        await self._execute(job)
+        return True
+
+    async def _execute(self, job: Job) -> None:
+        started = time.perf_counter()
+        handler = self.handlers.get(job.job_type)
+        try:
+            if handler is None:
+                raise ValueError(f"처리기가 없는 작업 종류입니다: {job.job_type.name}")
+            await handler(job)
+            if job.status == JobStatusEnum.WAITING:
+                # 처리기가 하위 작업 등록과 함께 이미 커밋함 (여기서 저장하면 먼저 끝난 하위 작업 반영을 덮어씀)
+                JOB_RUNS_TOTAL.labels(job.job_type.name, "split").inc()
+                JOB_DURATION.labels(job.job_type.name).observe(time.perf_counter() - started)
+                return
+            job.succeed()
+            outcome = "succeeded"
+        except asyncio.CancelledError:
+            # 점유 기간이 지나면 다른 워커가 이어받음
+            raise
+        except ValueError as e:
+            # 잘못된 요청(게임 없음, 종료되지 않은 경기 등)은 재시도해도 같으므로 바로 실패 처리
+            logger.warning("작업 %s(%s) 실패: %s", job.id, job.job_type.name, e)
+            job.fail(str(e), max_attempts=job.attempts, retry_delay_seconds=0)
+            outcome = "failed"
+        except Exception as e:
+            logger.exception("작업 %s(%s) 실행 중 오류 (시도 %d회)", job.id, job.job_type.name, job.attempts)
+            job.fail(
+                f"{type(e).__name__}: {e}",
+                max_attempts=settings.JOB_MAX_ATTEMPTS,
+                retry_delay_seconds=settings.JOB_RETRY_DELAY_SECONDS * 2 ** (job.attempts - 1),
+            )
+            outcome = "failed" if job.is_finished else "retry"
+
+        async with AsyncSessionLocal() as session:
+            repository = JobRepositoryImpl(session)
+            await repository.save(job)
+            if job.parent_id is not None and job.is_finished:
+                parent = await repository.find_by_id_for_update(job.parent_id)
+                if parent is not None:
+                    parent.child_finished(job)
+                    await repository.save(parent)
+            await session.commit()
+        JOB_RUNS_TOTAL.labels(job.job_type.name, outcome).inc()
+        JOB_DURATION.labels(job.job_type.name).observe(time.perf_counter() - started)
+
+    async def _loop(self, index: int) -> None:
+        worker_id = f"{self.name}:{index}"
+        while True:
+            try:
+                if await self.run_once(worker_id):
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("작업 점유 실패 (%s): %s", worker_id, e)
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+
+    async def run(self) -> None:
+        """작업 폴링 (취소될 때까지)"""
+        await asyncio.gather(*(self._loop(index) for index in range(self.concurrency)))
+
+    async def drain(self) -> int:
+        """실행 가능한 작업이 없을 때까지 실행 (실행한 작업 수 반환)"""
+        count = 0
+        while await self.run_once():
+            count += 1
+        return count
+
+    def start(self) -> None:
+        """백그라운드 실행 시작"""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._loop(index), name=f"job-worker-{index}")
+                for index in range(self.concurrency)
+            ]
+
+    async def stop(self) -> None:
+        """백그라운드 실행 중지"""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+
+def create_job_worker(concurrency: Optional[int] = None) -> JobWorker:
+    """작업 종류별 처리기를 등록한 워커"""
+    from src.infrastructure.jobs.settlement import SettlementJobHandler
+
+    return JobWorker({JobTypeEnum.SETTLEMENT: SettlementJobHandler()}, concurrency)
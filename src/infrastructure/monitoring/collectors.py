@@ -0,0 +1,51 @@
+"""커넥션 풀 상태 Prometheus 게이지 갱신
+
+스크레이프 시점에 읽는 커스텀 수집기는 멀티 프로세스 모드에서 스크레이프를 받은 워커의 풀만 보여 주므로,
+요청을 마칠 때마다 이 프로세스의 풀 상태를 게이지(multiprocess_mode=livesum)에 기록해 워커들의 합으로 내보냅니다.
+"""
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.cache.redis_client import RedisClient
+from src.infrastructure.monitoring.metrics import (
+    DB_POOL_CHECKED_IN,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    REDIS_POOL_AVAILABLE,
+    REDIS_POOL_IN_USE,
+    REDIS_POOL_MAX_CONNECTIONS,
+)
+
+
+class PoolStats:
+    """DB 커넥션 풀 / Redis 커넥션 풀 상태 게이지 갱신"""
+
+    def __init__(self, engine: AsyncEngine, redis_client: RedisClient):
+        self.engine = engine
+        self.redis_client = redis_client
+
+    def update(self) -> None:
+        self._update_db_pool()
+        self._update_redis_pool()
+
+    def _update_db_pool(self) -> None:
+        pool = self.engine.sync_engine.pool
+        # QueuePool 계열만 상태 조회를 지원 (sqlite 대체 엔진의 NullPool 등은 생략)
+        for gauge, method in (
+            (DB_POOL_SIZE, "size"),
+            (DB_POOL_CHECKED_OUT, "checkedout"),
+            (DB_POOL_CHECKED_IN, "checkedin"),
+            (DB_POOL_OVERFLOW, "overflow"),
+        ):
+            if hasattr(pool, method):
+                gauge.set(getattr(pool, method)())
+
+    def _update_redis_pool(self) -> None:
+        if self.redis_client.redis is None:
+            return
+        pool = getattr(self.redis_client.redis, "connection_pool", None)
+        if pool is None:
+            return
+        REDIS_POOL_IN_USE.set(len(getattr(pool, "_in_use_connections", ())))
+        REDIS_POOL_AVAILABLE.set(len(getattr(pool, "_available_connections", ())))
+        REDIS_POOL_MAX_CONNECTIONS.set(pool.max_connections)
@@ -0,0 +1,148 @@
+"""Prometheus 메트릭 정의
+
+라우트 라벨은 경로 템플릿(예: /api/v1/games/{game_id})만 사용해 시계열 수를 제한합니다.
+
+gunicorn 멀티 워커(python -m src.server)에서는 PROMETHEUS_MULTIPROC_DIR의 파일로 워커들의 값을 공유하고,
+스크레이프 시 generate_metrics()가 모든 워커의 값을 합칩니다. 게이지는 multiprocess_mode로 합치는 방식을 정합니다
+(livesum: 살아 있는 워커 값의 합).
+"""
+import os
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+
+# HTTP (PrometheusMiddleware)
+HTTP_REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "처리한 HTTP 요청 수",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수 (라우팅 전에는 라우트를 알 수 없으므로 메서드 단위)",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP 응답 본문 크기",
+    ["method", "route"],
+    buckets=(100, 500, 1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000),
+)
+
+# 응답 압축 (CompressionMiddleware): 압축률은 rate(...{stage="encoded"}) / rate(...{stage="identity"})
+HTTP_RESPONSE_COMPRESSION_BYTES = Counter(
+    "http_response_compression_bytes_total",
+    "압축한 응답 본문 바이트 (stage: identity=압축 전, encoded=압축 후)",
+    ["route", "encoding", "stage"],
+)
+
+# 커넥션 풀 상태 (PoolStats가 요청마다 갱신, 워커별 풀의 합)
+DB_POOL_SIZE = Gauge("db_pool_size", "DB 커넥션 풀 크기", multiprocess_mode="livesum")
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "사용 중인 DB 커넥션 수", multiprocess_mode="livesum")
+DB_POOL_CHECKED_IN = Gauge("db_pool_checked_in", "풀에서 대기 중인 DB 커넥션 수", multiprocess_mode="livesum")
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "pool_size를 초과해 연 DB 커넥션 수", multiprocess_mode="livesum")
+REDIS_POOL_IN_USE = Gauge("redis_pool_in_use", "사용 중인 Redis 커넥션 수", multiprocess_mode="livesum")
+REDIS_POOL_AVAILABLE = Gauge("redis_pool_available", "풀에서 대기 중인 Redis 커넥션 수", multiprocess_mode="livesum")
+REDIS_POOL_MAX_CONNECTIONS = Gauge(
+    "redis_pool_max_connections",
+    "Redis 커넥션 풀 최대 크기",
+    multiprocess_mode="livesum",
+)
+
+# 요청당 SQL 문 수 / DB 시간 (QueryStatsMiddleware)
+DB_STATEMENTS_PER_REQUEST = Histogram(
+    "db_statements_per_request",
+    "요청 하나에서 실행된 SQL 문 수",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 500, 1000),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "요청 하나에서 SQL 실행에 사용한 총 시간",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+# 인증
+TOKEN_REVOCATION_CHECKS = Counter(
+    "token_revocation_checks_total",
+    "토큰 무효화 확인 (filter: 로컬 필터에서 종료, redis: Redis 조회)",
+    ["path"],
+)
+
+# 스포츠 피드 수집 (SportsFeedWorker)
+SPORTS_FEED_REQUESTS_TOTAL = Counter(
+    "sports_feed_requests_total",
+    "스포츠 피드 요청 수 (result: ok | not_modified | error)",
+    ["endpoint", "result"],
+)
+SPORTS_FEED_CHANGES_TOTAL = Counter(
+    "sports_feed_changes_total",
+    "피드에서 반영한 변경 수",
+    ["kind"],
+)
+SPORTS_FEED_SYNC_DURATION = Histogram(
+    "sports_feed_sync_duration_seconds",
+    "전체 리그 동기화 1회 소요 시간",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+# 비즈니스 지표
+BETS_PLACED_TOTAL = Counter(
+    "bets_placed_total",
+    "접수된 배팅 수",
+    ["bet_type"],
+)
+BET_AMOUNT_TOTAL = Counter(
+    "bet_amount_total",
+    "접수된 배팅 금액 합계",
+    ["bet_type"],
+)
+BETS_REJECTED_EXPOSURE_TOTAL = Counter(
+    "bets_rejected_exposure_total",
+    "노출 한도 초과로 거절된 배팅 수",
+    ["bet_type"],
+)
+RATE_LIMITED_TOTAL = Counter(
+    "rate_limited_total",
+    "속도 제한으로 거절된 요청 수 (source: local/redis)",
+    ["rule", "source"],
+)
+# 초당 정산 행 수는 rate(settlement_rows_total[5m])로 계산
+SETTLEMENT_ROWS_TOTAL = Counter(
+    "settlement_rows_total",
+    "정산 처리한 배팅 수",
+)
+SETTLEMENT_DURATION = Histogram(
+    "settlement_duration_seconds",
+    "게임 1건 정산 소요 시간",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+
+# 백그라운드 작업 (jobs 테이블)
+JOB_RUNS_TOTAL = Counter(
+    "job_runs_total",
+    "실행을 마친 백그라운드 작업 수 (result: succeeded/failed/retry/split)",
+    ["job_type", "result"],
+)
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "백그라운드 작업 1회 실행 시간",
+    ["job_type"],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+
+
+def generate_metrics() -> bytes:
+    """스크레이프 응답 본문 (멀티 프로세스 모드면 모든 워커의 값을 합침)"""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
@@ -1,27 +1,63 @@
-import sys
-import os
-from contextlib import asynccontextmanager
+"""FastAPI 애플리케이션 진입점
 
-# Add project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+프로젝트 루트에서 실행합니다: `uvicorn src.main:app` 또는 `python -m src.main` (개발용)
+운영 서버는 `python -m src.server` (gunicorn 멀티 워커, src/server.py)
+"""
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST
 
-from src.infrastructure.database.connection import init_db, close_db
+from src.config import settings
+from src.infrastructure.database.connection import engine, verify_schema_revision, prewarm_pool, close_db
 from src.infrastructure.cache.redis_client import redis_client
-from src.presentation.api.v1 import auth, users, wallet, leagues, games
+from src.infrastructure.auth.revocation import revocation_registry
+from src.infrastructure.jobs.exposure import exposure_reconciler
+from src.infrastructure.jobs.rollup import rollup_scheduler
+from src.infrastructure.jobs.worker import create_job_worker
+from src.infrastructure.monitoring.collectors import PoolStats
+from src.infrastructure.monitoring.metrics import generate_metrics
+from src.presentation.api.v1 import auth, users, wallet, leagues, games, jobs, exposure, reports
 from src.presentation.api.v1.betting import options_router, bets_router
+from src.presentation.middleware.compression import CompressionMiddleware
+from src.presentation.middleware.query_stats import QueryStatsMiddleware
+from src.presentation.middleware.metrics import PrometheusMiddleware
+from src.presentation.responses import ORJSONResponse
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 라이프사이클"""
-    # Startup
-    await init_db()
-    await redis_client.connect()
+    # Startup: 테이블 생성은 Alembic 마이그레이션(alembic upgrade head)이 담당
+    if settings.DB_VERIFY_SCHEMA_ON_STARTUP:
+        await verify_schema_revision()
+    # DB/Redis 커넥션은 첫 요청 시 지연 연결, 설정 시에만 사전 연결
+    await prewarm_pool(settings.DB_POOL_PREWARM)
+    if settings.REDIS_PREWARM:
+        await redis_client.ping()
+    # 토큰 무효화 필터 동기화 (백그라운드, 동기화 전에는 Redis 직접 조회)
+    if settings.REVOCATION_SYNC_ENABLED:
+        revocation_registry.start()
+    # 내장 백그라운드 작업 (BACKGROUND_TASKS_EMBEDDED=false면 scripts/*_worker.py로 분리)
+    background = settings.BACKGROUND_TASKS_EMBEDDED is not False
+    # 정산 등 백그라운드 작업
+    job_worker = create_job_worker() if background and settings.JOB_WORKER_EMBEDDED else None
+    if job_worker is not None:
+        job_worker.start()
+    # 노출 집계 주기 대조
+    if background and settings.EXPOSURE_TRACKING_ENABLED and settings.EXPOSURE_RECONCILE_INTERVAL_SECONDS > 0:
+        exposure_reconciler.start()
+    # 보고서 집계 주기 갱신
+    if background and settings.ROLLUP_INTERVAL_SECONDS > 0:
+        rollup_scheduler.start()
     yield
     # Shutdown
+    if job_worker is not None:
+        await job_worker.stop()
+    await exposure_reconciler.stop()
+    await rollup_scheduler.stop()
+    await revocation_registry.stop()
     await close_db()
     await redis_client.disconnect()
 
@@ -33,6 +69,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정
@@ -44,6 +81,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (gzip/brotli, 메트릭의 응답 크기는 압축 후 바이트)
+app.add_middleware(CompressionMiddleware)
+# 요청 단위 DB 왕복 계측 (Server-Timing, 쿼리 예산 경고)
+app.add_middleware(QueryStatsMiddleware)
+# HTTP 요청 메트릭 (가장 바깥에서 전체 처리 시간 측정, 요청마다 DB/Redis 커넥션 풀 게이지 갱신)
+pool_stats = PoolStats(engine, redis_client)
+app.add_middleware(PrometheusMiddleware, pool_stats=pool_stats)
+
 # API 라우터 등록
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(users.router, prefix="/api/v1")
@@ -52,6 +97,9 @@ app.include_router(leagues.router, prefix="/api/v1")
 app.include_router(games.router, prefix="/api/v1")
 app.include_router(options_router, prefix="/api/v1")
 app.include_router(bets_router, prefix="/api/v1")
+app.include_router(jobs.router, prefix="/api/v1")
+app.include_router(exposure.router, prefix="/api/v1")
+app.include_router(reports.router, prefix="/api/v1")
 
 
 @app.get("/")
@@ -70,6 +118,20 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 엔드포인트 (멀티 워커면 모든 워커의 값을 합침)"""
+    pool_stats.update()
+    return Response(generate_metrics(), headers={"Content-Type": CONTENT_TYPE_LATEST})
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "src.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        reload=settings.DEBUG,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+    )
@@ -1,36 +1,50 @@
 """FastAPI 의존성 주입"""
-from typing import Annotated
+import math
+from typing import Annotated, Callable
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.infrastructure.database.connection import get_db
 from src.infrastructure.database.repositories.user_repository import UserRepositoryImpl
 from src.infrastructure.database.repositories.wallet_repository import WalletRepositoryImpl
 from src.infrastructure.database.repositories.league_repository import SQLAlchemyLeagueRepository
 from src.infrastructure.database.repositories.game_repository import GameRepositoryImpl
+from src.infrastructure.database.repositories.job_repository import JobRepositoryImpl
 from src.infrastructure.database.repositories.betting_repository import (
     BettingOptionRepositoryImpl,
     BetRepositoryImpl,
     BetSlipRepositoryImpl,
+    UserBetStatsRepositoryImpl,
 )
+from src.infrastructure.database.repositories.report_repository import ReportRepositoryImpl
+from src.infrastructure.cache.exposure_repository import ExposureRepositoryImpl
+from src.infrastructure.cache.rate_limiter import RateLimit, rate_limiter
 from src.infrastructure.auth.jwt_handler import jwt_handler
 from src.infrastructure.auth.token_repository import token_repository
 from src.domain.common.exceptions import AuthenticationException, EntityNotFoundException
+from src.infrastructure.monitoring.metrics import RATE_LIMITED_TOTAL
 from src.domain.user.service import UserService
 from src.domain.wallet.service import WalletService
-from src.domain.betting.service import BettingService
+from src.domain.betting.service import BettingService, ExposureService
 from src.domain.game.service import GameService
 from src.application.user.use_cases import UserUseCases as UserUseCasesClass
 from src.application.wallet.use_cases import WalletUseCases as WalletUseCasesClass
 from src.application.league.use_cases import LeagueUseCases as LeagueUseCasesClass
-from src.application.game.use_cases import GameUseCases as GameUseCasesClass
+from src.application.game.use_cases import (
+    GameUseCases as GameUseCasesClass,
+    FixtureImportUseCase as FixtureImportUseCaseClass,
+)
+from src.application.job.use_cases import JobUseCases as JobUseCasesClass
 from src.application.betting.use_cases import (
     BettingOptionUseCases as BettingOptionUseCasesClass,
     BettingUseCases as BettingUseCasesClass,
+    ExposureUseCases as ExposureUseCasesClass,
 )
+from src.application.report.use_cases import ReportUseCases as ReportUseCasesClass
 from src.presentation.schemas.user import UserResponse
 
 
@@ -66,6 +80,13 @@ async def get_game_repository(
     return GameRepositoryImpl(session)
 
 
+async def get_job_repository(
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> JobRepositoryImpl:
+    """Job Repository 의존성"""
+    return JobRepositoryImpl(session)
+
+
 async def get_betting_option_repository(
     session: Annotated[AsyncSession, Depends(get_db)]
 ) -> BettingOptionRepositoryImpl:
@@ -87,6 +108,18 @@ async def get_bet_slip_repository(
     return BetSlipRepositoryImpl(session)
 
 
+async def get_bet_stats_repository(
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> UserBetStatsRepositoryImpl:
+    """UserBetStats Repository 의존성"""
+    return UserBetStatsRepositoryImpl(session)
+
+
+async def get_exposure_repository() -> ExposureRepositoryImpl:
+    """Exposure Repository 의존성 (Redis)"""
+    return ExposureRepositoryImpl()
+
+
 async def get_user_service(
     user_repository: Annotated[UserRepositoryImpl, Depends(get_user_repository)]
 ) -> UserService:
@@ -106,28 +139,47 @@ async def get_betting_service(
     bet_slip_repository: Annotated[BetSlipRepositoryImpl, Depends(get_bet_slip_repository)],
     betting_option_repository: Annotated[BettingOptionRepositoryImpl, Depends(get_betting_option_repository)],
     wallet_service: Annotated[WalletService, Depends(get_wallet_service)],
+    exposure_repository: Annotated[ExposureRepositoryImpl, Depends(get_exposure_repository)],
+    bet_stats_repository: Annotated[UserBetStatsRepositoryImpl, Depends(get_bet_stats_repository)],
+    game_repository: Annotated[GameRepositoryImpl, Depends(get_game_repository)],
 ) -> BettingService:
-    """Betting Service 의존성"""
+    """Betting Service 의존성 (EXPOSURE_TRACKING_ENABLED면 노출 집계/한도 검사)"""
     return BettingService(
         bet_repository,
         bet_slip_repository,
         betting_option_repository,
         wallet_service,
+        exposure_repository if settings.EXPOSURE_TRACKING_ENABLED else None,
+        bet_stats_repository,
+        game_repository,
     )
 
 
+async def get_exposure_service(
+    bet_repository: Annotated[BetRepositoryImpl, Depends(get_bet_repository)],
+    bet_slip_repository: Annotated[BetSlipRepositoryImpl, Depends(get_bet_slip_repository)],
+    exposure_repository: Annotated[ExposureRepositoryImpl, Depends(get_exposure_repository)],
+) -> ExposureService:
+    """Exposure Service 의존성"""
+    return ExposureService(bet_repository, bet_slip_repository, exposure_repository)
+
+
 async def get_game_service(
     game_repository: Annotated[GameRepositoryImpl, Depends(get_game_repository)],
     bet_repository: Annotated[BetRepositoryImpl, Depends(get_bet_repository)],
     bet_slip_repository: Annotated[BetSlipRepositoryImpl, Depends(get_bet_slip_repository)],
+    betting_option_repository: Annotated[BettingOptionRepositoryImpl, Depends(get_betting_option_repository)],
     wallet_service: Annotated[WalletService, Depends(get_wallet_service)],
+    bet_stats_repository: Annotated[UserBetStatsRepositoryImpl, Depends(get_bet_stats_repository)],
 ) -> GameService:
     """Game Service 의존성"""
     return GameService(
         game_repository,
         bet_repository,
         bet_slip_repository,
+        betting_option_repository,
         wallet_service,
+        bet_stats_repository,
     )
 
 
@@ -152,12 +204,29 @@ async def get_league_use_cases(
     return LeagueUseCasesClass(league_repository)
 
 
+async def get_job_use_cases(
+    job_repository: Annotated[JobRepositoryImpl, Depends(get_job_repository)]
+) -> JobUseCasesClass:
+    """Job Use Cases 의존성"""
+    return JobUseCasesClass(job_repository)
+
+
 async def get_game_use_cases(
     game_repository: Annotated[GameRepositoryImpl, Depends(get_game_repository)],
     game_service: Annotated[GameService, Depends(get_game_service)],
+    job_use_cases: Annotated[JobUseCasesClass, Depends(get_job_use_cases)],
 ) -> GameUseCasesClass:
     """Game Use Cases 의존성"""
-    return GameUseCasesClass(game_repository, game_service)
+    return GameUseCasesClass(game_repository, game_service, job_use_cases)
+
+
+async def get_fixture_import_use_case(
+    game_repository: Annotated[GameRepositoryImpl, Depends(get_game_repository)],
+    betting_option_repository: Annotated[BettingOptionRepositoryImpl, Depends(get_betting_option_repository)],
+    league_repository: Annotated[SQLAlchemyLeagueRepository, Depends(get_league_repository)],
+) -> FixtureImportUseCaseClass:
+    """Fixture Import Use Case 의존성"""
+    return FixtureImportUseCaseClass(game_repository, betting_option_repository, league_repository)
 
 
 async def get_betting_option_use_cases(
@@ -170,24 +239,39 @@ async def get_betting_option_use_cases(
 async def get_betting_use_cases(
     betting_service: Annotated[BettingService, Depends(get_betting_service)],
     bet_repository: Annotated[BetRepositoryImpl, Depends(get_bet_repository)],
+    bet_stats_repository: Annotated[UserBetStatsRepositoryImpl, Depends(get_bet_stats_repository)],
 ) -> BettingUseCasesClass:
     """Betting Use Cases 의존성"""
-    return BettingUseCasesClass(betting_service, bet_repository)
+    return BettingUseCasesClass(betting_service, bet_repository, bet_stats_repository)
 
 
-async def get_current_user_id(
+async def get_exposure_use_cases(
+    exposure_repository: Annotated[ExposureRepositoryImpl, Depends(get_exposure_repository)],
+    exposure_service: Annotated[ExposureService, Depends(get_exposure_service)],
+) -> ExposureUseCasesClass:
+    """Exposure Use Cases 의존성"""
+    return ExposureUseCasesClass(exposure_repository, exposure_service)
+
+
+async def get_report_use_cases(
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> ReportUseCasesClass:
+    """Report Use Cases 의존성"""
+    return ReportUseCasesClass(ReportRepositoryImpl(session))
+
+
+async def get_token_payload(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]
-) -> UUID:
-    """현재 로그인한 사용자 ID 추출"""
+) -> dict:
+    """검증된 Access Token 클레임
+
+    서명 검증(최근 검증한 토큰은 로컬 캐시)을 먼저 수행하고,
+    유효한 토큰에 대해서만 토큰 ID(jti)로 블랙리스트를 확인합니다.
+    """
+    token = credentials.credentials
     try:
-        token = credentials.credentials
-        if await token_repository.is_blacklisted(token):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="토큰이 무효화되었습니다",
-            )
-        user_id = jwt_handler.get_user_id_from_token(token)
-        return user_id
+        payload = jwt_handler.decode_token(token)
+        UUID(payload["user_id"])  # 사용자 ID 형식 검증
     except AuthenticationException as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -199,6 +283,35 @@ async def get_current_user_id(
             detail="유효하지 않은 인증 정보입니다",
         )
 
+    if await token_repository.is_blacklisted(jwt_handler.get_token_id(token, payload)):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="토큰이 무효화되었습니다",
+        )
+    return payload
+
+
+async def get_current_user_id(
+    payload: Annotated[dict, Depends(get_token_payload)]
+) -> UUID:
+    """현재 로그인한 사용자 ID 추출"""
+    return UUID(payload["user_id"])
+
+
+async def get_current_admin_id(
+    payload: Annotated[dict, Depends(get_token_payload)]
+) -> UUID:
+    """현재 로그인한 관리자 ID 추출 (관리자가 아니면 403)
+
+    역할은 토큰 클레임으로 확인하므로 DB를 조회하지 않습니다.
+    """
+    if payload.get("role") != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다",
+        )
+    return UUID(payload["user_id"])
+
 
 async def get_current_user(
     user_id: Annotated[UUID, Depends(get_current_user_id)],
@@ -224,8 +337,54 @@ async def get_current_token(
     return credentials.credentials
 
 
+async def _enforce_rate_limit(rule: str, identity: str, limit: RateLimit) -> None:
+    """한도를 넘으면 429 (Retry-After: 다음 요청이 허용될 때까지 남은 초)"""
+    result = await rate_limiter.hit(rule, identity, limit)
+    if not result.allowed:
+        RATE_LIMITED_TOTAL.labels(rule=rule, source=result.source).inc()
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(max(1, math.ceil(result.retry_after)))},
+        )
+
+
+def rate_limit_by_ip(rule: str) -> Callable:
+    """클라이언트 IP 기준 속도 제한 의존성 (로그인 전 엔드포인트용)
+
+    @router.post("/login", dependencies=[Depends(rate_limit_by_ip("login"))])
+
+    신뢰하는 프록시(SERVER_FORWARDED_ALLOW_IPS)를 거친 요청은 uvicorn이 request.client를
+    X-Forwarded-For의 클라이언트 IP로 바꿔 두므로, 로드밸런서 뒤에서도 클라이언트마다 따로 셉니다.
+    신뢰하지 않는 주소에서 보낸 X-Forwarded-For는 무시되어 헤더를 바꿔 한도를 피할 수 없습니다.
+    """
+    async def dependency(request: Request) -> None:
+        limit = rate_limiter.limit_for(rule)
+        if not settings.RATE_LIMIT_ENABLED or limit is None:
+            return
+        client = request.client.host if request.client else "unknown"
+        await _enforce_rate_limit(rule, f"ip:{client}", limit)
+
+    return dependency
+
+
+def rate_limit_by_user(rule: str) -> Callable:
+    """사용자 기준 속도 제한 의존성 (역할별 한도는 토큰의 role 클레임으로 선택)
+
+    @router.post("", dependencies=[Depends(rate_limit_by_user("bets"))])
+    """
+    async def dependency(payload: Annotated[dict, Depends(get_token_payload)]) -> None:
+        limit = rate_limiter.limit_for(rule, payload.get("role"))
+        if not settings.RATE_LIMIT_ENABLED or limit is None:
+            return
+        await _enforce_rate_limit(rule, f"user:{payload['user_id']}", limit)
+
+    return dependency
+
+
 # 타입 별칭
 CurrentUserId = Annotated[UUID, Depends(get_current_user_id)]
+CurrentAdminId = Annotated[UUID, Depends(get_current_admin_id)]
 CurrentToken = Annotated[str, Depends(get_current_token)]
 CurrentUser = Annotated[UserResponse, Depends(get_current_user)]
 UserRepository = Annotated[UserRepositoryImpl, Depends(get_user_repository)]
@@ -239,7 +398,10 @@ UserUseCases = Annotated[UserUseCasesClass, Depends(get_user_use_cases)]
 WalletUseCases = Annotated[WalletUseCasesClass, Depends(get_wallet_use_cases)]
 LeagueUseCases = Annotated[LeagueUseCasesClass, Depends(get_league_use_cases)]
 GameUseCases = Annotated[GameUseCasesClass, Depends(get_game_use_cases)]
+FixtureImportUseCase = Annotated[FixtureImportUseCaseClass, Depends(get_fixture_import_use_case)]
 BettingOptionUseCases = Annotated[BettingOptionUseCasesClass, Depends(get_betting_option_use_cases)]
 BettingUseCases = Annotated[BettingUseCasesClass, Depends(get_betting_use_cases)]
+ExposureUseCases = Annotated[ExposureUseCasesClass, Depends(get_exposure_use_cases)]
+ReportUseCases = Annotated[ReportUseCasesClass, Depends(get_report_use_cases)]
 GameService = Annotated[GameService, Depends(get_game_service)]
 
@@ -1,5 +1,5 @@
 """인증 API 엔드포인트"""
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.application.user.dto import (
     RegisterUserDTO,
@@ -28,7 +28,7 @@ from src.presentation.schemas.auth import (
     MessageResponse,
 )
 from src.presentation.schemas.user import UserResponse
-from src.presentation.api.dependencies import UserRepository, CurrentUserId, CurrentToken
+from src.presentation.api.dependencies import UserRepository, CurrentUserId, CurrentToken, rate_limit_by_ip
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -37,6 +37,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
     "/register",
     response_model=UserResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit_by_ip("register"))],
     summary="회원가입",
     description="새로운 사용자 계정을 생성합니다"
 )
@@ -80,6 +81,7 @@ async def register(
 @router.post(
     "/login",
     response_model=LoginResponse,
+    dependencies=[Depends(rate_limit_by_ip("login"))],
     summary="로그인",
     description="사용자 인증 후 토큰을 발급받습니다"
 )
@@ -120,18 +122,17 @@ async def login(
 @router.post(
     "/refresh",
     response_model=TokenResponse,
+    dependencies=[Depends(rate_limit_by_ip("refresh"))],
     summary="토큰 갱신",
     description="만료된 Access Token을 Refresh Token으로 갱신합니다"
 )
 async def refresh_token(
     request: RefreshTokenRequest,
-    user_id: CurrentUserId,
-    user_repository: UserRepository,
 ):
-    """토큰 갱신"""
+    """토큰 갱신 (Access Token 없이 Refresh Token만으로 갱신)"""
     try:
-        use_case = RefreshTokenUseCase(user_repository)
-        auth_token = await use_case.execute(user_id, request.refresh_token)
+        use_case = RefreshTokenUseCase()
+        auth_token = await use_case.execute(request.refresh_token)
 
         return TokenResponse(
             access_token=auth_token.access_token,
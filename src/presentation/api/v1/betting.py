@@ -1,21 +1,43 @@
 """BettingOption and Bet API 엔드포인트"""
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from src.application.betting.use_cases import BettingOptionUseCases, BettingUseCases
-from src.application.betting.dto import CreateBettingOptionDTO, UpdateBettingOptionDTO, PlaceBetRequestDTO
+from src.application.betting.dto import (
+    BetDTO,
+    BetSlipDTO,
+    BettingOptionDTO,
+    CreateBettingOptionDTO,
+    UpdateBettingOptionDTO,
+    PlaceBetRequestDTO,
+    BetSelectionDTO,
+    UserBetStatsDTO,
+)
 from src.presentation.schemas.betting import (
     BettingOptionResponse,
     CreateBettingOptionRequest,
     UpdateBettingOptionRequest,
     PlaceBetRequest,
     BetResponse,
+    BetSlipResponse,
+    UserBetStatsResponse,
 )
+from src.infrastructure.cache.catalog_versions import options_scope
 from src.presentation.api.dependencies import (
     get_betting_option_use_cases,
     get_betting_use_cases,
+    rate_limit_by_user,
+    CurrentAdminId,
     CurrentUserId,
 )
+from src.presentation.http_cache import catalog_cache
+from src.presentation.responses import ORJSONResponse, ensure_trusted, trusted_response
+
+# 조회 엔드포인트는 DTO를 그대로 직렬화
+ensure_trusted(BettingOptionDTO, BettingOptionResponse)
+ensure_trusted(BetDTO, BetResponse)
+ensure_trusted(BetSlipDTO, BetSlipResponse)
+ensure_trusted(UserBetStatsDTO, UserBetStatsResponse)
 
 # betting-options router
 options_router = APIRouter(prefix="/betting-options", tags=["betting-options"])
@@ -45,14 +67,18 @@ async def create_betting_option(
     "/game/{game_id}",
     response_model=List[BettingOptionResponse],
     summary="게임별 배팅 옵션 목록 조회",
-    description="특정 게임에 대한 모든 배팅 옵션을 조회합니다."
+    description="특정 게임에 대한 모든 배팅 옵션을 조회합니다. ETag/If-None-Match 조건부 요청을 지원합니다."
 )
 async def get_options_for_game(
     game_id: str,
+    request: Request,
     use_cases: BettingOptionUseCases = Depends(get_betting_option_use_cases)
-) -> List[BettingOptionResponse]:
+) -> ORJSONResponse:
+    cache = await catalog_cache(request, options_scope(game_id))
+    if cache.is_fresh(request):
+        return cache.not_modified()
     options = await use_cases.get_options_for_game(game_id)
-    return [BettingOptionResponse.model_validate(opt) for opt in options]
+    return trusted_response(options, headers=cache.headers())
 
 @options_router.get(
     "/{option_id}",
@@ -63,14 +89,14 @@ async def get_options_for_game(
 async def get_betting_option(
     option_id: str,
     use_cases: BettingOptionUseCases = Depends(get_betting_option_use_cases)
-) -> BettingOptionResponse:
+) -> ORJSONResponse:
     option_dto = await use_cases.get_option_by_id(option_id)
     if not option_dto:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"배팅 옵션을 찾을 수 없습니다: {option_id}"
         )
-    return BettingOptionResponse.model_validate(option_dto)
+    return trusted_response(option_dto)
 
 @options_router.patch(
     "/{option_id}",
@@ -117,6 +143,7 @@ bets_router = APIRouter(prefix="/bets", tags=["bets"])
     "",
     response_model=BetResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit_by_user("bets"))],
     summary="배팅하기",
     description="선택한 옵션으로 배팅을 합니다."
 )
@@ -126,7 +153,11 @@ async def place_bet(
     use_cases: BettingUseCases = Depends(get_betting_use_cases)
 ) -> BetResponse:
     try:
-        request_dto = PlaceBetRequestDTO(**request.model_dump())
+        request_dto = PlaceBetRequestDTO(
+            selections=[BetSelectionDTO(option_id=selection.option_id) for selection in request.selections],
+            amount=request.amount,
+            bet_type=request.bet_type,
+        )
         bet_dto = await use_cases.place_bet(str(user_id), request_dto)
         return BetResponse.model_validate(bet_dto)
     except Exception as e:
@@ -139,11 +170,38 @@ async def place_bet(
     "/my-bets",
     response_model=List[BetResponse],
     summary="내 배팅 내역 조회",
-    description="현재 로그인한 사용자의 모든 배팅 내역을 조회합니다."
+    description="현재 로그인한 사용자의 배팅 내역을 조회합니다. BET_HISTORY_MONTHS를 두면 이번 달과 이전 N개월 배팅과 대기 중인 배팅만 조회합니다."
 )
 async def get_my_bets(
     user_id: CurrentUserId,
     use_cases: BettingUseCases = Depends(get_betting_use_cases)
-) -> List[BetResponse]:
+) -> ORJSONResponse:
     bets = await use_cases.get_my_bets(str(user_id))
-    return [BetResponse.model_validate(bet) for bet in bets]
+    return trusted_response(bets)
+
+@bets_router.get(
+    "/my-stats",
+    response_model=UserBetStatsResponse,
+    summary="내 배팅 통계 조회",
+    description="적중률, 배팅 금액/지급액 합계, ROI, 연속 기록을 조회합니다."
+)
+async def get_my_bet_stats(
+    user_id: CurrentUserId,
+    use_cases: BettingUseCases = Depends(get_betting_use_cases)
+) -> ORJSONResponse:
+    stats = await use_cases.get_bet_stats(str(user_id))
+    return trusted_response(stats)
+
+@bets_router.get(
+    "/users/{user_id}/stats",
+    response_model=UserBetStatsResponse,
+    summary="사용자 배팅 통계 조회 (관리자)",
+    description="사용자의 적중률, 배팅 금액/지급액 합계, ROI, 연속 기록을 조회합니다."
+)
+async def get_user_bet_stats(
+    user_id: str,
+    admin_id: CurrentAdminId,
+    use_cases: BettingUseCases = Depends(get_betting_use_cases)
+) -> ORJSONResponse:
+    stats = await use_cases.get_bet_stats(user_id)
+    return trusted_response(stats)
@@ -0,0 +1,58 @@
+"""Exposure API 엔드포인트 (관리자)"""
+from fastapi import APIRouter, Depends
+
+from src.application.betting.use_cases import ExposureUseCases
+from src.presentation.schemas.exposure import (
+    GameExposureResponse,
+    LeagueExposureResponse,
+    ExposureReconcileResponse,
+)
+from src.presentation.api.dependencies import get_exposure_use_cases, CurrentAdminId
+
+router = APIRouter(prefix="/exposure", tags=["exposure"])
+
+
+@router.get(
+    "/games/{game_id}",
+    response_model=GameExposureResponse,
+    summary="게임 노출 조회",
+    description="게임의 옵션별 배팅 금액과 예상 지급액(옵션이 적중했을 때 지급할 금액)을 조회합니다."
+)
+async def get_game_exposure(
+    game_id: str,
+    admin_id: CurrentAdminId,
+    use_cases: ExposureUseCases = Depends(get_exposure_use_cases)
+) -> GameExposureResponse:
+    """게임 노출 조회"""
+    exposure_dto = await use_cases.get_game_exposure(game_id)
+    return GameExposureResponse.model_validate(exposure_dto)
+
+
+@router.get(
+    "/leagues/{league_id}",
+    response_model=LeagueExposureResponse,
+    summary="리그 노출 조회",
+    description="리그의 게임별 노출과 합계를 조회합니다 (노출이 있는 게임만)."
+)
+async def get_league_exposure(
+    league_id: str,
+    admin_id: CurrentAdminId,
+    use_cases: ExposureUseCases = Depends(get_exposure_use_cases)
+) -> LeagueExposureResponse:
+    """리그 노출 조회"""
+    exposure_dto = await use_cases.get_league_exposure(league_id)
+    return LeagueExposureResponse.model_validate(exposure_dto)
+
+
+@router.post(
+    "/reconcile",
+    response_model=ExposureReconcileResponse,
+    summary="노출 대조",
+    description="대기 배팅으로 노출을 다시 계산해 집계를 교체합니다 (주기 대조를 기다리지 않을 때)."
+)
+async def reconcile_exposure(
+    admin_id: CurrentAdminId,
+    use_cases: ExposureUseCases = Depends(get_exposure_use_cases)
+) -> ExposureReconcileResponse:
+    """노출 대조"""
+    return ExposureReconcileResponse(games=await use_cases.reconcile())
@@ -1,9 +1,10 @@
 """Game API 엔드포인트"""
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
 
-from src.application.game.use_cases import GameUseCases
-from src.application.game.dto import CreateGameDTO, UpdateGameDTO, SetFinalScoreDTO
+from src.application.game.fixture_import import detect_format
+from src.application.game.use_cases import GameUseCases, FixtureImportUseCase
+from src.application.game.dto import CreateGameDTO, GameDTO, UpdateGameDTO, SetFinalScoreDTO, SettleGameRequestDTO
 from src.presentation.schemas.game import (
     GameResponse,
     CreateGameRequest,
@@ -11,11 +12,19 @@ from src.presentation.schemas.game import (
     SetFinalScoreRequest,
     GameListResponse,
     SettleGameRequest,
+    ImportFixturesResponse,
 )
-from src.presentation.api.dependencies import get_game_use_cases
+from src.presentation.schemas.job import JobResponse
+from src.infrastructure.cache.catalog_versions import GAMES_SCOPE, game_scope
+from src.presentation.api.dependencies import get_game_use_cases, get_fixture_import_use_case, CurrentAdminId
+from src.presentation.http_cache import catalog_cache
+from src.presentation.responses import ORJSONResponse, ensure_trusted, trusted_response
 
 router = APIRouter(prefix="/games", tags=["games"])
 
+# 조회 엔드포인트는 GameDTO를 그대로 직렬화
+ensure_trusted(GameDTO, GameResponse)
+
 
 @router.post(
     "",
@@ -40,21 +49,64 @@ async def create_game(
         )
 
 
+@router.post(
+    "/import",
+    response_model=ImportFixturesResponse,
+    summary="게임/배팅 옵션 일괄 임포트",
+    description=(
+        "NDJSON(게임당 한 줄, 옵션 중첩) 또는 CSV(옵션당 한 줄) 파일로 게임과 배팅 옵션을 "
+        "external_id 기준으로 일괄 등록/수정합니다. 오류가 있는 게임은 제외하고 행별 오류를 반환합니다. (관리자 전용)"
+    ),
+)
+async def import_games(
+    admin_id: CurrentAdminId,
+    file: UploadFile = File(..., description="NDJSON 또는 CSV 파일 (UTF-8)"),
+    fmt: Optional[str] = Query(None, alias="format", description="파일 형식 (ndjson | csv, 생략 시 확장자로 판단)"),
+    dry_run: bool = Query(False, description="검증만 수행하고 저장하지 않음"),
+    use_case: FixtureImportUseCase = Depends(get_fixture_import_use_case),
+) -> ImportFixturesResponse:
+    """게임/배팅 옵션 일괄 임포트"""
+    fmt = fmt or detect_format(file.filename, file.content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="파일 형식을 알 수 없습니다. format 파라미터(ndjson | csv)를 지정하세요."
+        )
+    try:
+        text = (await file.read()).decode("utf-8-sig")
+        result_dto = await use_case.execute(text, fmt, dry_run=dry_run)
+        return ImportFixturesResponse.model_validate(result_dto)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="UTF-8 인코딩 파일만 지원합니다."
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.get(
     "",
     response_model=GameListResponse,
     summary="게임 목록 조회",
-    description="게임 목록을 조회합니다. 필터링 및 페이지네이션을 지원합니다."
+    description="게임 목록을 조회합니다. 필터링 및 페이지네이션을 지원합니다. ETag/If-None-Match 조건부 요청을 지원합니다."
 )
 async def get_games(
+    request: Request,
     league_id: Optional[str] = Query(None, description="리그 ID 필터"),
     status: Optional[str] = Query(None, description="경기 상태 필터"),
     is_live: Optional[bool] = Query(None, description="라이브 여부 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
     use_cases: GameUseCases = Depends(get_game_use_cases)
-) -> GameListResponse:
+) -> ORJSONResponse:
     """게임 목록 조회"""
+    cache = await catalog_cache(request, GAMES_SCOPE)
+    if cache.is_fresh(request):
+        return cache.not_modified()
     game_list_dto = await use_cases.get_games(
         league_id=league_id,
         status=status,
@@ -62,30 +114,39 @@ async def get_games(
         page=page,
         limit=limit
     )
-    return GameListResponse(
-        items=[GameResponse.model_validate(dto) for dto in game_list_dto.items],
-        pagination=game_list_dto
-    )
+    return trusted_response({
+        "items": game_list_dto.items,
+        "pagination": {
+            "total": game_list_dto.total,
+            "page": game_list_dto.page,
+            "size": game_list_dto.limit,
+            "total_pages": game_list_dto.total_pages,
+        },
+    }, headers=cache.headers())
 
 
 @router.get(
     "/{game_id}",
     response_model=GameResponse,
     summary="게임 상세 조회",
-    description="특정 게임의 상세 정보를 조회합니다."
+    description="특정 게임의 상세 정보를 조회합니다. ETag/If-None-Match 조건부 요청을 지원합니다."
 )
 async def get_game(
     game_id: str,
+    request: Request,
     use_cases: GameUseCases = Depends(get_game_use_cases)
-) -> GameResponse:
+) -> ORJSONResponse:
     """게임 상세 조회"""
+    cache = await catalog_cache(request, game_scope(game_id))
+    if cache.is_fresh(request):
+        return cache.not_modified()
     game_dto = await use_cases.get_game_by_id(game_id)
     if not game_dto:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"게임을 찾을 수 없습니다: {game_id}"
         )
-    return GameResponse.model_validate(game_dto)
+    return trusted_response(game_dto, headers=cache.headers())
 
 
 @router.patch(
@@ -115,7 +176,7 @@ async def update_game(
     "/{game_id}/score",
     response_model=GameResponse,
     summary="최종 스코어 설정",
-    description="경기의 최종 스코어를 설정하고 상태를 '종료'로 변경합니다."
+    description="경기의 최종 스코어를 설정하고 상태를 '종료'로 변경한 뒤 자동 정산 작업을 등록합니다."
 )
 async def set_final_score(
     game_id: str,
@@ -155,21 +216,30 @@ async def delete_game(
 
 @router.post(
     "/{game_id}/settle",
-    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="게임 정산",
-    description="게임 결과를 정산하고 배팅을 처리합니다."
+    description=(
+        "게임 정산 작업을 등록합니다. 정산은 작업 워커가 청크 단위로 실행하며 "
+        "진행 상황은 GET /jobs/{job_id}로 확인합니다. "
+        "winning_option_ids를 생략하면 최종 스코어로 배팅 옵션을 자동 판정합니다 "
+        "(취소된 경기는 모든 옵션 무효, 판정할 수 없는 옵션은 대기로 남음)."
+    )
 )
 async def settle_game(
     game_id: str,
-    request: SettleGameRequest,
+    response: Response,
+    request: Optional[SettleGameRequest] = None,
     use_cases: GameUseCases = Depends(get_game_use_cases)
-) -> None:
-    """게임 정산"""
+) -> JobResponse:
+    """게임 정산 작업 등록"""
     try:
-        request_dto = SettleGameRequestDTO(**request.model_dump())
-        await use_cases.settle_game(game_id, request_dto)
+        request_dto = SettleGameRequestDTO(**request.model_dump()) if request else SettleGameRequestDTO()
+        job_dto = await use_cases.settle_game(game_id, request_dto)
     except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+    response.headers["Location"] = f"/api/v1/jobs/{job_dto.job_id}"
+    return JobResponse.model_validate(job_dto)
@@ -0,0 +1,28 @@
+"""Job API 엔드포인트"""
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.application.job.use_cases import JobUseCases
+from src.presentation.schemas.job import JobResponse
+from src.presentation.api.dependencies import get_job_use_cases
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="작업 진행 상황 조회",
+    description="정산 등 백그라운드 작업의 상태와 진행률을 조회합니다."
+)
+async def get_job(
+    job_id: str,
+    use_cases: JobUseCases = Depends(get_job_use_cases)
+) -> JobResponse:
+    """작업 진행 상황 조회"""
+    job_dto = await use_cases.get_job(job_id)
+    if not job_dto:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"작업을 찾을 수 없습니다: {job_id}"
+        )
+    return JobResponse.model_validate(job_dto)
@@ -1,20 +1,25 @@
 """League API 엔드포인트"""
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
 from src.application.league.use_cases import LeagueUseCases
-from src.application.league.dto import CreateLeagueDTO, UpdateLeagueDTO
+from src.application.league.dto import CreateLeagueDTO, LeagueDTO, UpdateLeagueDTO
 from src.presentation.schemas.league import (
     LeagueResponse,
     CreateLeagueRequest,
     UpdateLeagueRequest,
     LeagueListResponse,
-    PaginationInfo
 )
+from src.infrastructure.cache.catalog_versions import LEAGUES_SCOPE
 from src.presentation.api.dependencies import get_league_use_cases
+from src.presentation.http_cache import catalog_cache
+from src.presentation.responses import ORJSONResponse, ensure_trusted, trusted_response
 
 router = APIRouter(prefix="/leagues", tags=["leagues"])
 
+# 조회 엔드포인트는 LeagueDTO를 그대로 직렬화
+ensure_trusted(LeagueDTO, LeagueResponse)
+
 
 @router.post(
     "",
@@ -48,16 +53,20 @@ async def create_league(
     "",
     response_model=LeagueListResponse,
     summary="리그 목록 조회",
-    description="리그 목록을 조회합니다. 필터링 및 페이지네이션을 지원합니다."
+    description="리그 목록을 조회합니다. 필터링 및 페이지네이션을 지원합니다. ETag/If-None-Match 조건부 요청을 지원합니다."
 )
 async def get_leagues(
+    request: Request,
     sport_type: Optional[str] = Query(None, description="스포츠 종류 필터"),
     is_active: Optional[bool] = Query(None, description="활성화 여부 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
     use_cases: LeagueUseCases = Depends(get_league_use_cases)
-) -> LeagueListResponse:
+) -> ORJSONResponse:
     """리그 목록 조회"""
+    cache = await catalog_cache(request, LEAGUES_SCOPE)
+    if cache.is_fresh(request):
+        return cache.not_modified()
     league_list_dto = await use_cases.get_leagues(
         sport_type=sport_type,
         is_active=is_active,
@@ -65,15 +74,15 @@ async def get_leagues(
         limit=limit
     )
 
-    return LeagueListResponse(
-        items=[LeagueResponse(**dto.__dict__) for dto in league_list_dto.items],
-        pagination=PaginationInfo(
-            page=league_list_dto.page,
-            limit=league_list_dto.limit,
-            total=league_list_dto.total,
-            total_pages=league_list_dto.total_pages
-        )
-    )
+    return trusted_response({
+        "items": league_list_dto.items,
+        "pagination": {
+            "page": league_list_dto.page,
+            "limit": league_list_dto.limit,
+            "total": league_list_dto.total,
+            "total_pages": league_list_dto.total_pages,
+        },
+    }, headers=cache.headers())
 
 
 @router.get(
@@ -0,0 +1,106 @@
+"""Report API 엔드포인트 (관리자)
+
+보고서는 집계 테이블(bet_rollups_hourly/daily)만 읽으므로 기간이 길어도 배팅 테이블을 스캔하지 않습니다.
+집계는 ROLLUP_INTERVAL_SECONDS 주기(또는 scripts/rollup_worker.py)로 갱신되며,
+응답의 generated_through 이후의 배팅/결과 확정은 아직 반영되지 않았습니다.
+"""
+import csv
+import io
+from datetime import date
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from src.application.report.dto import ReportQueryDTO, ReportRowDTO, TurnoverReportDTO
+from src.application.report.use_cases import ReportUseCases
+from src.domain.common.exceptions import ValidationException
+from src.presentation.schemas.report import ReportRowResponse, TurnoverReportResponse
+from src.presentation.api.dependencies import get_report_use_cases, CurrentAdminId
+from src.presentation.responses import ensure_trusted, trusted_response
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+ensure_trusted(ReportRowDTO, ReportRowResponse)
+ensure_trusted(TurnoverReportDTO, TurnoverReportResponse)
+
+CSV_COLUMNS = ("period_start", "group_key", "selections", "stake", "settled_stake", "payout", "ggr", "margin", "bettors")
+# 스트리밍 청크당 행 수
+CSV_CHUNK_ROWS = 500
+
+
+def _csv_line(values) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(values)
+    return buffer.getvalue()
+
+
+def _csv_row(row: ReportRowDTO) -> str:
+    return _csv_line([
+        row.period_start.isoformat(),
+        row.group_key or "",
+        row.selections,
+        row.stake,
+        row.settled_stake,
+        row.payout,
+        row.ggr,
+        "" if row.margin is None else row.margin,
+        "" if row.bettors is None else row.bettors,
+    ])
+
+
+async def _csv_chunks(rows: AsyncIterator[ReportRowDTO]) -> AsyncIterator[str]:
+    """CSV_CHUNK_ROWS행씩 묶어 내보냄 (행마다 보내면 응답 압축이 청크마다 flush해 압축률/CPU가 나빠짐)"""
+    lines = [_csv_line(CSV_COLUMNS)]
+    async for row in rows:
+        lines.append(_csv_row(row))
+        if len(lines) >= CSV_CHUNK_ROWS:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+@router.get(
+    "/turnover",
+    response_model=TurnoverReportResponse,
+    summary="배팅 보고서 조회",
+    description=(
+        "기간(UTC 날짜, 종료일 포함)의 시간/일 단위 배팅 금액, 지급액, GGR을 전체/스포츠/리그/게임별로 조회합니다. "
+        "format=csv면 행을 CSV로 스트리밍합니다 (X-Generated-Through 헤더에 집계 반영 시각)."
+    ),
+    responses={200: {"content": {"text/csv": {}}}},
+)
+async def get_turnover_report(
+    admin_id: CurrentAdminId,
+    start: date = Query(..., description="시작 날짜 (UTC)"),
+    end: date = Query(..., description="종료 날짜 (UTC, 포함)"),
+    granularity: str = Query("daily", description="집계 단위 (hourly | daily)"),
+    group_by: str = Query("all", description="묶음 기준 (all | sport | league | game)"),
+    fmt: str = Query("json", alias="format", description="응답 형식 (json | csv)"),
+    use_cases: ReportUseCases = Depends(get_report_use_cases),
+):
+    """배팅 보고서 조회"""
+    query = ReportQueryDTO(start=start, end=end, granularity=granularity, group_by=group_by)
+    try:
+        if fmt == "csv":
+            use_cases.validate(query)
+            generated_through = await use_cases.get_generated_through()
+            filename = f"turnover_{query.granularity}_{query.group_by}_{start:%Y%m%d}_{end:%Y%m%d}.csv"
+            headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+            if generated_through is not None:
+                headers["X-Generated-Through"] = generated_through.isoformat()
+            return StreamingResponse(
+                _csv_chunks(use_cases.iter_turnover_rows(query)),
+                media_type="text/csv",
+                headers=headers,
+            )
+        if fmt != "json":
+            raise ValidationException("format은 json 또는 csv만 지원합니다.")
+        report = await use_cases.get_turnover_report(query)
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return trusted_response(report)
@@ -2,17 +2,21 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from src.application.wallet.dto import WalletDepositRequestDto, WalletWithdrawRequestDto
+from src.application.wallet.dto import WalletBalanceDto, WalletDepositRequestDto, WalletWithdrawRequestDto
 from src.application.wallet.use_cases import WalletUseCases
 from src.domain.common.exceptions import EntityNotFoundException, DomainException
 from src.presentation.api.dependencies import get_current_user, get_wallet_use_cases
 from src.presentation.schemas.common import SuccessResponse
 from src.presentation.schemas.user import UserResponse
 from src.presentation.schemas.wallet import WalletBalanceResponse, WalletDepositRequest, WalletWithdrawRequest
+from src.presentation.responses import ensure_trusted, success_response
 
 
 router = APIRouter()
 
+# 잔액 DTO를 그대로 직렬화
+ensure_trusted(WalletBalanceDto, WalletBalanceResponse)
+
 
 @router.get(
     "/balance",
@@ -30,9 +34,7 @@ async def get_wallet_balance(
     """
     try:
         balance_dto = await wallet_use_cases.get_wallet_balance(current_user.user_id)
-        return SuccessResponse[WalletBalanceResponse](
-            data=WalletBalanceResponse(**balance_dto.model_dump())
-        )
+        return success_response(balance_dto)
     except EntityNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -57,9 +59,7 @@ async def deposit_to_wallet(
     deposit_dto = WalletDepositRequestDto(amount=request.amount, payment_method=request.payment_method)
     try:
         balance_dto = await wallet_use_cases.deposit_to_wallet(current_user.user_id, deposit_dto)
-        return SuccessResponse[WalletBalanceResponse](
-            data=WalletBalanceResponse(**balance_dto.model_dump())
-        )
+        return success_response(balance_dto)
     except EntityNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except DomainException as e:
@@ -86,9 +86,7 @@ async def withdraw_from_wallet(
     withdraw_dto = WalletWithdrawRequestDto(amount=request.amount, bank_account=request.bank_account)
     try:
         balance_dto = await wallet_use_cases.withdraw_from_wallet(current_user.user_id, withdraw_dto)
-        return SuccessResponse[WalletBalanceResponse](
-            data=WalletBalanceResponse(**balance_dto.model_dump())
-        )
+        return success_response(balance_dto)
     except EntityNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except DomainException as e:
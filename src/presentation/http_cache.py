@@ -0,0 +1,93 @@
+"""카탈로그 조회 응답의 HTTP 캐시 헤더
+
+    cache = await catalog_cache(request, GAMES_SCOPE)
+    if cache.is_fresh(request):
+        return cache.not_modified()       # DB 조회 없이 304
+    ...
+    return trusted_response(data, headers=cache.headers())
+
+- ETag: scope 스탬프 + 경로/쿼리 문자열의 해시 (W/ 약한 검증자, 압축 여부와 관계없이 같은 값)
+- Last-Modified: scope 스탬프 중 가장 최근 시각 (If-None-Match가 없을 때만 If-Modified-Since 비교)
+- Cache-Control: public, max-age=CATALOG_CACHE_MAX_AGE, stale-while-revalidate=...
+  (앞단 CDN/nginx가 짧게 캐시하고, 만료 후에는 이전 응답을 내주면서 조건부 GET으로 재검증)
+
+스탬프를 DB보다 먼저 읽어야 커밋 직후의 변경을 이전 스탬프로 내보내지 않습니다
+(src/infrastructure/cache/catalog_versions.py). Redis 오류 시에는 검증자 없이 응답합니다.
+"""
+import hashlib
+import logging
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, List, Optional
+
+from fastapi import Request, Response, status
+
+from src.config import settings
+from src.infrastructure.cache.catalog_versions import catalog_versions
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogCache:
+    """응답 검증자와 Cache-Control"""
+
+    def __init__(self, etag: Optional[str] = None, last_modified: Optional[int] = None):
+        self.etag = etag
+        # 마지막 변경 시각 (유닉스 초)
+        self.last_modified = last_modified
+
+    def is_fresh(self, request: Request) -> bool:
+        """클라이언트가 가진 응답이 최신인지 (If-None-Match 우선, 없으면 If-Modified-Since)"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if self.etag is None:
+                return False
+            candidates = {tag.strip() for tag in if_none_match.split(",")}
+            # 약한 비교 (W/ 접두사 무시)
+            return "*" in candidates or self._opaque(self.etag) in {self._opaque(tag) for tag in candidates}
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return self.last_modified <= since
+
+    def headers(self) -> Dict[str, str]:
+        headers = {
+            "Cache-Control": (
+                f"public, max-age={settings.CATALOG_CACHE_MAX_AGE}, "
+                f"stale-while-revalidate={settings.CATALOG_CACHE_STALE_WHILE_REVALIDATE}"
+            ),
+        }
+        if self.etag is not None:
+            headers["ETag"] = self.etag
+        if self.last_modified is not None:
+            headers["Last-Modified"] = formatdate(self.last_modified, usegmt=True)
+        return headers
+
+    def not_modified(self) -> Response:
+        """304 (본문 없이 검증자와 Cache-Control만)"""
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers())
+
+    @staticmethod
+    def _opaque(tag: str) -> str:
+        return tag[2:] if tag.startswith("W/") else tag
+
+
+async def catalog_cache(request: Request, *scopes: str) -> CatalogCache:
+    """scope 스탬프로 만든 검증자 (비활성화/Redis 오류 시 Cache-Control만)"""
+    if not settings.CATALOG_CACHE_ENABLED:
+        return CatalogCache()
+    try:
+        stamps: List[int] = await catalog_versions.get(scopes)
+    except Exception as e:
+        logger.warning("카탈로그 버전 스탬프 조회 실패, 검증자 없이 응답합니다: %s", e)
+        return CatalogCache()
+
+    query = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+    digest = hashlib.sha1(
+        f"{request.url.path}?{query}|{','.join(map(str, stamps))}".encode("utf-8")
+    ).hexdigest()[:20]
+    return CatalogCache(etag=f'W/"{digest}"', last_modified=max(stamps) // 1_000_000)
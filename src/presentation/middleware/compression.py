@@ -0,0 +1,262 @@
+"""응답 압축 미들웨어 (gzip, brotli)
+
+- Accept-Encoding 협상: br(brotli 패키지가 있을 때) > gzip, q=0은 제외
+- COMPRESSION_MIN_SIZE보다 작은 응답, 압축 효과가 없는 Content-Type, 이미 인코딩된 응답,
+  Cache-Control: no-transform 응답은 그대로 보냄
+- 라우트 템플릿별 레벨 (COMPRESSION_ROUTE_LEVELS): 큰 CSV 스트림은 낮은 레벨, 0이면 압축 안 함
+
+응답 본문을 버퍼링하지 않습니다. 본문이 한 번에 오면 통째로 압축해 Content-Length를 다시 계산하고,
+스트리밍 응답(more_body)은 청크마다 압축 후 flush(gzip Z_SYNC_FLUSH, brotli flush)해서 바로 내보냅니다.
+Starlette GZipMiddleware는 brotli와 라우트별 레벨이 없고 스트리밍 청크를 flush하지 않아 직접 구현합니다.
+
+약한 ETag(W/)는 인코딩이 달라도 같은 표현으로 보므로 그대로 두고, 강한 ETag는 약한 ETag로 바꿉니다.
+"""
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+from src.infrastructure.monitoring.metrics import HTTP_RESPONSE_COMPRESSION_BYTES
+from src.presentation.middleware.routing import get_route_template
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 협상
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+
+# 압축 효과가 있는 Content-Type (이미지/압축 파일 등은 제외)
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/xml",
+    "application/javascript",
+    "application/problem+json",
+    "application/openmetrics-text",
+)
+
+
+@dataclass(frozen=True)
+class CompressionLevel:
+    """인코딩별 압축 레벨"""
+    gzip: int
+    brotli: int
+
+
+def parse_route_levels(spec: str) -> Dict[str, Optional[CompressionLevel]]:
+    """COMPRESSION_ROUTE_LEVELS 설정 파싱
+
+    "/api/v1/reports/turnover=1/1,/metrics=0" → {"/api/v1/reports/turnover": CompressionLevel(1, 1), "/metrics": None}
+    (0이면 압축 안 함)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 범위를 벗어난 레벨
+    """
+    levels: Dict[str, Optional[CompressionLevel]] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        route, sep, value = item.rpartition("=")
+        route, value = route.strip(), value.strip()
+        if not sep or not route.startswith("/"):
+            raise ValueError(f"압축 레벨 규칙 형식이 잘못되었습니다: {item} (라우트=gzip레벨/brotli품질)")
+        if value == "0":
+            levels[route] = None
+            continue
+        gzip_level, sep, brotli_quality = value.partition("/")
+        try:
+            level = CompressionLevel(int(gzip_level), int(brotli_quality))
+        except ValueError:
+            raise ValueError(f"압축 레벨 규칙 형식이 잘못되었습니다: {item} (라우트=gzip레벨/brotli품질)") from None
+        if not sep or not 1 <= level.gzip <= 9 or not 0 <= level.brotli <= 11:
+            raise ValueError(f"압축 레벨이 범위를 벗어났습니다: {item} (gzip 1~9, brotli 0~11)")
+        levels[route] = level
+    return levels
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 인코딩 (q 값이 높은 것, 같으면 br 우선, 없으면 None)"""
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+
+    candidates = (BROTLI, GZIP) if brotli is not None else (GZIP,)
+    best, best_q = None, 0.0
+    for coding in candidates:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        # wbits 31: gzip 헤더/트레일러 포함
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """청크 압축 후 지금까지의 출력을 모두 내보냄 (스트림은 계속)"""
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+def create_encoder(encoding: str, level: CompressionLevel):
+    """인코딩별 압축기 (compress: 스트림 청크, finish: 마지막 청크)"""
+    if encoding == BROTLI:
+        return _BrotliEncoder(level.brotli)
+    return _GzipEncoder(level.gzip)
+
+
+class CompressionMiddleware:
+    """Accept-Encoding에 따라 응답 본문을 gzip/brotli로 압축
+
+    응답 시작 메시지는 첫 body 메시지가 올 때까지만 잡아 둡니다 (단일 본문인지 스트림인지 판단).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: Optional[int] = None,
+        default_level: Optional[CompressionLevel] = None,
+        route_levels: Optional[str] = None,
+    ):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        self.default_level = default_level or CompressionLevel(
+            settings.COMPRESSION_GZIP_LEVEL, settings.COMPRESSION_BROTLI_QUALITY
+        )
+        self.route_levels = parse_route_levels(
+            settings.COMPRESSION_ROUTE_LEVELS if route_levels is None else route_levels
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(self, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+    def level_for(self, route: str) -> Optional[CompressionLevel]:
+        """라우트 템플릿의 압축 레벨 (None이면 압축 안 함)"""
+        return self.route_levels.get(route, self.default_level)
+
+
+class _CompressionResponder:
+    """요청 하나의 응답 메시지 변환"""
+
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, send: Send, encoding: Optional[str]):
+        self.middleware = middleware
+        self.scope = scope
+        self._send = send
+        self.encoding = encoding
+        self.start_message: Optional[Message] = None
+        self.level: Optional[CompressionLevel] = None
+        self.encoder = None
+        self.route = ""
+        self.identity_bytes = 0
+        self.encoded_bytes = 0
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            if self._prepare(message):
+                # 첫 body에서 단일 본문/스트림을 구분할 때까지 보류
+                self.start_message = message
+                return
+            await self._send(message)
+            return
+
+        if message_type != "http.response.body" or (self.start_message is None and self.encoder is None):
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            if not more_body and len(body) < self.middleware.minimum_size:
+                await self._send(start)
+                await self._send(message)
+                return
+            self.encoder = create_encoder(self.encoding, self.level)
+            headers = MutableHeaders(scope=start)
+            headers["Content-Encoding"] = self.encoding
+            etag = headers.get("etag")
+            if etag is not None and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                del headers["Content-Length"]
+                chunk = self.encoder.compress(body)
+            else:
+                chunk = self.encoder.finish(body)
+                headers["Content-Length"] = str(len(chunk))
+            await self._send(start)
+        else:
+            chunk = self.encoder.compress(body) if more_body else self.encoder.finish(body)
+
+        self.identity_bytes += len(body)
+        self.encoded_bytes += len(chunk)
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+        if not more_body:
+            self._record()
+
+    def _prepare(self, message: Message) -> bool:
+        """압축 대상이면 True (압축 가능한 Content-Type이면 Vary: Accept-Encoding 추가)"""
+        headers = MutableHeaders(scope=message)
+        if message["status"] in (204, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return False
+        if "no-transform" in headers.get("cache-control", ""):
+            return False
+        headers.add_vary_header("Accept-Encoding")
+        if self.encoding is None:
+            return False
+
+        self.route = get_route_template(self.scope)
+        self.level = self.middleware.level_for(self.route)
+        if self.level is None:
+            return False
+        content_length = headers.get("content-length")
+        if content_length is not None and content_length.isdigit():
+            return int(content_length) >= self.middleware.minimum_size
+        return True
+
+    def _record(self) -> None:
+        HTTP_RESPONSE_COMPRESSION_BYTES.labels(self.route, self.encoding, "identity").inc(self.identity_bytes)
+        HTTP_RESPONSE_COMPRESSION_BYTES.labels(self.route, self.encoding, "encoded").inc(self.encoded_bytes)
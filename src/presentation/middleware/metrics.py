@@ -0,0 +1,59 @@
+"""HTTP 요청 Prometheus 메트릭 미들웨어"""
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.monitoring.collectors import PoolStats
+from src.infrastructure.monitoring.metrics import (
+    HTTP_REQUESTS_TOTAL,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_RESPONSE_SIZE,
+)
+from src.presentation.middleware.routing import get_route_template
+
+
+class PrometheusMiddleware:
+    """라우트별 요청 수, 처리 시간, 처리 중 요청 수, 응답 크기 기록
+
+    응답 본문을 버퍼링하지 않도록 BaseHTTPMiddleware 대신 순수 ASGI로 구현하며,
+    응답 크기는 전송되는 body 청크 길이를 누적해 계산합니다.
+    pool_stats가 있으면 요청을 마칠 때마다 이 프로세스의 커넥션 풀 게이지를 갱신합니다.
+    """
+
+    def __init__(self, app: ASGIApp, pool_stats: Optional[PoolStats] = None):
+        self.app = app
+        self.pool_stats = pool_stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = get_route_template(scope)
+            HTTP_REQUESTS_TOTAL.labels(method, route, str(status_code)).inc()
+            HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed)
+            HTTP_RESPONSE_SIZE.labels(method, route).observe(response_size)
+            if self.pool_stats is not None:
+                self.pool_stats.update()
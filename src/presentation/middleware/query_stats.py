@@ -0,0 +1,61 @@
+"""요청 단위 DB 왕복 계측 미들웨어"""
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+from src.infrastructure.database.instrumentation import start_query_stats, stop_query_stats
+from src.infrastructure.monitoring.metrics import DB_STATEMENTS_PER_REQUEST, DB_TIME_PER_REQUEST
+from src.presentation.middleware.routing import get_route_template
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """요청마다 SQL 문 수, 총 DB 시간, 가장 느린 문을 기록
+
+    - 응답 헤더: Server-Timing (응답 시작 시점까지의 통계)
+    - Prometheus: 라우트별 SQL 문 수 / DB 시간 히스토그램
+    - 쿼리 예산(DB_QUERY_BUDGET, DB_QUERY_TIME_BUDGET_MS) 초과 시 경고 로그
+
+    응답 본문을 버퍼링하지 않도록 BaseHTTPMiddleware 대신 순수 ASGI로 구현합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats()
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            stop_query_stats(token)
+            method = scope["method"]
+            route = get_route_template(scope)
+            DB_STATEMENTS_PER_REQUEST.labels(method, route).observe(stats.count)
+            DB_TIME_PER_REQUEST.labels(method, route).observe(stats.total_ms / 1000)
+            if stats.count > settings.DB_QUERY_BUDGET or stats.total_ms > settings.DB_QUERY_TIME_BUDGET_MS:
+                logger.warning(
+                    "DB 쿼리 예산 초과: %s %s statements=%d (budget=%d) db_time=%.1fms (budget=%.0fms) "
+                    "slowest=%.1fms %s",
+                    method,
+                    route,
+                    stats.count,
+                    settings.DB_QUERY_BUDGET,
+                    stats.total_ms,
+                    settings.DB_QUERY_TIME_BUDGET_MS,
+                    stats.slowest_ms,
+                    stats.slowest_statement,
+                )
@@ -0,0 +1,32 @@
+"""라우트 템플릿 조회 (메트릭 라벨용)"""
+from typing import Dict
+
+from starlette.types import Scope
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+# app id → {endpoint: path_format}
+_route_templates: Dict[int, Dict[object, str]] = {}
+
+
+def get_route_template(scope: Scope) -> str:
+    """요청이 매칭된 라우트의 경로 템플릿 (예: /api/v1/games/{game_id})
+
+    Starlette 0.27은 scope에 route를 넣지 않으므로, 라우팅 후 scope에 채워진
+    endpoint로 앱의 라우트 테이블에서 경로 템플릿을 찾습니다.
+    실제 경로를 라벨로 쓰면 ID마다 시계열이 생기므로 매칭 실패 시 고정값을 반환합니다.
+    """
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is None or app is None:
+        return UNMATCHED_ROUTE
+
+    templates = _route_templates.get(id(app))
+    if templates is None:
+        templates = {}
+        for route in getattr(app, "routes", []):
+            route_endpoint = getattr(route, "endpoint", None)
+            if route_endpoint is not None:
+                templates.setdefault(route_endpoint, getattr(route, "path_format", UNMATCHED_ROUTE))
+        _route_templates[id(app)] = templates
+    return templates.get(endpoint, UNMATCHED_ROUTE)
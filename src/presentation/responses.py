@@ -0,0 +1,84 @@
+"""orjson 응답
+
+- ORJSONResponse: 앱 기본 응답 클래스 (main.py의 default_response_class)
+- trusted_response(): 서비스 계층이 만든 DTO를 응답 스키마 검증 없이 바로 직렬화
+
+엔드포인트가 Response 객체를 반환하면 FastAPI는 response_model 검증/직렬화를 건너뛰므로,
+DTO → 응답 스키마 → response_model 재검증 → json.dumps로 이어지던 세 번의 변환이
+orjson 한 번으로 줄어듭니다. orjson은 dataclass, datetime, UUID, Enum을 직접 직렬화하고
+Decimal은 pydantic과 같이 문자열로 내보내므로 응답 JSON은 이전과 같습니다.
+
+검증을 건너뛰는 만큼 DTO 필드가 응답 스키마와 어긋나면 문서와 다른 응답이 나가므로,
+trusted_response를 쓰는 라우터는 모듈 로드 시 ensure_trusted()로 필드 목록을 맞춰 봅니다.
+response_model은 OpenAPI 문서용으로 데코레이터에 그대로 둡니다.
+"""
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from typing import Any, Mapping, Optional, Type
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def _default(obj: Any) -> Any:
+    """orjson이 직접 직렬화하지 못하는 타입"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """응답과 같은 규칙으로 JSON 직렬화"""
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def trusted_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> ORJSONResponse:
+    """내부에서 만든 DTO(dataclass/pydantic)나 dict를 response_model 검증 없이 응답"""
+    return ORJSONResponse(content, status_code=status_code, headers=headers)
+
+
+def success_response(data: Any, status_code: int = 200) -> ORJSONResponse:
+    """SuccessResponse 형태({message, status_code, data})의 trusted_response"""
+    return trusted_response(
+        {"message": "Success", "status_code": status_code, "data": data},
+        status_code=status_code,
+    )
+
+
+def _field_names(model: type) -> tuple:
+    if is_dataclass(model):
+        return tuple(field.name for field in fields(model))
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return tuple(model.model_fields)
+    raise TypeError(f"dataclass 또는 pydantic 모델이 아닙니다: {model!r}")
+
+
+def ensure_trusted(dto_type: type, response_model: Type[BaseModel]) -> None:
+    """DTO 필드가 응답 스키마 필드와 같은 순서로 일치하는지 확인
+
+    Raises:
+        TypeError: 필드가 다른 경우 (라우터 import 시점에 실패)
+    """
+    dto_fields = _field_names(dto_type)
+    schema_fields = _field_names(response_model)
+    if dto_fields != schema_fields:
+        raise TypeError(
+            f"{dto_type.__name__} 필드가 {response_model.__name__}와 다릅니다: "
+            f"{dto_fields} != {schema_fields}"
+        )
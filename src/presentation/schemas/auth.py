@@ -62,7 +62,7 @@ class TokenResponse(BaseModel):
         "json_schema_extra": {
             "examples": [{
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                "refresh_token": "550e8400-e29b-41d4-a716-446655440000",
+                "refresh_token": "9b1deb4d3b7d4bad9bdd2b0d7b3dcb6d.Qm9yZWRvbS1pcy1hLXNlY3JldC10b2tlbi0xMjM0NTY",
                 "token_type": "Bearer",
                 "expires_in": 900
             }]
@@ -82,7 +82,7 @@ class LoginResponse(BaseModel):
         "json_schema_extra": {
             "examples": [{
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                "refresh_token": "550e8400-e29b-41d4-a716-446655440000",
+                "refresh_token": "9b1deb4d3b7d4bad9bdd2b0d7b3dcb6d.Qm9yZWRvbS1pcy1hLXNlY3JldC10b2tlbi0xMjM0NTY",
                 "token_type": "Bearer",
                 "expires_in": 900,
                 "user": {
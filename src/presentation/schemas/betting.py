@@ -1,4 +1,5 @@
 """Betting API 스키마"""
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List
 from pydantic import BaseModel, Field
@@ -18,7 +19,7 @@ class BettingOptionResponse(BaseModel):
     over_under_line: Optional[Decimal] = None
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 
 class CreateBettingOptionRequest(BaseModel):
@@ -59,7 +60,7 @@ class BetSlipResponse(BaseModel):
     result: str
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 
 class BetResponse(BaseModel):
@@ -74,4 +75,26 @@ class BetResponse(BaseModel):
     slips: List[BetSlipResponse]
 
     class Config:
-        orm_mode = True
+        from_attributes = True
+
+
+class UserBetStatsResponse(BaseModel):
+    """사용자 배팅 통계 응답 스키마 (current_streak: 양수는 연속 적중, 음수는 연속 미적중)"""
+    user_id: str
+    bets_placed: int
+    bets_pending: int
+    bets_won: int
+    bets_lost: int
+    bets_cancelled: int
+    total_staked: Decimal
+    total_returned: Decimal
+    net_profit: Decimal
+    win_rate: Optional[Decimal]
+    roi: Optional[Decimal]
+    current_streak: int
+    longest_win_streak: int
+    longest_loss_streak: int
+    last_bet_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,45 @@
+"""Exposure API 스키마"""
+from decimal import Decimal
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class OptionExposureResponse(BaseModel):
+    """옵션 노출 응답 스키마"""
+    option_id: str
+    stake: Decimal = Field(..., description="옵션을 포함한 대기 배팅의 배팅 금액 합")
+    payout: Decimal = Field(..., description="옵션이 적중하면 지급할 예상 지급액 합 (조합 배팅은 전액)")
+    bets: int = Field(..., description="옵션을 포함한 대기 배팅 수")
+
+    class Config:
+        from_attributes = True
+
+
+class GameExposureResponse(BaseModel):
+    """게임 노출 응답 스키마"""
+    game_id: str
+    stake: Decimal
+    payout: Decimal
+    max_option_payout: Decimal = Field(..., description="가장 큰 옵션 예상 지급액")
+    bets: int
+    options: List[OptionExposureResponse] = Field(default_factory=list, description="예상 지급액이 큰 순")
+
+    class Config:
+        from_attributes = True
+
+
+class LeagueExposureResponse(BaseModel):
+    """리그 노출 응답 스키마"""
+    league_id: str
+    stake: Decimal
+    payout: Decimal
+    bets: int
+    games: List[GameExposureResponse] = Field(default_factory=list, description="최대 옵션 예상 지급액이 큰 순")
+
+    class Config:
+        from_attributes = True
+
+
+class ExposureReconcileResponse(BaseModel):
+    """노출 대조 응답 스키마"""
+    games: int = Field(..., description="노출이 있는 게임 수")
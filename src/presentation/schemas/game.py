@@ -24,7 +24,7 @@ class GameResponse(BaseModel):
     updated_at: datetime
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 
 class CreateGameRequest(BaseModel):
@@ -61,4 +61,32 @@ class GameListResponse(BaseModel):
 
 class SettleGameRequest(BaseModel):
     """게임 정산 요청 스키마"""
-    winning_option_ids: List[str] = Field(..., min_items=1, description="적중한 배팅 옵션 ID 목록")
+    winning_option_ids: Optional[List[str]] = Field(
+        None,
+        min_items=1,
+        description="적중한 배팅 옵션 ID 목록 (생략 시 최종 스코어로 자동 판정)",
+    )
+
+
+class ImportRowErrorResponse(BaseModel):
+    """임포트 행 오류 응답 스키마"""
+    row: int = Field(..., description="입력 파일의 행 번호 (CSV는 헤더 포함 기준)")
+    external_id: Optional[str] = Field(None, description="외부 경기 ID")
+    field: Optional[str] = Field(None, description="오류 필드")
+    message: str = Field(..., description="오류 내용")
+
+    class Config:
+        from_attributes = True
+
+
+class ImportFixturesResponse(BaseModel):
+    """게임 일괄 임포트 응답 스키마"""
+    total_games: int
+    imported_games: int
+    imported_options: int
+    failed_games: int
+    dry_run: bool
+    errors: List[ImportRowErrorResponse]
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,23 @@
+"""Job API 스키마"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class JobResponse(BaseModel):
+    """백그라운드 작업 응답 스키마"""
+    job_id: str
+    job_type: str = Field(..., description="작업 종류 (정산)")
+    status: str = Field(..., description="작업 상태 (대기, 실행중, 하위작업대기, 완료, 실패)")
+    total: int = Field(..., description="처리할 항목 수 (정산: 대상 슬립 수, 판정 전에는 0)")
+    processed: int = Field(..., description="처리한 항목 수")
+    progress: float = Field(..., ge=0, le=1, description="진행률 (0~1)")
+    attempts: int = Field(..., description="실행 시도 횟수")
+    result: Dict[str, Any] = Field(default_factory=dict, description="작업 결과 (정산: settled_bets 등)")
+    error: Optional[str] = Field(None, description="마지막 실패 사유")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
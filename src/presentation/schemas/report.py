@@ -0,0 +1,36 @@
+"""Report API 스키마"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class ReportRowResponse(BaseModel):
+    """보고서 행 응답 스키마"""
+    period_start: datetime = Field(..., description="기간 시작 (UTC, 일 단위는 0시)")
+    group_key: Optional[str] = Field(None, description="스포츠 종류/리그 ID/게임 ID (전체는 null)")
+    selections: int = Field(..., description="슬립 수 (조합 배팅은 게임마다 하나)")
+    stake: Decimal = Field(..., description="배팅 금액 (조합 배팅은 슬립 수로 나눠 배분)")
+    settled_stake: Decimal = Field(..., description="결과가 확정된 배팅 금액")
+    payout: Decimal = Field(..., description="지급액 (취소는 원금 환급)")
+    ggr: Decimal = Field(..., description="결과가 확정된 배팅 금액 - 지급액")
+    margin: Optional[Decimal] = Field(None, description="GGR / 결과가 확정된 배팅 금액")
+    bettors: Optional[int] = Field(None, description="활성 배팅 사용자 수 (일 단위만)")
+
+    class Config:
+        from_attributes = True
+
+
+class TurnoverReportResponse(BaseModel):
+    """배팅 보고서 응답 스키마"""
+    granularity: str
+    group_by: str
+    start: date
+    end: date
+    generated_through: Optional[datetime] = Field(
+        None, description="이 시각 이전의 배팅/결과 확정이 반영됨 (집계 주기만큼 늦음)"
+    )
+    rows: List[ReportRowResponse] = Field(default_factory=list, description="기간, 묶음 키 순")
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,189 @@
+"""운영 서버 진입점 (gunicorn + uvicorn 워커)
+
+    python -m src.server
+    python -m src.server --workers 4 --port 8080
+
+- 워커 수: SERVER_WORKERS (0이면 사용 가능한 CPU 수, SERVER_MAX_WORKERS 상한)
+- 이벤트 루프/HTTP 파서: uvloop, httptools
+- 앞단 프록시: SERVER_FORWARDED_ALLOW_IPS에서 온 요청은 X-Forwarded-For/Proto로 클라이언트 주소/스킴을 바꿈
+- SERVER_PRELOAD_APP: 마스터에서 src.main을 import 한 뒤 fork 해 코드/상수를 워커끼리 공유
+  (DB 커넥션 풀은 fork 직후 워커마다 새로 만들고, lifespan은 워커마다 실행)
+- SIGTERM: 새 연결을 받지 않고 처리 중 요청을 SERVER_GRACEFUL_TIMEOUT 안에 마친 뒤 lifespan 종료
+- SERVER_MAX_REQUESTS(+ JITTER): 요청 수가 차면 워커를 재시작해 메모리 누적을 정리
+- Prometheus: 워커들이 PROMETHEUS_MULTIPROC_DIR의 파일로 메트릭 값을 공유하고 /metrics가 모두 합쳐 내보냄
+  (종료된 워커의 live 게이지는 child_exit에서 제거)
+- 내장 백그라운드 작업(작업 워커, 노출 대조, 보고서 집계)은 워커마다 중복 실행되므로, 워커가 여럿이면
+  BACKGROUND_TASKS_EMBEDDED를 지정해야 시작합니다. 이미지(Dockerfile)는 false로 두고 docker-compose가
+  아래 프로세스를 각각 따로 띄웁니다.
+
+    python -m scripts.job_worker        # 정산 등 작업 (여러 개 띄워도 SKIP LOCKED로 나눠 가짐)
+    python -m scripts.exposure_worker   # 노출 집계 주기 대조
+    python -m scripts.rollup_worker     # 보고서 집계 주기 갱신
+
+개발 중에는 `python -m src.main` (DEBUG면 --reload)을 사용합니다.
+"""
+import argparse
+import logging
+import math
+import os
+import sys
+import tempfile
+from typing import Any, Dict, Optional
+
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# uvicorn이 처리 중 요청을 기다리는 시간. 남은 시간에 lifespan 종료(작업 워커 정지, 풀 정리)를 마치도록
+# gunicorn graceful_timeout보다 짧게 둡니다.
+_LIFESPAN_SHUTDOWN_SECONDS = 5
+
+
+class ServerWorker(UvicornWorker):
+    """uvloop/httptools를 사용하는 uvicorn 워커"""
+
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "lifespan": "on",
+        # 신뢰할 프록시 주소는 gunicorn forwarded_allow_ips로 전달 (UvicornWorker가 uvicorn 설정으로 넘김)
+        "proxy_headers": True,
+        "timeout_graceful_shutdown": max(settings.SERVER_GRACEFUL_TIMEOUT - _LIFESPAN_SHUTDOWN_SECONDS, 1),
+    }
+
+
+def _cgroup_cpu_limit() -> Optional[float]:
+    """컨테이너 CPU 제한 (cgroup v2 cpu.max, 제한이 없으면 None)"""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+    except (OSError, ValueError):
+        return None
+    if quota == "max":
+        return None
+    return int(quota) / int(period)
+
+
+def available_cpus() -> int:
+    """이 프로세스가 사용할 수 있는 CPU 수"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, max(math.ceil(limit), 1))
+    return cpus
+
+
+def worker_count() -> int:
+    """SERVER_WORKERS, 0이면 CPU 수 (SERVER_MAX_WORKERS 상한)"""
+    if settings.SERVER_WORKERS > 0:
+        return settings.SERVER_WORKERS
+    return max(1, min(available_cpus(), settings.SERVER_MAX_WORKERS))
+
+
+def _post_fork(server: Any, worker: Any) -> None:
+    """마스터에서 만든 DB 풀을 워커에서 이어 쓰지 않도록 버림 (커넥션은 닫지 않음)"""
+    connection = sys.modules.get("src.infrastructure.database.connection")
+    if connection is not None:
+        connection.engine.sync_engine.dispose(close=False)
+
+
+def _child_exit(server: Any, worker: Any) -> None:
+    """종료된 워커의 live 게이지 값 제거 (마스터에서 실행)"""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def prepare_metrics_dir() -> str:
+    """Prometheus 멀티 프로세스 모드 디렉터리 준비
+
+    prometheus_client는 import 시점의 PROMETHEUS_MULTIPROC_DIR로 값 저장 방식을 정하므로
+    src.main을 import 하기 전에 호출합니다. 이전 실행의 값이 섞이지 않도록 디렉터리를 비웁니다.
+    """
+    if "prometheus_client" in sys.modules:
+        raise RuntimeError("prometheus_client를 import 하기 전에 메트릭 디렉터리를 설정해야 합니다")
+    directory = settings.PROMETHEUS_MULTIPROC_DIR or tempfile.mkdtemp(prefix="prometheus-")
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.endswith(".db"):
+            os.remove(os.path.join(directory, name))
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+    return directory
+
+
+def gunicorn_options(host: str, port: int, workers: int) -> Dict[str, Any]:
+    """Settings로 만든 gunicorn 설정"""
+    options: Dict[str, Any] = {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": "src.server.ServerWorker",
+        "preload_app": settings.SERVER_PRELOAD_APP,
+        "max_requests": settings.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+        "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT,
+        "timeout": settings.SERVER_TIMEOUT,
+        "keepalive": settings.SERVER_KEEPALIVE,
+        "forwarded_allow_ips": settings.SERVER_FORWARDED_ALLOW_IPS,
+        "post_fork": _post_fork,
+        "child_exit": _child_exit,
+        "accesslog": "-" if settings.DEBUG else None,
+        "errorlog": "-",
+    }
+    # 워커 heartbeat 파일을 디스크 대신 메모리에 (컨테이너에서 디스크 I/O로 워커가 멈추는 것 방지)
+    if os.path.isdir("/dev/shm"):
+        options["worker_tmp_dir"] = "/dev/shm"
+    return options
+
+
+class Server(BaseApplication):
+    """gunicorn 애플리케이션 (설정 파일/명령행 대신 Settings 사용)"""
+
+    def __init__(self, options: Dict[str, Any]):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Any:
+        # preload_app이면 마스터에서 한 번, 아니면 워커마다 fork 후 import
+        from src.main import app
+
+        return app
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="운영 API 서버 (gunicorn + uvicorn 워커)")
+    parser.add_argument("--host", default=settings.SERVER_HOST, help="바인드 주소 (기본: SERVER_HOST)")
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT, help="포트 (기본: SERVER_PORT)")
+    parser.add_argument("--workers", type=int, default=0, help="워커 수 (기본: SERVER_WORKERS, 0이면 CPU 수)")
+    args = parser.parse_args()
+
+    workers = args.workers or worker_count()
+    if settings.BACKGROUND_TASKS_EMBEDDED is None and workers > 1:
+        parser.error(
+            "워커가 여럿이면 BACKGROUND_TASKS_EMBEDDED를 지정하세요 "
+            "(false: scripts/job_worker.py, exposure_worker.py, rollup_worker.py를 따로 실행, true: 워커마다 실행)"
+        )
+    if settings.BACKGROUND_TASKS_EMBEDDED is False:
+        logger.warning(
+            "BACKGROUND_TASKS_EMBEDDED=false: API 서버는 정산 작업/노출 대조/보고서 집계를 실행하지 않습니다. "
+            "scripts.job_worker, scripts.exposure_worker, scripts.rollup_worker를 따로 실행하세요"
+        )
+    elif settings.BACKGROUND_TASKS_EMBEDDED and workers > 1:
+        logger.warning("BACKGROUND_TASKS_EMBEDDED=true: 워커 %d개가 노출 대조/보고서 집계를 각자 실행합니다", workers)
+
+    prepare_metrics_dir()
+    Server(gunicorn_options(args.host, args.port, workers)).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
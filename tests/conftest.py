@@ -0,0 +1,28 @@
+"""테스트 공통 설정
+
+MySQL/Redis 대신 벤치마크용 대체 환경(sqlite+aiosqlite, fakeredis, scripts/benchmarks/standins.py)을 사용합니다.
+src.config.settings가 import 시점의 환경 변수를 읽으므로 src를 import 하기 전에 환경을 설정합니다.
+"""
+import pytest
+
+from scripts.benchmarks.standins import configure_environment, install_fake_redis, upgrade_schema
+
+# 백그라운드 루프는 테스트가 직접 실행
+configure_environment(
+    BCRYPT_ROUNDS=4,
+    JOB_WORKER_EMBEDDED="false",
+    ROLLUP_INTERVAL_SECONDS="0",
+    EXPOSURE_RECONCILE_INTERVAL_SECONDS="0",
+    REVOCATION_SYNC_ENABLED="false",
+)
+upgrade_schema()
+
+
+@pytest.fixture(autouse=True)
+async def fake_redis():
+    """테스트마다 빈 fakeredis (테스트의 이벤트 루프에서 생성)"""
+    install_fake_redis()
+    from src.infrastructure.cache.redis_client import redis_client
+
+    yield redis_client.redis
+    await redis_client.redis.flushall()
@@ -0,0 +1,175 @@
+"""테스트 데이터 적재 (모델을 직접 저장, 테스트마다 새 ID를 사용하므로 DB를 공유해도 겹치지 않음)"""
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select
+
+from src.application.game.dto import FeedFixtureDTO
+from src.application.game.use_cases import FeedSyncUseCase
+from src.application.job.use_cases import JobUseCases
+from src.domain.game import enums as game_enums
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.models import (
+    BetModel,
+    BetSlipModel,
+    BetStatusEnum,
+    BetTypeEnum,
+    BettingOptionModel,
+    BettingOptionTypeEnum,
+    GameModel,
+    GameStatusEnum,
+    LeagueModel,
+    SportTypeEnum,
+    WalletModel,
+)
+from src.infrastructure.database.repositories.betting_repository import BettingOptionRepositoryImpl
+from src.infrastructure.database.repositories.game_repository import GameRepositoryImpl
+from src.infrastructure.database.repositories.job_repository import JobRepositoryImpl
+from src.infrastructure.jobs.worker import create_job_worker
+
+START = datetime(2026, 10, 20, 19, 30)  # create_game/feed_fixture 기본 시작 시각
+
+
+def new_id() -> str:
+    return str(uuid.uuid4())
+
+
+async def create_league() -> str:
+    league_id = new_id()
+    async with AsyncSessionLocal() as session:
+        session.add(LeagueModel(id=league_id, league_name="테스트 리그", sport_type=SportTypeEnum.SOCCER, country="KR"))
+        await session.commit()
+    return league_id
+
+
+async def create_game(
+    league_id: str,
+    status: GameStatusEnum = GameStatusEnum.LIVE,
+    external_id: Optional[str] = None,
+    start_time: Optional[datetime] = None,
+) -> str:
+    game_id = new_id()
+    start_time = start_time or START
+    async with AsyncSessionLocal() as session:
+        session.add(GameModel(
+            id=game_id,
+            league_id=league_id,
+            external_id=external_id,
+            sport_type=SportTypeEnum.SOCCER,
+            home_team="홈팀",
+            away_team="원정팀",
+            start_time=start_time,
+            betting_deadline=start_time - timedelta(minutes=10),
+            status=status,
+            is_live=status == GameStatusEnum.LIVE,
+        ))
+        await session.commit()
+    return game_id
+
+
+async def create_options(game_id: str, odds: Tuple[str, ...] = ("2.00", "3.00", "3.50")) -> List[str]:
+    """승무패 옵션 (홈팀 승, 무승부, 원정팀 승 순)"""
+    option_ids = []
+    async with AsyncSessionLocal() as session:
+        for name, value in zip(("홈팀 승", "무승부", "원정팀 승"), odds):
+            option_id = new_id()
+            session.add(BettingOptionModel(
+                id=option_id,
+                game_id=game_id,
+                option_type=BettingOptionTypeEnum.WIN_DRAW_LOSS,
+                option_name=name,
+                odds=Decimal(value),
+            ))
+            option_ids.append(option_id)
+        await session.commit()
+    return option_ids
+
+
+async def create_wallet(balance: Decimal = Decimal("0")) -> str:
+    """사용자 ID와 지갑 (사용자 행은 정산에 필요 없으므로 만들지 않음)"""
+    user_id = new_id()
+    async with AsyncSessionLocal() as session:
+        session.add(WalletModel(id=new_id(), user_id=user_id, balance=balance))
+        await session.commit()
+    return user_id
+
+
+async def create_bet(
+    user_id: str,
+    legs: List[Tuple[str, str, Decimal]],
+    amount: Decimal = Decimal("1000"),
+    bet_id: Optional[str] = None,
+    created_at: Optional[datetime] = None,
+    status: BetStatusEnum = BetStatusEnum.PENDING,
+) -> str:
+    """배팅 (legs: (게임 ID, 옵션 ID, 배당), 기본은 지금 접수한 대기 중인 배팅)"""
+    bet_id = bet_id or new_id()
+    created_at = created_at or datetime.utcnow()
+    total_odds = Decimal("1")
+    for _, _, odds in legs:
+        total_odds *= odds
+    async with AsyncSessionLocal() as session:
+        session.add(BetModel(
+            id=bet_id,
+            user_id=user_id,
+            bet_type=BetTypeEnum.SINGLE if len(legs) == 1 else BetTypeEnum.COMBO,
+            total_amount=amount,
+            potential_return=(amount * total_odds).quantize(Decimal("0.01")),
+            total_odds=total_odds,
+            status=status,
+            pending_legs=len(legs) if status == BetStatusEnum.PENDING else 0,
+            created_at=created_at,
+        ))
+        for game_id, option_id, odds in legs:
+            session.add(BetSlipModel(
+                id=new_id(), bet_id=bet_id, game_id=game_id, option_id=option_id, odds=odds, created_at=created_at,
+            ))
+        await session.commit()
+    return bet_id
+
+
+async def get_bet(bet_id: str) -> BetModel:
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(select(BetModel).where(BetModel.id == bet_id))).scalar_one()
+
+
+async def get_balance(user_id: str) -> Decimal:
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(select(WalletModel.balance).where(WalletModel.user_id == user_id))).scalar_one()
+
+
+def feed_fixture(external_id: str, status: game_enums.GameStatusEnum, home: int = None, away: int = None) -> FeedFixtureDTO:
+    """피드 경기 (create_game 기본값과 같은 팀/시작 시각)"""
+    return FeedFixtureDTO(
+        external_id=external_id,
+        home_team="홈팀",
+        away_team="원정팀",
+        start_time=START,
+        betting_deadline=START - timedelta(minutes=10),
+        sport_type=game_enums.SportTypeEnum.SOCCER,
+        status=status,
+        home_score=home,
+        away_score=away,
+    )
+
+
+async def sync_feed(league_id: str, fixtures) -> int:
+    """피드 반영 후 등록된 정산 작업 수"""
+    async with AsyncSessionLocal() as session:
+        use_case = FeedSyncUseCase(
+            GameRepositoryImpl(session),
+            BettingOptionRepositoryImpl(session),
+            JobUseCases(JobRepositoryImpl(session)),
+        )
+        result = await use_case.execute(league_id, fixtures, None)
+        await session.commit()
+    return result.settlement_jobs
+
+
+async def drain_jobs() -> None:
+    """실행 가능한 백그라운드 작업을 모두 처리 (내장 작업 워커는 테스트에서 끔)"""
+    worker = create_job_worker()
+    while await worker.run_once():
+        pass
@@ -0,0 +1,31 @@
+"""내 배팅 내역 조회 범위 (BET_HISTORY_MONTHS)"""
+from datetime import datetime
+from decimal import Decimal
+
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.models import BetStatusEnum
+from src.infrastructure.database.partitioning import history_start
+from src.infrastructure.database.repositories.betting_repository import BetRepositoryImpl
+from tests import factories
+
+NOW = datetime(2026, 10, 19, 12, 0)
+
+
+async def test_history_window_keeps_old_pending_bets():
+    league_id = await factories.create_league()
+    game_id = await factories.create_game(league_id)
+    home, _, _ = await factories.create_options(game_id)
+    user_id = await factories.create_wallet()
+    leg = [(game_id, home, Decimal("2.00"))]
+    recent = await factories.create_bet(user_id, leg, created_at=datetime(2026, 10, 1, 9, 0))
+    old_pending = await factories.create_bet(user_id, leg, created_at=datetime(2025, 12, 24, 9, 0))
+    await factories.create_bet(user_id, leg, created_at=datetime(2025, 12, 24, 9, 0), status=BetStatusEnum.LOSS)
+
+    async with AsyncSessionLocal() as session:
+        repository = BetRepositoryImpl(session)
+        windowed = await repository.find_by_user_id(user_id, since=history_start(6, NOW))
+        everything = await repository.find_by_user_id(user_id, since=history_start(0, NOW))
+
+    assert {bet.id for bet in windowed} == {recent, old_pending}
+    assert all(len(bet.slips) == 1 for bet in windowed)
+    assert len(everything) == 3
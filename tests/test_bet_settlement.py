@@ -0,0 +1,62 @@
+"""배팅 결과 확정 (Bet.settle_leg, 조합 배팅 부분 정산)"""
+from decimal import Decimal
+
+from src.domain.betting.entity import Bet
+from src.domain.game.enums import GameStatusEnum
+from src.infrastructure.database.models import BetSlipResultEnum, BetStatusEnum, BetTypeEnum
+from tests import factories
+from tests.factories import START, drain_jobs, feed_fixture, sync_feed
+
+
+def combo(legs: int) -> Bet:
+    return Bet(
+        user_id=factories.new_id(),
+        bet_type=BetTypeEnum.COMBO,
+        total_amount=Decimal("1000"),
+        potential_return=Decimal("1000"),
+        total_odds=Decimal("1"),
+        pending_legs=legs,
+    )
+
+
+def test_all_void_legs_cancel():
+    bet = combo(2)
+    assert bet.settle_leg(BetSlipResultEnum.VOID, Decimal("2.00")) is None
+    assert bet.settle_leg(BetSlipResultEnum.VOID, Decimal("3.00")) == Decimal("1000")
+    assert bet.status == BetStatusEnum.CANCELLED
+
+
+def test_winning_legs_at_even_odds_win():
+    bet = combo(2)
+    assert bet.settle_leg(BetSlipResultEnum.WIN, Decimal("1.00")) is None
+    assert bet.settle_leg(BetSlipResultEnum.WIN, Decimal("1.00")) == Decimal("1000.00")
+    assert bet.status == BetStatusEnum.WIN
+
+
+def test_void_and_even_odds_win_leg_win():
+    bet = combo(2)
+    assert bet.settle_leg(BetSlipResultEnum.VOID, Decimal("2.00")) is None
+    assert bet.settle_leg(BetSlipResultEnum.WIN, Decimal("1.00")) == Decimal("1000.00")
+    assert bet.status == BetStatusEnum.WIN
+
+
+async def test_even_odds_combo_settled_across_games_wins():
+    league_id = await factories.create_league()
+    user_id = await factories.create_wallet()
+    external_ids = [factories.new_id(), factories.new_id()]
+    legs = []
+    for external_id in external_ids:
+        game_id = await factories.create_game(league_id, external_id=external_id, start_time=START)
+        home, _, _ = await factories.create_options(game_id, odds=("1.00", "3.00", "3.50"))
+        legs.append((game_id, home, Decimal("1.00")))
+    bet_id = await factories.create_bet(user_id, legs)
+
+    # 게임마다 따로 정산해도 적중 슬립 수가 저장되어 마지막 게임에서 적중으로 확정
+    for external_id in external_ids:
+        assert await sync_feed(league_id, [feed_fixture(external_id, GameStatusEnum.FINISHED, 1, 0)]) == 1
+        await drain_jobs()
+
+    bet = await factories.get_bet(bet_id)
+    assert bet.status == BetStatusEnum.WIN
+    assert bet.won_legs == 2
+    assert await factories.get_balance(user_id) == Decimal("1000.00")
@@ -0,0 +1,57 @@
+"""사용자 배팅 통계 증분 갱신과 재계산(rebuild) 일치"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from src.domain.game.enums import GameStatusEnum
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.repositories.betting_repository import UserBetStatsRepositoryImpl
+from tests import factories
+from tests.factories import drain_jobs, feed_fixture, sync_feed
+
+# 게임별 최종 결과 (홈팀 승에 배팅, None이면 대기)
+OUTCOMES = [(2, 1), (0, 1), (1, 1), "CANCELLED", (3, 0), None]
+
+
+async def find_stats(user_id: str):
+    async with AsyncSessionLocal() as session:
+        return await UserBetStatsRepositoryImpl(session).find_by_user_id(user_id)
+
+
+async def test_incremental_stats_match_rebuild():
+    league_id = await factories.create_league()
+    user_id = await factories.create_wallet()
+    placed_at = datetime(2026, 10, 1, 9, 0)
+    games = []
+    for index, outcome in enumerate(OUTCOMES):
+        external_id = factories.new_id()
+        game_id = await factories.create_game(league_id, external_id=external_id, start_time=factories.START)
+        home, _, _ = await factories.create_options(game_id)
+        amount = Decimal(1000 * (index + 1))
+        created_at = placed_at + timedelta(hours=index)
+        await factories.create_bet(user_id, [(game_id, home, Decimal("2.00"))], amount, created_at=created_at)
+        # 배팅 접수(BettingService.place_bet)와 같은 증분 갱신
+        async with AsyncSessionLocal() as session:
+            await UserBetStatsRepositoryImpl(session).add_placed(user_id, amount, created_at)
+            await session.commit()
+        games.append((external_id, outcome))
+
+    # 배팅 순서대로 결과 확정 (연속 기록은 재계산에서 배팅 시각 순서)
+    for external_id, outcome in games:
+        if outcome is None:
+            continue
+        if outcome == "CANCELLED":
+            await sync_feed(league_id, [feed_fixture(external_id, GameStatusEnum.CANCELLED)])
+        else:
+            await sync_feed(league_id, [feed_fixture(external_id, GameStatusEnum.FINISHED, *outcome)])
+        await drain_jobs()
+
+    incremental = await find_stats(user_id)
+    assert (incremental.bets_placed, incremental.bets_won, incremental.bets_lost, incremental.bets_cancelled) == (6, 2, 2, 1)
+    assert incremental.bets_pending == 1
+    assert incremental.total_returned == Decimal("2000") + Decimal("10000") + Decimal("4000")  # 적중 2건 + 취소 환급
+    assert (incremental.current_streak, incremental.longest_win_streak, incremental.longest_loss_streak) == (1, 1, 2)
+
+    async with AsyncSessionLocal() as session:
+        assert await UserBetStatsRepositoryImpl(session).rebuild([user_id]) == 1
+        await session.commit()
+    assert await find_stats(user_id) == incremental
@@ -0,0 +1,125 @@
+"""응답 압축 미들웨어 (Accept-Encoding 협상, 스트리밍 청크 flush)"""
+import asyncio
+import gzip
+import zlib
+
+import brotli
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from src.presentation.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+BIG = {"rows": [{"id": index, "name": f"경기 {index}"} for index in range(200)]}
+CHUNKS = [f"line {index},{'x' * 200}\n".encode() for index in range(20)]
+
+
+async def big(request):
+    return JSONResponse(BIG, headers={"ETag": '"v1"'})
+
+
+async def raw(request):
+    return JSONResponse(BIG)
+
+
+async def small(request):
+    return JSONResponse({"ok": True})
+
+
+async def image(request):
+    return Response(b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+
+async def stream(request):
+    async def rows():
+        for chunk in CHUNKS:
+            yield chunk
+    return StreamingResponse(rows(), media_type="text/csv")
+
+
+def compressed_app(route_levels: str = "") -> CompressionMiddleware:
+    app = Starlette(routes=[
+        Route("/big", big), Route("/small", small), Route("/image", image), Route("/stream", stream),
+        Route("/raw", raw),
+    ])
+    return CompressionMiddleware(app, minimum_size=500, route_levels=route_levels)
+
+
+async def fetch(path: str, accept_encoding: str, route_levels: str = "") -> httpx.Response:
+    transport = httpx.ASGITransport(app=compressed_app(route_levels))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        request = client.build_request("GET", path, headers={"Accept-Encoding": accept_encoding})
+        response = await client.send(request, stream=True)
+        response.raw_body = b"".join([chunk async for chunk in response.aiter_raw()])
+        await response.aclose()
+        return response
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", "br"),
+    ("gzip", "gzip"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("br;q=0, gzip;q=0", None),
+    ("*", "br"),
+    ("identity", None),
+    ("", None),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+@pytest.mark.parametrize("encoding, decode", [("gzip", gzip.decompress), ("br", brotli.decompress)])
+async def test_large_json_is_compressed(encoding, decode):
+    response = await fetch("/big", encoding)
+
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(response.raw_body)
+    assert response.headers["etag"] == 'W/"v1"'
+    assert decode(response.raw_body) == JSONResponse(BIG).body
+
+
+@pytest.mark.parametrize("path, accept_encoding, route_levels", [
+    ("/small", "gzip", ""),  # COMPRESSION_MIN_SIZE 미만
+    ("/image", "gzip", ""),  # 압축 효과가 없는 Content-Type
+    ("/big", "identity", ""),
+    ("/raw", "gzip", "/raw=0"),  # 라우트별 압축 끔
+])
+async def test_uncompressed_responses(path, accept_encoding, route_levels):
+    response = await fetch(path, accept_encoding, route_levels)
+    assert "content-encoding" not in response.headers
+    assert int(response.headers["content-length"]) == len(response.raw_body)
+
+
+async def test_streaming_chunks_are_flushed_as_they_arrive():
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # 연결이 끊기지 않음 (StreamingResponse가 본문을 다 보내면 대기를 취소)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/stream", "raw_path": b"/stream", "root_path": "",
+        "scheme": "http", "query_string": b"", "headers": [(b"accept-encoding", b"gzip")],
+        "server": ("test", 80), "client": ("127.0.0.1", 1234), "http_version": "1.1",
+    }
+    await compressed_app()(scope, receive, send)
+
+    start = messages[0]
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip" and b"content-length" not in headers
+
+    # 각 청크가 앞 청크까지의 원문을 바로 풀 수 있을 만큼 flush 되어 있음
+    decoder = zlib.decompressobj(31)
+    decoded = [decoder.decompress(message["body"]) for message in messages[1:]]
+    assert decoded[:len(CHUNKS)] == CHUNKS
+    assert b"".join(decoded) == b"".join(CHUNKS)
+    assert messages[-1]["more_body"] is False
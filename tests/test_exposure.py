@@ -0,0 +1,131 @@
+"""노출 집계 대조 (접수 중 배팅과 대조가 겹칠 때)"""
+from decimal import Decimal
+
+from sqlalchemy import select, update
+
+from src.application.betting.dto import BetSelectionDTO, PlaceBetRequestDTO
+from src.application.betting.use_cases import ExposureUseCases
+from src.config import settings
+from src.domain.betting.exposure import ExposureLine
+from src.domain.betting.service import BettingService, ExposureService
+from src.domain.wallet.service import WalletService
+from src.infrastructure.cache.exposure_repository import ExposureRepositoryImpl
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.models import BetModel, BetSlipModel, BetStatusEnum, BetTypeEnum
+from src.infrastructure.database.repositories.betting_repository import (
+    BetRepositoryImpl,
+    BetSlipRepositoryImpl,
+    BettingOptionRepositoryImpl,
+)
+from src.infrastructure.database.repositories.game_repository import GameRepositoryImpl
+from src.infrastructure.database.repositories.wallet_repository import WalletRepositoryImpl
+from src.infrastructure.jobs.exposure import reconcile_exposure
+from tests import factories
+
+
+async def game_exposure(game_id: str):
+    return (await ExposureRepositoryImpl().find_by_game_ids([game_id]))[0]
+
+
+async def test_reconcile_keeps_reservation_committed_after_snapshot():
+    league_id = await factories.create_league()
+    game_id = await factories.create_game(league_id)
+    home, _, _ = await factories.create_options(game_id)
+    user_id = await factories.create_wallet()
+    await factories.create_bet(user_id, [(game_id, home, Decimal("2.00"))])
+    bet_id = factories.new_id()
+
+    # 배팅 접수: 노출을 더한 뒤 트랜잭션이 커밋되기 전에 대조가 DB를 읽음
+    repository = ExposureRepositoryImpl()
+    line = ExposureLine(game_id=game_id, option_id=home, stake=Decimal("1000"), payout=Decimal("2000.00"))
+    assert await repository.reserve(bet_id, [line]) is None
+    await reconcile_exposure()
+
+    exposure = await game_exposure(game_id)
+    assert exposure.bets == 2
+    assert exposure.payout == Decimal("4000.00")
+
+    # 커밋 후 대조해도 접수 중 기록과 DB 집계에 두 번 잡히지 않음
+    await factories.create_bet(user_id, [(game_id, home, Decimal("2.00"))], bet_id=bet_id)
+    await reconcile_exposure([game_id])
+
+    exposure = await game_exposure(game_id)
+    assert exposure.bets == 2
+    assert exposure.options[home].payout == Decimal("4000.00")
+
+
+async def test_reconcile_clears_expired_uncommitted_reservation(monkeypatch):
+    league_id = await factories.create_league()
+    game_id = await factories.create_game(league_id)
+    home, _, _ = await factories.create_options(game_id)
+
+    line = ExposureLine(game_id=game_id, option_id=home, stake=Decimal("1000"), payout=Decimal("2000.00"))
+    assert await ExposureRepositoryImpl().reserve(factories.new_id(), [line]) is None
+    await reconcile_exposure()
+    assert (await game_exposure(game_id)).bets == 1
+
+    # 커밋되지 않은 채 기록이 만료되면 다음 대조에서 정리
+    monkeypatch.setattr(settings, "EXPOSURE_RESERVATION_TTL_SECONDS", -1.0)
+    await reconcile_exposure()
+    assert (await game_exposure(game_id)).bets == 0
+
+
+async def place_bet(user_id: str, option_id: str) -> None:
+    async with AsyncSessionLocal() as session:
+        service = BettingService(
+            BetRepositoryImpl(session),
+            BetSlipRepositoryImpl(session),
+            BettingOptionRepositoryImpl(session),
+            WalletService(WalletRepositoryImpl(session)),
+            ExposureRepositoryImpl(),
+            game_repository=GameRepositoryImpl(session),
+        )
+        request = PlaceBetRequestDTO([BetSelectionDTO(option_id)], Decimal("1000"), BetTypeEnum.SINGLE)
+        await service.place_bet(user_id, request)
+        await session.commit()
+
+
+async def league_exposure(league_id: str):
+    async with AsyncSessionLocal() as session:
+        use_cases = ExposureUseCases(
+            ExposureRepositoryImpl(),
+            ExposureService(BetRepositoryImpl(session), BetSlipRepositoryImpl(session), ExposureRepositoryImpl()),
+        )
+        return await use_cases.get_league_exposure(league_id)
+
+
+async def test_league_exposure_lists_games_with_exposure():
+    league_id, other_league_id = await factories.create_league(), await factories.create_league()
+    game_id = await factories.create_game(league_id)
+    idle_game_id = await factories.create_game(league_id)
+    other_game_id = await factories.create_game(other_league_id)
+    home, _, _ = await factories.create_options(game_id)
+    other_home, _, _ = await factories.create_options(other_game_id)
+    user_id = await factories.create_wallet(Decimal("5000"))
+
+    # 접수 시 리그별 노출 게임 목록에 추가 (노출이 없는 게임, 다른 리그 게임은 제외)
+    await place_bet(user_id, home)
+    await place_bet(user_id, other_home)
+    exposure = await league_exposure(league_id)
+    assert [game.game_id for game in exposure.games] == [game_id]
+    assert exposure.payout == Decimal("2000.00")
+
+    # 노출 기록 없이 저장된 배팅의 게임은 대조에서 리그 목록에 추가
+    idle_home, _, _ = await factories.create_options(idle_game_id)
+    await factories.create_bet(user_id, [(idle_game_id, idle_home, Decimal("2.00"))])
+    await reconcile_exposure()
+    exposure = await league_exposure(league_id)
+    assert sorted(game.game_id for game in exposure.games) == sorted([game_id, idle_game_id])
+
+    # 노출이 없어진 게임(배팅 취소)은 대조에서 리그 목록에서 뺌
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(BetModel)
+            .where(BetModel.id.in_(select(BetSlipModel.bet_id).where(BetSlipModel.game_id == game_id)))
+            .values(status=BetStatusEnum.CANCELLED)
+        )
+        await session.commit()
+    await reconcile_exposure([game_id])
+    exposure = await league_exposure(league_id)
+    assert [game.game_id for game in exposure.games] == [idle_game_id]
+    assert await ExposureRepositoryImpl().redis.client.smembers(f"exposure:league:{league_id}") == {idle_game_id}
@@ -0,0 +1,57 @@
+"""피드 동기화 (FeedSyncUseCase)"""
+from decimal import Decimal
+
+from src.domain.game.enums import GameStatusEnum
+from src.infrastructure.database.models import BetStatusEnum
+from tests import factories
+from tests.factories import START, drain_jobs, feed_fixture, sync_feed
+
+async def test_feed_finished_game_is_settled():
+    league_id = await factories.create_league()
+    external_id = factories.new_id()
+    game_id = await factories.create_game(league_id, external_id=external_id, start_time=START)
+    home, draw, _ = await factories.create_options(game_id)
+    user_id = await factories.create_wallet()
+    winner = await factories.create_bet(user_id, [(game_id, home, Decimal("2.00"))])
+    loser = await factories.create_bet(user_id, [(game_id, draw, Decimal("3.00"))])
+
+    assert await sync_feed(league_id, [feed_fixture(external_id, GameStatusEnum.FINISHED, 2, 1)]) == 1
+    await drain_jobs()
+
+    assert (await factories.get_bet(winner)).status == BetStatusEnum.WIN
+    assert (await factories.get_bet(loser)).status == BetStatusEnum.LOSS
+    assert await factories.get_balance(user_id) == Decimal("2000.00")
+
+    # 이미 종료된 게임은 피드가 다시 보내도 정산 작업을 또 등록하지 않음
+    assert await sync_feed(league_id, [feed_fixture(external_id, GameStatusEnum.FINISHED, 2, 1)]) == 0
+
+
+async def test_feed_cancelled_game_refunds_bets():
+    league_id = await factories.create_league()
+    external_id = factories.new_id()
+    game_id = await factories.create_game(league_id, external_id=external_id, start_time=START)
+    home, _, _ = await factories.create_options(game_id)
+    user_id = await factories.create_wallet()
+    bet_id = await factories.create_bet(user_id, [(game_id, home, Decimal("2.00"))])
+
+    assert await sync_feed(league_id, [feed_fixture(external_id, GameStatusEnum.CANCELLED)]) == 1
+    await drain_jobs()
+
+    assert (await factories.get_bet(bet_id)).status == BetStatusEnum.CANCELLED
+    assert await factories.get_balance(user_id) == Decimal("1000.00")
+
+
+async def test_feed_finished_without_score_waits_for_score():
+    league_id = await factories.create_league()
+    external_id = factories.new_id()
+    game_id = await factories.create_game(league_id, external_id=external_id, start_time=START)
+    _, _, away = await factories.create_options(game_id)
+    user_id = await factories.create_wallet()
+    bet_id = await factories.create_bet(user_id, [(game_id, away, Decimal("3.50"))])
+
+    assert await sync_feed(league_id, [feed_fixture(external_id, GameStatusEnum.FINISHED)]) == 0
+    assert await sync_feed(league_id, [feed_fixture(external_id, GameStatusEnum.FINISHED, 0, 1)]) == 1
+    await drain_jobs()
+
+    assert (await factories.get_bet(bet_id)).status == BetStatusEnum.WIN
+    assert await factories.get_balance(user_id) == Decimal("3500.00")
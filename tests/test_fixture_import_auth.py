@@ -0,0 +1,36 @@
+"""게임/배팅 옵션 일괄 임포트 권한 (POST /games/import)"""
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.infrastructure.auth.jwt_handler import jwt_handler
+from src.main import app
+
+NDJSON = b'{"external_id": "auth-check"}\n'
+
+
+def bearer(role: str) -> dict:
+    token = jwt_handler.create_access_token(user_id=uuid4(), username="tester", role=role)
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def dry_run_import(headers: dict) -> int:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/games/import",
+            params={"dry_run": "true"},
+            files={"file": ("games.ndjson", NDJSON, "application/x-ndjson")},
+            headers=headers,
+        )
+    return response.status_code
+
+
+@pytest.mark.parametrize("headers", [{}, bearer("user")])
+async def test_import_requires_admin(headers):
+    assert await dry_run_import(headers) == 403
+
+
+async def test_admin_can_dry_run_import():
+    assert await dry_run_import(bearer("admin")) == 200
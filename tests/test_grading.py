@@ -0,0 +1,113 @@
+"""배팅 옵션 자동 판정 (grade_options)"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+import pytest
+
+from src.domain.betting.entity import BettingOption
+from src.domain.betting.enums import BettingOptionTypeEnum, OptionGradeEnum
+from src.domain.betting.grading import grade_options
+from src.domain.game.entity import Game
+from src.domain.game.enums import GameStatusEnum, SportTypeEnum
+
+WIN, LOSS, PUSH, VOID = OptionGradeEnum.WIN, OptionGradeEnum.LOSS, OptionGradeEnum.PUSH, OptionGradeEnum.VOID
+
+
+def game(home: Optional[int], away: Optional[int], status=GameStatusEnum.FINISHED, teams=("LG", "두산")) -> Game:
+    return Game(
+        league_id="league",
+        home_team=teams[0],
+        away_team=teams[1],
+        start_time=datetime(2026, 10, 20, 18, 30),
+        betting_deadline=datetime(2026, 10, 20, 18, 20),
+        sport_type=SportTypeEnum.BASEBALL,
+        status=status,
+        final_score_home=home,
+        final_score_away=away,
+    )
+
+
+def win_draw_loss(*names: str) -> List[BettingOption]:
+    return [
+        BettingOption(game_id="game", option_type=BettingOptionTypeEnum.WIN_DRAW_LOSS, option_name=name,
+                      odds=Decimal("2.00"), id=name)
+        for name in names
+    ]
+
+
+def handicap(name: str, value: str) -> BettingOption:
+    return BettingOption(game_id="game", option_type=BettingOptionTypeEnum.HANDICAP, option_name=name,
+                         odds=Decimal("1.90"), id=f"{name} {value}", handicap_value=Decimal(value))
+
+
+def over_under(name: str, line: str) -> BettingOption:
+    return BettingOption(game_id="game", option_type=BettingOptionTypeEnum.OVER_UNDER, option_name=name,
+                         odds=Decimal("1.90"), id=f"{name} {line}", over_under_line=Decimal(line))
+
+
+def grades(played: Game, options: List[BettingOption]) -> Dict[str, OptionGradeEnum]:
+    return grade_options(played, options).grades
+
+
+@pytest.mark.parametrize("names", [
+    ("홈팀 승", "무승부", "원정팀 승"),
+    ("LG", "무승부", "두산"),
+    ("홈 승리", "무승부", "원정 승리"),
+])
+def test_three_way_draw_loses_team_options(names):
+    home, draw, away = names
+    assert grades(game(3, 3), win_draw_loss(*names)) == {home: LOSS, draw: WIN, away: LOSS}
+    assert grades(game(4, 3), win_draw_loss(*names)) == {home: WIN, draw: LOSS, away: LOSS}
+    assert grades(game(2, 3), win_draw_loss(*names)) == {home: LOSS, draw: LOSS, away: WIN}
+
+
+@pytest.mark.parametrize("names", [("홈팀", "원정팀"), ("홈팀 승", "원정팀 승"), ("LG", "두산")])
+def test_two_way_draw_pushes(names):
+    home, away = names
+    assert grades(game(3, 3), win_draw_loss(*names)) == {home: PUSH, away: PUSH}
+    assert grades(game(1, 3), win_draw_loss(*names)) == {home: LOSS, away: WIN}
+
+
+def test_team_name_prefix_matches_longest_team():
+    played = game(2, 1, teams=("KT", "KT 위즈 2군"))
+    assert grades(played, win_draw_loss("KT 위즈 2군", "KT")) == {"KT 위즈 2군": LOSS, "KT": WIN}
+
+
+def test_handicap():
+    options = [handicap("홈팀", "-1.5"), handicap("원정팀", "+1.5"), handicap("홈팀", "-1"), handicap("원정팀", "-2")]
+    assert grades(game(3, 2), options) == {"홈팀 -1.5": LOSS, "원정팀 +1.5": WIN, "홈팀 -1": PUSH, "원정팀 -2": LOSS}
+    assert grades(game(5, 2), options)["홈팀 -1.5"] == WIN
+
+
+def test_over_under():
+    options = [over_under("오버", "4.5"), over_under("언더", "4.5"), over_under("Over", "5"), over_under("Under", "5")]
+    assert grades(game(3, 2), options) == {"오버 4.5": WIN, "언더 4.5": LOSS, "Over 5": PUSH, "Under 5": PUSH}
+    assert grades(game(1, 2), options) == {"오버 4.5": LOSS, "언더 4.5": WIN, "Over 5": LOSS, "Under 5": WIN}
+
+
+def test_quarter_lines_and_unknown_options_are_ungraded():
+    options = [handicap("홈팀", "-0.25"), over_under("오버", "2.75"), over_under("합계", "2.5"), handicap("무승부", "0.5")]
+    result = grade_options(game(2, 1), options)
+    assert result.grades == {}
+    assert sorted(result.ungraded) == sorted(option.id for option in options)
+
+
+def test_winner_prediction_is_ungraded():
+    option = BettingOption(game_id="game", option_type=BettingOptionTypeEnum.WINNER_PREDICTION,
+                           option_name="LG 우승", odds=Decimal("5.00"), id="winner")
+    assert grade_options(game(2, 1), [option]).ungraded == ["winner"]
+
+
+def test_cancelled_game_voids_every_option():
+    options = win_draw_loss("홈팀 승", "무승부", "원정팀 승") + [handicap("홈팀", "-0.25")]
+    assert set(grades(game(None, None, GameStatusEnum.CANCELLED), options).values()) == {VOID}
+
+
+@pytest.mark.parametrize("status, home, away", [
+    (GameStatusEnum.LIVE, 1, 0),
+    (GameStatusEnum.FINISHED, None, None),
+])
+def test_unfinished_game_is_rejected(status, home, away):
+    with pytest.raises(ValueError):
+        grade_options(game(home, away, status), win_draw_loss("홈팀", "원정팀"))
@@ -0,0 +1,72 @@
+"""카탈로그 조회 조건부 GET (ETag/If-None-Match, Last-Modified/If-Modified-Since)"""
+from email.utils import formatdate, parsedate_to_datetime
+
+import httpx
+import pytest
+
+from src.main import app
+from tests import factories
+
+
+@pytest.fixture
+async def client():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def game_url():
+    league_id = await factories.create_league()
+    return f"/api/v1/games/{await factories.create_game(league_id)}"
+
+
+async def test_matching_etag_returns_304_without_body(client, game_url):
+    first = await client.get(game_url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"].startswith("public, max-age=")
+
+    cached = await client.get(game_url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    # 약한 비교 (W/ 유무 무관), 여러 검증자 중 하나만 맞아도 304
+    strong = etag[2:]
+    assert (await client.get(game_url, headers={"If-None-Match": f'"other", {strong}'})).status_code == 304
+    assert (await client.get(game_url, headers={"If-None-Match": '"other"'})).status_code == 200
+
+
+async def test_change_invalidates_validators(client, game_url):
+    first = await client.get(game_url)
+    etag = first.headers["etag"]
+
+    updated = await client.patch(game_url, json={"home_team": "새 홈팀"})
+    assert updated.status_code == 200
+
+    after = await client.get(game_url, headers={"If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.headers["etag"] != etag
+    assert after.json()["home_team"] == "새 홈팀"
+
+
+async def test_if_modified_since(client, game_url):
+    first = await client.get(game_url)
+    last_modified = first.headers["last-modified"]
+    earlier = formatdate(parsedate_to_datetime(last_modified).timestamp() - 60, usegmt=True)
+
+    assert (await client.get(game_url, headers={"If-Modified-Since": last_modified})).status_code == 304
+    assert (await client.get(game_url, headers={"If-Modified-Since": earlier})).status_code == 200
+    # If-None-Match가 있으면 If-Modified-Since는 보지 않음
+    response = await client.get(game_url, headers={"If-None-Match": '"other"', "If-Modified-Since": last_modified})
+    assert response.status_code == 200
+
+
+async def test_etag_ignores_query_parameter_order(client):
+    first = await client.get("/api/v1/games", params=[("page", "1"), ("limit", "5")])
+    second = await client.get("/api/v1/games", params=[("limit", "5"), ("page", "1")])
+    other = await client.get("/api/v1/games", params=[("limit", "6"), ("page", "1")])
+
+    assert first.headers["etag"] == second.headers["etag"] != other.headers["etag"]
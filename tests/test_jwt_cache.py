@@ -0,0 +1,93 @@
+"""Access Token 검증 캐시와 jti 블랙리스트"""
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.infrastructure.auth import jwt_handler as jwt_module
+from src.infrastructure.auth.jwt_handler import DecodedTokenCache, jwt_handler
+from src.infrastructure.auth.token_repository import token_repository
+from src.presentation.api.dependencies import get_token_payload
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """서명 검증(_decode) 호출 횟수 (캐시는 테스트마다 비움)"""
+    jwt_handler.cache.clear()
+    calls = []
+    original = jwt_handler._decode
+
+    def counting(token):
+        calls.append(token)
+        return original(token)
+
+    monkeypatch.setattr(jwt_handler, "_decode", counting)
+    yield calls
+    jwt_handler.cache.clear()
+
+
+def access_token(**kwargs) -> str:
+    return jwt_handler.create_access_token(user_id=uuid4(), username="tester", role="user", **kwargs)
+
+
+def credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_verified_token_is_served_from_cache(decodes):
+    token = access_token()
+    first = jwt_handler.decode_token(token)
+    assert jwt_handler.decode_token(token) is first
+    assert decodes == [token]
+
+
+def test_cached_entry_expires_with_token(decodes, monkeypatch):
+    token = access_token(expires_delta=timedelta(minutes=1))
+    payload = jwt_handler.decode_token(token)
+
+    monkeypatch.setattr(jwt_module.time, "time", lambda: payload["exp"] + 1)
+    assert jwt_handler.cache.get(token) is None
+    assert len(jwt_handler.cache._entries) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = DecodedTokenCache(max_size=2)
+    exp = jwt_module.time.time() + 60
+    cache.put("a", {"exp": exp})
+    cache.put("b", {"exp": exp})
+    assert cache.get("a") is not None
+    cache.put("c", {"exp": exp})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_disabled_cache_and_tokens_without_exp_are_not_stored():
+    disabled = DecodedTokenCache(max_size=0)
+    disabled.put("a", {"exp": jwt_module.time.time() + 60})
+    cache = DecodedTokenCache(max_size=10)
+    cache.put("b", {"user_id": "no-exp"})
+    assert disabled.get("a") is None and cache.get("b") is None
+
+
+async def test_revoked_token_is_rejected_even_when_cached(decodes):
+    token = access_token()
+    payload = await get_token_payload(credentials(token))
+
+    await token_repository.add_to_blacklist(jwt_handler.get_token_id(token, payload), payload["exp"])
+    with pytest.raises(HTTPException) as error:
+        await get_token_payload(credentials(token))
+    assert error.value.status_code == 401
+    assert decodes == [token]
+
+
+async def test_other_tokens_of_same_user_stay_valid(decodes):
+    user_id = uuid4()
+    revoked = jwt_handler.create_access_token(user_id=user_id, username="tester", role="user")
+    other = jwt_handler.create_access_token(user_id=user_id, username="tester", role="user")
+    payload = await get_token_payload(credentials(revoked))
+    await token_repository.add_to_blacklist(jwt_handler.get_token_id(revoked, payload), payload["exp"])
+
+    assert (await get_token_payload(credentials(other)))["user_id"] == str(user_id)
@@ -0,0 +1,107 @@
+"""월 파티션 아카이브 (archive_month)
+
+MySQL 전용 SQL이라 실행한 문장을 기록하고 information_schema/행 수 조회에 정해 둔 값을 돌려주는 세션으로 확인합니다.
+"""
+from datetime import date
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+import pytest
+
+from src.infrastructure.database.partitioning import (
+    ArchiveMismatchError,
+    PartitionManager,
+    copy_statement,
+)
+
+MONTH = date(2026, 3, 1)
+COLUMNS = {
+    "bets": ["id", "user_id", "status", "created_at", "settled_at", "won_legs"],
+    "bet_slips": ["id", "bet_id", "result", "created_at"],
+    "transactions": ["id", "wallet_id", "amount", "created_at"],
+}
+
+
+class _Result:
+    def __init__(self, rows: List[Tuple]):
+        self.rows = rows
+
+    def all(self) -> List[Tuple]:
+        return self.rows
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def one(self) -> Tuple:
+        return self.rows[0]
+
+
+class RecordingSession:
+    """실행한 SQL을 기록하는 MySQL 세션 대역"""
+
+    def __init__(self, pending: bool = False, archived: Dict[str, int] = None):
+        self.pending = pending
+        self.archived = archived or {}
+        self.statements: List[str] = []
+        self.commits = 0
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="mysql"))
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if "information_schema.PARTITIONS" in sql:
+            return _Result([("p202603",), ("p202604",), ("pmax",)])
+        if "information_schema.COLUMNS" in sql:
+            return _Result([(column,) for column in COLUMNS[params["table"]]])
+        if "status = 'PENDING'" in sql:
+            return _Result([(1,)] if self.pending else [])
+        if sql.startswith("SELECT COUNT(*)"):
+            table = sql.split(" FROM ")[1].split(" ")[0]
+            return _Result([(10, self.archived.get(table, 10))])
+        return _Result([])
+
+    async def commit(self):
+        self.commits += 1
+
+    def executed(self, prefix: str) -> List[str]:
+        return [sql for sql in self.statements if sql.startswith(prefix)]
+
+
+def test_copy_statement_names_live_columns():
+    sql = copy_statement("bets", ["id", "created_at", "settled_at"], "p202603")
+    assert sql.startswith("INSERT INTO bets_archive (`id`, `created_at`, `settled_at`) SELECT src.`id`")
+    assert "FROM bets PARTITION (p202603) AS src" in sql
+    assert sql.endswith("ON DUPLICATE KEY UPDATE `id` = src.`id`, `created_at` = src.`created_at`, `settled_at` = src.`settled_at`")
+    assert "IGNORE" not in sql and "*" not in sql
+
+
+async def test_archive_month_copies_then_drops_partitions():
+    session = RecordingSession()
+    moved = await PartitionManager(session).archive_month(MONTH)
+
+    assert moved == {"bets": 10, "bet_slips": 10, "transactions": 10}
+    inserts = session.executed("INSERT INTO")
+    assert inserts == [copy_statement(table, COLUMNS[table], "p202603") for table in ("bets", "bet_slips", "transactions")]
+    assert session.executed("ALTER TABLE") == [
+        f"ALTER TABLE {table} DROP PARTITION p202603" for table in ("bets", "bet_slips", "transactions")
+    ]
+    # 복사를 커밋하고 행 수를 확인한 뒤에 파티션 삭제
+    first_drop = session.statements.index("ALTER TABLE bets DROP PARTITION p202603")
+    assert session.statements.index(session.executed("SELECT COUNT(*)")[-1]) < first_drop
+    assert session.commits == 1
+
+
+async def test_archive_month_keeps_partitions_when_counts_differ():
+    session = RecordingSession(archived={"bet_slips": 9})
+    with pytest.raises(ArchiveMismatchError):
+        await PartitionManager(session).archive_month(MONTH)
+    assert session.commits == 1
+    assert session.executed("ALTER TABLE") == []
+
+
+async def test_archive_month_skips_month_with_pending_bets():
+    session = RecordingSession(pending=True)
+    assert await PartitionManager(session).archive_month(MONTH) is None
+    assert session.executed("INSERT INTO") == [] and session.executed("ALTER TABLE") == []
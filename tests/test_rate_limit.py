@@ -0,0 +1,55 @@
+"""IP 기준 속도 제한 (앞단 프록시 뒤의 클라이언트 구분)"""
+import httpx
+import uvicorn
+from gunicorn.config import Config
+
+from src.config import settings
+from src.infrastructure.cache.rate_limiter import parse_rate_limits, rate_limiter
+from src.main import app
+from src.server import ServerWorker, gunicorn_options
+
+PROXY = "10.0.0.2"
+
+
+def served_app():
+    """python -m src.server 워커와 같은 프록시 설정으로 감싼 ASGI 앱"""
+    cfg = Config()
+    cfg.set("forwarded_allow_ips", gunicorn_options("127.0.0.1", 8000, 1)["forwarded_allow_ips"])
+    config = uvicorn.Config(
+        app,
+        lifespan="off",
+        proxy_headers=ServerWorker.CONFIG_KWARGS["proxy_headers"],
+        forwarded_allow_ips=cfg.forwarded_allow_ips,
+    )
+    config.load()
+    return config.loaded_app
+
+
+async def login(client: httpx.AsyncClient, forwarded_for: str) -> int:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"username": "nobody", "password": "wrong-password"},
+        headers={"X-Forwarded-For": forwarded_for},
+    )
+    return response.status_code
+
+
+async def test_clients_behind_trusted_proxy_have_separate_limits(monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_FORWARDED_ALLOW_IPS", PROXY)
+    monkeypatch.setattr(rate_limiter, "limits", parse_rate_limits("login=2/60"))
+    transport = httpx.ASGITransport(app=served_app(), client=(PROXY, 40000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert [await login(client, "198.51.100.1") for _ in range(3)][-1] == 429
+        # 같은 로드밸런서를 거쳐도 다른 클라이언트는 따로 셈
+        assert await login(client, "198.51.100.2") != 429
+        # 클라이언트가 보낸 X-Forwarded-For 앞부분은 무시 (프록시가 덧붙인 마지막 주소 기준)
+        assert await login(client, "198.51.100.2, 198.51.100.1") == 429
+
+
+async def test_forwarded_for_from_untrusted_peer_is_ignored(monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_FORWARDED_ALLOW_IPS", PROXY)
+    monkeypatch.setattr(rate_limiter, "limits", parse_rate_limits("login=2/60"))
+    transport = httpx.ASGITransport(app=served_app(), client=("203.0.113.7", 40000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        statuses = [await login(client, f"198.51.100.{i}") for i in range(10, 13)]
+    assert statuses[-1] == 429
@@ -0,0 +1,73 @@
+"""Refresh Token 패밀리 교체와 재사용 감지"""
+from uuid import uuid4
+
+import pytest
+
+from src.config import settings
+from src.infrastructure.auth.token_repository import (
+    FAMILY_KEY_PREFIX,
+    USER_FAMILIES_KEY_PREFIX,
+    RefreshTokenReusedError,
+    RefreshTokenUserInactiveError,
+    token_repository,
+)
+
+
+async def issue(is_active: bool = True):
+    user_id = uuid4()
+    token, family_id = await token_repository.issue_refresh_token(user_id, "tester", "user", is_active)
+    return user_id, token, family_id
+
+
+async def family_exists(fake_redis, user_id, family_id) -> bool:
+    return bool(await fake_redis.exists(f"{FAMILY_KEY_PREFIX}{family_id}")) and bool(
+        await fake_redis.sismember(f"{USER_FAMILIES_KEY_PREFIX}{user_id}", family_id)
+    )
+
+
+async def test_rotation_issues_new_token_in_same_family():
+    user_id, token, family_id = await issue()
+    session = await token_repository.rotate_refresh_token(token)
+
+    assert session.user_id == user_id and session.family_id == family_id
+    assert session.refresh_token.startswith(f"{family_id}.") and session.refresh_token != token
+    assert (await token_repository.rotate_refresh_token(session.refresh_token)).family_id == family_id
+
+
+async def test_unknown_secret_does_not_revoke_family(fake_redis):
+    user_id, token, family_id = await issue()
+
+    assert await token_repository.rotate_refresh_token(f"{family_id}.garbage") is None
+    assert await token_repository.rotate_refresh_token("not-a-token") is None
+    assert await family_exists(fake_redis, user_id, family_id)
+    assert await token_repository.rotate_refresh_token(token) is not None
+
+
+async def test_concurrent_refresh_with_previous_secret_is_rejected_without_revoking(fake_redis):
+    user_id, token, family_id = await issue()
+    first = await token_repository.rotate_refresh_token(token)
+
+    # 다른 탭이 같은 토큰으로 동시에 갱신 (유예 시간 안)
+    assert await token_repository.rotate_refresh_token(token) is None
+    assert await family_exists(fake_redis, user_id, family_id)
+    assert await token_repository.rotate_refresh_token(first.refresh_token) is not None
+
+
+async def test_reused_retired_secret_revokes_family(fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "REFRESH_TOKEN_REUSE_GRACE_SECONDS", 0)
+    user_id, token, family_id = await issue()
+    first = await token_repository.rotate_refresh_token(token)
+    second = await token_repository.rotate_refresh_token(first.refresh_token)
+
+    with pytest.raises(RefreshTokenReusedError):
+        await token_repository.rotate_refresh_token(token)
+    assert not await family_exists(fake_redis, user_id, family_id)
+    assert await token_repository.rotate_refresh_token(second.refresh_token) is None
+
+
+async def test_inactive_user_revokes_family(fake_redis):
+    user_id, token, family_id = await issue(is_active=False)
+
+    with pytest.raises(RefreshTokenUserInactiveError):
+        await token_repository.rotate_refresh_token(token)
+    assert not await family_exists(fake_redis, user_id, family_id)
@@ -0,0 +1,93 @@
+"""토큰 무효화 레지스트리 (Bloom 필터 + Redis pub/sub 동기화)"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.auth.revocation import BLACKLIST_INDEX_KEY, BloomFilter, RevocationRegistry
+from src.infrastructure.cache.redis_client import redis_client
+
+
+async def wait_for(condition, timeout: float = 3.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("조건을 기다리다 시간 초과")
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def registries():
+    """같은 Redis를 쓰는 두 워커의 레지스트리 (동기화 시작 후 반환)"""
+    workers = [RevocationRegistry(redis_client), RevocationRegistry(redis_client)]
+    for registry in workers:
+        registry.start()
+    await wait_for(lambda: all(registry.is_synced for registry in workers))
+    yield workers
+    for registry in workers:
+        await registry.stop()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [uuid4().hex for _ in range(1000)]
+    for item in added:
+        bloom.add(item)
+
+    assert all(item in bloom for item in added)
+    false_positives = sum(uuid4().hex in bloom for _ in range(5000))
+    assert false_positives < 5000 * 0.03
+
+
+async def test_snapshot_loads_revocations_made_before_start():
+    revoked = uuid4().hex
+    await RevocationRegistry(redis_client).revoke(revoked)
+
+    registry = RevocationRegistry(redis_client)
+    registry.start()
+    try:
+        await wait_for(lambda: registry.is_synced)
+        assert revoked in registry._filter
+        assert await registry.is_revoked(revoked)
+    finally:
+        await registry.stop()
+
+
+async def test_revocation_propagates_to_other_workers(registries):
+    revoking, other = registries
+    token_id = uuid4().hex
+    await revoking.revoke(token_id)
+
+    await wait_for(lambda: token_id in other._filter)
+    assert await other.is_revoked(token_id)
+    assert not await other.is_revoked(uuid4().hex)
+
+
+async def test_synced_filter_answers_without_redis(registries, monkeypatch):
+    registry = registries[0]
+
+    async def unreachable(key):
+        raise AssertionError("필터에 없는 토큰은 Redis를 조회하지 않아야 함")
+
+    monkeypatch.setattr(registry.redis, "exists", unreachable)
+    assert not await registry.is_revoked(uuid4().hex)
+
+
+async def test_unsynced_registry_checks_redis():
+    token_id = uuid4().hex
+    await RevocationRegistry(redis_client).revoke(token_id)
+
+    registry = RevocationRegistry(redis_client)
+    assert not registry.is_synced
+    assert await registry.is_revoked(token_id)
+    assert not await registry.is_revoked(uuid4().hex)
+
+
+async def test_rebuild_drops_expired_revocations():
+    registry = RevocationRegistry(redis_client)
+    await registry.revoke("expired", expires_at=1)
+    await registry.revoke("active")
+
+    await registry._rebuild()
+    assert await redis_client.client.zrange(BLACKLIST_INDEX_KEY, 0, -1) == ["active"]
+    assert "active" in registry._filter
@@ -0,0 +1,111 @@
+"""보고서 집계 진행 시각(watermark)과 다시 계산할 구간 (RollupService)"""
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+from src.domain.report.repository import RollupRepository
+from src.domain.report.service import RollupService, hour_floor
+
+NOW = datetime(2026, 10, 19, 12, 30)
+LAG = 60.0
+
+
+class MemoryRollupRepository(RollupRepository):
+    """배팅 (접수 시각, 결과 확정 시각) 목록과 진행 시각만 가진 집계 리포지토리"""
+
+    def __init__(self, bets: List[Tuple[datetime, Optional[datetime]]], created=None, settled=None):
+        self.bets = bets
+        self.watermarks = (created, settled)
+        self.rebuilt_hours: List[datetime] = []
+        self.rebuilt_days: List[date] = []
+
+    async def lock_watermarks(self):
+        return self.watermarks
+
+    async def save_watermarks(self, created, settled):
+        self.watermarks = (created, settled)
+
+    async def find_earliest_bet_at(self):
+        return min((created for created, _ in self.bets), default=None)
+
+    async def find_settled_hours(self, since, until, before):
+        return sorted({
+            hour_floor(created) for created, settled in self.bets
+            if settled is not None and (since is None or settled >= since) and settled < until and created < before
+        })
+
+    async def rebuild_hours(self, hours):
+        self.rebuilt_hours = list(hours)
+        return len(hours)
+
+    async def rebuild_days(self, days):
+        self.rebuilt_days = list(days)
+        return len(days)
+
+
+def hours_between(start: datetime, end: datetime) -> List[datetime]:
+    hours, hour = [], start
+    while hour <= end:
+        hours.append(hour)
+        hour += timedelta(hours=1)
+    return hours
+
+
+async def test_first_run_starts_from_earliest_bet():
+    repository = MemoryRollupRepository([(datetime(2026, 10, 19, 9, 15), None)])
+    result = await RollupService(repository).run_once(NOW, LAG, max_hours=168)
+
+    until = NOW - timedelta(seconds=LAG)
+    assert repository.rebuilt_hours == hours_between(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 12))
+    assert repository.rebuilt_days == [date(2026, 10, 19)]
+    assert repository.watermarks == (until, until)
+    assert result.watermark == until and not result.has_more
+
+
+async def test_without_bets_only_watermarks_move():
+    repository = MemoryRollupRepository([])
+    result = await RollupService(repository).run_once(NOW, LAG, max_hours=168)
+
+    assert repository.rebuilt_hours == []
+    assert repository.watermarks == (result.watermark, result.watermark)
+
+
+async def test_settled_old_bet_recomputes_its_hour_and_day():
+    watermark = datetime(2026, 10, 19, 11, 20)
+    repository = MemoryRollupRepository(
+        [
+            (datetime(2026, 10, 17, 22, 5), datetime(2026, 10, 19, 11, 40)),  # 이전에 접수, 이번 구간에 확정
+            (datetime(2026, 10, 16, 8, 0), datetime(2026, 10, 19, 10, 0)),  # 이미 반영된 확정
+        ],
+        created=watermark,
+        settled=watermark,
+    )
+    await RollupService(repository).run_once(NOW, LAG, max_hours=168)
+
+    # 진행 시각이 걸친 11시부터 다시 계산하고, 확정된 배팅의 접수 시간도 다시 계산
+    assert repository.rebuilt_hours == [datetime(2026, 10, 17, 22), datetime(2026, 10, 19, 11), datetime(2026, 10, 19, 12)]
+    assert repository.rebuilt_days == [date(2026, 10, 17), date(2026, 10, 19)]
+
+
+async def test_backlog_is_split_by_max_hours():
+    until = NOW - timedelta(seconds=LAG)
+    repository = MemoryRollupRepository([(datetime(2026, 10, 18, 0, 30), None)])
+    service = RollupService(repository)
+
+    first = await service.run_once(NOW, LAG, max_hours=24)
+    assert first.has_more and first.hours == 24
+    assert repository.watermarks == (datetime(2026, 10, 19, 0), until)
+    assert first.watermark == datetime(2026, 10, 19, 0)
+
+    second = await service.run_once(NOW, LAG, max_hours=24)
+    assert not second.has_more
+    assert repository.rebuilt_hours == hours_between(datetime(2026, 10, 19, 0), datetime(2026, 10, 19, 12))
+    assert repository.watermarks == (until, until)
+
+
+async def test_up_to_date_watermark_does_nothing():
+    until = NOW - timedelta(seconds=LAG)
+    repository = MemoryRollupRepository([(datetime(2026, 10, 19, 9, 15), None)], created=until, settled=until)
+    result = await RollupService(repository).run_once(NOW, LAG, max_hours=168)
+
+    assert repository.rebuilt_hours == [] and result.hours == 0
+    assert result.watermark == until
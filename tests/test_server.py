@@ -0,0 +1,40 @@
+"""운영 서버 시작 시 내장 백그라운드 작업 설정 확인"""
+import sys
+
+import pytest
+
+from src import server
+from src.config import settings
+
+
+@pytest.fixture
+def started(monkeypatch):
+    """Server.run 대신 전달된 gunicorn 설정을 기록"""
+    runs = []
+    monkeypatch.setattr(server.Server, "run", lambda self: runs.append(self.options))
+    monkeypatch.setattr(server, "prepare_metrics_dir", lambda: "")
+    return runs
+
+
+def run_main(monkeypatch, embedded, workers: int) -> None:
+    monkeypatch.setattr(settings, "BACKGROUND_TASKS_EMBEDDED", embedded)
+    monkeypatch.setattr(sys, "argv", ["src.server", "--workers", str(workers)])
+    server.main()
+
+
+def test_multi_worker_server_requires_explicit_background_setting(monkeypatch, started):
+    with pytest.raises(SystemExit):
+        run_main(monkeypatch, None, 2)
+    assert started == []
+
+
+@pytest.mark.parametrize("embedded, workers", [(False, 2), (True, 2), (None, 1)])
+def test_server_keeps_configured_background_setting(monkeypatch, started, embedded, workers):
+    run_main(monkeypatch, embedded, workers)
+    assert started[0]["workers"] == workers
+    assert settings.BACKGROUND_TASKS_EMBEDDED is embedded
+
+
+def test_disabled_background_tasks_warn_at_startup(monkeypatch, started, caplog):
+    run_main(monkeypatch, False, 2)
+    assert "scripts.job_worker" in caplog.text